@@ -0,0 +1,95 @@
+"""
+Benchmark the parse throughput of the XML backends of ModelAnalysis, on the bundled URDF files and on synthetic models.
+
+Run from the root of the repository:
+    python benchmarks/xml_backend_benchmark.py [--links 100 1000 10000] [--repeat 5]
+"""
+from pathlib import Path
+import xml.etree.ElementTree as ET
+import tempfile
+import argparse
+import logging
+import time
+import os
+
+import pandas as pd
+
+from urdf_analyzer.model_analysis import ModelAnalysis
+from urdf_analyzer.xml_backend import get_available_xml_backends
+
+
+BUNDLED_URDF_DIR = "resources/urdf_files"
+
+
+def create_synthetic_urdf(filename: str, n_links: int):
+    """
+    A serial chain of n_links links, each with a visual mesh, a collision box and inertial properties.
+    """
+    robot = ET.Element("robot", name=f"synthetic_{n_links}")
+    for i in range(n_links):
+        link = ET.SubElement(robot, "link", name=f"link_{i}")
+        inertial = ET.SubElement(link, "inertial")
+        ET.SubElement(inertial, "mass", value="1.0")
+        ET.SubElement(inertial, "inertia", ixx="0.1", ixy="0", ixz="0", iyy="0.1", iyz="0", izz="0.1")
+        visual = ET.SubElement(ET.SubElement(link, "visual"), "geometry")
+        ET.SubElement(visual, "mesh", filename=f"package://synthetic/meshes/link_{i}.stl")
+        collision = ET.SubElement(link, "collision")
+        ET.SubElement(collision, "origin", xyz="0 0 0.05", rpy="0 0 0")
+        ET.SubElement(ET.SubElement(collision, "geometry"), "box", size="0.1 0.1 0.1")
+        if i > 0:
+            joint = ET.SubElement(robot, "joint", name=f"joint_{i}", type="revolute")
+            ET.SubElement(joint, "parent", link=f"link_{i-1}")
+            ET.SubElement(joint, "child", link=f"link_{i}")
+            ET.SubElement(joint, "origin", xyz="0 0 0.1", rpy="0 0 0")
+            ET.SubElement(joint, "limit", lower="-3.14", upper="3.14", effort="10", velocity="1")
+    ET.ElementTree(robot).write(filename)
+
+
+def benchmark_backend(backend: str, urdf_files: list, repeat: int):
+    """
+    :return: the best time of reading the files (parse), and of reading the files and extracting the joint and link information (analysis)
+    """
+    model_analysis = ModelAnalysis(logging.getLogger("urdf_analyzer"), backend)
+    parse_times = []
+    analysis_times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for urdf_file in urdf_files:
+            model_analysis.xml_urdf_reader(urdf_file)
+        parse_times.append(time.perf_counter() - start)
+
+        start = time.perf_counter()
+        for urdf_file in urdf_files:
+            model_analysis.xml_urdf_reader(urdf_file)
+            model_analysis.get_joint_information()
+            model_analysis.get_link_information()
+        analysis_times.append(time.perf_counter() - start)
+    return min(parse_times), min(analysis_times)
+
+
+def main():
+    args_parser = argparse.ArgumentParser()
+    args_parser.add_argument("--links", type=int, nargs="+", default=[100, 1000, 10000], help="The number of links of the synthetic models.")
+    args_parser.add_argument("--repeat", type=int, default=5, help="The number of repetitions, of which the best time is reported.")
+    args = args_parser.parse_args()
+
+    results = []
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        datasets = {"bundled": [str(f) for f in sorted(Path(BUNDLED_URDF_DIR).rglob("*.urdf"))]}
+        for n_links in args.links:
+            filename = str(Path(tmp_dir, f"synthetic_{n_links}.urdf"))
+            create_synthetic_urdf(filename, n_links)
+            datasets[f"synthetic_{n_links}"] = [filename]
+
+        for dataset, urdf_files in datasets.items():
+            size_mb = sum(os.path.getsize(f) for f in urdf_files) / 1e6
+            for backend in get_available_xml_backends():
+                parse_time, analysis_time = benchmark_backend(backend, urdf_files, args.repeat)
+                results.append({"dataset": dataset, "backend": backend, "n_files": len(urdf_files), "size_mb": round(size_mb, 3),
+                                "parse_s": round(parse_time, 4), "parse_mb_per_s": round(size_mb / parse_time, 1),
+                                "analysis_s": round(analysis_time, 4), "analysis_files_per_s": round(len(urdf_files) / analysis_time, 1)})
+    print(pd.DataFrame(results).to_string(index=False))
+
+
+if __name__ == '__main__':
+    main()
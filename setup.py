@@ -19,6 +19,7 @@ setuptools.setup(
     ],
     extras_require={
         "urdf_tools": ["yourdfpy","urdfpy","roboticstoolbox-python"],
+        "lxml": ["lxml"],
         "testing": ["coverage"]
     },
     classifiers=[
@@ -26,5 +27,5 @@ setuptools.setup(
         "Operating System :: OS Independent",
     ],
     python_requires=">=3.8",
-    entry_points={"console_scripts": ["urdf_analyzer=urdf_analyzer.cli:main"]},
+    entry_points={"console_scripts": ["urdf_analyzer=urdf_analyzer.cli:main", "urdf_analyzer_client=urdf_analyzer.client:main"]},
 )
\ No newline at end of file
@@ -1,9 +1,13 @@
 from pathlib import Path
+import tempfile
 import unittest
+import shutil
+import json
 import logging
 import os
 
 from urdf_analyzer.urdf_parser import URDFparser
+from urdf_analyzer.model_analysis import ModelAnalysis
 from urdf_analyzer import api
 
 
@@ -94,6 +98,94 @@ class APITests(unittest.TestCase):
             self.assertIsNotNone(urdf_info)
         
 
+    ############# generate_duplicates_comparison_schema(...) #################
+
+    def _create_duplicates_file(self, tmp_dir, robots):
+        duplicates = {}
+        for robot, urdf_file in robots.items():
+            duplicates[robot] = {"variant": []}
+            for source in ["ros_industrial", "upstream"]:
+                os.makedirs(Path(tmp_dir, source, robot))
+                shutil.copy(urdf_file, Path(tmp_dir, source, robot, Path(urdf_file).name))
+                duplicates[robot]["variant"].append({"source": source, "urdf_path": str([f"{source}/{robot}/{Path(urdf_file).name}"])})
+        duplicates_file = Path(tmp_dir, "duplicates.json")
+        with open(duplicates_file, "w") as f:
+            json.dump(duplicates, f)
+        return duplicates_file
+
+    def test_generate_duplicates_comparison_schema(self):
+        robots = {"pioneer3dx": "./resources/urdf_files/adept_mobile_robots/pioneer3dx.urdf",
+                  "pioneer3at": "./resources/urdf_files/adept_mobile_robots/pioneer3at.urdf"}
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            duplicates_file = self._create_duplicates_file(tmp_dir, robots)
+            duplicates_information, duplicates_comparisons = api.generate_duplicates_comparison_schema(duplicates_file, out=str(Path(tmp_dir, "duplicates.csv")), n_workers=2)
+        # one row per duplicate, and one comparison per robot variant, in the order of the duplicates file
+        self.assertEqual(list(duplicates_information["name"]), ["pioneer3dx", "pioneer3dx", "pioneer3at", "pioneer3at"])
+        self.assertEqual(list(duplicates_comparisons["name"]), ["pioneer3dx", "pioneer3at"])
+        self.assertEqual(list(duplicates_comparisons["joints_diff"]), ["", ""])
+        self.assertEqual(duplicates_comparisons.loc[0, "sources"], str(["ros_industrial", "upstream"]))
+
+
+    ############# generate_duplicates_diff_schema(...) #################
+
+    def test_generate_duplicates_diff_schema(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            for source in ["ros_industrial", "upstream"]:
+                os.makedirs(Path(tmp_dir, source))
+                shutil.copy("./resources/urdf_files/adept_mobile_robots/pioneer3dx.urdf", Path(tmp_dir, source, "pioneer3dx.urdf"))
+            duplicates = {"pioneer": {"3dx": [{"source": "ros_industrial", "urdf_path": str(["ros_industrial/pioneer3dx.urdf"])},
+                                              {"source": "upstream", "urdf_path": str(["upstream/pioneer3dx.urdf"])}]}}
+            duplicates_file = Path(tmp_dir, "duplicates.json")
+            with open(duplicates_file, "w") as f:
+                json.dump(duplicates, f)
+            diff_results = api.generate_duplicates_diff_schema(duplicates_file, out=str(Path(tmp_dir, "diff.csv")), n_workers=1)
+            self.assertEqual(len(diff_results), 1)
+            self.assertEqual(diff_results.loc[0, "sources"], ["ros_industrial", "upstream"])
+            self.assertTrue(diff_results.loc[0, "identical"])
+
+
+    ############# schema_generator(...) #################
+
+    def test_plan_schema_work_units(self):
+        # the units shared by the schemas are only planned once
+        self.assertEqual(api.plan_schema_work_units(["model-info", "urdf-parse-cmp", "tool-cmp", "validation"]), ["xml", "model", "parsing", "keywords", "validation"])
+        self.assertEqual(api.plan_schema_work_units(["dataset-stats", "name-index"]), ["xml", "dataset", "names"])
+
+    def test_schema_generator_reads_each_file_once(self):
+        urdf_files = api.search_for_urdfs(self.urdf_files_dir/self.urdf_root_dir)
+        n_reads = {}
+        xml_urdf_reader = ModelAnalysis.xml_urdf_reader
+        def counting_xml_urdf_reader(model_analysis, filename, *args, **kwargs):
+            path = Path(os.path.abspath(filename if len(args) == 0 else os.path.join(args[0], os.path.basename(filename))))
+            n_reads[path] = n_reads.get(path, 0) + 1
+            return xml_urdf_reader(model_analysis, filename, *args, **kwargs)
+        ModelAnalysis.xml_urdf_reader = counting_xml_urdf_reader
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            try:
+                api.schema_generator(["model-info", "dataset-stats", "name-index"], urdf_files, workers=1, name_index=str(Path(tmp_dir, "names.sqlite")))
+            finally:
+                ModelAnalysis.xml_urdf_reader = xml_urdf_reader
+        # the model information, the dataset statistics and the name index are computed from a single read of each file
+        self.assertEqual(n_reads, {Path(os.path.abspath(f)): 1 for f in urdf_files})
+
+    def test_get_xml_information(self):
+        urdf_files = api.search_for_urdfs(self.urdf_files_dir/self.urdf_root_dir)
+        validator = api.URDFValidator(logging.getLogger("urdf_analyzer"))
+        urdfs_information, validation_issues, _ = api.get_xml_information(urdf_files, api.MODEL_INFORMATION_SCHEMA_KWARGS, validator)
+        # the same results as reading the files once per schema
+        expected_information = api.get_models_information(urdf_files, **api.MODEL_INFORMATION_SCHEMA_KWARGS)
+        self.assertEqual([i.joint_information.n_joints for i in urdfs_information], [i.joint_information.n_joints for i in expected_information])
+        self.assertEqual([i.filename for i in urdfs_information], [i.filename for i in expected_information])
+        self.assertEqual([(str(f), len(issues)) for f, issues in validation_issues], [(str(f), len(issues)) for f, issues in api.validate_urdfs(urdf_files)])
+
+    def test_get_keyword_counts(self):
+        urdf_file = self.urdf_files_dir/self.urdf_root_dir/self.working_urdf_filename
+        keyword_counts = api.get_keyword_counts([urdf_file], ['xacro', 'link'])
+        with open(urdf_file) as f:
+            content = f.read()
+        self.assertEqual(list(keyword_counts.loc[urdf_file]), [content.count('xacro'), content.count('link')])
+
+
     ############# save_model_information(...) #################
 
 
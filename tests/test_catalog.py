@@ -0,0 +1,77 @@
+from pathlib import Path
+import tempfile
+import unittest
+import logging
+import os
+
+from urdf_analyzer.catalog import URDFCatalog
+from urdf_analyzer.model_analysis import ModelAnalysis
+from urdf_analyzer.urdf_components.urdf_information import URDFInformation
+
+
+class CatalogTests(unittest.TestCase):
+
+
+    @classmethod
+    def setUpClass(self):
+        """
+        Runs when class is loaded.
+        """
+        logging.basicConfig(level=logging.ERROR)
+        self.logger = logging.getLogger("urdf_analyzer")
+
+        self.urdf_files = sorted(Path("resources/urdf_files/adept_mobile_robots").glob("*.urdf"))
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.catalog_file = os.path.join(self.tmp_dir.name, "catalog.sqlite")
+
+        model_analysis = ModelAnalysis(self.logger)
+        urdfs_information = []
+        for urdf_file in self.urdf_files:
+            model_analysis.xml_urdf_reader(urdf_file)
+            urdfs_information.append(URDFInformation(os.path.basename(urdf_file), model_analysis.get_joint_information(), model_analysis.get_link_information()))
+
+        catalog = URDFCatalog(self.catalog_file, self.logger)
+        catalog.add_urdfs_information(urdfs_information, self.urdf_files)
+        # adding the same files again should replace them rather than duplicate them
+        catalog.add_urdfs_information(urdfs_information, self.urdf_files)
+        catalog.close()
+
+    @classmethod
+    def tearDownClass(self):
+        self.tmp_dir.cleanup()
+
+    def test_query_all_files(self):
+        catalog = URDFCatalog(self.catalog_file, self.logger, read_only=True)
+        results = catalog.query()
+        catalog.close()
+        self.assertEqual(len(results), len(self.urdf_files))
+
+    def test_query_where(self):
+        catalog = URDFCatalog(self.catalog_file, self.logger, read_only=True)
+        results = catalog.query(where="n_joints = 10")
+        catalog.close()
+        self.assertIn("pioneer3dx.urdf", list(results["filename"]))
+
+    def test_query_mesh_type(self):
+        catalog = URDFCatalog(self.catalog_file, self.logger, read_only=True)
+        visual_dae = catalog.query(visual_mesh="dae")
+        collision_obj = catalog.query(collision_mesh="obj")
+        catalog.close()
+        self.assertTrue(set(visual_dae["filename"]) <= {"pioneer-lx.urdf", "pioneer-lx-devil.urdf"})
+        self.assertTrue(len(visual_dae) > 0)
+        self.assertEqual(len(collision_obj), 0)
+
+    def test_sql_aggregate(self):
+        catalog = URDFCatalog(self.catalog_file, self.logger, read_only=True)
+        results = catalog.sql("SELECT COUNT(*) AS n FROM joints")
+        expected = catalog.sql("SELECT SUM(n_joints) AS n FROM files")
+        catalog.close()
+        self.assertEqual(results.loc[0, "n"], expected.loc[0, "n"])
+
+    def test_catalog_nonexistant(self):
+        with self.assertRaises(FileNotFoundError):
+            URDFCatalog(os.path.join(self.tmp_dir.name, "non_existing.sqlite"), self.logger, read_only=True)
+
+
+if __name__ == '__main__':
+    unittest.main()
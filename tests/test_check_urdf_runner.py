@@ -0,0 +1,72 @@
+from pathlib import Path
+import tempfile
+import unittest
+import logging
+import stat
+import sys
+import os
+
+from urdf_analyzer.check_urdf_runner import run_check_urdfs, run_check_urdf
+
+
+# A local stand-in for the urdfdom check_urdf executable:
+# files containing 'fail' in their name fail, and files containing 'slow' in their name take a long time
+STUB_CHECK_URDF = f"""#!{sys.executable}
+import sys, time
+filename = sys.argv[1]
+if 'slow' in filename:
+    time.sleep(10)
+if 'fail' in filename:
+    sys.stderr.write('Error: failed to parse ' + filename)
+    sys.exit(1)
+print('robot name is: ' + filename)
+"""
+
+
+@unittest.skipIf(sys.platform.startswith("win"), "The stub check_urdf executable requires a POSIX system.")
+class CheckURDFRunnerTests(unittest.TestCase):
+
+
+    @classmethod
+    def setUpClass(self):
+        """
+        Runs when class is loaded.
+        """
+        logging.basicConfig(level=logging.ERROR)
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.executable = os.path.join(self.tmp_dir.name, "check_urdf")
+        with open(self.executable, "w") as f:
+            f.write(STUB_CHECK_URDF)
+        os.chmod(self.executable, os.stat(self.executable).st_mode | stat.S_IEXEC)
+
+    @classmethod
+    def tearDownClass(self):
+        self.tmp_dir.cleanup()
+
+    def test_run_check_urdfs(self):
+        filenames = ["robot_a.urdf", "robot_fail.urdf", "robot_b.urdf"]
+        results = run_check_urdfs(filenames, executable=self.executable, max_concurrency=2)
+        self.assertEqual([r.filename for r in results], filenames)
+        self.assertEqual([r.passed for r in results], [True, False, True])
+        self.assertIn("failed to parse robot_fail.urdf", results[1].stderr)
+        self.assertEqual(results[1].returncode, 1)
+
+    def test_run_check_urdf_path_with_spaces(self):
+        filename = str(Path("a directory", "robot with spaces.urdf"))
+        result = run_check_urdf(filename, executable=self.executable)
+        self.assertTrue(result.passed)
+        self.assertIn(filename, result.stdout)
+
+    def test_run_check_urdf_timeout(self):
+        result = run_check_urdf("robot_slow.urdf", executable=self.executable, timeout=0.5)
+        self.assertTrue(result.timed_out)
+        self.assertFalse(result.passed)
+
+    def test_run_check_urdf_executable_missing(self):
+        result = run_check_urdf("robot_a.urdf", executable=os.path.join(self.tmp_dir.name, "non_existing"))
+        self.assertFalse(result.passed)
+        self.assertIsNone(result.returncode)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,70 @@
+import unittest
+import tempfile
+import logging
+import os
+
+import numpy as np
+
+from urdf_analyzer.model_analysis import ModelAnalysis
+from urdf_analyzer.mesh_analysis import read_stl_vertices, resolve_mesh_filename, get_mesh_bounds
+from urdf_analyzer.urdf_components.collision import CollisionMetaInformation
+from urdf_analyzer.urdf_components.joint import Joint
+from urdf_analyzer.urdf_components.link import Link, Collision, Box, Sphere
+from urdf_analyzer.urdf_components.origin import Origin
+
+
+class CollisionTests(unittest.TestCase):
+
+
+    def test_self_collision_candidates(self):
+        links = [Link("base", collisions=[Collision(Box("1 1 1"))]),
+                 Link("arm", collisions=[Collision(Box("1 1 1"), Origin([0.5, 0, 0], [0, 0, 0]))]),
+                 Link("gripper", collisions=[Collision(Sphere("0.2"))]),
+                 Link("far", collisions=[Collision(Sphere("0.2"))])]
+        joints = [Joint("base_arm", "fixed", "base", "arm"),
+                  Joint("arm_gripper", "fixed", "arm", "gripper", Origin([0.2, 0, 0], [0, 0, 0])),
+                  Joint("base_far", "fixed", "base", "far", Origin([5, 0, 0], [0, 0, 0]))]
+        collisions = CollisionMetaInformation(links, joints)
+        self.assertEqual(collisions.n_collision_bodies, 4)
+        # base and arm are adjacent, and the gripper overlaps both the base and the arm
+        self.assertEqual(collisions.self_collision_candidates, [("base", "gripper")])
+        self.assertEqual(collisions.collision_bounds, [[-0.5, -0.5, -0.5], [5.2, 0.5, 0.5]])
+
+    def test_rotated_aabb(self):
+        links = [Link("base", collisions=[Collision(Box("2 0 0"), Origin([0, 0, 0], [0, 0, np.pi/2]))])]
+        collisions = CollisionMetaInformation(links, [])
+        np.testing.assert_allclose(collisions.aabb_min, [[0, -1, 0]], atol=1e-9)
+        np.testing.assert_allclose(collisions.aabb_max, [[0, 1, 0]], atol=1e-9)
+
+    def test_sweep_and_prune(self):
+        rng = np.random.default_rng(0)
+        aabb_min = rng.random((200, 3)) * 5
+        aabb_max = aabb_min + rng.random((200, 3))
+        pairs = CollisionMetaInformation._sweep_and_prune(aabb_min, aabb_max)
+        overlap = np.all((aabb_min[:, None] < aabb_max[None]) & (aabb_min[None] < aabb_max[:, None]), axis=2)
+        expected = set(zip(*np.nonzero(np.triu(overlap, k=1))))
+        self.assertEqual(set(map(tuple, np.sort(pairs.T, axis=1).tolist())), expected)
+
+    def test_ascii_stl_bounds(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            os.makedirs(os.path.join(tmp_dir, "meshes"))
+            filename = os.path.join(tmp_dir, "meshes", "part.stl")
+            with open(filename, "w") as f:
+                f.write("solid part\nfacet normal 0 0 1\nouter loop\nvertex 0 0 0\nvertex 1 0 0\nvertex 0 2 -1\nendloop\nendfacet\nendsolid part\n")
+            self.assertEqual(read_stl_vertices(filename).shape, (3, 3))
+            self.assertEqual(resolve_mesh_filename("package://meshes/part.stl", tmp_dir), filename)
+            bounds = get_mesh_bounds(filename)
+            np.testing.assert_allclose(bounds[0], [0, 0, -1])
+            np.testing.assert_allclose(bounds[1], [1, 2, 0])
+
+    def test_bundled_urdf(self):
+        model_analysis = ModelAnalysis(logging.getLogger("urdf_analyzer"))
+        model_analysis.xml_urdf_reader("resources/urdf_files/adept_mobile_robots/pioneer3at.urdf")
+        collisions = model_analysis.get_collision_information()
+        self.assertEqual(collisions.n_collision_bodies, 9)
+        self.assertEqual(collisions.n_unresolved_collision_meshes, 0)
+        self.assertIn("n_self_collision_candidates", collisions.df_results.columns)
+
+
+if __name__ == '__main__':
+    unittest.main()
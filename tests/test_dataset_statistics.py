@@ -0,0 +1,72 @@
+from pathlib import Path
+import tempfile
+import unittest
+import logging
+import json
+
+import numpy as np
+
+from urdf_analyzer.dataset_statistics import LogHistogram, DatasetStatistics, get_dataset_statistics
+from urdf_analyzer import api
+
+
+class LogHistogramTests(unittest.TestCase):
+
+
+    def test_quantiles(self):
+        values = np.random.default_rng(0).lognormal(mean=3, sigma=1.5, size=10000)
+        histogram = LogHistogram(relative_error=0.01)
+        for v in np.concatenate([values, np.zeros(100)]):
+            histogram.add(float(v))
+        self.assertEqual((histogram.count, histogram.n_zeros), (10100, 100))
+        self.assertEqual(histogram.quantile(0.0), 0)
+        self.assertEqual(histogram.quantile(1.0), values.max())
+        for q in [0.1, 0.5, 0.9, 0.99]:
+            expected = np.quantile(np.concatenate([values, np.zeros(100)]), q, method='lower')
+            self.assertLessEqual(abs(histogram.quantile(q) - expected), 0.01 * expected + 1e-9)
+
+    def test_merge(self):
+        values = np.random.default_rng(1).integers(0, 1000, size=1000)
+        histogram = LogHistogram()
+        parts = [LogHistogram(), LogHistogram()]
+        for i, v in enumerate(values):
+            histogram.add(int(v))
+            parts[i % 2].add(int(v))
+        merged = LogHistogram.from_dict(json.loads(json.dumps(parts[0].to_dict()))).merge(parts[1])
+        self.assertEqual(merged.to_dict(), histogram.to_dict())
+        with self.assertRaises(ValueError):
+            histogram.merge(LogHistogram(relative_error=0.05))
+
+
+class DatasetStatisticsTests(unittest.TestCase):
+
+
+    def setUp(self):
+        self.logger = logging.getLogger("urdf_analyzer")
+        self.urdf_files = [str(f) for f in api.search_for_urdfs("resources/urdf_files")]
+
+    def test_statistics(self):
+        statistics = get_dataset_statistics(self.urdf_files, self.logger)
+        urdfs_information = api.get_models_information(self.urdf_files, joints=True, links=True)
+        self.assertEqual(statistics.n_files, len(self.urdf_files))
+        self.assertEqual(statistics.histograms["n_joints"].total, sum(u.joint_information.n_joints for u in urdfs_information))
+        self.assertEqual(statistics.histograms["n_links"].max, max(u.link_information.n_links for u in urdfs_information))
+        self.assertEqual(sum(statistics.mesh_types["collision"].values()), sum(sum(u.link_information.collision_mesh_types.values()) for u in urdfs_information))
+        summary = statistics.get_summary().set_index("statistic")
+        self.assertEqual(summary.loc["n_files", "count"], len(self.urdf_files))
+
+    def test_merge_shards(self):
+        statistics = get_dataset_statistics(self.urdf_files, self.logger)
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            partial_files = []
+            for i in range(1, 3):
+                shard_files = api.shard_urdf_files(self.urdf_files, (i, 2), "resources/urdf_files")
+                partial_file = str(Path(tmp_dir, f"dataset_statistics_schema_shard-{i}-of-2"))
+                api.generate_dataset_statistics_schema(shard_files, out=partial_file, n_workers=1, partial=True)
+                partial_files.append(partial_file + ".json")
+            merged_summary = api.merge_schemas('dataset-stats', partial_files, out=False)
+        self.assertTrue(merged_summary.equals(statistics.get_summary()))
+
+
+if __name__ == '__main__':
+    unittest.main()
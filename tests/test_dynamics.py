@@ -0,0 +1,53 @@
+import unittest
+import logging
+
+import numpy as np
+
+from urdf_analyzer.model_analysis import ModelAnalysis
+from urdf_analyzer.urdf_components.dynamics import DynamicsMetaInformation
+from urdf_analyzer.urdf_components.joint import Joint
+from urdf_analyzer.urdf_components.link import Link, Inertial, Box, Sphere
+from urdf_analyzer.urdf_components.origin import Origin
+
+
+class DynamicsTests(unittest.TestCase):
+
+
+    def test_total_mass_and_center_of_mass(self):
+        links = [Link("base", inertial=Inertial(1.0, [1, 0, 0, 1, 0, 1])),
+                 Link("arm", inertial=Inertial(3.0, [1, 0, 0, 1, 0, 1], Origin([0, 0, 1], [0, 0, 0])))]
+        joints = [Joint("joint", "revolute", "base", "arm", Origin([1, 0, 0], [0, 0, np.pi/2]), limit={'lower': -1.0, 'upper': 1.0, 'effort': 10.0, 'velocity': 1.0})]
+        dynamics = DynamicsMetaInformation(links, joints)
+        self.assertEqual(dynamics.total_mass, 4.0)
+        np.testing.assert_allclose(dynamics.center_of_mass, [0.75, 0, 0.75], atol=1e-6)
+        self.assertEqual(dynamics.n_joint_limits, 1)
+        self.assertEqual(dynamics.n_invalid_joint_limits, 0)
+        self.assertEqual(dynamics.joint_properties['upper'][0], 1.0)
+        self.assertTrue(np.isnan(dynamics.joint_properties['damping'][0]))
+
+    def test_inertia_checks(self):
+        links = [Link("valid", inertial=Inertial(1.0, [1, 0, 0, 2, 0, 2])),
+                 Link("not_positive_definite", inertial=Inertial(1.0, [1, 0, 0, 0, 0, 1])),
+                 Link("triangle_inequality", inertial=Inertial(1.0, [1, 0, 0, 1, 0, 3]))]
+        dynamics = DynamicsMetaInformation(links, [])
+        self.assertEqual(list(dynamics.non_positive_definite), [False, True, False])
+        self.assertEqual(list(dynamics.triangle_inequality_violations), [False, False, True])
+
+    def test_primitive_inertia_mismatches(self):
+        box_inertia = [(0.2**2 + 0.3**2) * 2 / 12, 0, 0, (0.1**2 + 0.3**2) * 2 / 12, 0, (0.1**2 + 0.2**2) * 2 / 12]
+        links = [Link("box", collision_geometry=Box("0.1 0.2 0.3"), inertial=Inertial(2.0, box_inertia)),
+                 Link("sphere", collision_geometry=Sphere("0.5"), inertial=Inertial(1.0, [1, 0, 0, 1, 0, 1]))]
+        dynamics = DynamicsMetaInformation(links, [])
+        self.assertEqual(dynamics.primitive_inertia_mismatches, ["sphere"])
+
+    def test_bundled_urdf(self):
+        model_analysis = ModelAnalysis(logging.getLogger("urdf_analyzer"))
+        model_analysis.xml_urdf_reader("resources/urdf_files/adept_mobile_robots/pioneer3dx.urdf")
+        dynamics = model_analysis.get_dynamics_information()
+        self.assertAlmostEqual(dynamics.total_mass, 3.7201)
+        self.assertEqual(dynamics.n_non_positive_definite_inertias, 0)
+        self.assertIn("total_mass", dynamics.df_results_full.columns)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,85 @@
+from pathlib import Path
+import tempfile
+import unittest
+import logging
+import os
+
+from urdf_analyzer.journal import ParsingJournal
+
+
+class ParsingJournalTests(unittest.TestCase):
+
+
+    def setUp(self):
+        self.logger = logging.getLogger("urdf_analyzer")
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.journal_file = str(Path(self.tmp_dir.name, "journals", "parsing_journal.jsonl"))
+        self.urdf_files = []
+        for name in ["robot_a.urdf", "robot_b.urdf"]:
+            self.urdf_files.append(str(Path(self.tmp_dir.name, name)))
+            with open(self.urdf_files[-1], "w") as f:
+                f.write("<robot name='robot'/>")
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def _record_units(self):
+        journal = ParsingJournal(self.journal_file, self.logger)
+        journal.record(self.urdf_files[0], "yourdfpy", "full", True)
+        journal.record(self.urdf_files[1], "yourdfpy", "full", False)
+        journal.close()
+
+    def test_resume(self):
+        self._record_units()
+        journal = ParsingJournal(self.journal_file, self.logger, resume=True)
+        self.assertTrue(journal.get_result(self.urdf_files[0], "yourdfpy", "full"))
+        self.assertFalse(journal.get_result(self.urdf_files[1], "yourdfpy", "full"))
+        self.assertIsNone(journal.get_result(self.urdf_files[0], "yourdfpy", "structure"))
+        self.assertIsNone(journal.get_result(self.urdf_files[0], "pybullet", "full"))
+        journal.close()
+
+    def test_no_resume_resets_the_journal(self):
+        self._record_units()
+        journal = ParsingJournal(self.journal_file, self.logger)
+        self.assertIsNone(journal.get_result(self.urdf_files[0], "yourdfpy", "full"))
+        journal.close()
+        self.assertEqual(os.path.getsize(self.journal_file), 0)
+
+    def test_modified_file_is_not_completed(self):
+        self._record_units()
+        with open(self.urdf_files[0], "a") as f:
+            f.write("\n")
+        journal = ParsingJournal(self.journal_file, self.logger, resume=True)
+        self.assertIsNone(journal.get_result(self.urdf_files[0], "yourdfpy", "full"))
+        self.assertFalse(journal.get_result(self.urdf_files[1], "yourdfpy", "full"))
+        journal.close()
+
+    def test_interrupted_write(self):
+        self._record_units()
+        # the process was killed while writing the third unit
+        with open(self.journal_file, "ab") as f:
+            f.write(b'{"file": "robot_c.urdf", "sign')
+        journal = ParsingJournal(self.journal_file, self.logger, resume=True)
+        self.assertEqual(len(journal.completed), 2)
+        journal.record(self.urdf_files[0], "pybullet", "full", True)
+        journal.close()
+
+        journal = ParsingJournal(self.journal_file, self.logger, resume=True)
+        self.assertEqual(len(journal.completed), 3)
+        self.assertTrue(journal.get_result(self.urdf_files[0], "pybullet", "full"))
+        journal.close()
+
+    def test_corrupted_line(self):
+        self._record_units()
+        with open(self.journal_file, "rb") as f:
+            lines = f.read().splitlines(keepends=True)
+        with open(self.journal_file, "wb") as f:
+            f.write(lines[0].replace(b"true", b"fals") + lines[1])
+        journal = ParsingJournal(self.journal_file, self.logger, resume=True)
+        self.assertIsNone(journal.get_result(self.urdf_files[0], "yourdfpy", "full"))
+        self.assertFalse(journal.get_result(self.urdf_files[1], "yourdfpy", "full"))
+        journal.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,150 @@
+import unittest
+import tempfile
+import logging
+import os
+
+import numpy as np
+
+import urdf_analyzer.mesh_analysis as mesh_analysis
+from urdf_analyzer.mesh_analysis import get_mesh_statistics, get_mesh_bounds, get_mesh_validity, scale_mesh_statistics, triangulate_polygons
+from urdf_analyzer.model_analysis import ModelAnalysis
+
+
+MESHES_DIR = "resources/urdf_files/adept_mobile_robots/meshes/pioneer-lx"
+
+# a unit square in the xy plane (a quad and two triangles of a polylist), and a triangle of <polygons>, of a geometry instanced
+# twice: translated, and rotated by 90 degrees around z and scaled by 2. The unit is millimeters.
+COLLADA_FILE = """<?xml version="1.0" encoding="utf-8"?>
+<COLLADA xmlns="http://www.collada.org/2005/11/COLLADASchema" version="1.4.1">
+  <asset><unit name="millimeter" meter="0.001"/></asset>
+  <library_animations><animation><source id="time"><float_array id="time-array" count="2">0 1</float_array></source></animation></library_animations>
+  <library_geometries>
+    <geometry id="square-mesh">
+      <mesh>
+        <source id="square-positions">
+          <float_array id="square-positions-array" count="15">0 0 0 1 0 0 1 1 0 0 1 0 0 0 1</float_array>
+          <technique_common><accessor source="#square-positions-array" count="5" stride="3"/></technique_common>
+        </source>
+        <source id="square-normals">
+          <float_array id="square-normals-array" count="3">0 0 1</float_array>
+          <technique_common><accessor source="#square-normals-array" count="1" stride="3"/></technique_common>
+        </source>
+        <vertices id="square-vertices"><input semantic="POSITION" source="#square-positions"/></vertices>
+        <polylist count="3">
+          <input semantic="VERTEX" source="#square-vertices" offset="0"/>
+          <input semantic="NORMAL" source="#square-normals" offset="1"/>
+          <vcount>4 3 3</vcount>
+          <p>0 0 1 0 2 0 3 0 0 0 1 0 2 0 0 0 2 0 3 0</p>
+        </polylist>
+        <polygons count="1">
+          <input semantic="VERTEX" source="#square-vertices" offset="0"/>
+          <p>0 1 4</p>
+        </polygons>
+      </mesh>
+    </geometry>
+  </library_geometries>
+  <library_visual_scenes>
+    <visual_scene id="Scene">
+      <node id="translated"><translate>10 0 0</translate><instance_geometry url="#square-mesh"/></node>
+      <node id="rotated"><rotate>0 0 1 90</rotate><node id="scaled"><scale>2 2 2</scale><instance_geometry url="#square-mesh"/></node></node>
+    </visual_scene>
+  </library_visual_scenes>
+</COLLADA>
+"""
+
+
+class MeshAnalysisTests(unittest.TestCase):
+
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def _write(self, name: str, content: str):
+        filename = os.path.join(self.tmp_dir.name, name)
+        with open(filename, "w") as f:
+            f.write(content)
+        return filename
+
+    def test_triangulate_polygons(self):
+        triangles = triangulate_polygons(np.array([5, 6, 7, 8, 1, 2, 3, 9, 9]), [4, 3, 2])
+        np.testing.assert_array_equal(triangles, [[5, 6, 7], [5, 7, 8], [1, 2, 3]])
+
+    def test_collada_statistics(self):
+        filename = self._write("square.dae", COLLADA_FILE)
+        # the numbers are split between the text chunks received from the parser
+        for buffer_size in [2**20, 5]:
+            with self.subTest(buffer_size=buffer_size):
+                mesh_analysis._ColladaReader.buffer_size = buffer_size
+                try:
+                    statistics = mesh_analysis.read_dae_statistics(filename)
+                finally:
+                    mesh_analysis._ColladaReader.buffer_size = 2**20
+                # the square (4 triangles) and the vertical triangle, twice
+                self.assertEqual(statistics["n_triangles"], 10)
+                np.testing.assert_allclose(statistics["aabb_min"], [-0.002, 0, 0], atol=1e-12)
+                np.testing.assert_allclose(statistics["aabb_max"], [0.011, 0.002, 0.002], atol=1e-12)
+                self.assertAlmostEqual(statistics["surface_area"], (1 + 1 + 0.5) * 1e-6 * (1 + 4))
+
+    def test_obj_statistics(self):
+        filename = self._write("square.obj", "# a unit square and a vertical triangle\no square\nv 0 0 0\nv 1 0 0\nv 1 1 0\nv 0 1 0\n"
+                                             "vn 0 0 1\nf 1//1 2//1 3//1 4//1\nv 0 0 2\nf -5/1/1 -4/1/1 -1/1/1\n")
+        for chunk_size in [2**16, 1]:
+            with self.subTest(chunk_size=chunk_size):
+                mesh_analysis.mesh_chunk_size = chunk_size
+                try:
+                    statistics = mesh_analysis.read_obj_statistics(filename)
+                finally:
+                    mesh_analysis.mesh_chunk_size = 2**16
+                self.assertEqual(statistics["n_triangles"], 3)
+                np.testing.assert_allclose(statistics["aabb_min"], [0, 0, 0])
+                np.testing.assert_allclose(statistics["aabb_max"], [1, 1, 2])
+                self.assertAlmostEqual(statistics["surface_area"], 2)
+
+    def test_invalid_meshes(self):
+        self.assertIsNone(get_mesh_statistics(self._write("broken.dae", COLLADA_FILE[:-200])))
+        self.assertIsNone(get_mesh_statistics(self._write("broken.obj", "v 0 0 0\nv 1 0 0\nf 1 2 3\n")))
+        self.assertIsNone(get_mesh_statistics(self._write("mesh.ply", "ply\n")))
+        self.assertEqual(get_mesh_statistics(self._write("empty.obj", "# empty\n"))["n_triangles"], 0)
+        self.assertIsNone(get_mesh_bounds(os.path.join(self.tmp_dir.name, "empty.obj")))
+        validity = get_mesh_validity(["broken.dae", "square.dae", "missing.obj"], self.tmp_dir.name)
+        self.assertEqual(validity, {"n_meshes": 3, "n_missing_meshes": 2, "n_unreadable_meshes": 1})
+
+    def test_bundled_collada_meshes(self):
+        # the Collada and STL exports of the same plinth
+        dae_statistics = get_mesh_statistics(os.path.join(MESHES_DIR, "pioneer-lx-plinth.dae"))
+        stl_statistics = get_mesh_statistics(os.path.join(MESHES_DIR, "pioneer-lx-plinth.stl"))
+        self.assertEqual(dae_statistics["n_triangles"], stl_statistics["n_triangles"])
+        np.testing.assert_allclose(dae_statistics["aabb_min"], stl_statistics["aabb_min"], atol=1e-3)
+        np.testing.assert_allclose(dae_statistics["aabb_max"], stl_statistics["aabb_max"], atol=1e-3)
+        self.assertAlmostEqual(dae_statistics["surface_area"], stl_statistics["surface_area"], delta=1)
+        # the hull is translated by its node
+        hull_bounds = get_mesh_bounds(os.path.join(MESHES_DIR, "pioneer-lx_hull.dae"))
+        np.testing.assert_allclose(hull_bounds[0], get_mesh_bounds(os.path.join(MESHES_DIR, "pioneer-lx_hull.stl"))[0], atol=1e-3)
+
+    def test_scale_mesh_statistics(self):
+        statistics = {"n_triangles": 2, "aabb_min": np.array([-1.0, 0, 0]), "aabb_max": np.array([1.0, 2, 0]), "surface_area": 4.0}
+        scaled = scale_mesh_statistics(statistics, [-2, 2, 2])
+        np.testing.assert_allclose(scaled["aabb_min"], [-2, 0, 0])
+        np.testing.assert_allclose(scaled["aabb_max"], [2, 4, 0])
+        self.assertEqual(scaled["surface_area"], 16.0)
+        self.assertIsNone(scale_mesh_statistics(statistics, [1, 2, 1])["surface_area"])
+
+    def test_link_mesh_statistics(self):
+        model_analysis = ModelAnalysis(logging.getLogger("urdf_analyzer"))
+        model_analysis.xml_urdf_reader("resources/urdf_files/adept_mobile_robots/pioneer-lx-devil.urdf")
+        self.assertNotIn("mesh_statistics", model_analysis.get_link_information().df_columns_full)
+        links_information = model_analysis.get_link_information(mesh_statistics=True)
+        mesh_statistics = {k: v for d in links_information.df_results_full.loc[0, "mesh_statistics"] for k, v in d.items()}
+        # the visual mesh of the base link does not exist, and the plinth mesh is scaled to meters
+        self.assertIsNone(mesh_statistics["base_link_visual"])
+        self.assertEqual(mesh_statistics["plinth_visual"]["n_triangles"], 12)
+        self.assertEqual(mesh_statistics["plinth_visual"]["aabb_max"], [0.265872, 0.114914, 0.916691])
+        plinth = next(l for l in links_information.links if l.name == "plinth")
+        self.assertAlmostEqual(plinth.visual_geometry.statistics["surface_area"], 0.917977, places=6)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,116 @@
+from pathlib import Path
+import concurrent.futures
+import tempfile
+import unittest
+import logging
+import shutil
+import os
+
+from urdf_analyzer.model_cache import ModelInformationCache
+from urdf_analyzer import api
+
+
+class ModelInformationCacheTests(unittest.TestCase):
+
+
+    @classmethod
+    def setUpClass(self):
+        """
+        Runs when class is loaded.
+        """
+        logging.basicConfig(level=logging.ERROR)
+        self.urdf_file = "./resources/urdf_files/adept_mobile_robots/pioneer3dx.urdf"
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.tmp_urdf_file = str(Path(self.tmp_dir.name, "pioneer3dx.urdf"))
+        shutil.copy(self.urdf_file, self.tmp_urdf_file)
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_get_model_information_cached(self):
+        cache = ModelInformationCache()
+        kwargs = {'joints': True, 'links': True}
+        urdf_information = api.get_model_information(self.tmp_urdf_file, cache=cache, **kwargs)
+        cached_information = api.get_model_information(self.tmp_urdf_file, cache=cache, **kwargs)
+        self.assertEqual(cached_information.joint_information.n_joints, 10)
+        self.assertIs(cached_information.joint_information, urdf_information.joint_information)
+        self.assertIsNot(cached_information, urdf_information)
+        # the XML tree is reused for other options
+        api.get_model_information(self.tmp_urdf_file, cache=cache, joints=True, dynamics=True)
+        statistics = cache.get_statistics()
+        self.assertEqual((statistics["n_information_hits"], statistics["n_information_misses"]), (1, 2))
+        self.assertEqual((statistics["n_root_hits"], statistics["n_root_misses"]), (1, 1))
+        self.assertEqual(statistics["n_entries"], 3)
+
+    def test_modified_file(self):
+        cache = ModelInformationCache()
+        api.get_model_information(self.tmp_urdf_file, cache=cache, joints=True)
+        # a file without joints, replacing the entries of the previous version
+        with open(self.tmp_urdf_file, "w") as f:
+            f.write('<robot name="r"><link name="base_link"/></robot>')
+        os.utime(self.tmp_urdf_file, ns=(0, 0))
+        urdf_information = api.get_model_information(self.tmp_urdf_file, cache=cache, joints=True)
+        self.assertEqual(urdf_information.joint_information.n_joints, 0)
+        self.assertEqual(cache.get_statistics()["n_entries"], 2)
+
+    def test_invalidate(self):
+        cache = ModelInformationCache()
+        api.get_model_information(self.tmp_urdf_file, cache=cache, joints=True)
+        self.assertEqual(cache.invalidate(self.tmp_urdf_file), 2)
+        self.assertEqual(cache.get_statistics()["n_bytes"], 0)
+        api.get_model_information(self.tmp_urdf_file, cache=cache, joints=True)
+        self.assertEqual(cache.get_statistics()["n_information_misses"], 2)
+
+    def test_eviction_by_bytes(self):
+        cache = ModelInformationCache(max_bytes=100)
+        file_key = cache.get_file_key(self.tmp_urdf_file)
+        cache.put(("a", *file_key), "a", 60)
+        cache.put(("b", *file_key), "b", 30)
+        cache.get(("a", *file_key)) # b is now the least recently used
+        cache.put(("c", *file_key), "c", 30)
+        self.assertIsNone(cache.get(("b", *file_key)))
+        self.assertEqual(cache.get(("a", *file_key)), "a")
+        cache.put(("d", *file_key), "d", 101) # larger than the cache
+        self.assertEqual(cache.get_statistics()["n_bytes"], 90)
+        self.assertEqual(cache.get_statistics()["n_evictions"], 1)
+
+    def test_threads(self):
+        cache = ModelInformationCache(max_bytes=1000)
+        file_key = cache.get_file_key(self.tmp_urdf_file)
+        def use_cache(i):
+            key = (f"kind{i % 8}", *file_key, i % 50)
+            if cache.get(key) is None:
+                cache.put(key, i, 10 + i % 7)
+        with concurrent.futures.ThreadPoolExecutor(8) as executor:
+            list(executor.map(use_cache, range(5000)))
+        statistics = cache.get_statistics()
+        self.assertLessEqual(statistics["n_bytes"], 1000)
+        self.assertEqual(statistics["n_bytes"], sum(n_bytes for _, n_bytes in cache.entries.values()))
+        self.assertEqual(sum(v for k, v in statistics.items() if k.endswith("_hits") or k.endswith("_misses")), 5000)
+
+    def test_concurrent_misses_keep_working_directory(self):
+        # copies in other directories, such that the misses read files relative to different directories
+        urdf_files = []
+        for i in range(8):
+            os.makedirs(Path(self.tmp_dir.name, f"robot{i}"))
+            urdf_files.append(str(Path(self.tmp_dir.name, f"robot{i}", "pioneer3dx.urdf")))
+            shutil.copy(self.urdf_file, urdf_files[-1])
+        cwd = os.getcwd()
+        def get_model_information(filename):
+            # the working directory is also checked while the other threads are reading their files
+            return api.get_model_information(filename, cache=cache, joints=True, links=True), os.getcwd()
+        for _ in range(20):
+            cache = ModelInformationCache()
+            with concurrent.futures.ThreadPoolExecutor(8) as executor:
+                results, working_dirs = zip(*executor.map(get_model_information, urdf_files * 4))
+            self.assertEqual(set(working_dirs), {cwd})
+            self.assertEqual(os.getcwd(), cwd)
+            self.assertTrue(all(r.joint_information.n_joints == results[0].joint_information.n_joints for r in results))
+        # relative filenames are still read relative to the working directory
+        self.assertIsNotNone(api.get_model_information(self.urdf_file, cache=ModelInformationCache(), joints=True).joint_information)
+
+
+if __name__ == '__main__':
+    unittest.main()
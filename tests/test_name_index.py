@@ -0,0 +1,74 @@
+from pathlib import Path
+import tempfile
+import unittest
+import logging
+import shutil
+import os
+
+from urdf_analyzer import api
+from urdf_analyzer.name_index import URDFNameIndex
+
+
+class NameIndexTests(unittest.TestCase):
+
+
+    def setUp(self):
+        self.logger = logging.getLogger("urdf_analyzer")
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        shutil.copytree("resources/urdf_files", Path(self.tmp_dir.name, "urdf_files"))
+        self.urdf_files = api.search_for_urdfs(Path(self.tmp_dir.name, "urdf_files"))
+        self.index_file = str(Path(self.tmp_dir.name, "name_index.sqlite"))
+        api.generate_name_index_schema(self.urdf_files, self.index_file, n_workers=1)
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_glob_search(self):
+        results = api.search_names("*_wheel_joint", self.index_file, kinds=["joint"])
+        self.assertIn("left_wheel_joint", list(results["name"]))
+        self.assertTrue(all(name.endswith("_wheel_joint") for name in results["name"]))
+        self.assertEqual(set(results["kind"]), {"joint"})
+
+    def test_substring_search(self):
+        results = api.search_names("BASE_LINK", self.index_file, kinds=["link"])
+        self.assertEqual(len(results[results["name"] == "base_link"]), len(self.urdf_files))
+        self.assertIn("ptu_base_link", list(results["name"]))
+        # the literal parts of the pattern are too short for the trigrams
+        self.assertEqual(set(api.search_names("b?se_link", self.index_file, kinds=["link"])["name"]), {"base_link"})
+
+    def test_fuzzy_search(self):
+        results = api.search_names("left_wheel_jiont", self.index_file, kinds=["joint"], fuzzy=True)
+        self.assertEqual(results.loc[0, "name"], "left_wheel_joint")
+        self.assertTrue(results["similarity"].is_monotonic_decreasing)
+
+    def test_mesh_search(self):
+        results = api.search_names("*.stl", self.index_file, kinds=["mesh"])
+        self.assertGreater(len(results), 0)
+
+    def test_incremental_update(self):
+        name_index = URDFNameIndex(self.index_file, self.logger)
+        self.assertEqual(name_index.get_changed_files(self.urdf_files), [])
+        name_index.close()
+
+        # rename a joint of one file, and remove another file
+        modified_file = [f for f in self.urdf_files if f.name == "pioneer3dx.urdf"][0]
+        modified_file.write_text(modified_file.read_text().replace("left_wheel_joint", "left_drive_joint"))
+        removed_file = [f for f in self.urdf_files if f.name == "pioneer3at.urdf"][0]
+        os.remove(removed_file)
+        urdf_files = api.search_for_urdfs(Path(self.tmp_dir.name, "urdf_files"))
+        name_index = URDFNameIndex(self.index_file, self.logger)
+        self.assertEqual(name_index.get_changed_files(urdf_files), [modified_file])
+        name_index.close()
+
+        api.generate_name_index_schema(urdf_files, self.index_file, n_workers=1)
+        self.assertEqual(list(api.search_names("left_drive_joint", self.index_file)["path"]), [modified_file.absolute().as_posix()])
+        self.assertEqual(len(api.search_names("left_wheel_joint", self.index_file)), 0)
+        self.assertEqual(len(api.search_names("p3at_", self.index_file)), 0)
+
+    def test_missing_index(self):
+        with self.assertRaises(FileNotFoundError):
+            api.search_names("base_link", str(Path(self.tmp_dir.name, "missing.sqlite")))
+
+
+if __name__ == '__main__':
+    unittest.main()
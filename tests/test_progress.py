@@ -0,0 +1,69 @@
+import unittest
+import json
+import io
+
+from urdf_analyzer.api import generate_dataset_statistics_schema, search_for_urdfs
+from urdf_analyzer.progress import ProgressReporter
+
+
+class ProgressTests(unittest.TestCase):
+
+
+    def _get_events(self, stream):
+        return [json.loads(line) for line in stream.getvalue().splitlines()]
+
+    def test_json_progress(self):
+        stream = io.StringIO()
+        progress = ProgressReporter("json", stream, interval=0)
+        progress.start_stage("parsing:yourdfpy", 3)
+        progress.update()
+        progress.update(2, failed=1)
+        progress.start_stage("parsing:urdfpy", 1)
+        progress.update()
+        progress.close()
+        events = self._get_events(stream)
+        self.assertEqual([e["event"] for e in events], ["progress", "progress", "stage_finished", "progress", "stage_finished", "run_finished"])
+        self.assertEqual(events[2]["done"], 3)
+        self.assertEqual(events[2]["failed"], 1)
+        self.assertEqual(events[2]["eta_s"], 0)
+        self.assertEqual([s["stage"] for s in events[-1]["stages"]], ["parsing:yourdfpy", "parsing:urdfpy"])
+
+    def test_interval(self):
+        stream = io.StringIO()
+        progress = ProgressReporter("json", stream, interval=3600)
+        progress.start_stage("model-info", 1000)
+        for _ in range(1000):
+            progress.update()
+        progress.finish_stage()
+        self.assertEqual([e["event"] for e in self._get_events(stream)], ["stage_finished"])
+
+    def test_tty_progress(self):
+        stream = io.StringIO()
+        progress = ProgressReporter("tty", stream, interval=0)
+        progress.start_stage("validation", 2)
+        progress.update()
+        progress.update()
+        progress.close()
+        # the status line is rewritten, and ended when the stage is finished
+        lines = stream.getvalue().split("\r")[1:]
+        self.assertTrue(lines[0].startswith("validation: 1/2 files (50%)"))
+        self.assertTrue(lines[2].startswith("validation: 2/2 files (100%)"))
+        self.assertTrue(lines[2].endswith("\n"))
+
+    def test_unknown_mode(self):
+        with self.assertRaises(ValueError):
+            ProgressReporter("unknown")
+
+    def test_progress_of_workers(self):
+        urdf_files = search_for_urdfs("resources/urdf_files")
+        stream = io.StringIO()
+        progress = ProgressReporter("json", stream, interval=0)
+        generate_dataset_statistics_schema(urdf_files, out=False, n_workers=2, progress=progress)
+        progress.close()
+        finished = [e for e in self._get_events(stream) if e["event"] == "stage_finished"]
+        self.assertEqual(finished[0]["done"], len(urdf_files))
+        self.assertEqual(finished[0]["total"], len(urdf_files))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,87 @@
+from pathlib import Path
+import tempfile
+import unittest
+import shutil
+
+import pandas as pd
+
+from urdf_analyzer import api
+from urdf_analyzer.sampling import URDFSample
+
+
+class SamplingTests(unittest.TestCase):
+
+
+    def setUp(self):
+        # a dataset of 3 sources with 8, 4 and 4 files
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        urdf_files = api.search_for_urdfs("resources/urdf_files")
+        for source, n_copies in [("source_a", 2), ("source_b", 1), ("source_c", 1)]:
+            Path(self.tmp_dir.name, source).mkdir()
+            for i in range(n_copies):
+                for urdf_file in urdf_files:
+                    shutil.copy(urdf_file, Path(self.tmp_dir.name, source, f"{i}_{urdf_file.name}"))
+        self.urdf_files = api.search_for_urdfs(self.tmp_dir.name)
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_reproducible_sample(self):
+        sample = URDFSample(self.urdf_files, n=8, root_dir=self.tmp_dir.name)
+        self.assertEqual(len(sample.files), 8)
+        self.assertEqual(sample.stratum_sizes, {"source_a": 8, "source_b": 4, "source_c": 4})
+        # proportional allocation
+        self.assertEqual(sorted(sample.stratum_of_file.values()), ["source_a"] * 4 + ["source_b"] * 2 + ["source_c"] * 2)
+        reversed_sample = URDFSample(list(reversed(self.urdf_files)), n=8, root_dir=self.tmp_dir.name)
+        self.assertEqual(set(sample.files), set(reversed_sample.files))
+        other_seed_sample = URDFSample(self.urdf_files, n=8, seed=1, root_dir=self.tmp_dir.name)
+        self.assertNotEqual(set(sample.files), set(other_seed_sample.files))
+
+    def test_allocation(self):
+        self.assertEqual(URDFSample._allocate({"a": 100, "b": 1, "c": 1}, 3), {"a": 1, "b": 1, "c": 1})
+        self.assertEqual(URDFSample._allocate({"a": 2, "b": 50}, 30), {"a": 2, "b": 28})
+        self.assertEqual(URDFSample._allocate({"a": 1, "b": 3, "c": 50}, 6), {"a": 1, "b": 2, "c": 3})
+        self.assertEqual(URDFSample._allocate({"a": 5, "b": 5, "c": 5}, 5), {"a": 2, "b": 2, "c": 1})
+        self.assertEqual(sum(URDFSample._allocate({"a": 5, "b": 5, "c": 5}, 2).values()), 2)
+
+    def test_size_strata(self):
+        sample = URDFSample(self.urdf_files, fraction=0.5, strata="size")
+        self.assertEqual(len(sample.files), 8)
+        self.assertTrue(all(h.startswith("size<") for h in sample.stratum_sizes))
+
+    def test_invalid_sample(self):
+        for kwargs in [{}, {"n": 2, "fraction": 0.5}, {"n": 0}, {"fraction": 1.5}, {"n": 2, "strata": "unknown"}]:
+            with self.assertRaises(ValueError):
+                URDFSample(self.urdf_files, **kwargs)
+
+    def test_estimates(self):
+        sample = URDFSample(self.urdf_files, n=8, root_dir=self.tmp_dir.name)
+        results = pd.DataFrame({"passed": [True, False] * 4, "n_joints": [1, 3] * 4, "name": ["a"] * 8}, index=sample.files)
+        estimates = sample.get_estimates(results).set_index("statistic")
+        self.assertEqual(list(estimates.index), ["fraction_passed", "mean_n_joints"])
+        self.assertAlmostEqual(estimates.loc["fraction_passed", "estimate"], 0.5)
+        self.assertAlmostEqual(estimates.loc["mean_n_joints", "estimate"], 2)
+        self.assertGreater(estimates.loc["mean_n_joints", "standard_error"], 0)
+        self.assertGreaterEqual(estimates.loc["fraction_passed", "ci_low"], 0)
+        self.assertEqual(estimates.loc["mean_n_joints", "n_population"], 16)
+
+    def test_single_file_strata_have_error(self):
+        # one file per source, where the variance of each stratum is estimated from all of the sampled files
+        sample = URDFSample(self.urdf_files, n=3, root_dir=self.tmp_dir.name)
+        self.assertEqual(len(sample.files), 3)
+        results = pd.DataFrame({"passed": [True, False, True], "n_joints": [1, 3, 8]}, index=sample.files)
+        estimates = sample.get_estimates(results).set_index("statistic")
+        for statistic in ["fraction_passed", "mean_n_joints"]:
+            self.assertGreater(estimates.loc[statistic, "standard_error"], 0)
+            self.assertLess(estimates.loc[statistic, "ci_low"], estimates.loc[statistic, "ci_high"])
+
+    def test_census_has_no_error(self):
+        sample = URDFSample(self.urdf_files, fraction=1.0, root_dir=self.tmp_dir.name)
+        results = pd.DataFrame({"n_joints": range(16)}, index=sample.files)
+        estimates = sample.get_estimates(results)
+        self.assertAlmostEqual(estimates.loc[0, "estimate"], 7.5)
+        self.assertEqual(estimates.loc[0, "standard_error"], 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
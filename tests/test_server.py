@@ -0,0 +1,105 @@
+from pathlib import Path
+import concurrent.futures
+import threading
+import tempfile
+import unittest
+import logging
+import xml.etree.ElementTree as ET
+import shutil
+import sys
+import os
+
+from urdf_analyzer.server import AnalysisService, create_server
+from urdf_analyzer.client import send_request
+from urdf_analyzer.urdf_parser import URDFparser
+
+
+class AnalysisServerTests(unittest.TestCase):
+
+
+    def setUp(self):
+        self.urdf_file = str(Path("resources/urdf_files/adept_mobile_robots/pioneer3at.urdf").absolute())
+        self.service = AnalysisService(logging.getLogger("urdf_analyzer"), max_concurrency=2)
+
+    def tearDown(self):
+        self.service.close()
+
+    def _start(self, **kwargs):
+        server = create_server(self.service, port=0, **kwargs)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        self.addCleanup(server.server_close)
+        self.addCleanup(server.shutdown)
+        return server
+
+    def test_requests(self):
+        server = self._start()
+        address = f"http://127.0.0.1:{server.server_address[1]}"
+
+        status, health = send_request(address, "/health")
+        self.assertEqual((status, health["status"]), (200, "ok"))
+
+        status, information = send_request(address, "/model-information", {"filename": self.urdf_file})
+        self.assertEqual(status, 200)
+        self.assertEqual((information["n_joints"], information["n_links"]), (15, 16))
+
+        status, information = send_request(address, "/validate", {"filename": self.urdf_file, "rules": ["unique-names"]})
+        self.assertEqual((status, information["filename"]), (200, self.urdf_file))
+
+        self.assertEqual(send_request(address, "/model-information", {"filename": "non_existing.urdf"})[0], 400)
+        self.assertEqual(send_request(address, "/unknown", {"filename": self.urdf_file})[0], 404)
+
+        status, metrics = send_request(address, "/metrics")
+        self.assertEqual((metrics["n_requests"], metrics["n_errors"], metrics["in_flight"]), (3, 1, 0))
+        self.assertEqual(metrics["endpoints"]["model-information"]["n_requests"], 2)
+
+    def test_concurrency_limit(self):
+        server = self._start()
+        address = f"http://127.0.0.1:{server.server_address[1]}"
+        # the requests being handled are simulated by taking the slots of the daemon
+        for _ in range(self.service.max_concurrency):
+            self.assertTrue(self.service.try_acquire())
+        self.assertEqual(send_request(address, "/model-information", {"filename": self.urdf_file})[0], 503)
+        self.service.release("model-information", 0.0, False)
+        self.assertEqual(send_request(address, "/model-information", {"filename": self.urdf_file})[0], 200)
+        self.assertEqual(send_request(address, "/metrics")[1]["n_rejected"], 1)
+
+    @staticmethod
+    def _create_etree_parser(name: str):
+        # the Python parsers are not necessarily installed, so a parser loading the files with ElementTree stands in for them
+        tool_parser = URDFparser("check_urdf", logging.getLogger("urdf_analyzer"))
+        tool_parser.parser = {name: ET}
+        tool_parser.urdf_loader = lambda filename: ET.parse(filename).getroot()
+        return tool_parser
+
+    def test_concurrent_parsers_keep_working_directory(self):
+        # two parsers with their own locks, such that their loads overlap
+        for parser in ["yourdfpy", "urdfpy"]:
+            self.service.parsers[parser], self.service.parser_locks[parser] = self._create_etree_parser(parser), threading.Lock()
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            urdf_files = []
+            for i in range(4):
+                os.makedirs(Path(tmp_dir, f"robot{i}"))
+                urdf_files.append(str(Path(tmp_dir, f"robot{i}", "pioneer3at.urdf")))
+                shutil.copy(self.urdf_file, urdf_files[-1])
+            cwd = os.getcwd()
+            def parse(i):
+                self.service.handle("parsing-information", {"filename": urdf_files[i % 4], "parser": ["yourdfpy", "urdfpy"][i % 2]})
+                return os.getcwd()
+            with concurrent.futures.ThreadPoolExecutor(8) as executor:
+                working_dirs = set(executor.map(parse, range(400)))
+            self.assertEqual(working_dirs, {cwd})
+            self.assertEqual(os.getcwd(), cwd)
+
+    @unittest.skipIf(sys.platform.startswith("win"), "Unix sockets require a POSIX system.")
+    def test_unix_socket(self):
+        tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp_dir.cleanup)
+        socket_file = str(Path(tmp_dir.name, "urdf_analyzer.sock"))
+        self._start(unix_socket=socket_file)
+        status, information = send_request(f"unix://{socket_file}", "/model-information", {"filename": self.urdf_file, "dynamics": True})
+        self.assertEqual((status, information["n_joints"]), (200, 15))
+        self.assertIn("total_mass", information)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,80 @@
+from pathlib import Path
+import tempfile
+import unittest
+import logging
+
+import pandas as pd
+
+from urdf_analyzer import api
+from urdf_analyzer.urdf_parser import URDFparser
+
+
+class ShardingTests(unittest.TestCase):
+
+
+    def setUp(self):
+        logging.basicConfig(level=logging.ERROR)
+        self.urdf_search_dir = "resources/urdf_files"
+        self.urdf_files = api.search_for_urdfs(self.urdf_search_dir)
+        self.tmp_dir = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_parse_shard(self):
+        self.assertEqual(api.parse_shard("2/4"), (2, 4))
+        for shard in ["0/4", "5/4", "1", "a/b"]:
+            with self.assertRaises(ValueError):
+                api.parse_shard(shard)
+
+    def test_shards_partition_the_files(self):
+        n_shards = 3
+        shards = [api.shard_urdf_files(self.urdf_files, (i, n_shards), self.urdf_search_dir) for i in range(1, n_shards + 1)]
+        self.assertEqual(sorted(f for shard in shards for f in shard), sorted(self.urdf_files))
+        # the partition only depends on the paths relative to the search directory
+        moved_files = [Path("/data", f.relative_to(self.urdf_search_dir)) for f in reversed(self.urdf_files)]
+        moved_shard = api.shard_urdf_files(moved_files, (1, n_shards), "/data")
+        self.assertEqual(sorted(f.relative_to("/data") for f in moved_shard), sorted(f.relative_to(self.urdf_search_dir) for f in shards[0]))
+
+    def _create_parsing_results(self, urdf_files):
+        # the results of the parsers are given by the index of the file, such that each parser passes a different subset
+        parsers = URDFparser.supported_parsers
+        records = {f: {p: (i + j) % 3 != 0 for j, p in enumerate(parsers)} for i, f in enumerate(urdf_files)}
+        parsing_results = pd.DataFrame.from_dict(records, orient='index', columns=parsers)
+        parsing_results['count'] = parsing_results.sum(axis=1)
+        return parsing_results
+
+    def test_merge_tool_comparison_schemas(self):
+        urdf_files = [str(f) for f in self.urdf_files]
+        parsing_results = self._create_parsing_results(urdf_files)
+        tool_cmp_results = api.generate_tool_comparison_schema(urdf_files, parsing_results.copy(), out=False)
+
+        partial_files = []
+        for i in range(1, 3):
+            shard_files = api.shard_urdf_files(urdf_files, (i, 2), self.urdf_search_dir)
+            partial_file = str(Path(self.tmp_dir.name, f"tool_comparison_schema_shard-{i}-of-2.csv"))
+            api.generate_tool_comparison_schema(shard_files, parsing_results.loc[shard_files].copy(), out=partial_file, partial=True)
+            partial_files.append(partial_file)
+
+        merged_results = api.merge_schemas('tool-cmp', partial_files, out=False)
+        self.assertTrue(merged_results.equals(tool_cmp_results))
+
+    def test_merge_urdf_parsing_comparison_schemas(self):
+        parsing_results = self._create_parsing_results([str(f) for f in self.urdf_files])
+        partial_files = []
+        for i, partial_results in enumerate([parsing_results.iloc[:2], parsing_results.iloc[2:]]):
+            partial_file = str(Path(self.tmp_dir.name, f"urdf_parsing_comparison_schema_shard-{i + 1}-of-2.csv"))
+            # the count of the partial schemas is not used
+            api._save_information(partial_results.assign(count=0), partial_file)
+            partial_files.append(partial_file)
+
+        merged_results = api.merge_schemas('urdf-parse-cmp', partial_files, out=False)
+        self.assertEqual(list(merged_results['count']), list(parsing_results['count']))
+
+    def test_merge_unknown_schema(self):
+        with self.assertRaises(ValueError):
+            api.merge_schemas('duplicates-cmp', [], out=False)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,50 @@
+import unittest
+import logging
+
+from urdf_analyzer.model_analysis import ModelAnalysis
+from urdf_analyzer.urdf_components.topology import TopologyMetaInformation
+from urdf_analyzer.urdf_components.joint import Joint
+
+
+class TopologyTests(unittest.TestCase):
+
+
+    def test_branching_tree(self):
+        # base -> torso -> (left_arm -> left_hand, right_arm -> right_hand, head)
+        joints = [Joint("base_torso", "prismatic", "base", "torso"),
+                  Joint("torso_left_arm", "revolute", "torso", "left_arm"),
+                  Joint("left_arm_hand", "revolute", "left_arm", "left_hand"),
+                  Joint("torso_right_arm", "revolute", "torso", "right_arm"),
+                  Joint("right_arm_hand", "revolute", "right_arm", "right_hand", mimic="left_arm_hand"),
+                  Joint("torso_head", "fixed", "torso", "head")]
+        topology = TopologyMetaInformation(joints)
+        self.assertEqual(topology.actuated_dof, 4)
+        self.assertEqual(topology.tree_depth, 3)
+        self.assertEqual(topology.n_leaves, 3)
+        self.assertEqual(topology.max_branching_factor, 3)
+        self.assertEqual(topology.mean_branching_factor, 1.5)
+        self.assertEqual(topology.longest_serial_chain, 2)
+        self.assertCountEqual(topology.kinematic_chains, [["base", "torso", "left_arm", "left_hand"],
+                                                          ["base", "torso", "right_arm", "right_hand"],
+                                                          ["base", "torso", "head"]])
+
+    def test_serial_chain(self):
+        joints = [Joint(f"joint_{i}", "continuous", f"link_{i}", f"link_{i+1}") for i in range(100)]
+        topology = TopologyMetaInformation(joints)
+        self.assertEqual(topology.actuated_dof, 100)
+        self.assertEqual(topology.tree_depth, 100)
+        self.assertEqual(topology.longest_serial_chain, 100)
+        self.assertEqual(topology.n_leaves, 1)
+        self.assertEqual(len(topology.kinematic_chains[0]), 101)
+
+    def test_model_information(self):
+        model_analysis = ModelAnalysis(logging.getLogger("urdf_analyzer"))
+        model_analysis.xml_urdf_reader("resources/urdf_files/adept_mobile_robots/pioneer3at.urdf")
+        topology = model_analysis.get_topology_information()
+        self.assertEqual(topology.df_results.shape, (1, 3))
+        self.assertEqual(topology.df_results_full.shape, (1, 7))
+        self.assertEqual(topology.n_leaves, len(topology.kinematic_chains))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,69 @@
+import xml.etree.ElementTree as ET
+import unittest
+import logging
+import copy
+
+from urdf_analyzer.urdf_diff import URDFDiff
+
+
+class URDFDiffTests(unittest.TestCase):
+
+
+    @classmethod
+    def setUpClass(self):
+        """
+        Runs when class is loaded.
+        """
+        logging.basicConfig(level=logging.ERROR)
+        self.urdf_diff = URDFDiff(logging.getLogger("urdf_analyzer"))
+        self.root = ET.parse("resources/urdf_files/adept_mobile_robots/pioneer3dx.urdf").getroot()
+
+    def _changes(self, root):
+        return sorted((c.change_type, c.element, c.name) for c in self.urdf_diff.diff(self.root, root))
+
+    def test_identical(self):
+        self.assertEqual(self.urdf_diff.diff(self.root, copy.deepcopy(self.root)), [])
+
+    def test_equal_numbers(self):
+        root = copy.deepcopy(self.root)
+        origin = root.find("joint").find("origin")
+        origin.attrib["xyz"] = " ".join(f"{float(v):.4f}" for v in origin.attrib["xyz"].split())
+        self.assertEqual(self.urdf_diff.diff(self.root, root), [])
+
+    def test_renamed_link(self):
+        root = copy.deepcopy(self.root)
+        link = root.find("link")
+        old_name = link.attrib["name"]
+        link.attrib["name"] = "new_name"
+        for reference in root.iter():
+            if reference.tag in ["parent", "child"] and reference.attrib.get("link") == old_name:
+                reference.attrib["link"] = "new_name"
+        changes = self.urdf_diff.diff(self.root, root)
+        # the joints and geometries of the renamed link are not reported as modified
+        self.assertEqual([(c.change_type, c.name, c.new_name) for c in changes], [("renamed", old_name, "new_name")])
+
+    def test_added_removed_and_modified(self):
+        root = copy.deepcopy(self.root)
+        joint = root.find("joint")
+        joint.find("origin").attrib["xyz"] = "1 2 3"
+        removed = root.findall("link")[-1]
+        root.remove(removed)
+        ET.SubElement(root, "link", name="added_link")
+        changes = self.urdf_diff.diff(self.root, root)
+        modified = [c for c in changes if c.change_type == "modified"]
+        self.assertEqual([(c.element, c.name, c.details) for c in modified], [("joint", joint.attrib["name"], ["origin"])])
+        self.assertIn(("added", "link", "added_link"), self._changes(root))
+        self.assertIn(("removed", "link", removed.attrib["name"]), self._changes(root))
+
+    def test_diff_information(self):
+        root = copy.deepcopy(self.root)
+        root.find("link").find("visual").find("origin").attrib["rpy"] = "0 0 1"
+        information = self.urdf_diff.get_diff_information("a.urdf", "b.urdf", self.urdf_diff.diff(self.root, root))
+        self.assertFalse(information["identical"])
+        self.assertEqual(information["n_visuals_modified"], 1)
+        self.assertEqual(information["n_links_modified"], 0)
+        self.assertIsNone(self.urdf_diff.get_diff_information("a.urdf", "b.urdf", None)["identical"])
+
+
+if __name__ == '__main__':
+    unittest.main()
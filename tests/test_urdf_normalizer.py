@@ -0,0 +1,135 @@
+from pathlib import Path
+import xml.etree.ElementTree as ET
+import tempfile
+import unittest
+import logging
+import os
+
+from urdf_analyzer.model_analysis import ModelAnalysis
+from urdf_analyzer.urdf_normalizer import normalize_urdf_file, _normalize_numbers
+from urdf_analyzer.api import _time_variants
+
+
+class URDFNormalizerTests(unittest.TestCase):
+
+
+    def setUp(self):
+        self.logger = logging.getLogger("urdf_analyzer")
+        self.urdf_file = "resources/urdf_files/adept_mobile_robots/pioneer3at.urdf"
+        self.tmp_dir = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_normalize_numbers(self):
+        self.assertEqual(_normalize_numbers("0.000 -0.0 1.50 2e-3"), "0 0 1.5 0.002")
+        self.assertEqual(_normalize_numbers("  3.0   4 "), "3 4")
+        self.assertEqual(_normalize_numbers("not a number"), "not a number")
+
+    def test_canonical_file(self):
+        urdf_file = Path(self.tmp_dir.name, "robot.urdf")
+        Path(self.tmp_dir.name, "meshes").mkdir()
+        Path(self.tmp_dir.name, "meshes", "base.stl").write_bytes(b"")
+        urdf_file.write_text("""<?xml version="1.0"?>
+<robot name="robot">
+  <!-- a comment -->
+  <link name="base">
+    <visual>
+      <origin xyz="0.000 0 1.50" rpy="0 0 0"/>
+      <geometry><mesh filename="meshes/base.stl" scale="1.0 1.0 1.0"/></geometry>
+    </visual>
+  </link>
+</robot>
+""")
+        canonical_file = normalize_urdf_file(str(urdf_file), self.logger, cache_dir=self.tmp_dir.name + "/cache")
+        content = Path(canonical_file).read_text()
+        self.assertNotIn("comment", content)
+        self.assertEqual(len(content.splitlines()), 2) # the xml declaration and the minified robot
+        origin = ET.parse(canonical_file).getroot().find("link/visual/origin")
+        self.assertEqual(list(origin.attrib.items()), [("rpy", "0 0 0"), ("xyz", "0 0 1.5")])
+        mesh = ET.parse(canonical_file).getroot().find("link/visual/geometry/mesh")
+        self.assertEqual(mesh.attrib["filename"], os.path.abspath(Path(self.tmp_dir.name, "meshes", "base.stl")))
+        self.assertEqual(mesh.attrib["scale"], "1 1 1")
+
+    def test_cache(self):
+        cache_dir = self.tmp_dir.name + "/cache"
+        canonical_file = normalize_urdf_file(self.urdf_file, self.logger, cache_dir=cache_dir)
+        mtime_ns = os.stat(canonical_file).st_mtime_ns
+        self.assertEqual(normalize_urdf_file(self.urdf_file, self.logger, cache_dir=cache_dir), canonical_file)
+        self.assertEqual(os.stat(canonical_file).st_mtime_ns, mtime_ns)
+        self.assertLess(os.path.getsize(canonical_file), os.path.getsize(self.urdf_file))
+
+    def _write_mesh_urdf(self, mesh_filename: str):
+        urdf_file = Path(self.tmp_dir.name, "robot.urdf")
+        urdf_file.write_text(f'<robot name="robot"><link name="base"><visual><geometry><mesh filename="{mesh_filename}"/></geometry></visual></link></robot>')
+        return str(urdf_file)
+
+    def _get_mesh_filename(self, canonical_file: str):
+        return ET.parse(canonical_file).getroot().find("link/visual/geometry/mesh").attrib["filename"]
+
+    def test_unresolved_meshes_not_cached(self):
+        cache_dir = self.tmp_dir.name + "/cache"
+        urdf_file = self._write_mesh_urdf("meshes/base.stl")
+        self.assertEqual(self._get_mesh_filename(normalize_urdf_file(urdf_file, self.logger, cache_dir=cache_dir)), "meshes/base.stl")
+        # the mesh is created, and the file is normalised again
+        mesh_file = Path(self.tmp_dir.name, "meshes", "base.stl")
+        mesh_file.parent.mkdir()
+        mesh_file.write_bytes(b"")
+        canonical_file = normalize_urdf_file(urdf_file, self.logger, cache_dir=cache_dir)
+        self.assertEqual(self._get_mesh_filename(canonical_file), os.path.abspath(mesh_file))
+        # once resolved, the canonical file is cached
+        mtime_ns = os.stat(canonical_file).st_mtime_ns
+        self.assertEqual(normalize_urdf_file(urdf_file, self.logger, cache_dir=cache_dir), canonical_file)
+        self.assertEqual(os.stat(canonical_file).st_mtime_ns, mtime_ns)
+
+    def test_cache_key_ros_package_path(self):
+        cache_dir = self.tmp_dir.name + "/cache"
+        urdf_file = self._write_mesh_urdf("package://robot_description/base.stl")
+        mesh_file = Path(self.tmp_dir.name, "packages", "robot_description", "base.stl")
+        mesh_file.parent.mkdir(parents=True)
+        mesh_file.write_bytes(b"")
+        ros_package_path = os.environ.get("ROS_PACKAGE_PATH")
+        os.environ["ROS_PACKAGE_PATH"] = str(Path(self.tmp_dir.name, "packages"))
+        try:
+            self.assertEqual(self._get_mesh_filename(normalize_urdf_file(urdf_file, self.logger, cache_dir=cache_dir)), os.path.abspath(mesh_file))
+            # the canonical file of another ROS_PACKAGE_PATH is not reused
+            del os.environ["ROS_PACKAGE_PATH"]
+            self.assertEqual(self._get_mesh_filename(normalize_urdf_file(urdf_file, self.logger, cache_dir=cache_dir)), "package://robot_description/base.stl")
+        finally:
+            if ros_package_path is not None:
+                os.environ["ROS_PACKAGE_PATH"] = ros_package_path
+            else:
+                os.environ.pop("ROS_PACKAGE_PATH", None)
+
+    def test_same_model_information(self):
+        canonical_file = normalize_urdf_file(self.urdf_file, self.logger, cache_dir=self.tmp_dir.name + "/cache")
+        information = []
+        for urdf_file in [self.urdf_file, canonical_file]:
+            model_analysis = ModelAnalysis(self.logger)
+            model_analysis.xml_urdf_reader(urdf_file)
+            information.append((model_analysis.get_joint_information(), model_analysis.get_link_information()))
+        self.assertEqual(information[0][0].n_joints, information[1][0].n_joints)
+        self.assertEqual(information[0][0].n_joint_types, information[1][0].n_joint_types)
+        self.assertEqual(information[0][1].n_links, information[1][1].n_links)
+        self.assertEqual(information[0][1].visual_mesh_types, information[1][1].visual_mesh_types)
+
+    def test_unreadable_file(self):
+        urdf_file = Path(self.tmp_dir.name, "broken.urdf")
+        urdf_file.write_text("<robot name='broken'><link></robot>")
+        self.assertIsNone(normalize_urdf_file(str(urdf_file), self.logger, cache_dir=self.tmp_dir.name + "/cache"))
+
+    def test_time_variants_warm_up_and_order(self):
+        calls = []
+        def load(files):
+            calls.append(list(files))
+            return len(files)
+        times, n_loaded = _time_variants(load, {"original": ["a.urdf", "b.urdf"], "normalized": ["a-n.urdf", "b-n.urdf"]}, repeats=3)
+        # an untimed warm-up load, then the variants in alternating order
+        self.assertEqual(calls, [["a.urdf"], ["a.urdf", "b.urdf"], ["a-n.urdf", "b-n.urdf"], ["a-n.urdf", "b-n.urdf"], ["a.urdf", "b.urdf"],
+                                 ["a.urdf", "b.urdf"], ["a-n.urdf", "b-n.urdf"]])
+        self.assertEqual(n_loaded, {"original": 2, "normalized": 2})
+        self.assertEqual(set(times.keys()), {"original", "normalized"})
+
+
+if __name__ == '__main__':
+    unittest.main()
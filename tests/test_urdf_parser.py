@@ -0,0 +1,116 @@
+from pathlib import Path
+import tempfile
+import unittest
+import logging
+import stat
+import sys
+import os
+
+from urdf_analyzer.urdf_parser import URDFparser
+from urdf_analyzer.journal import ParsingJournal
+from urdf_analyzer.parser_latency import ParserLatencyHistory
+from urdf_analyzer import api
+from tests.test_check_urdf_runner import STUB_CHECK_URDF
+
+
+@unittest.skipIf(sys.platform.startswith("win"), "The stub check_urdf executable requires a POSIX system.")
+class URDFparserLoadManyTests(unittest.TestCase):
+
+
+    @classmethod
+    def setUpClass(self):
+        """
+        Runs when class is loaded. The stub check_urdf executable is found through the PATH.
+        """
+        logging.basicConfig(level=logging.ERROR)
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        executable = os.path.join(self.tmp_dir.name, "check_urdf")
+        with open(executable, "w") as f:
+            f.write(STUB_CHECK_URDF)
+        os.chmod(executable, os.stat(executable).st_mode | stat.S_IEXEC)
+        self.path = os.environ["PATH"]
+        os.environ["PATH"] = self.tmp_dir.name + os.pathsep + self.path
+        self.urdf_files = [str(Path(self.tmp_dir.name, f)) for f in ["robot_a.urdf", "robot_fail.urdf", "robot_b.urdf"]]
+
+    @classmethod
+    def tearDownClass(self):
+        os.environ["PATH"] = self.path
+        self.tmp_dir.cleanup()
+
+    def test_load_many(self):
+        parser = URDFparser('check_urdf', logging.getLogger("urdf_analyzer"))
+        results = list(parser.load_many(self.urdf_files))
+        self.assertEqual([f for f, _ in results], self.urdf_files)
+        self.assertEqual([m is not None for _, m in results], [True, False, True])
+        self.assertTrue(parser.check_urdf_result.passed)
+
+    def test_get_parsings_information(self):
+        parsing_results = api.get_parsings_information(self.urdf_files, 'check_urdf')
+        self.assertEqual(list(parsing_results.index), self.urdf_files)
+        self.assertEqual(list(parsing_results['check_urdf']), [True, False, True])
+        self.assertEqual(list(parsing_results['count']), [1, 0, 1])
+
+    def test_get_parsings_information_resume(self):
+        journal_file = str(Path(self.tmp_dir.name, "parsing_journal.jsonl"))
+        journal = ParsingJournal(journal_file, logging.getLogger("urdf_analyzer"))
+        api.get_parsings_information(self.urdf_files[:2], 'check_urdf', journal=journal)
+        journal.close()
+
+        # the completed units are taken from the journal, which is shown by changing a journaled result
+        journal = ParsingJournal(journal_file, logging.getLogger("urdf_analyzer"), resume=True)
+        journal.record(self.urdf_files[1], 'check_urdf', 'structure', True)
+        parsing_results = api.get_parsings_information(self.urdf_files, 'check_urdf', journal=journal)
+        journal.close()
+        self.assertEqual(list(parsing_results['check_urdf']), [True, True, True])
+        self.assertEqual(len(journal.completed), 3)
+
+    def _get_gate_journal(self, name: str):
+        # the results of yourdfpy are journaled, such that the gate does not need to load yourdfpy
+        journal = ParsingJournal(str(Path(self.tmp_dir.name, name)), logging.getLogger("urdf_analyzer"))
+        for urdf_file, passed in zip(self.urdf_files, [False, True, True]):
+            journal.record(urdf_file, 'yourdfpy', 'full', passed)
+        return journal
+
+    def test_gate(self):
+        history = ParserLatencyHistory(str(Path(self.tmp_dir.name, "parser_latency.json")), logging.getLogger("urdf_analyzer"))
+        journal = self._get_gate_journal("gate_any.jsonl")
+        parsing_results = api.get_parsings_information(self.urdf_files, ['yourdfpy', 'check_urdf'], journal=journal, gate='any', latency_history=history)
+        journal.close()
+        # check_urdf is tried first, as it is cheaper, and yourdfpy only for the file failing check_urdf
+        self.assertEqual(list(parsing_results['passed_gate']), [True, True, True])
+        self.assertEqual(list(parsing_results['skipped_parsers']), [['yourdfpy'], [], ['yourdfpy']])
+        self.assertEqual(parsing_results['yourdfpy'].isna().tolist(), [True, False, True])
+        self.assertEqual(ParserLatencyHistory(history.history_file, logging.getLogger("urdf_analyzer")).latencies['check_urdf:structure']['n_files'], 3)
+
+        journal = self._get_gate_journal("gate_all.jsonl")
+        parsing_results = api.get_parsings_information(self.urdf_files, ['yourdfpy', 'check_urdf'], journal=journal, gate='all')
+        journal.close()
+        self.assertEqual(list(parsing_results['passed_gate']), [False, False, True])
+        self.assertEqual(list(parsing_results['skipped_parsers']), [[], ['yourdfpy'], []])
+
+    def test_parser_latency_history(self):
+        history = ParserLatencyHistory(None, logging.getLogger("urdf_analyzer"))
+        self.assertEqual(history.order(['matlab', 'yourdfpy', 'check_urdf'], {'matlab': 'full', 'yourdfpy': 'full', 'check_urdf': 'structure'}), ['check_urdf', 'yourdfpy', 'matlab'])
+        # the measured latencies replace the prior latencies
+        history.record('check_urdf', 'structure', 2.0, 10)
+        history.record('check_urdf', 'structure', 1.0, 10)
+        self.assertAlmostEqual(history.get_latency('check_urdf', 'structure'), 0.15)
+        self.assertEqual(history.order(['yourdfpy', 'check_urdf'], {'yourdfpy': 'full', 'check_urdf': 'structure'}), ['yourdfpy', 'check_urdf'])
+        with self.assertRaises(ValueError):
+            api.get_parsings_information(self.urdf_files, 'check_urdf', gate='most')
+
+    def test_structure_only(self):
+        # check_urdf never loads the meshes, while the parsers without a structure only mode are used in full
+        self.assertEqual(URDFparser('check_urdf', logging.getLogger("urdf_analyzer"), structure_only=True).parse_mode, 'structure')
+        parsing_results = api.get_parsings_information(self.urdf_files, 'check_urdf', structure_only=True)
+        self.assertEqual(list(parsing_results['count']), [1, 0, 1])
+        self.assertEqual(set(parsing_results['parse_mode']), {'check_urdf:structure'})
+
+    def test_check_meshes(self):
+        urdf_file = "resources/urdf_files/adept_mobile_robots/pioneer3at.urdf"
+        parsing_results = api.get_parsings_information([urdf_file], 'check_urdf', check_meshes=True)
+        self.assertEqual(parsing_results.loc[urdf_file, ['n_meshes', 'n_missing_meshes', 'n_unreadable_meshes']].tolist(), [8, 0, 0])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,101 @@
+import xml.etree.ElementTree as ET
+from pathlib import Path
+import unittest
+import logging
+
+from urdf_analyzer.urdf_validator import URDFValidator
+
+
+def create_urdf(links, joints):
+    """
+    Create a URDF root element, with joints given as (name, type, parent, child).
+    """
+    root = ET.Element("robot", name="test_robot")
+    for link in links:
+        ET.SubElement(root, "link", name=link)
+    for name, jtype, parent, child in joints:
+        joint = ET.SubElement(root, "joint", name=name, type=jtype)
+        ET.SubElement(joint, "parent", link=parent)
+        ET.SubElement(joint, "child", link=child)
+    return root
+
+
+class URDFValidatorTests(unittest.TestCase):
+
+
+    @classmethod
+    def setUpClass(self):
+        """
+        Runs when class is loaded.
+        """
+        logging.basicConfig(level=logging.ERROR)
+        self.validator = URDFValidator(logging.getLogger("urdf_analyzer"))
+
+    def get_issue_types(self, root):
+        return sorted([i.issue_type for i in self.validator.validate(root)])
+
+    def test_validate_bundled_urdfs(self):
+        for urdf_file in Path("resources/urdf_files/adept_mobile_robots").glob("*.urdf"):
+            self.assertEqual(self.validator.validate_file(urdf_file), [])
+
+    def test_validate_multiple_parents(self):
+        root = create_urdf(["base", "a", "b"], [("j1", "fixed", "base", "a"), ("j2", "fixed", "a", "b"), ("j3", "fixed", "b", "a")])
+        self.assertEqual(self.get_issue_types(root), ["multiple_parents"])
+
+    def test_validate_cycle(self):
+        root = create_urdf(["base", "a", "b", "c"], [("j1", "fixed", "a", "b"), ("j2", "fixed", "b", "c"), ("j3", "fixed", "c", "a")])
+        self.assertEqual(self.get_issue_types(root), ["cycle", "orphan_link"])
+
+    def test_validate_cycle_no_root(self):
+        root = create_urdf(["a", "b"], [("j1", "fixed", "a", "b"), ("j2", "fixed", "b", "a")])
+        self.assertEqual(self.get_issue_types(root), ["cycle", "no_root"])
+
+    def test_validate_multiple_roots_and_orphan(self):
+        root = create_urdf(["a", "b", "c", "d", "orphan"], [("j1", "fixed", "a", "b"), ("j2", "fixed", "c", "d")])
+        self.assertEqual(self.get_issue_types(root), ["multiple_roots", "orphan_link"])
+
+    def test_validate_unknown_link_and_duplicate_names(self):
+        root = create_urdf(["a", "b", "b"], [("j1", "fixed", "a", "b"), ("j1", "fixed", "b", "c")])
+        self.assertEqual(self.get_issue_types(root), ["duplicate_name", "duplicate_name", "unknown_link"])
+
+    def test_validate_missing_required_elements(self):
+        root = create_urdf(["a", "b"], [("j1", "revolute", "a", "b")])
+        ET.SubElement(root.find("link"), "visual").append(ET.Element("geometry"))
+        ET.SubElement(ET.SubElement(root.findall("link")[1], "collision"), "geometry").append(ET.Element("cylinder", radius="1"))
+        self.assertEqual(self.get_issue_types(root), ["missing_attribute", "missing_element", "missing_element"])
+
+    def test_validate_large_chain(self):
+        n_links = 20000
+        root = create_urdf([f"link_{i}" for i in range(n_links)], [(f"joint_{i}", "fixed", f"link_{i-1}", f"link_{i}") for i in range(1, n_links)])
+        self.assertEqual(self.validator.validate(root), [])
+
+    def test_validate_selected_rules(self):
+        validator = URDFValidator(logging.getLogger("urdf_analyzer"), rules=["unique-names"])
+        root = create_urdf(["a", "a", "orphan"], [("j1", "revolute", "a", "b")])
+        self.assertEqual([i.issue_type for i in validator.validate(root)], ["duplicate_name"])
+
+    def test_validate_unknown_rule(self):
+        with self.assertRaises(ValueError):
+            URDFValidator(logging.getLogger("urdf_analyzer"), rules=["non-existing-rule"])
+
+    def test_rule_statistics(self):
+        validator = URDFValidator(logging.getLogger("urdf_analyzer"))
+        root = create_urdf(["a", "b", "orphan"], [("j1", "fixed", "a", "b")])
+        validator.validate(root)
+        validator.validate(root)
+        statistics = validator.get_rule_statistics().set_index("rule")
+        self.assertEqual(statistics.loc["kinematic-tree", "hits"], 8) # 3 links and 1 joint, validated twice
+        self.assertEqual(statistics.loc["link-standard", "hits"], 6)
+        self.assertEqual(statistics.loc["kinematic-tree", "n_issues"], 2)
+        self.assertTrue((statistics["time_s"] >= 0).all())
+
+    def test_get_issues_information(self):
+        root = create_urdf(["a", "b", "orphan"], [("j1", "fixed", "a", "b")])
+        information = self.validator.get_issues_information("test.urdf", self.validator.validate(root))
+        self.assertFalse(information["valid"])
+        self.assertEqual(information["n_issues"], 1)
+        self.assertEqual(information["n_orphan_link"], 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,105 @@
+import xml.etree.ElementTree as ET
+from pathlib import Path
+import tempfile
+import unittest
+import logging
+import time
+import os
+
+from urdf_analyzer.xacro_expander import XacroExpander, XacroError, expand_xacro_file
+
+
+MACROS_XACRO = """<?xml version="1.0"?>
+<robot xmlns:xacro="http://www.ros.org/wiki/xacro">
+  <xacro:property name="wheel_radius" value="${base_size/4}"/>
+  <xacro:macro name="wheel" params="prefix *origin reflect:=1 color:=^|black">
+    <link name="${prefix}_wheel">
+      <visual><geometry><cylinder radius="${wheel_radius}" length="0.05"/></geometry><material name="${color}"/></visual>
+    </link>
+    <joint name="${prefix}_wheel_joint" type="continuous">
+      <parent link="base_link"/>
+      <child link="${prefix}_wheel"/>
+      <xacro:insert_block name="origin"/>
+      <axis xyz="0 ${reflect} 0"/>
+    </joint>
+  </xacro:macro>
+</robot>
+"""
+
+ROBOT_XACRO = """<?xml version="1.0"?>
+<robot name="test_robot" xmlns:xacro="http://www.ros.org/wiki/xacro">
+  <xacro:arg name="with_arm" default="false"/>
+  <xacro:property name="base_size" value="0.4"/>
+  <xacro:include filename="$(find macros_description)/macros.xacro"/>
+  <link name="base_link"><visual><geometry><box size="${base_size} ${base_size} 0.1"/></geometry></visual></link>
+  <xacro:wheel prefix="left"><origin xyz="0 ${base_size/2} 0"/></xacro:wheel>
+  <xacro:wheel prefix="right" reflect="-1" color="red"><origin xyz="0 -${base_size/2} 0"/></xacro:wheel>
+  <xacro:if value="$(arg with_arm)"><link name="arm"/></xacro:if>
+</robot>
+"""
+
+
+class XacroExpanderTests(unittest.TestCase):
+
+
+    def setUp(self):
+        logging.basicConfig(level=logging.ERROR)
+        self.logger = logging.getLogger("urdf_analyzer")
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.cache_dir = os.path.join(self.tmp_dir.name, "cache")
+        os.makedirs(os.path.join(self.tmp_dir.name, "macros_description"))
+        self.macros_file = os.path.join(self.tmp_dir.name, "macros_description", "macros.xacro")
+        self.robot_file = os.path.join(self.tmp_dir.name, "robot.urdf.xacro")
+        with open(self.macros_file, "w") as f:
+            f.write(MACROS_XACRO)
+        with open(self.robot_file, "w") as f:
+            f.write(ROBOT_XACRO)
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_expand_file(self):
+        root = XacroExpander(self.logger).expand_file(self.robot_file)
+        self.assertEqual([l.attrib["name"] for l in root.iter("link")], ["base_link", "left_wheel", "right_wheel"])
+        self.assertEqual([j.attrib["name"] for j in root.iter("joint")], ["left_wheel_joint", "right_wheel_joint"])
+        self.assertEqual(root.find("link/visual/geometry/box").attrib["size"], "0.4 0.4 0.1")
+        self.assertEqual(float(root.find("link/visual/geometry/cylinder").attrib["radius"]), 0.1)
+        right_joint = root.findall("joint")[1]
+        self.assertEqual(right_joint.find("origin").attrib["xyz"], "0 -0.2 0")
+        self.assertEqual(right_joint.find("axis").attrib["xyz"], "0 -1 0")
+        self.assertEqual([m.attrib["name"] for m in root.iter("material")], ["black", "red"])
+
+    def test_expand_file_args(self):
+        root = XacroExpander(self.logger, args={"with_arm": "true"}).expand_file(self.robot_file)
+        self.assertIn("arm", [l.attrib["name"] for l in root.iter("link")])
+
+    def test_expand_file_undefined_property(self):
+        with open(self.robot_file, "w") as f:
+            f.write(ROBOT_XACRO.replace("${base_size/2}", "${undefined_size/2}"))
+        with self.assertRaises(XacroError):
+            XacroExpander(self.logger).expand_file(self.robot_file)
+
+    def test_expand_xacro_file_cache(self):
+        expanded_file = expand_xacro_file(self.robot_file, self.logger, cache_dir=self.cache_dir)
+        self.assertIsNotNone(expanded_file)
+        self.assertEqual(ET.parse(expanded_file).getroot().attrib["name"], "test_robot")
+        modification_time = os.stat(expanded_file).st_mtime_ns
+        self.assertEqual(expand_xacro_file(self.robot_file, self.logger, cache_dir=self.cache_dir), expanded_file)
+        self.assertEqual(os.stat(expanded_file).st_mtime_ns, modification_time) # the cached file is not written again
+
+    def test_expand_xacro_file_include_changed(self):
+        expanded_file = expand_xacro_file(self.robot_file, self.logger, cache_dir=self.cache_dir)
+        time.sleep(0.01)
+        with open(self.macros_file, "w") as f:
+            f.write(MACROS_XACRO.replace("length=\"0.05\"", "length=\"0.5\""))
+        expanded_file = expand_xacro_file(self.robot_file, self.logger, cache_dir=self.cache_dir)
+        self.assertEqual(ET.parse(expanded_file).getroot().find("link/visual/geometry/cylinder").attrib["length"], "0.5")
+
+    def test_expand_xacro_file_error(self):
+        with open(self.robot_file, "w") as f:
+            f.write(ROBOT_XACRO.replace("macros.xacro", "non_existing.xacro"))
+        self.assertIsNone(expand_xacro_file(self.robot_file, self.logger, cache_dir=self.cache_dir))
+
+
+if __name__ == '__main__':
+    unittest.main()
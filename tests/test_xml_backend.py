@@ -0,0 +1,41 @@
+import unittest
+import logging
+
+from urdf_analyzer.model_analysis import ModelAnalysis
+from urdf_analyzer.xml_backend import get_xml_backend, get_available_xml_backends, lxml_etree
+
+
+class XMLBackendTests(unittest.TestCase):
+
+
+    def setUp(self):
+        self.urdf_file = "resources/urdf_files/adept_mobile_robots/pioneer3at.urdf"
+
+    def _get_information(self, xml_backend):
+        model_analysis = ModelAnalysis(logging.getLogger("urdf_analyzer"), xml_backend)
+        self.assertIsNotNone(model_analysis.xml_urdf_reader(self.urdf_file))
+        return model_analysis.get_joint_information(), model_analysis.get_link_information()
+
+    def test_default_backend(self):
+        # lxml is only used if it is chosen, as the full analysis is slower with it
+        self.assertEqual(get_xml_backend().name, "etree")
+        self.assertEqual(get_available_xml_backends()[0], "lxml" if lxml_etree is not None else "etree")
+
+    def test_unknown_backend(self):
+        with self.assertRaises(ValueError):
+            get_xml_backend("unknown")
+
+    def test_etree_backend(self):
+        joint_information, link_information = self._get_information("etree")
+        self.assertEqual(joint_information.n_joints, 15)
+        self.assertEqual(link_information.n_links, 16)
+        self.assertEqual(link_information.collision_mesh_types, {"stl": 5})
+
+    @unittest.skipIf(lxml_etree is None, "lxml is not installed")
+    def test_lxml_backend_same_as_etree(self):
+        for etree_information, lxml_information in zip(self._get_information("etree"), self._get_information("lxml")):
+            self.assertTrue(etree_information.df_results_full.equals(lxml_information.df_results_full))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,22 +1,44 @@
 from pathlib import Path
 from filecmp import cmp
+import concurrent.futures
 from typing import Union
 import pandas as pd
 import itertools
+import threading
+import hashlib
 import logging
+import copy
 import json
+import time
 import os
 
 
 from urdf_analyzer.urdf_components.urdf_information import URDFInformation
 from urdf_analyzer.urdf_components.joint import JointsMetaInformation
 from urdf_analyzer.urdf_components.link import LinksMetaInformation
+from urdf_analyzer.urdf_components.dynamics import DynamicsMetaInformation
+from urdf_analyzer.urdf_components.collision import CollisionMetaInformation
+from urdf_analyzer.urdf_components.topology import TopologyMetaInformation
 from urdf_analyzer.model_analysis import ModelAnalysis
 from urdf_analyzer.urdf_parser import URDFparser
+from urdf_analyzer.catalog import URDFCatalog
+from urdf_analyzer.check_urdf_runner import CheckURDFResult, run_check_urdfs
+from urdf_analyzer.xacro_expander import expand_xacro_file
+from urdf_analyzer.urdf_validator import URDFValidator, ValidationIssue
+from urdf_analyzer.urdf_diff import URDFDiff, ElementChange
+from urdf_analyzer.mesh_analysis import get_mesh_validity
+from urdf_analyzer.journal import ParsingJournal
+from urdf_analyzer.dataset_statistics import DatasetStatistics, get_dataset_statistics
+from urdf_analyzer.progress import ProgressReporter
+from urdf_analyzer.sampling import URDFSample
+from urdf_analyzer.urdf_normalizer import normalize_urdf_file
+from urdf_analyzer.name_index import URDFNameIndex, get_urdf_names, get_model_names
+from urdf_analyzer.parser_latency import ParserLatencyHistory
+from urdf_analyzer.model_cache import ModelInformationCache, estimate_element_bytes, estimate_object_bytes
 from urdf_analyzer.constants import *
 
 
-def search_for_urdfs(dir: Union[str, Path]):
+def search_for_urdfs(dir: Union[str, Path], include_xacro: bool=False):
     l = logging.getLogger("urdf_analyzer")
 
     list_of_urdf_file_paths = []
@@ -29,20 +51,204 @@ def search_for_urdfs(dir: Union[str, Path]):
     for path in Path(dir).rglob("*.urdf"):
         list_of_urdf_file_paths.append(path)
 
+    # only the xacro files describing a robot are included, i.e. not the xacro files only containing macros
+    if include_xacro:
+        for path in Path(dir).rglob("*.urdf.xacro"):
+            list_of_urdf_file_paths.append(path)
+
     if len(list_of_urdf_file_paths) == 0:
         l.warning(f"No URDF files were found when searching in the path: {dir}")
     return list_of_urdf_file_paths
 
 
+def parse_shard(shard: str):
+    """
+    :param shard: the shard as 'i/N', i.e. the i'th of N shards, where 1 <= i <= N
+    :type shard: str
+    :raises ValueError: if the shard is not of the form 'i/N' with 1 <= i <= N
+    :return: the index of the shard (starting from 1) and the number of shards
+    :rtype: tuple[int, int]
+    """
+    try:
+        shard_index, n_shards = (int(v) for v in shard.split("/"))
+    except ValueError:
+        raise ValueError(f"The shard '{shard}' is not of the form 'i/N'.")
+    if not 1 <= shard_index <= n_shards:
+        raise ValueError(f"The shard '{shard}' has to satisfy 1 <= i <= N.")
+    return shard_index, n_shards
+
+
+def shard_urdf_files(urdf_files: list, shard: tuple[int, int], root_dir: Union[str, Path]=None):
+    """
+    Partition the URDF files into shards, e.g. to analyse a dataset on several machines, and return the files of one shard.
+    A file is assigned to a shard by a stable hash of its path relative to the root directory, such that each machine
+    obtains the same partition independently of the order in which the files were found and of where the dataset is stored.
+
+    :param urdf_files: the URDF files found in the root directory, see search_for_urdfs()
+    :type urdf_files: list[str]
+    :param shard: the index of the shard (starting from 1) and the number of shards, see parse_shard()
+    :type shard: tuple[int, int]
+    :param root_dir: the directory the files were found in
+    :type root_dir: str
+    :return: the URDF files of the shard, in the order of urdf_files
+    :rtype: list[str]
+    """
+    shard_index, n_shards = shard
+    sharded_files = []
+    for urdf_file in urdf_files:
+        path = Path(urdf_file)
+        if root_dir is not None:
+            try:
+                path = path.relative_to(root_dir)
+            except ValueError: # the file is not in the root directory
+                pass
+        digest = hashlib.blake2b(path.as_posix().encode(), digest_size=8).digest()
+        if int.from_bytes(digest, "big") % n_shards == shard_index - 1:
+            sharded_files.append(urdf_file)
+    return sharded_files
+
+
+def _get_journal_file(shard: tuple[int, int]=None):
+    if shard is None:
+        return f"{DEFAULT_JOURNAL_DIR}/parsing_journal.jsonl"
+    return f"{DEFAULT_JOURNAL_DIR}/parsing_journal_shard-{shard[0]}-of-{shard[1]}.jsonl"
+
+
+def _get_schema_output_file(schema_name: str, shard: tuple[int, int]=None):
+    # the schema of a shard is saved as a partial schema, which is combined with the other shards using the merge_X_schemas() functions
+    if shard is None:
+        return True
+    return f"{DEFAULT_OUTPUT_DIR}/{schema_name}_shard-{shard[0]}-of-{shard[1]}"
+
+
+def _imap_in_pool(func, items: list, n_workers: int=None):
+    """
+    Apply func to each of the items in a process pool, yielding the results in the same order as the items, as soon as they are returned.
+    If n_workers is 1, the items are processed in the current process.
+    """
+    if n_workers == 1 or len(items) <= 1:
+        for item in items:
+            yield func(item)
+        return
+    n_workers = n_workers if n_workers is not None else (os.cpu_count() or 1)
+    with concurrent.futures.ProcessPoolExecutor(max_workers=n_workers) as executor:
+        yield from executor.map(func, items, chunksize=max(1, len(items) // (4 * n_workers)))
+
+
+def _save_sample_estimates(sample: URDFSample, results: pd.DataFrame, schema_name: str, shard: tuple[int, int]=None):
+    # the estimates over all of the files are saved next to the schema of the sampled files
+    output_file = _get_schema_output_file(f"{schema_name}_estimates", shard)
+    _save_information(sample.get_estimates(results), f"{DEFAULT_OUTPUT_DIR}/{schema_name}_estimates" if output_file == True else output_file)
+
+
+def _map_in_pool(func, items: list, n_workers: int=None):
+    """
+    Apply func to each of the items in a process pool, returning the results in the same order as the items, see _imap_in_pool().
+    """
+    return list(_imap_in_pool(func, items, n_workers))
+
+
+# The per-file work units needed to generate each schema. A unit needed by several of the requested schemas is only run once
+# per file, and its results are shared by these schemas, see plan_schema_work_units():
+#   - xml: reading the XML tree of the file, from which the model information, the validation issues, the dataset statistics
+#     and the names of the name index are computed
+#   - model: the model analysis of the joints, links, dynamics, collisions and topology
+#   - validation: checking the validation rules
+#   - dataset: adding the joints, links and meshes of the file to the dataset statistics
+#   - names: collecting the link names, joint names and mesh filenames of the file for the name index
+#   - parsing: loading the file with each of the URDF parsers
+#   - keywords: counting the keywords of the tool comparison in the file
+SCHEMA_WORK_UNITS = {"model-info": ["xml", "model"],
+                     "catalog": ["xml", "model"],
+                     "validation": ["xml", "validation"],
+                     "dataset-stats": ["xml", "dataset"],
+                     "name-index": ["xml", "names"],
+                     "urdf-parse-cmp": ["parsing"],
+                     "tool-cmp": ["parsing", "keywords"]}
+
+TOOL_COMPARISON_WORDS = ['xacro', 'package', 'author']
+
+MODEL_INFORMATION_SCHEMA_KWARGS = {'joints': True, 'links': True, 'mesh_statistics': True, 'dynamics': True, 'collisions': True, 'topology': True}
+
+
+def plan_schema_work_units(schemas: list[str]):
+    """
+    :return: the work units needed by the schemas, each only once, in the order they are run, see SCHEMA_WORK_UNITS
+    :rtype: list[str]
+    """
+    units = []
+    for schema in schemas:
+        for unit in SCHEMA_WORK_UNITS.get(schema, []):
+            if unit not in units:
+                units.append(unit)
+    return units
+
+
 def schema_generator(schemas, files, **kwargs):
-    urdf_parsing_comparison = None
+    l = logging.getLogger("urdf_analyzer")
+    n_workers = kwargs['workers'] if 'workers' in kwargs else None
+    shard = kwargs.get('shard')
+    progress = None
+    progress_file = None
+    if kwargs.get('progress') is not None:
+        # the progress is written to stderr, or appended to the progress file, e.g. to be collected by a job dashboard
+        progress_file = open(kwargs['progress_file'], 'a') if kwargs.get('progress_file') is not None else None
+        progress = ProgressReporter(kwargs['progress'], progress_file, kwargs.get('progress_interval') or DEFAULT_PROGRESS_INTERVAL)
+    sample = None
+    if isinstance(files, list) and (kwargs.get('sample') is not None or kwargs.get('sample_fraction') is not None):
+        # only a stratified sample of the files is analysed, and the means and pass rates over all of the files are estimated
+        sample = URDFSample(files, kwargs.get('sample'), kwargs.get('sample_fraction'), kwargs.get('sample_strata') or "directory",
+                            kwargs.get('sample_seed') or 0, kwargs.get('urdf_search_dir'))
+        l.info(f"Analysing a sample of {len(sample.files)} of the {len(files)} urdf files")
+        files = sample.files
+    structure_only = kwargs.get('structure_only', False)
+    normalized = kwargs.get('normalized', False)
+
+    # run each work unit needed by the schemas once over the files, a single file is analysed by each schema on its own
+    units = plan_schema_work_units(schemas) if isinstance(files, list) else []
+    if len(units) > 0:
+        l.info(f"Running the work units {units} once for the schemas {[s for s in schemas if s in SCHEMA_WORK_UNITS]}")
+    urdfs_information = None
+    validation_issues = None
+    dataset_statistics = None
+    urdfs_names = None
+    name_index = kwargs['name_index'] if kwargs.get('name_index') is not None else True
+    if "xml" in units:
+        # the catalog only needs the joints and links, which are included in the model information
+        model_kwargs = None
+        if "model" in units:
+            model_kwargs = MODEL_INFORMATION_SCHEMA_KWARGS if "model-info" in schemas else {'joints': True, 'links': True}
+        validator = URDFValidator(l, kwargs.get('rules')) if "validation" in units else None
+        dataset_statistics = DatasetStatistics() if "dataset" in units else None
+        xml_files = files
+        if "names" in units and not any("xml" in SCHEMA_WORK_UNITS.get(s, []) for s in schemas if s != "name-index"):
+            # only the new or modified files are added to the name index, so only these are read if no other schema reads the files
+            xml_files = get_name_index_changed_files(files, name_index)
+        urdfs_information, validation_issues, urdfs_names = get_xml_information(xml_files, model_kwargs, validator, dataset_statistics, "names" in units,
+                                                                                n_workers=n_workers, progress=progress,
+                                                                                stage="+".join([s for s in schemas if "xml" in SCHEMA_WORK_UNITS.get(s, [])]))
     if "model-info" in schemas:
-        generate_model_information_schema(files)
+        urdfs_information = generate_model_information_schema(files, out=_get_schema_output_file("model_information_schema", shard), n_workers=n_workers, progress=progress, urdfs_information=urdfs_information)
+        if sample is not None:
+            model_information = pd.concat([urdf_information.df_results for urdf_information in urdfs_information])
+            _save_sample_estimates(sample, model_information.set_axis(files, axis=0), "model_information_schema", shard)
+
+    parsing_results = None
+    if "parsing" in units:
+        # the completed (file, parser) units are journaled, such that an interrupted generation can be resumed
+        journal = ParsingJournal(_get_journal_file(shard), l, resume=kwargs.get('resume', False))
+        parsing_results = get_parsings_information(files, URDFparser.supported_parsers, structure_only=structure_only, journal=journal, progress=progress, normalized=normalized)
+        journal.close()
+    keyword_counts = get_keyword_counts(files, TOOL_COMPARISON_WORDS) if "keywords" in units else None
     if "urdf-parse-cmp" in schemas:
-        urdf_parsing_comparison = generate_urdf_parsing_comparison_schema(files)
+        urdf_parsing_comparison = generate_urdf_parsing_comparison_schema(files, out=_get_schema_output_file("urdf_parsing_comparison_schema", shard), structure_only=structure_only, normalized=normalized, parsing_results=parsing_results)
+        if sample is not None:
+            _save_sample_estimates(sample, urdf_parsing_comparison, "urdf_parsing_comparison_schema", shard)
     if "tool-cmp" in schemas:
-        urdf_parsing_comparison = urdf_parsing_comparison if not None else None
-        generate_tool_comparison_schema(files, urdf_parsing_comparison)
+        generate_tool_comparison_schema(files, parsing_results, out=_get_schema_output_file("tool_comparison_schema", shard), structure_only=structure_only, partial=shard is not None, normalized=normalized, keyword_counts=keyword_counts)
+        if sample is not None:
+            # the pass rates of the parsers, and the fractions of the files containing each word
+            _save_sample_estimates(sample, parsing_results.join(keyword_counts), "tool_comparison_schema", shard)
     if "duplicates-cmp" in schemas:
         dup_cmp_parser = None
         dup_cmp_sources = None
@@ -50,32 +256,66 @@ def schema_generator(schemas, files, **kwargs):
             dup_cmp_parser = kwargs['dup_cmp_parser'] # TODO: implement dup_cmp_parser in the 'generate_duplicates_comparison_schema' function
         if 'dup_cmp_sources' in kwargs:
             dup_cmp_sources = kwargs['dup_cmp_sources']
-        generate_duplicates_comparison_schema(kwargs['duplicates_file'], dup_cmp_sources, dup_cmp_parser)
-
-
-def _count_word_in_urdf_file(word, urdf_file):
+        generate_duplicates_comparison_schema(kwargs['duplicates_file'], dup_cmp_sources, dup_cmp_parser, n_workers=n_workers)
+    if "duplicates-diff" in schemas:
+        generate_duplicates_diff_schema(kwargs['duplicates_file'], kwargs.get('dup_cmp_sources'), n_workers=n_workers)
+    if "validation" in schemas:
+        validation_results = generate_validation_schema(files, out=_get_schema_output_file("validation_schema", shard), rules=kwargs['rules'] if 'rules' in kwargs else None, progress=progress, validation_issues=validation_issues)
+        if sample is not None:
+            _save_sample_estimates(sample, validation_results.set_index("filename"), "validation_schema", shard)
+    if "dataset-stats" in schemas:
+        generate_dataset_statistics_schema(files, out=_get_schema_output_file("dataset_statistics_schema", shard), n_workers=n_workers, partial=shard is not None, progress=progress, dataset_statistics=dataset_statistics)
+    if "normalize" in schemas:
+        generate_normalization_schema(files, out=_get_schema_output_file("normalization_schema", shard), n_workers=n_workers, structure_only=structure_only)
+    if "catalog" in schemas:
+        catalog = kwargs['catalog'] if kwargs.get('catalog') is not None else True
+        generate_catalog_schema(files, catalog, progress=progress, urdfs_information=urdfs_information)
+    if "name-index" in schemas:
+        generate_name_index_schema(files, name_index, n_workers=n_workers, progress=progress, urdfs_names=urdfs_names)
+    if progress is not None:
+        progress.close()
+    if progress_file is not None:
+        progress_file.close()
+
+
+def _count_words_in_urdf_file(words: list[str], urdf_file):
     with open(urdf_file) as f:
-        return int(f.read().count(word))
+        content = f.read()
+    return [content.count(word) for word in words]
 
 def _count_n_lines_in_file(file):
     with open(file, 'r') as fp:
         n_lines = len(fp.readlines())
     return n_lines
 
-def _get_word_information(words, file):
-    for word in list(words.keys()):
-        words[word] = _count_word_in_urdf_file(word, file)
-    return words
+def get_keyword_counts(urdf_files: list[str], words: list[str]=TOOL_COMPARISON_WORDS):
+    """
+    Count the occurrences of the words in the URDF files, reading each file once for all of the words.
 
+    :return: a row for each URDF file, in the order of the files, with a column for each word
+    :rtype: pd.DataFrame
+    """
+    return pd.DataFrame([_count_words_in_urdf_file(words, urdf_file) for urdf_file in urdf_files], index=urdf_files, columns=words)
 
-def generate_tool_comparison_schema(urdf_files, urdf_parsing_results=None, out=True):
-    parsers = URDFparser.supported_parsers
-    parser_results = {}
-    for p in parsers:
-        parser_results[p] = 0
 
-    # read urdf file and check for words
-    words = {'xacro': 0,'package': 0, 'author':0}
+def generate_tool_comparison_schema(urdf_files, urdf_parsing_results=None, out=True, structure_only: bool=False, partial: bool=False, journal: ParsingJournal=None, progress: ProgressReporter=None, normalized: bool=False, keyword_counts: pd.DataFrame=None):
+    """
+    :param urdf_parsing_results: the parsing results of the URDF files, see get_parsings_information(). The files are parsed if not provided.
+    :type urdf_parsing_results: pd.DataFrame
+    :param partial: if True, the counts of the passed URDF files are returned and saved instead of the formatted schema,
+        such that the schemas of several shards can be combined using merge_tool_comparison_schemas()
+    :type partial: bool
+    :param journal: the journal recording the completed (file, parser) units, see get_parsings_information()
+    :type journal: ParsingJournal
+    :param progress: if provided, the progress of parsing the files with each parser is reported, see get_parsings_information()
+    :type progress: ProgressReporter
+    :param normalized: if True, the parsers are fed the canonical URDF files, see get_parsings_information()
+    :type normalized: bool
+    :param keyword_counts: the counts of the words in the URDF files, see get_keyword_counts(). The words are counted if not provided.
+    :type keyword_counts: pd.DataFrame
+    """
+    parsers = URDFparser.supported_parsers
+    words = TOOL_COMPARISON_WORDS
 
     tool_cmp_results_column_name = 'n_passed_urdfs'
     tool_cmp_results = pd.DataFrame(0, index=parsers, columns=[tool_cmp_results_column_name])
@@ -83,49 +323,189 @@ def generate_tool_comparison_schema(urdf_files, urdf_parsing_results=None, out=T
     if isinstance(urdf_files, list):
         if urdf_parsing_results is None:
             # urdf_parsing_results = get_parsings_information(urdf_files, parsers)
-            urdf_parsing_results = _get_parsings_information_tool_cmp(urdf_files, parsers)
-
-        # add word columns
-        for word in words.keys():
-            urdf_parsing_results[word] = 0
-            tool_cmp_results[word] = 0
+            urdf_parsing_results = _get_parsings_information_tool_cmp(urdf_files, parsers, structure_only=structure_only, journal=journal, progress=progress, normalized=normalized)
 
-        for urdf_file in urdf_files:
-            words = _get_word_information(words, urdf_file)
-            urdf_parsing_results.loc[urdf_file, list(words.keys())] = list(words.values())
+        if keyword_counts is None:
+            keyword_counts = get_keyword_counts(urdf_files, words)
 
-        # dropping the count column, as we're not using it
-        urdf_parsing_results = urdf_parsing_results.drop(['count'], axis=1)
-        
-        tool_cmp_results.loc[:,tool_cmp_results_column_name] = urdf_parsing_results.iloc[:,0:len(parsers)].sum()
-        
-        total_files_words = words
-        for word in words:
-            total_files_words[word] = urdf_parsing_results.query(f"{word} > 0").shape[0]
-            for p in parsers:
-                n_passed_with_word = urdf_parsing_results.query(f"{p} == True & {word} > 0").shape[0]
-                tool_cmp_results.loc[p,word] = f"{n_passed_with_word}/{tool_cmp_results.loc[p,tool_cmp_results_column_name]}"
-        
-        n_urdf_files = urdf_parsing_results.shape[0]
+        # add the word columns to a copy, as the parsing results may be shared with other schemas,
+        # and drop the count and parse mode columns, as we're not using them
+        urdf_parsing_results = urdf_parsing_results.drop(['count', 'parse_mode'] + words, axis=1, errors='ignore').join(keyword_counts[words])
 
-        tool_cmp_results = tool_cmp_results.rename(columns={w:f"n_{w}_passed, total: {total_files_words[w]}" for w in words})
-        tool_cmp_results.loc[:,tool_cmp_results_column_name] = tool_cmp_results.loc[:,tool_cmp_results_column_name].astype(str) + f"/{n_urdf_files}"
+        tool_cmp_counts = _get_tool_comparison_counts(urdf_parsing_results, parsers, words)
+        if partial:
+            tool_cmp_results = tool_cmp_counts.reset_index()
+        else:
+            tool_cmp_results = _format_tool_comparison(tool_cmp_counts, words)
         
     if out == True:
         _save_information(tool_cmp_results, output_file=f"{DEFAULT_OUTPUT_DIR}/tool_comparison_schema")
-    # else:
-    #     _save_information(tool_cmp_results, out)
+    elif out:
+        _save_information(tool_cmp_results, out)
     
     return tool_cmp_results
 
 
-def generate_model_information_schema(urdf_files, out=True):
-    kwargs = {'joints': True, 'links': True}
-    urdfs_information: list[URDFInformation] = []
-    if isinstance(urdf_files, list):
-        urdfs_information = get_models_information(urdf_files, **kwargs)
+def _get_tool_comparison_counts(urdf_parsing_results, parsers: list[str], words: list[str]):
+    """
+    Count the URDF files passed by each parser, in total and of the files containing each word.
+    The counts are additive, i.e. the counts of several shards are summed to obtain the counts of all of the files.
+
+    :return: a row for each parser, with the number of files, the number of passed files, and for each word the number of files containing the word and the number of passed files containing the word
+    :rtype: pd.DataFrame
+    """
+    tool_cmp_counts = pd.DataFrame(index=pd.Index(parsers, name='parser'))
+    tool_cmp_counts['n_urdf_files'] = urdf_parsing_results.shape[0]
+    tool_cmp_counts['n_passed_urdfs'] = [int(urdf_parsing_results[p].astype(bool).sum()) for p in parsers]
+    for word in words:
+        has_word = urdf_parsing_results[word] > 0
+        tool_cmp_counts[f"n_{word}_files"] = int(has_word.sum())
+        tool_cmp_counts[f"n_{word}_passed"] = [int((urdf_parsing_results[p].astype(bool) & has_word).sum()) for p in parsers]
+    return tool_cmp_counts
+
+
+def _format_tool_comparison(tool_cmp_counts, words: list[str]):
+    # e.g. 'n_passed_urdfs': '3/4', and 'n_xacro_passed, total: 2': '1/3', i.e. 1 of the 3 passed files contains the word xacro, of the 2 files containing it
+    tool_cmp_results_column_name = 'n_passed_urdfs'
+    tool_cmp_results = pd.DataFrame(index=list(tool_cmp_counts.index))
+    tool_cmp_results[tool_cmp_results_column_name] = tool_cmp_counts['n_passed_urdfs'].astype(str) + "/" + tool_cmp_counts['n_urdf_files'].astype(str)
+    for word in words:
+        total_files_word = tool_cmp_counts[f"n_{word}_files"].max() if tool_cmp_counts.shape[0] > 0 else 0
+        tool_cmp_results[f"n_{word}_passed, total: {total_files_word}"] = tool_cmp_counts[f"n_{word}_passed"].astype(str) + "/" + tool_cmp_counts['n_passed_urdfs'].astype(str)
+    return tool_cmp_results
+
+
+def _read_partial_schemas(partial_files: list[str]):
+    partial_schemas = []
+    for partial_file in partial_files:
+        ext = str(partial_file).split(".")[-1]
+        if ext == "csv":
+            partial_schemas.append(pd.read_csv(partial_file))
+        elif ext == "json":
+            partial_schemas.append(pd.read_json(partial_file))
+        else:
+            raise ValueError(f"The partial schema '{partial_file}' cannot be merged, only .csv and .json schemas are supported.")
+    return pd.concat(partial_schemas, ignore_index=True)
+
+
+def merge_model_information_schemas(partial_files: list[str], out=True):
+    """
+    Combine the model-information schemas of several shards, see shard_urdf_files().
+
+    :param partial_files: the schemas of the shards
+    :type partial_files: list[str]
+    :param out: if True the schema is saved using the default filename, otherwise the filename of the schema. Not saved if False.
+    :return: the model-information of all of the shards
+    :rtype: pd.DataFrame
+    """
+    model_information = _read_partial_schemas(partial_files)
+    if out == True:
+        _save_information(model_information, output_file=f"{DEFAULT_OUTPUT_DIR}/model_information_schema")
+    elif out:
+        _save_information(model_information, out)
+    return model_information
+
+
+def merge_urdf_parsing_comparison_schemas(partial_files: list[str], out=True):
+    """
+    Combine the urdf parsing comparison schemas of several shards, recomputing the number of parsers that loaded each file.
+
+    :param partial_files: the schemas of the shards
+    :type partial_files: list[str]
+    :param out: if True the schema is saved using the default filename, otherwise the filename of the schema. Not saved if False.
+    :rtype: pd.DataFrame
+    """
+    parsing_results = _read_partial_schemas(partial_files)
+    parsers = [p for p in URDFparser.supported_parsers if p in parsing_results.columns]
+    parsing_results['count'] = parsing_results[parsers].astype(bool).sum(axis=1)
+    if out == True:
+        _save_information(parsing_results, output_file=f"{DEFAULT_OUTPUT_DIR}/urdf_parsing_comparison_schema")
+    elif out:
+        _save_information(parsing_results, out)
+    return parsing_results
+
+
+def merge_tool_comparison_schemas(partial_files: list[str], out=True):
+    """
+    Combine the partial tool comparison schemas of several shards, i.e. generated with partial=True, by summing the counts of each parser.
+
+    :param partial_files: the partial schemas of the shards
+    :type partial_files: list[str]
+    :param out: if True the schema is saved using the default filename, otherwise the filename of the schema. Not saved if False.
+    :return: the tool comparison of all of the shards, as generated by generate_tool_comparison_schema()
+    :rtype: pd.DataFrame
+    """
+    tool_cmp_counts = _read_partial_schemas(partial_files).groupby('parser', sort=False).sum()
+    parsers = [p for p in URDFparser.supported_parsers if p in tool_cmp_counts.index]
+    words = [c[len("n_"):-len("_files")] for c in tool_cmp_counts.columns if c.endswith("_files") and c != "n_urdf_files"]
+    tool_cmp_results = _format_tool_comparison(tool_cmp_counts.loc[parsers], words)
+    if out == True:
+        _save_information(tool_cmp_results, output_file=f"{DEFAULT_OUTPUT_DIR}/tool_comparison_schema")
+    elif out:
+        _save_information(tool_cmp_results, out)
+    return tool_cmp_results
+
+
+def merge_dataset_statistics_schemas(partial_files: list[str], out=True):
+    """
+    Combine the partial dataset statistics of several shards, i.e. generated with partial=True. The merged statistics are
+    the same as the statistics computed over all of the files at once.
+
+    :param partial_files: the partial statistics (.json) of the shards
+    :type partial_files: list[str]
+    :param out: if True the schema is saved using the default filename, otherwise the filename of the schema. Not saved if False.
+    :return: the summary of the statistics of all of the shards
+    :rtype: pd.DataFrame
+    """
+    statistics = None
+    for partial_file in partial_files:
+        with open(partial_file, 'r') as f:
+            partial_statistics = DatasetStatistics.from_dict(json.load(f))
+        statistics = partial_statistics if statistics is None else statistics.merge(partial_statistics)
+    statistics_summary = statistics.get_summary() if statistics is not None else DatasetStatistics().get_summary()
+    if out == True:
+        _save_information(statistics_summary, output_file=f"{DEFAULT_OUTPUT_DIR}/dataset_statistics_schema")
+    elif out:
+        _save_information(statistics_summary, out)
+    return statistics_summary
+
+
+def merge_schemas(schema: str, partial_files: list[str], out=True):
+    """
+    Combine the partial schemas generated on several shards into the schema of the whole dataset.
+
+    :param schema: the type of the schemas, one of 'model-info', 'urdf-parse-cmp', 'tool-cmp' and 'dataset-stats'
+    :type schema: str
+    :raises ValueError: if the schemas of this type cannot be merged
+    """
+    merge_functions = {'model-info': merge_model_information_schemas,
+                       'urdf-parse-cmp': merge_urdf_parsing_comparison_schemas,
+                       'tool-cmp': merge_tool_comparison_schemas,
+                       'dataset-stats': merge_dataset_statistics_schemas}
+    if schema not in merge_functions:
+        raise ValueError(f"The '{schema}' schemas cannot be merged. The schemas that can be merged are: {list(merge_functions.keys())}")
+    return merge_functions[schema](partial_files, out)
+
+
+def generate_model_information_schema(urdf_files, out=True, n_workers: int=None, progress: ProgressReporter=None, urdfs_information: list[URDFInformation]=None):
+    """
+    :param urdfs_information: the model information of the URDF files, computed with MODEL_INFORMATION_SCHEMA_KWARGS, see get_xml_information().
+        The files are analysed if not provided.
+    :type urdfs_information: list[URDFInformation]
+    """
+    kwargs = MODEL_INFORMATION_SCHEMA_KWARGS
+    if urdfs_information is not None:
+        pass # already analysed
+    elif isinstance(urdf_files, list):
+        # expand the xacro files in the worker pool, so the model analysis reads the expanded files from the xacro cache
+        xacro_files = [f for f in urdf_files if str(f).endswith(".xacro")]
+        if len(xacro_files) > 0:
+            expand_xacros(xacro_files, n_workers)
+        if progress is not None:
+            progress.start_stage("model-info", len(urdf_files))
+        urdfs_information = get_models_information(urdf_files, progress=progress, **kwargs)
     else:
-        urdfs_information.append(get_model_information(urdf_files, **kwargs))
+        urdfs_information = [get_model_information(urdf_files, **kwargs)]
     
     if out == True:
         save_model_information(urdfs_information, output_file=f"{DEFAULT_OUTPUT_DIR}/model_information_schema", full_results=True)
@@ -137,12 +517,283 @@ def generate_model_information_schema(urdf_files, out=True):
     return urdfs_information
 
 
-def generate_urdf_parsing_comparison_schema(urdf_files, out=True):
+def _get_dataset_statistics(urdf_files):
+    return get_dataset_statistics(urdf_files, logging.getLogger("urdf_analyzer")).to_dict()
+
+
+def generate_dataset_statistics_schema(urdf_files, out=True, n_workers: int=None, partial: bool=False, progress: ProgressReporter=None, dataset_statistics: DatasetStatistics=None):
+    """
+    Summarise the joints, degrees of freedom, links, mesh formats and file sizes of the URDF files, in a single pass.
+    The files are split into chunks, of which the statistics are computed in a process pool and merged, see DatasetStatistics.
+
+    :param out: if True the schema is saved using the default filename, otherwise the filename of the schema. Not saved if False.
+    :param partial: if True, the mergeable statistics are saved (.json) instead of the summary, such that the statistics of several shards
+        can be combined using merge_dataset_statistics_schemas()
+    :type partial: bool
+    :param progress: if provided, the files are reported as each chunk is returned by the workers
+    :type progress: ProgressReporter
+    :param dataset_statistics: the statistics of the URDF files, see get_xml_information(). The files are read if not provided.
+    :type dataset_statistics: DatasetStatistics
+    :rtype: DatasetStatistics
+    """
+    if not isinstance(urdf_files, list):
+        urdf_files = [urdf_files]
+    urdf_files = [str(f) for f in urdf_files]
+    statistics = dataset_statistics
+    if statistics is None:
+        n_chunks = 1 if n_workers == 1 else 4 * (n_workers if n_workers is not None else (os.cpu_count() or 1))
+        chunks = [urdf_files[i::n_chunks] for i in range(min(n_chunks, len(urdf_files)))]
+        statistics = DatasetStatistics()
+        if progress is not None:
+            progress.start_stage("dataset-stats", len(urdf_files))
+        for partial_statistics in _imap_in_pool(_get_dataset_statistics, chunks, n_workers):
+            statistics.merge(DatasetStatistics.from_dict(partial_statistics))
+            if progress is not None:
+                progress.update(partial_statistics["n_files"], partial_statistics["n_failed_files"])
+
+    output_file = f"{DEFAULT_OUTPUT_DIR}/dataset_statistics_schema" if out == True else out
+    if output_file and partial:
+        dir = os.path.dirname(output_file)
+        if dir != "" and not Path(dir).exists():
+            os.makedirs(dir)
+        with open(output_file if output_file.endswith(".json") else f"{output_file}.json", 'w') as f:
+            json.dump(statistics.to_dict(), f)
+    elif output_file:
+        _save_information(statistics.get_summary(), output_file)
+    return statistics
+
+
+def generate_validation_schema(urdf_files, out=True, rules: list[str]=None, progress: ProgressReporter=None, validation_issues: list=None):
+    """
+    Validate the URDF files against the URDF standard, and check that the links and joints form a kinematic tree.
+
+    :param urdf_files: the URDF files to validate
+    :type urdf_files: list[str] or str
+    :param out: if True the schema is saved using the default filename, otherwise the filename of the schema
+    :param rules: the names of the validation rules to use. By default all of the registered rules are used.
+    :type rules: list[str]
+    :param progress: if provided, the progress of validating the files is reported
+    :type progress: ProgressReporter
+    :param validation_issues: the (filename, issues) of the URDF files validated with the rules, see get_xml_information().
+        The files are validated if not provided.
+    :type validation_issues: list[tuple[str, list[ValidationIssue]]]
+    :return: one row per URDF file, with the number of issues of each type and the issue messages
+    :rtype: pd.DataFrame
+    """
+    l = logging.getLogger("urdf_analyzer")
+    if not isinstance(urdf_files, list):
+        urdf_files = [urdf_files]
+
+    validator = URDFValidator(l, rules)
+    validation_results = []
+    if progress is not None and validation_issues is None:
+        progress.start_stage("validation", len(urdf_files))
+    for urdf_file, issues in validation_issues if validation_issues is not None else validate_urdfs(urdf_files, validator):
+        validation_results.append(validator.get_issues_information(str(urdf_file), issues))
+        if progress is not None and validation_issues is None:
+            progress.update(failed=1 if issues is None else 0)
+    validation_results = pd.DataFrame.from_records(validation_results, columns=list(validator.get_issues_information(None, None).keys()))
+
+    if out == True:
+        _save_information(validation_results, output_file=f"{DEFAULT_OUTPUT_DIR}/validation_schema")
+    else:
+        _save_information(validation_results, out)
+
+    return validation_results
+
+
+def get_validation_information(filename: str, model_analysis: ModelAnalysis=None, validator: URDFValidator=None):
+    """
+    Validate a URDF file against the URDF standard, and check that the links and joints form a kinematic tree.
+
+    :return: the issues found, or None if the file could not be read
+    :rtype: list[ValidationIssue]
+    """
+    l = logging.getLogger("urdf_analyzer")
+    model_analysis = model_analysis if model_analysis is not None else ModelAnalysis(l)
+    validator = validator if validator is not None else URDFValidator(l)
+    root = model_analysis.xml_urdf_reader(filename)
+    if root is None:
+        return None
+    return validator.validate(root)
+
+
+def validate_urdfs(urdf_files: list[str], validator: URDFValidator=None):
+    """
+    Validate the URDF files one at a time, yielding the results of each file as soon as it has been validated.
+    The execution time and hit count of each rule are accumulated in the validator, see URDFValidator.get_rule_statistics().
+
+    :return: a generator of (filename, issues), where issues is None if the file could not be read
+    :rtype: Generator[tuple[str, list[ValidationIssue]]]
+    """
+    l = logging.getLogger("urdf_analyzer")
+    model_analysis = ModelAnalysis(l)
+    validator = validator if validator is not None else URDFValidator(l)
+    for urdf_file in urdf_files:
+        yield urdf_file, get_validation_information(urdf_file, model_analysis, validator)
+
+
+def generate_catalog_schema(urdf_files, out=True, progress: ProgressReporter=None, urdfs_information: list[URDFInformation]=None):
+    """
+    Analyse the URDF files and persist the per-file, per-joint and per-link results in the catalog, which can be queried using query_catalog().
+
+    :param urdf_files: the URDF files to add to the catalog
+    :type urdf_files: list[str] or str
+    :param out: if True the default catalog file is used, otherwise the path of the catalog file
+    :param progress: if provided, the progress of analysing the files is reported
+    :type progress: ProgressReporter
+    :param urdfs_information: the model information of the URDF files, including the joints and links, see get_xml_information().
+        The files are analysed if not provided.
+    :type urdfs_information: list[URDFInformation]
+    :return: the catalog file
+    :rtype: str
+    """
+    l = logging.getLogger("urdf_analyzer")
+    kwargs = {'joints': True, 'links': True}
+    if not isinstance(urdf_files, list):
+        urdf_files = [urdf_files]
+    if urdfs_information is None:
+        if progress is not None:
+            progress.start_stage("catalog", len(urdf_files))
+        urdfs_information = get_models_information(urdf_files, progress=progress, **kwargs)
+
+    catalog_file = DEFAULT_CATALOG_FILE if out == True else out
+    catalog = URDFCatalog(catalog_file, l)
+    catalog.add_urdfs_information(urdfs_information, urdf_files)
+    catalog.close()
+    l.info(f"Added {len(urdf_files)} urdf files to the catalog '{catalog_file}'")
+
+    return catalog_file
+
+
+def query_catalog(catalog_file: str=DEFAULT_CATALOG_FILE, sql: str=None, **kwargs):
+    r"""
+    Query the catalog generated with generate_catalog_schema(), without reading the URDF files again.
+
+    :param catalog_file: the catalog file to query
+    :type catalog_file: str
+    :param sql: an SQL statement to run against the files, joints and links tables. If provided, the keyword arguments are ignored.
+    :type sql: str
+    :param \**kwargs:
+        See below
+    :return: the results of the query
+    :rtype: pd.DataFrame
+
+    :Keyword Arguments:
+        * *where* (``str``) --
+          An SQL condition on the files table, e.g. "n_revolute_joints > 6".
+        * *joint_type* (``str``) --
+          Only return files containing a joint of this type.
+        * *visual_mesh* (``str``) --
+          Only return files containing a visual mesh with this extension.
+        * *collision_mesh* (``str``) --
+          Only return files containing a collision mesh with this extension.
+    """
+    l = logging.getLogger("urdf_analyzer")
+    catalog = URDFCatalog(catalog_file, l, read_only=True)
+    try:
+        if sql is not None:
+            results = catalog.sql(sql)
+        else:
+            filters = {k: kwargs[k] for k in ['where', 'joint_type', 'visual_mesh', 'collision_mesh'] if kwargs.get(k) is not None}
+            results = catalog.query(**filters)
+    finally:
+        catalog.close()
+    return results
+
+
+def _get_urdf_names(urdf_file, urdfs_names: dict=None):
+    stat = os.stat(urdf_file)
+    names = urdfs_names[str(urdf_file)] if urdfs_names is not None else get_urdf_names(str(urdf_file), ModelAnalysis(logging.getLogger("urdf_analyzer")))
+    return str(urdf_file), names, stat.st_mtime_ns, stat.st_size
+
+
+def get_name_index_changed_files(urdf_files: list[str], out=True):
+    """
+    :param out: if True the default name index file is used, otherwise the path of the name index file
+    :return: the URDF files which are new or modified since they were added to the name index, see URDFNameIndex.get_changed_files()
+    :rtype: list[str]
+    """
+    name_index = URDFNameIndex(DEFAULT_NAME_INDEX_FILE if out == True else out, logging.getLogger("urdf_analyzer"))
+    try:
+        return name_index.get_changed_files(urdf_files)
+    finally:
+        name_index.close()
+
+
+def generate_name_index_schema(urdf_files, out=True, n_workers: int=None, progress: ProgressReporter=None, urdfs_names: dict=None):
+    """
+    Add the link names, joint names and mesh filenames of the URDF files to the name index, which can be searched using search_names().
+    The index is updated incrementally: only the URDF files which are new or modified since they were indexed are read, in a process pool,
+    and the files which no longer exist are removed.
+
+    :param urdf_files: the URDF files to add to the name index
+    :type urdf_files: list[str] or str
+    :param out: if True the default name index file is used, otherwise the path of the name index file
+    :param progress: if provided, the progress of reading the new and modified files is reported
+    :type progress: ProgressReporter
+    :param urdfs_names: the (kind, name) of each of the new and modified URDF files, see get_xml_information(). The files are read if not provided.
+    :type urdfs_names: dict
+    :return: the name index file
+    :rtype: str
+    """
+    l = logging.getLogger("urdf_analyzer")
+    if not isinstance(urdf_files, list):
+        urdf_files = [urdf_files]
+    index_file = DEFAULT_NAME_INDEX_FILE if out == True else out
+    name_index = URDFNameIndex(index_file, l)
+    try:
+        changed_files = name_index.get_changed_files(urdf_files)
+        l.info(f"Indexing {len(changed_files)} new or modified of the {len(urdf_files)} urdf files")
+        if progress is not None and urdfs_names is None:
+            progress.start_stage("name-index", len(changed_files))
+        with name_index.connection:
+            if urdfs_names is not None:
+                files_names = (_get_urdf_names(f, urdfs_names) for f in changed_files)
+            else:
+                files_names = _imap_in_pool(_get_urdf_names, changed_files, n_workers)
+            for urdf_file, names, mtime_ns, size in files_names:
+                name_index.add_file(urdf_file, names, mtime_ns, size)
+                if progress is not None and urdfs_names is None:
+                    progress.update(failed=1 if names is None else 0)
+        n_removed = name_index.remove_missing_files()
+        if n_removed > 0:
+            l.info(f"Removed {n_removed} urdf files which no longer exist from the name index")
+    finally:
+        name_index.close()
+    return index_file
+
+
+def search_names(pattern: str, index_file: str=DEFAULT_NAME_INDEX_FILE, kinds: list[str]=None, fuzzy: bool=False, min_similarity: float=DEFAULT_NAME_SIMILARITY, limit: int=None):
+    """
+    Search the link names, joint names and mesh filenames in the name index generated with generate_name_index_schema(),
+    without reading the URDF files again, see URDFNameIndex.search().
+
+    :return: a row for each matching name and file containing it
+    :rtype: pd.DataFrame
+    """
+    l = logging.getLogger("urdf_analyzer")
+    name_index = URDFNameIndex(index_file, l, read_only=True)
+    try:
+        results = name_index.search(pattern, kinds, fuzzy, min_similarity, limit)
+    finally:
+        name_index.close()
+    return results
+
+
+def generate_urdf_parsing_comparison_schema(urdf_files, out=True, structure_only: bool=False, journal: ParsingJournal=None, progress: ProgressReporter=None, normalized: bool=False, parsing_results: pd.DataFrame=None):
+    """
+    :param parsing_results: the parsing results of the URDF files with all of the parsers, see get_parsings_information().
+        The files are parsed if not provided.
+    :type parsing_results: pd.DataFrame
+    """
     parsers = URDFparser.supported_parsers 
-    if isinstance(urdf_files, list):
-        parsing_results = get_parsings_information(urdf_files, parsers)
+    if parsing_results is not None:
+        pass # already parsed
+    elif isinstance(urdf_files, list):
+        parsing_results = get_parsings_information(urdf_files, parsers, structure_only=structure_only, journal=journal, progress=progress, normalized=normalized)
     else:
-        parsing_results = get_parsing_information(urdf_files, parsers) # TODO: check up with the urdf_root_dir
+        parsing_results = get_parsing_information(urdf_files, parsers, structure_only=structure_only, normalized=normalized) # TODO: check up with the urdf_root_dir
 
     if out == True:
         _save_information(parsing_results, output_file=f"{DEFAULT_OUTPUT_DIR}/urdf_parsing_comparison_schema")
@@ -152,7 +803,7 @@ def generate_urdf_parsing_comparison_schema(urdf_files, out=True):
     return parsing_results    
 
 
-def generate_duplicates_comparison_schema(duplicates_file, dup_cmp_sources=None, dup_cmp_parser=None, out=True):
+def generate_duplicates_comparison_schema(duplicates_file, dup_cmp_sources=None, dup_cmp_parser=None, out=True, n_workers: int=None):
     with open(duplicates_file, 'r') as f:
         duplicates = json.load(f)
 
@@ -160,11 +811,11 @@ def generate_duplicates_comparison_schema(duplicates_file, dup_cmp_sources=None,
     meta_info_columns = ["name","variant"]
     duplicates_information_columns = meta_info_columns + ["source","n_urdf_files","n_joints","n_links","visual_meshes","collision_meshes","n_lines"]
     duplicates_comparisons_columns = meta_info_columns + ["sources","joints_diff","links_diff","mesh_diff","fk_diff","n_lines_diff","urdf_files"]
-    duplicates_information = pd.DataFrame(columns=duplicates_information_columns)
-    duplicates_comparisons = pd.DataFrame(columns=duplicates_comparisons_columns)
-    
     
-    duplicates_information, duplicates_comparisons = _get_duplicates_information(duplicates, duplicates_file, duplicates_information, duplicates_comparisons, dup_cmp_sources)
+    information_records, comparison_records = _get_duplicates_information(duplicates, duplicates_file, dup_cmp_sources, n_workers)
+    # the frames are created once from the records of all of the groups
+    duplicates_information = pd.DataFrame.from_records(information_records, columns=duplicates_information_columns)
+    duplicates_comparisons = pd.DataFrame.from_records(comparison_records, columns=duplicates_comparisons_columns)
 
     if out == True:
         _save_information(duplicates_information, output_file=f"{DEFAULT_OUTPUT_DIR}/duplicates_information_schema.csv")
@@ -173,12 +824,17 @@ def generate_duplicates_comparison_schema(duplicates_file, dup_cmp_sources=None,
         _save_information(duplicates_information, out)
         _save_information(duplicates_comparisons, out)
 
-def __get_duplicates_information(files, duplicates_file, robot, variant, duplicate, model_information_kwargs, transformations, duplicates_information):
+    return duplicates_information, duplicates_comparisons
+
+def _get_duplicate_urdf_files(duplicates_file, duplicate):
     dirname = os.path.dirname(duplicates_file)
     urdf_files = list(map(str.strip, duplicate['urdf_path'].strip('][').replace('"', '').split(',')))
     urdf_files = [f.strip("WindowsPath('") for f in urdf_files]
     urdf_files = [f.strip("')") for f in urdf_files]
-    urdf_files = [Path(dirname, f) for f in urdf_files]
+    return [Path(dirname, f) for f in urdf_files]
+
+def __get_duplicates_information(files, duplicates_file, robot, variant, duplicate, model_information_kwargs, transformations):
+    urdf_files = _get_duplicate_urdf_files(duplicates_file, duplicate)
     
     files += urdf_files
     n_urdf_files = len(urdf_files)
@@ -237,21 +893,19 @@ def __get_duplicates_information(files, duplicates_file, robot, variant, duplica
                 'visual_meshes': str(visual_meshes),
                 'collision_meshes': str(collision_meshes),
                 'n_lines': n_lines}
-    
-    duplicates_information = pd.concat([duplicates_information, pd.DataFrame(data=information_results, index=[0])])
 
     # accumulate to one index using: pd.MultiIndex.from_frame(df)
-    return duplicates_information, transformations, n_lines, files
+    return information_results, n_lines
 
 
-def __get_comparison_information(logger, duplicates_comparisons, duplicates_information, n_duplicates, files, transformations, n_lines, robot, variant):
+def __get_comparison_information(logger, group_information, files, transformations, n_lines, robot, variant):
     fk_diff = None
 
     if len(transformations) > 1:
         for transformation1,transformation2 in itertools.combinations(transformations, 2):
             if transformations[transformation1] != transformations[transformation2]: 
                 if not Path(DEFAULT_TRANFORMATION_COMPARISON_DIR).exists():
-                    os.makedirs(DEFAULT_TRANFORMATION_COMPARISON_DIR)
+                    os.makedirs(DEFAULT_TRANFORMATION_COMPARISON_DIR, exist_ok=True)
                 # TODO: fix this, so the same transformation isn't saved multiple times (waste of resources)
                 try:
                     import numpy as np
@@ -264,10 +918,8 @@ def __get_comparison_information(logger, duplicates_comparisons, duplicates_info
                 except:
                     logger.warning("Error occurred when saving the transformations of the duplicates.")
                 fk_diff = True
-                # duplicates_information.iloc[len(duplicates_information)-n_duplicates:len(duplicates_information), duplicates_information.columns.get_loc('fk_same')] = False
             else:
                 fk_diff = None
-                # duplicates_information.iloc[len(duplicates_information)-n_duplicates:len(duplicates_information), duplicates_information.columns.get_loc('fk_same')] = True
 
 
     duplicates = []
@@ -287,50 +939,56 @@ def __get_comparison_information(logger, duplicates_comparisons, duplicates_info
                     "urdf_files": str(duplicates)
                     }
 
+    comparison_results['sources'] = str([i["source"] for i in group_information])
 
-
-    cur_urdf_files_index = len(duplicates_information)-n_duplicates
-    joints_info = duplicates_information.iloc[cur_urdf_files_index:len(duplicates_information),duplicates_information.columns.get_loc("n_joints")]
-    links_info = duplicates_information.iloc[cur_urdf_files_index:len(duplicates_information),duplicates_information.columns.get_loc("n_links")]
-    visual_mesh_info = duplicates_information.iloc[cur_urdf_files_index:len(duplicates_information),duplicates_information.columns.get_loc("visual_meshes")]
-    collision_mesh_info = duplicates_information.iloc[cur_urdf_files_index:len(duplicates_information),duplicates_information.columns.get_loc("collision_meshes")]
-    n_lines_info = duplicates_information.iloc[cur_urdf_files_index:len(duplicates_information),duplicates_information.columns.get_loc("n_lines")]
-
-    sources = list(duplicates_information.iloc[cur_urdf_files_index:len(duplicates_information),duplicates_information.columns.get_loc("source")])
-    comparison_results['sources'] = str(sources)
-
-    comparison_results = _compare_information(joints_info, comparison_results, "joints_diff")
-    comparison_results = _compare_information(links_info, comparison_results, "links_diff")
-    comparison_results = _compare_information(visual_mesh_info, comparison_results, "mesh_diff")
+    comparison_results = _compare_information([i["n_joints"] for i in group_information], comparison_results, "joints_diff")
+    comparison_results = _compare_information([i["n_links"] for i in group_information], comparison_results, "links_diff")
+    comparison_results = _compare_information([i["visual_meshes"] for i in group_information], comparison_results, "mesh_diff")
     if comparison_results["mesh_diff"] != "":
-        comparison_results = _compare_information(collision_mesh_info, comparison_results, "mesh_diff")
-    comparison_results = _compare_information(n_lines_info, comparison_results, "n_lines_diff")
-    
-
-    duplicates_comparisons = pd.concat([duplicates_comparisons, pd.DataFrame(data=comparison_results, index=[0])])
+        comparison_results = _compare_information([i["collision_meshes"] for i in group_information], comparison_results, "mesh_diff")
+    comparison_results = _compare_information([i["n_lines"] for i in group_information], comparison_results, "n_lines_diff")
 
-    return duplicates_information, duplicates_comparisons
+    return comparison_results
 
 
+def _get_duplicate_group_information(group):
+    """
+    Get the information of each duplicate of a robot variant, and the comparison of the duplicates.
+    Each group is independent of the other groups, such that the groups can be processed in parallel.
 
-def _get_duplicates_information(duplicates, duplicates_file, duplicates_information, duplicates_comparisons, dup_cmp_sources):
+    :param group: (duplicates_file, robot, variant, duplicates)
+    :return: the information records of the duplicates, and the comparison record of the group
+    :rtype: tuple[list[dict], dict]
+    """
+    duplicates_file, robot, variant, duplicates = group
     logger = logging.getLogger("urdf_analyzer")
 
     model_information_kwargs = {'joints': True, 'links': True}
     transformations = {}
     files = []
     n_lines = 0
-    
-    # for each subdirectory in the current directory, get the urdf files, and run the analysis. Add results to dataframe
+    information_records = []
+    for duplicate in duplicates:
+        information_results, n_lines = __get_duplicates_information(files, duplicates_file, robot, variant, duplicate, model_information_kwargs, transformations)
+        information_records.append(information_results)
+    comparison_results = __get_comparison_information(logger, information_records, files, transformations, n_lines, robot, variant)
+    return information_records, comparison_results
+
+
+def _get_duplicates_information(duplicates, duplicates_file, dup_cmp_sources, n_workers: int=None):
+    # each robot variant is an independent task in the process pool
+    groups = []
     for robot in duplicates:
         for variant in duplicates[robot]:
-            for duplicate in duplicates[robot][variant]: # urdf_files, robot, variant, source,model_information_kwargs, transformations, duplicates_information
-                duplicates_information, transformations, n_lines, files = __get_duplicates_information(files, duplicates_file, robot, variant, duplicate, model_information_kwargs, transformations, duplicates_information)
-            n_duplicates = len(duplicates[robot][variant])
-            duplicates_information, duplicates_comparisons = __get_comparison_information(logger, duplicates_comparisons, duplicates_information, n_duplicates, files, transformations, n_lines, robot, variant)
+            group_duplicates = [d for d in duplicates[robot][variant] if dup_cmp_sources is None or d["source"] in dup_cmp_sources]
+            groups.append((duplicates_file, robot, variant, group_duplicates))
 
-    
-    return duplicates_information, duplicates_comparisons
+    information_records = []
+    comparison_records = []
+    for group_information_records, comparison_results in _map_in_pool(_get_duplicate_group_information, groups, n_workers):
+        information_records += group_information_records
+        comparison_records.append(comparison_results)
+    return information_records, comparison_records
 
 
 def _compare_information(information, comparison_results, key):
@@ -342,6 +1000,83 @@ def _compare_information(information, comparison_results, key):
     return comparison_results
 
 
+def get_diff_information(filename_a: str, filename_b: str, urdf_diff: URDFDiff=None):
+    """
+    Describe how two URDF files differ, i.e. the links, joints and geometry elements that were added, removed, renamed or modified.
+
+    :return: the changes from the first to the second file, or None if one of the files could not be read
+    :rtype: list[ElementChange]
+    """
+    urdf_diff = urdf_diff if urdf_diff is not None else URDFDiff(logging.getLogger("urdf_analyzer"))
+    return urdf_diff.diff_files(filename_a, filename_b)
+
+
+def _diff_urdf_pair(pair):
+    urdf_diff = URDFDiff(logging.getLogger("urdf_analyzer"))
+    filename_a, filename_b = str(pair[0]), str(pair[1])
+    return urdf_diff.get_diff_information(filename_a, filename_b, urdf_diff.diff_files(filename_a, filename_b))
+
+
+def diff_urdfs(urdf_file_pairs: list[tuple[str, str]], n_workers: int=None):
+    """
+    Compare each pair of URDF files, in a process pool.
+
+    :param urdf_file_pairs: the pairs of URDF files to compare
+    :type urdf_file_pairs: list[tuple[str, str]]
+    :param n_workers: the number of worker processes. Defaults to the number of CPUs.
+    :type n_workers: int
+    :return: a row for each pair, with the number of changes of each type and the descriptions of the changes
+    :rtype: pd.DataFrame
+    """
+    columns = list(URDFDiff(logging.getLogger("urdf_analyzer")).get_diff_information(None, None, None).keys())
+    return pd.DataFrame.from_records(_map_in_pool(_diff_urdf_pair, list(urdf_file_pairs), n_workers), columns=columns)
+
+
+def get_duplicates_urdf_pairs(duplicates_file, dup_cmp_sources=None):
+    """
+    The pairs of URDF files to compare in the duplicates file: for each robot and variant, the files of each pair of sources.
+    If both sources have a single URDF file they are compared, otherwise the URDF files with the same filename are compared.
+
+    :return: the pairs of URDF files, and the (robot, variant, source a, source b) of each pair
+    :rtype: tuple[list[tuple[Path, Path]], list[tuple[str, str, str, str]]]
+    """
+    with open(duplicates_file, 'r') as f:
+        duplicates = json.load(f)
+    pairs = []
+    groups = []
+    for robot in duplicates:
+        for variant in duplicates[robot]:
+            sources = [(d["source"], _get_duplicate_urdf_files(duplicates_file, d)) for d in duplicates[robot][variant]
+                       if dup_cmp_sources is None or d["source"] in dup_cmp_sources]
+            for (source_a, files_a), (source_b, files_b) in itertools.combinations(sources, 2):
+                if len(files_a) == 1 and len(files_b) == 1:
+                    file_pairs = [(files_a[0], files_b[0])]
+                else:
+                    files_b_by_name = {f.name: f for f in files_b}
+                    file_pairs = [(f, files_b_by_name[f.name]) for f in files_a if f.name in files_b_by_name]
+                pairs += file_pairs
+                groups += [(robot, variant, source_a, source_b)] * len(file_pairs)
+    return pairs, groups
+
+
+def generate_duplicates_diff_schema(duplicates_file, dup_cmp_sources=None, out=True, n_workers: int=None):
+    """
+    Describe how the duplicate URDF files of each robot differ, comparing all of the duplicate groups in parallel.
+    """
+    pairs, groups = get_duplicates_urdf_pairs(duplicates_file, dup_cmp_sources)
+    diff_results = diff_urdfs(pairs, n_workers)
+    diff_results.insert(0, "name", [g[0] for g in groups])
+    diff_results.insert(1, "variant", [g[1] for g in groups])
+    diff_results.insert(2, "sources", [[g[2], g[3]] for g in groups])
+
+    if out == True:
+        _save_information(diff_results, output_file=f"{DEFAULT_OUTPUT_DIR}/duplicates_diff_schema")
+    elif out:
+        _save_information(diff_results, out)
+
+    return diff_results
+
+
 def _get_n_mesh_types(mesh, link_mesh_dict):
     for mesh_type in link_mesh_dict.keys():
         if mesh_type not in mesh:
@@ -372,8 +1107,25 @@ def get_model_information(filename: str=None, model_analysis: ModelAnalysis=None
           The root directory of the URDF file. This is mainly used if the URDF file is not in the current directory. It is also used to be able to localise the meshes.
         * *joints* (``boolean``) --
           If True, then the joint information is obtained and sved in the returned URDFInformation.
+        * *links* (``boolean``) --
+          If True, then the link information is obtained and saved in the returned URDFInformation.
+        * *mesh_statistics* (``boolean``) --
+          If True (with links), then the number of triangles, the bounds and the surface area of the STL, OBJ and Collada meshes of the link geometries are read,
+          and saved in the link information.
+        * *dynamics* (``boolean``) --
+          If True, then the inertial, limit and dynamics information is obtained and saved in the returned URDFInformation.
+        * *collisions* (``boolean``) --
+          If True, then the collision bounding boxes and self-collision candidates are obtained and saved in the returned URDFInformation.
+        * *topology* (``boolean``) --
+          If True, then the topology metrics of the kinematic tree (actuated DOF, depth, leaves, branching, serial chains, kinematic chains) are obtained and saved in the returned URDFInformation.
         * *model_analysis* (``ModelAnalysis``) --
           A ModelAnalysis object. It is expected that the urdf file has been loaded using the xml_urdf_reader() function, thus there is no need to reload the file.
+        * *xml_backend* (``str``) --
+          The XML backend used to read the URDF file ('lxml' or 'etree'). By default ElementTree ('etree') is used, lxml has to be chosen.
+        * *cache* (``ModelInformationCache`` or ``boolean``) --
+          If provided with a filename, the XML tree and the model information of the file are cached in the process, and are reused
+          until the file is modified. If True, the cache shared by the process is used, see get_model_information_cache().
+          The returned URDFInformation is a copy, whose joint, link, etc. information is shared with the cache and should not be modified.
 
     full description
 
@@ -383,8 +1135,12 @@ def get_model_information(filename: str=None, model_analysis: ModelAnalysis=None
     """
     l = logging.getLogger("urdf_analyzer")
 
+    cache = kwargs.pop('cache', None)
+    if filename is not None and model_analysis is None and cache is not None and cache is not False:
+        return _get_cached_model_information(filename, get_model_information_cache() if cache is True else cache, **kwargs)
+
     if filename is not None and model_analysis is None:
-        model_analysis = ModelAnalysis(l)
+        model_analysis = ModelAnalysis(l, kwargs.get('xml_backend'))
         urdf_root_dir = None
         if 'urdf_root_dir' in kwargs:
             urdf_root_dir = kwargs['urdf_root_dir']
@@ -400,12 +1156,67 @@ def get_model_information(filename: str=None, model_analysis: ModelAnalysis=None
     if 'joints' in kwargs and kwargs['joints'] == True:
         urdf_information.joint_information: JointsMetaInformation = model_analysis.get_joint_information()
     if 'links' in kwargs and kwargs['links'] == True:
-        urdf_information.link_information: LinksMetaInformation = model_analysis.get_link_information()
+        urdf_information.link_information: LinksMetaInformation = model_analysis.get_link_information(kwargs.get('mesh_statistics') == True)
+    if 'dynamics' in kwargs and kwargs['dynamics'] == True:
+        # reuse the joints and links that have already been read, if any
+        urdf_information.dynamics_information: DynamicsMetaInformation = model_analysis.get_dynamics_information(urdf_information.joint_information, urdf_information.link_information)
+    if 'collisions' in kwargs and kwargs['collisions'] == True:
+        urdf_information.collision_information: CollisionMetaInformation = model_analysis.get_collision_information(urdf_information.joint_information, urdf_information.link_information)
+    if 'topology' in kwargs and kwargs['topology'] == True:
+        urdf_information.topology_information: TopologyMetaInformation = model_analysis.get_topology_information(urdf_information.joint_information, urdf_information.link_information)
         
     return urdf_information
 
 
 
+_model_information_cache = None # the cache shared by the process, see get_model_information_cache()
+_model_information_cache_lock = threading.Lock()
+
+
+def get_model_information_cache(max_bytes: int=None):
+    """
+    :param max_bytes: the maximum estimated size of the cache in bytes, which replaces the maximum of the shared cache if provided
+    :type max_bytes: int
+    :return: the model information cache shared by the process, which is used by get_model_information(cache=True)
+    :rtype: ModelInformationCache
+    """
+    global _model_information_cache
+    with _model_information_cache_lock:
+        if _model_information_cache is None:
+            _model_information_cache = ModelInformationCache()
+        if max_bytes is not None:
+            _model_information_cache.max_bytes = max_bytes
+    return _model_information_cache
+
+
+def _get_cached_model_information(filename: str, cache: ModelInformationCache, **kwargs):
+    l = logging.getLogger("urdf_analyzer")
+    file_key = cache.get_file_key(filename, kwargs.get('urdf_root_dir'))
+    if file_key is None:
+        # the file does not exist, which is reported by the xml reader
+        return get_model_information(filename, **kwargs)
+    options = tuple(kwargs.get(k) == True for k in ['joints', 'links', 'mesh_statistics', 'dynamics', 'collisions', 'topology'])
+    information_key = ("information", *file_key, options, kwargs.get('xml_backend'))
+    urdf_information = cache.get(information_key)
+    if urdf_information is None:
+        # the XML tree is shared by the calls with other options
+        model_analysis = ModelAnalysis(l, kwargs.get('xml_backend'))
+        root_key = ("root", *file_key, kwargs.get('xml_backend'))
+        cached_root = cache.get(root_key)
+        if cached_root is not None:
+            model_analysis.root, model_analysis.urdf_root_dir = cached_root
+        elif model_analysis.xml_urdf_reader(filename, kwargs.get('urdf_root_dir')) is not None:
+            cache.put(root_key, (model_analysis.root, model_analysis.urdf_root_dir), estimate_element_bytes(model_analysis.root))
+        urdf_information = get_model_information(model_analysis=model_analysis, **kwargs)
+        if model_analysis.root is None:
+            return urdf_information
+        cache.put(information_key, urdf_information, estimate_object_bytes(urdf_information))
+    # a copy, such that the filename and the compiled results of the callers are not shared
+    urdf_information = copy.copy(urdf_information)
+    urdf_information.filename = filename
+    return urdf_information
+
+
 def get_models_information(urdf_files: list[str], **kwargs):
     """
     Get information on the models of the URDF files, i.e. joints, links, etc.
@@ -422,6 +1233,10 @@ def get_models_information(urdf_files: list[str], **kwargs):
           List of URDF files to analyse
         * *joints* (``boolean``) --
           If True, then the joint information is obtained and sved in the returned URDFInformation.
+        * *xml_backend* (``str``) --
+          The XML backend used to read the URDF files ('lxml' or 'etree'). By default ElementTree ('etree') is used, lxml has to be chosen.
+        * *progress* (``ProgressReporter``) --
+          If provided, each analysed file is counted in the current stage of the progress.
 
 
     full description
@@ -431,13 +1246,14 @@ def get_models_information(urdf_files: list[str], **kwargs):
     
     """
     l = logging.getLogger("urdf_analyzer")
-    model_analysis = ModelAnalysis(l)
+    model_analysis = ModelAnalysis(l, kwargs.get('xml_backend'))
+    progress = kwargs.pop('progress', None)
     urdfs_information = []
 
     for urdf_file in urdf_files:
 
         urdf_root_dir = os.path.dirname(os.path.abspath(urdf_file))
-        model_analysis.xml_urdf_reader(urdf_file, urdf_root_dir)
+        root = model_analysis.xml_urdf_reader(urdf_file, urdf_root_dir)
         # if 'filename' in kwargs.keys():
         #     kwargs['filename'] = os.path.basename(urdf_file)
         # else:
@@ -445,72 +1261,378 @@ def get_models_information(urdf_files: list[str], **kwargs):
         urdf_information = get_model_information(model_analysis=model_analysis, **kwargs)
 
         urdfs_information.append(urdf_information)
+        if progress is not None:
+            progress.update(failed=1 if root is None else 0)
 
     return urdfs_information
 
 
+def get_xml_information(urdf_files: list[str], model_kwargs: dict=None, validator: URDFValidator=None, dataset_statistics: DatasetStatistics=None,
+                        names: bool=False, n_workers: int=None, progress: ProgressReporter=None, stage: str="xml"):
+    """
+    Read the XML tree of each URDF file once, and compute the model information, the validation issues, the dataset statistics
+    and the names of the name index from the same tree, instead of reading the files once per schema.
+
+    :param model_kwargs: the model information to get, see get_model_information(). The model information is not computed if None.
+    :type model_kwargs: dict
+    :param validator: the validator of the URDF files. The files are not validated if None.
+    :type validator: URDFValidator
+    :param dataset_statistics: the statistics to which the files are added, see DatasetStatistics. Not computed if None.
+    :type dataset_statistics: DatasetStatistics
+    :param names: if True, the (kind, name) of the links, joints and meshes of each file are collected, see get_urdf_names()
+    :type names: bool
+    :param n_workers: the number of processes expanding the xacro files beforehand, see expand_xacros()
+    :type n_workers: int
+    :param progress: if provided, the files are reported in a single stage
+    :type progress: ProgressReporter
+    :param stage: the name of the stage of the progress, e.g. the schemas sharing the files
+    :type stage: str
+    :return: the model information of each file (None if model_kwargs is None), and the (filename, issues) of each file (None if validator is None),
+        in the order of the files, and the (kind, name) of each file (None if names is False)
+    :rtype: tuple[list[URDFInformation], list[tuple[str, list[ValidationIssue]]], dict]
+    """
+    l = logging.getLogger("urdf_analyzer")
+    # expand the xacro files in the worker pool, so the model analysis reads the expanded files from the xacro cache
+    xacro_files = [f for f in urdf_files if str(f).endswith(".xacro")]
+    if len(xacro_files) > 0:
+        expand_xacros(xacro_files, n_workers)
+    model_analysis = ModelAnalysis(l)
+    urdfs_information = [] if model_kwargs is not None else None
+    validation_issues = [] if validator is not None else None
+    urdfs_names = {} if names else None
+    if progress is not None:
+        progress.start_stage(stage, len(urdf_files))
+    for urdf_file in urdf_files:
+        root = model_analysis.xml_urdf_reader(urdf_file, os.path.dirname(os.path.abspath(urdf_file)))
+        if model_kwargs is not None:
+            urdfs_information.append(get_model_information(model_analysis=model_analysis, filename=os.path.basename(urdf_file), **model_kwargs))
+        if validator is not None:
+            validation_issues.append((urdf_file, validator.validate(root) if root is not None else None))
+        if dataset_statistics is not None:
+            dataset_statistics.add_model(str(urdf_file), model_analysis, root)
+        if names:
+            urdfs_names[str(urdf_file)] = get_model_names(model_analysis, root)
+        if progress is not None:
+            progress.update(failed=1 if root is None else 0)
+    return urdfs_information, validation_issues, urdfs_names
+
+
+def _expand_xacro(xacro_file):
+    return expand_xacro_file(str(xacro_file), logging.getLogger("urdf_analyzer"))
+
+
+def expand_xacros(xacro_files: list[str], n_workers: int=None):
+    """
+    Expand the xacro files to URDF files in a process pool. The expanded URDF files are cached by the hash of the xacro file,
+    and the included files and macro definitions are cached within each worker process.
+
+    :param xacro_files: the xacro files to expand
+    :type xacro_files: list[str]
+    :param n_workers: the number of worker processes. Defaults to the number of CPUs.
+    :type n_workers: int
+    :return: the expanded URDF file of each xacro file, None if the expansion failed
+    :rtype: dict
+    """
+    l = logging.getLogger("urdf_analyzer")
+    expanded_files = _map_in_pool(_expand_xacro, list(xacro_files), n_workers)
+    n_failed = len([f for f in expanded_files if f is None])
+    if n_failed > 0:
+        l.warning(f"{n_failed} of {len(expanded_files)} xacro files could not be expanded.")
+    return dict(zip(xacro_files, expanded_files))
+
+
+def _normalize_urdf(urdf_file):
+    return normalize_urdf_file(str(urdf_file), logging.getLogger("urdf_analyzer"))
+
+
+def normalize_urdfs(urdf_files: list[str], n_workers: int=None):
+    """
+    Normalise the URDF files to their canonical form in a process pool, see urdf_normalizer.
+    The canonical URDF files are cached by the hash of the URDF file.
+
+    :param urdf_files: the URDF files to normalise
+    :type urdf_files: list[str]
+    :param n_workers: the number of worker processes. Defaults to the number of CPUs.
+    :type n_workers: int
+    :return: the canonical URDF file of each URDF file, None if the URDF file could not be read
+    :rtype: dict
+    """
+    l = logging.getLogger("urdf_analyzer")
+    normalized_files = _map_in_pool(_normalize_urdf, list(urdf_files), n_workers)
+    n_failed = len([f for f in normalized_files if f is None])
+    if n_failed > 0:
+        l.warning(f"{n_failed} of {len(normalized_files)} urdf files could not be normalised.")
+    return dict(zip(urdf_files, normalized_files))
+
+
+def _time_variants(load, variants: dict, repeats: int):
+    """
+    Time the loading of several variants of the same files. The loader is warmed up by an untimed load of the first file, and the
+    order of the variants is rotated between the repeats, such that no variant pays the warm-up cost or always runs first.
+
+    :param load: loads a list of files, and returns the number of loaded files
+    :type load: Callable[[list[str]], int]
+    :param variants: the files of each variant, by the name of the variant
+    :type variants: dict[str, list[str]]
+    :return: the median number of seconds of loading the files of each variant, and the number of loaded files of each variant (of the first repeat)
+    :rtype: tuple[dict[str, float], dict[str, int]]
+    """
+    names = list(variants.keys())
+    first_files = next((files for files in variants.values() if len(files) > 0), [])
+    load(first_files[:1])
+    times = {name: [] for name in names}
+    n_loaded = {}
+    for i in range(max(1, repeats)):
+        for name in names[i % len(names):] + names[:i % len(names)]:
+            start = time.perf_counter()
+            n = load(variants[name])
+            times[name].append(time.perf_counter() - start)
+            n_loaded.setdefault(name, n)
+    return {name: float(pd.Series(t).median()) for name, t in times.items()}, n_loaded
+
+
+def generate_normalization_schema(urdf_files, parsers: list[str]=URDFparser.supported_parsers, out=True, n_workers: int=None, structure_only: bool=False,
+                                  repeats: int=DEFAULT_NORMALIZATION_REPEATS):
+    """
+    Normalise the URDF files, and compare the time each parser takes to load the URDF files and the canonical URDF files.
+    The parsers which are not installed are skipped.
+
+    :param out: if True the schema is saved using the default filename, otherwise the filename of the schema. Not saved if False.
+    :param repeats: the number of times the files of each variant are loaded, after an untimed warm-up load, where the median time is reported
+        and the order of the variants alternates between the repeats, see _time_variants()
+    :type repeats: int
+    :return: a row for each parser, with the time of normalising the files, the time of loading the files and the canonical files,
+        the speedup, and the number of files loaded by the parser
+    :rtype: pd.DataFrame
+    """
+    l = logging.getLogger("urdf_analyzer")
+    if not isinstance(urdf_files, list):
+        urdf_files = [urdf_files]
+    start = time.perf_counter()
+    canonical_files = normalize_urdfs(urdf_files, n_workers)
+    normalize_s = time.perf_counter() - start
+    normalized_files = [canonical_files[f] if canonical_files[f] is not None else os.path.abspath(f) for f in urdf_files]
+
+    records = []
+    for p in parsers:
+        try:
+            tool_parser = URDFparser(p, l, structure_only)
+        except ImportError as e:
+            l.warning(f"The parser '{p}' is not installed, skipping it: {e}")
+            continue
+        record = {"parser": p, "parse_mode": tool_parser.parse_mode, "n_files": len(urdf_files)}
+        load = lambda files: len([model for _, model in tool_parser.load_many(files) if model is not None])
+        times, n_passed = _time_variants(load, {"original": urdf_files, "normalized": normalized_files}, repeats)
+        for variant in times:
+            record[f"n_passed_{variant}"] = n_passed[variant]
+            record[f"{variant}_s"] = times[variant]
+        tool_parser.close()
+        record["speedup"] = record["original_s"] / record["normalized_s"] if record["normalized_s"] > 0 else None
+        record["normalize_s"] = normalize_s
+        records.append(record)
+    columns = ["parser", "parse_mode", "n_files", "n_passed_original", "n_passed_normalized", "original_s", "normalized_s", "speedup", "normalize_s"]
+    normalization_results = pd.DataFrame.from_records(records, columns=columns)
+
+    if out == True:
+        _save_information(normalization_results, output_file=f"{DEFAULT_OUTPUT_DIR}/normalization_schema")
+    elif out:
+        _save_information(normalization_results, out)
+    return normalization_results
+
+
+_urdf_parsers = {} # parser name -> URDFparser, reused by the calls in the same process
+
+def _get_urdf_parser(logger: logging.Logger, parser: str):
+    if parser not in _urdf_parsers:
+        _urdf_parsers[parser] = URDFparser(parser, logger)
+    return _urdf_parsers[parser]
+
+
 def _parser_urdf(logger: logging.Logger, filename: str, parser: str, urdf_root_dir: str=None):
-    tool_parser = URDFparser(parser, logger)
-    model = tool_parser.load_urdf(filename, urdf_root_dir)
+    tool_parser = _get_urdf_parser(logger, parser)
+    _, model = next(tool_parser.load_many([filename], urdf_root_dir))
     return model
 
 
-def get_parsing_information(filename: str, parser: Union[str, list[str]]=URDFparser.supported_parsers, urdf_root_dir: str=None):
+GATE_MODES = ['any', 'all'] # a file passes the gate if any of the parsers loads it, or if all of them do
+
+
+def get_parsing_information(filename: str, parser: Union[str, list[str]]=URDFparser.supported_parsers, urdf_root_dir: str=None, structure_only: bool=False, check_meshes: bool=False, normalized: bool=False, gate: str=None, latency_history: ParserLatencyHistory=None):
+    return get_parsings_information([filename], parser, urdf_root_dir, structure_only, check_meshes, normalized=normalized, gate=gate, latency_history=latency_history)
+
+
+def get_parsings_information(urdf_files: list[str], parser: Union[str, list[str]]=URDFparser.supported_parsers, urdf_root_dir: str=None, structure_only: bool=False, check_meshes: bool=False, journal: ParsingJournal=None, progress: ProgressReporter=None, normalized: bool=False, gate: str=None, latency_history: ParserLatencyHistory=None):
+    """
+    Try loading the URDF files with each parser. Each parser is loaded once and reused for all of the files, see URDFparser.load_many().
+
+    With a gate, only the outcome of each file is needed: whether any of the parsers loads it ('any'), or all of them ('all').
+    The parsers are then tried from the cheapest to the most expensive, by their latency in the history, and a file is not loaded
+    with the remaining parsers as soon as its outcome is decided, i.e. once a parser loads it ('any') or fails to load it ('all').
+    The parsers which are not needed by any of the files are not loaded at all.
+
+    :param structure_only: if True, the parsers supporting it skip loading the meshes and building the scene graph, see URDFparser.structure_only_arguments
+    :type structure_only: bool
+    :param check_meshes: if True, the meshes referenced by the URDF files are checked to be found and readable, in a separate phase, see get_mesh_validity_information()
+    :type check_meshes: bool
+    :param journal: if provided, each completed (file, parser) unit is recorded in the journal as soon as it finishes, and the units
+        already completed in the journal are not loaded again
+    :type journal: ParsingJournal
+    :param progress: if provided, the files loaded by each parser are reported as a stage 'parsing:<parser>', excluding the units already completed in the journal
+    :type progress: ProgressReporter
+    :param normalized: if True, the parsers are fed the canonical URDF files instead of the URDF files, see normalize_urdfs().
+        The files that could not be normalised are loaded as they are.
+    :type normalized: bool
+    :param gate: 'any' or 'all' to stop loading a file as soon as its outcome is decided, see GATE_MODES. All of the parsers are used if None.
+    :type gate: str
+    :param latency_history: if provided, the latencies of the parsers are recorded in the history, and the parsers are ordered by them
+        when gating. Otherwise the prior latencies are used, see ParserLatencyHistory.
+    :type latency_history: ParserLatencyHistory
+    :raises ValueError: if the gate is not one of GATE_MODES
+    :return: a row for each URDF file, in the order of the files, with a column for each parser, the number of parsers that loaded the file,
+        and the mode in which each parser was used (full or structure, and '+normalized' for the canonical files).
+        With a gate, the gate, its outcome and the parsers skipped for each file, whose columns are empty.
+    :rtype: pd.DataFrame
+    """
     l = logging.getLogger("urdf_analyzer")
     if isinstance(parser, str):
         parser = [parser]
+    if gate is not None and gate not in GATE_MODES:
+        raise ValueError(f"The gate '{gate}' is not supported. The supported gates are: {GATE_MODES}")
 
     # results on urdf files and tools
-    urdfs_and_tools_results_column_names = parser
-    urdfs_and_tools_results = pd.DataFrame(columns=urdfs_and_tools_results_column_names)
-
-    for p in parser:
-        model = _parser_urdf(l, filename, p, urdf_root_dir)
-        urdfs_and_tools_results.loc[0, p] = True if model is not None else False
-
-    # Update urdfs_and_tools_results with sum of tools where the URDF file passes
-    urdfs_and_tools_results.loc[:,'count'] = urdfs_and_tools_results.sum(numeric_only=False, axis=1)
-    urdfs_and_tools_results = urdfs_and_tools_results.sort_values(by='count', ascending=False)
+    records = {urdf_file: {} for urdf_file in urdf_files}
+    loaded_files = {urdf_file: urdf_file for urdf_file in urdf_files} # the file loaded by the parsers for each URDF file
+    if normalized:
+        # the mesh filenames of the canonical files are absolute, so they are loaded without the root directory
+        canonical_files = normalize_urdfs(urdf_files)
+        loaded_files = {urdf_file: canonical_files[urdf_file] if canonical_files[urdf_file] is not None else os.path.abspath(urdf_file) for urdf_file in urdf_files}
+        urdf_root_dir = None
+    urdf_file_of_loaded_file = {str(f): urdf_file for urdf_file, f in loaded_files.items()}
+    parse_mode_of_parser = {p: URDFparser.get_parse_mode(p, structure_only) + ("+normalized" if normalized else "") for p in parser}
+    parse_modes = [f"{p}:{parse_mode_of_parser[p]}" for p in parser]
+    # the outcome of the gate of each file, None until it is decided
+    outcomes = {urdf_file: None for urdf_file in urdf_files}
+    if gate is not None:
+        history = latency_history if latency_history is not None else ParserLatencyHistory(None, l)
+        parser_order = history.order(parser, parse_mode_of_parser)
+        l.info(f"Gating the urdf files on {gate} of the parsers, in the order {parser_order}")
+    else:
+        parser_order = parser
+    for p in parser_order:
+        parse_mode = parse_mode_of_parser[p]
+        pending_files = []
+        for urdf_file in urdf_files:
+            if outcomes[urdf_file] is not None:
+                continue # decided by the previous parsers
+            passed = journal.get_result(urdf_file, p, parse_mode) if journal is not None else None
+            if passed is None:
+                pending_files.append(urdf_file)
+            else:
+                records[urdf_file][p] = passed
+                outcomes[urdf_file] = _get_gate_outcome(gate, passed)
+        if len(pending_files) == 0:
+            continue
+        if progress is not None:
+            progress.start_stage(f"parsing:{p}", len(pending_files))
+        tool_parser = URDFparser(p, l, structure_only)
+        start_time = time.perf_counter()
+        for loaded_file, model in tool_parser.load_many([loaded_files[f] for f in pending_files], urdf_root_dir):
+            urdf_file = urdf_file_of_loaded_file[str(loaded_file)]
+            records[urdf_file][p] = True if model is not None else False
+            outcomes[urdf_file] = _get_gate_outcome(gate, records[urdf_file][p])
+            if progress is not None:
+                progress.update(failed=0 if records[urdf_file][p] else 1)
+            if journal is not None:
+                journal.record(urdf_file, p, parse_mode, records[urdf_file][p])
+        if latency_history is not None:
+            latency_history.record(p, parse_mode, time.perf_counter() - start_time, len(pending_files))
+        tool_parser.close()
+    if latency_history is not None:
+        latency_history.save()
 
     # TODO: unify the saving method, e.g. if the 'filename' should only be the file or also the directory
-    urdfs_and_tools_results = urdfs_and_tools_results.rename(index={0:filename})
-
-    return urdfs_and_tools_results
+    # in the order of the files, as the files skipped by the first parsers are missing from their columns
+    parsing_results = pd.DataFrame.from_dict(records, orient='index', columns=parser).reindex(urdf_files)
+    # Update the results with sum of tools where the URDF file passes
+    parsing_results.loc[:,'count'] = parsing_results[parser].sum(numeric_only=False, axis=1)
+    parsing_results.loc[:,'parse_mode'] = ",".join(parse_modes)
+    if gate is not None:
+        # a file which was not decided by any of the parsers failed the 'any' gate, and passed the 'all' gate
+        parsing_results.loc[:,'gate'] = gate
+        parsing_results.loc[:,'passed_gate'] = [outcomes[f] if outcomes[f] is not None else gate == 'all' for f in urdf_files]
+        parsing_results.loc[:,'skipped_parsers'] = pd.Series({f: [p for p in parser_order if p not in records[f]] for f in urdf_files})
+
+    if check_meshes:
+        parsing_results = parsing_results.join(get_mesh_validity_information(urdf_files, urdf_root_dir))
 
+    return parsing_results
 
-def get_parsings_information(urdf_files: list[str], parser: Union[str, list[str]]=URDFparser.supported_parsers):
-    l = logging.getLogger("urdf_analyzer")
-    parsing_results = pd.DataFrame()
 
-    for urdf_file in urdf_files:
-        urdf_root_dir = os.path.dirname(os.path.abspath(urdf_file))
-        parsing_result = get_parsing_information(urdf_file, parser, urdf_root_dir)
-        parsing_results = pd.concat([parsing_results, parsing_result])
+def _get_gate_outcome(gate: str, passed: bool):
+    """
+    :return: the outcome of the gate decided by a parser loading the file or not, None if the outcome is not decided yet
+    :rtype: bool
+    """
+    if gate == 'any' and passed:
+        return True
+    if gate == 'all' and not passed:
+        return False
+    return None
 
-    return parsing_results
 
+def get_mesh_validity_information(urdf_files: list[str], urdf_root_dir: str=None):
+    """
+    Check that the meshes referenced by the URDF files can be found and read, see mesh_analysis.get_mesh_validity().
+    This is separate from parsing the URDF files, such that the structure of the files can be checked without loading the meshes.
 
-def _get_parsings_information_tool_cmp(urdf_files: list[str], parsers: Union[str, list[str]]=URDFparser.supported_parsers, urdf_root_dir: str=None):
+    :return: a row for each URDF file, with the number of meshes, missing meshes and unreadable meshes. None if the file could not be read.
+    :rtype: pd.DataFrame
+    """
     l = logging.getLogger("urdf_analyzer")
-    if isinstance(parsers, str):
-        parsers = [parsers]
+    model_analysis = ModelAnalysis(l)
+    records = {}
+    for urdf_file in urdf_files:
+        root = model_analysis.xml_urdf_reader(urdf_file, urdf_root_dir)
+        if root is None:
+            records[urdf_file] = {}
+            continue
+        filenames = [mesh.attrib.get("filename") for mesh in root.iter("mesh")]
+        records[urdf_file] = get_mesh_validity(filenames, model_analysis.urdf_root_dir)
+    return pd.DataFrame.from_dict(records, orient='index', columns=["n_meshes", "n_missing_meshes", "n_unreadable_meshes"])
 
-    # results on urdf files and tools
-    urdfs_and_tools_results_column_names = parsers
-    urdfs_and_tools_results = pd.DataFrame(columns=urdfs_and_tools_results_column_names)
-    
-    for p in parsers:
-        tool_parser = URDFparser(p, l)
-        for urdf in urdf_files:
-            model = tool_parser.load_urdf(urdf, urdf_root_dir)
-            urdfs_and_tools_results.loc[urdf, p] = True if model is not None else False
 
-    urdfs_and_tools_results.loc[:,'count'] = urdfs_and_tools_results.sum(numeric_only=False, axis=1)
+def _get_parsings_information_tool_cmp(urdf_files: list[str], parsers: Union[str, list[str]]=URDFparser.supported_parsers, urdf_root_dir: str=None, structure_only: bool=False, journal: ParsingJournal=None, progress: ProgressReporter=None, normalized: bool=False):
+    urdfs_and_tools_results = get_parsings_information(urdf_files, parsers, urdf_root_dir, structure_only, journal=journal, progress=progress, normalized=normalized)
     urdfs_and_tools_results = urdfs_and_tools_results.sort_values(by='count', ascending=False)
 
     return urdfs_and_tools_results
 
 
+def get_check_urdf_information(urdf_files: list[str], max_concurrency: int=None, timeout: float=DEFAULT_CHECK_URDF_TIMEOUT):
+    """
+    Run check_urdf on the URDF files concurrently, without using a shell.
+
+    :param urdf_files: the URDF files to check
+    :type urdf_files: list[str]
+    :param max_concurrency: the maximum number of check_urdf processes running at the same time. Defaults to the number of CPUs.
+    :type max_concurrency: int
+    :param timeout: the number of seconds after which a check_urdf process is killed, and the file is considered as failed
+    :type timeout: float
+    :return: for each file, if it passed, the return code, if it timed out, and the diagnostics (stderr) of check_urdf
+    :rtype: pd.DataFrame
+    """
+    l = logging.getLogger("urdf_analyzer")
+    results: list[CheckURDFResult] = run_check_urdfs(urdf_files, max_concurrency=max_concurrency, timeout=timeout)
+
+    check_urdf_results = pd.DataFrame(columns=['check_urdf', 'returncode', 'timed_out', 'diagnostics'])
+    for urdf, result in zip(urdf_files, results):
+        if not result.passed:
+            l.info(f"check_urdf failed for {urdf}: {result.stderr.strip()}")
+        check_urdf_results.loc[urdf] = [result.passed, result.returncode, result.timed_out, result.stderr.strip()]
+
+    return check_urdf_results
+
+
 def save_model_information(urdfs_information: list[URDFInformation], output_file: str=None, full_results=False):
     l = logging.getLogger("urdf_analyzer")
 
@@ -0,0 +1,156 @@
+from logging import Logger
+from pathlib import Path
+import pandas as pd
+import sqlite3
+import os
+
+from urdf_analyzer.urdf_components.urdf_information import URDFInformation
+from urdf_analyzer.urdf_standard import JointStandard
+
+
+# The catalog persists the results of the ModelAnalysis in an SQLite database, such that questions about a collection
+# of URDF files can be answered using queries, without having to read the URDF files again.
+# The tables are:
+#   - files: one row per URDF file, with the number of joints, links and joints of each type
+#   - joints: one row per joint, with the name and type of the joint
+#   - links: one row per link, with the name, the geometry types, and the mesh types (if the geometry is a mesh)
+class URDFCatalog:
+
+    joint_type_columns = [f"n_{j}_joints" for j in JointStandard.joint_types]
+    tables = ["files", "joints", "links"]
+
+    def __init__(self, catalog_file: str, logger: Logger, read_only: bool=False):
+        self.logger = logger
+        self.catalog_file = str(catalog_file)
+        if read_only:
+            if not Path(self.catalog_file).exists():
+                raise FileNotFoundError(f"The catalog '{self.catalog_file}' does not exist. Generate it using the 'catalog' schema first.")
+            self.connection = sqlite3.connect(f"file:{Path(self.catalog_file).absolute().as_posix()}?mode=ro", uri=True)
+        else:
+            dir = os.path.dirname(self.catalog_file)
+            if dir != "" and not Path(dir).exists():
+                os.makedirs(dir)
+            self.connection = sqlite3.connect(self.catalog_file)
+            self._create_tables()
+
+
+    def _create_tables(self):
+        joint_type_columns = ", ".join([f"{c} INTEGER" for c in self.joint_type_columns])
+        self.connection.executescript(f"""
+            CREATE TABLE IF NOT EXISTS files (id INTEGER PRIMARY KEY, path TEXT UNIQUE NOT NULL, filename TEXT,
+                                              n_joints INTEGER, n_links INTEGER, {joint_type_columns});
+            CREATE TABLE IF NOT EXISTS joints (file_id INTEGER NOT NULL REFERENCES files(id) ON DELETE CASCADE,
+                                               name TEXT, type TEXT);
+            CREATE TABLE IF NOT EXISTS links (file_id INTEGER NOT NULL REFERENCES files(id) ON DELETE CASCADE,
+                                              name TEXT, visual_geometry TEXT, collision_geometry TEXT,
+                                              visual_mesh_type TEXT, collision_mesh_type TEXT);
+            CREATE INDEX IF NOT EXISTS idx_files_n_joints ON files(n_joints);
+            CREATE INDEX IF NOT EXISTS idx_files_n_links ON files(n_links);
+            CREATE INDEX IF NOT EXISTS idx_joints_file ON joints(file_id);
+            CREATE INDEX IF NOT EXISTS idx_joints_type ON joints(type, file_id);
+            CREATE INDEX IF NOT EXISTS idx_joints_name ON joints(name);
+            CREATE INDEX IF NOT EXISTS idx_links_file ON links(file_id);
+            CREATE INDEX IF NOT EXISTS idx_links_name ON links(name);
+            CREATE INDEX IF NOT EXISTS idx_links_visual_mesh ON links(visual_mesh_type, file_id);
+            CREATE INDEX IF NOT EXISTS idx_links_collision_mesh ON links(collision_mesh_type, file_id);
+        """)
+        self.connection.commit()
+
+
+    @staticmethod
+    def _get_mesh_type(geometry):
+        if geometry is None or getattr(geometry, "filename", None) is None:
+            return None
+        return os.path.splitext(geometry.filename)[1][1:].lower()
+
+
+    def add_urdf_information(self, urdf_information: URDFInformation, path: str):
+        """
+        Add (or replace) the results of a single URDF file in the catalog.
+
+        :param urdf_information: the analysed data of the URDF file, containing both joint and link information
+        :type urdf_information: URDFInformation
+        :param path: the path of the URDF file, used as the unique key of the file in the catalog
+        :type path: str
+        """
+        path = Path(path).as_posix()
+        joint_information = urdf_information.joint_information
+        link_information = urdf_information.link_information
+        joints = joint_information.joints if joint_information is not None else []
+        links = link_information.links if link_information is not None else []
+
+        cursor = self.connection.cursor()
+        cursor.execute("DELETE FROM joints WHERE file_id IN (SELECT id FROM files WHERE path = ?)", (path,))
+        cursor.execute("DELETE FROM links WHERE file_id IN (SELECT id FROM files WHERE path = ?)", (path,))
+        cursor.execute("DELETE FROM files WHERE path = ?", (path,))
+
+        n_joint_types = [joint_information.n_joint_types[j] if joint_information is not None else None for j in JointStandard.joint_types]
+        columns = ["path", "filename", "n_joints", "n_links"] + self.joint_type_columns
+        values = [path, os.path.basename(path),
+                  joint_information.n_joints if joint_information is not None else None,
+                  link_information.n_links if link_information is not None else None] + n_joint_types
+        cursor.execute(f"INSERT INTO files ({', '.join(columns)}) VALUES ({', '.join(['?']*len(columns))})", values)
+        file_id = cursor.lastrowid
+
+        cursor.executemany("INSERT INTO joints (file_id, name, type) VALUES (?, ?, ?)",
+                           [(file_id, j.name, j.type) for j in joints])
+        cursor.executemany("INSERT INTO links (file_id, name, visual_geometry, collision_geometry, visual_mesh_type, collision_mesh_type) VALUES (?, ?, ?, ?, ?, ?)",
+                           [(file_id, l.name,
+                             l.visual_geometry.geometry_type if l.visual_geometry is not None else None,
+                             l.collision_geometry.geometry_type if l.collision_geometry is not None else None,
+                             self._get_mesh_type(l.visual_geometry),
+                             self._get_mesh_type(l.collision_geometry)) for l in links])
+
+
+    def add_urdfs_information(self, urdfs_information: list[URDFInformation], paths: list[str]):
+        assert len(urdfs_information) == len(paths), f"The number of URDF information objects ({len(urdfs_information)}) does not match the number of paths ({len(paths)})."
+        with self.connection:
+            for urdf_information, path in zip(urdfs_information, paths):
+                self.add_urdf_information(urdf_information, path)
+
+
+    def query(self, where: str=None, joint_type: str=None, visual_mesh: str=None, collision_mesh: str=None):
+        """
+        Find the URDF files in the catalog that fulfill all of the given filters.
+
+        :param where: an SQL condition on the columns of the files table, e.g. "n_revolute_joints > 6"
+        :type where: str
+        :param joint_type: only return files containing at least one joint of this type
+        :type joint_type: str
+        :param visual_mesh: only return files containing at least one visual mesh with this extension, e.g. "dae"
+        :type visual_mesh: str
+        :param collision_mesh: only return files containing at least one collision mesh with this extension, e.g. "dae"
+        :type collision_mesh: str
+        :return: the rows of the files table matching the filters
+        :rtype: pd.DataFrame
+        """
+        conditions = []
+        parameters = []
+        if where is not None:
+            conditions.append(f"({where})")
+        if joint_type is not None:
+            conditions.append("id IN (SELECT file_id FROM joints WHERE type = ?)")
+            parameters.append(joint_type)
+        if visual_mesh is not None:
+            conditions.append("id IN (SELECT file_id FROM links WHERE visual_mesh_type = ?)")
+            parameters.append(visual_mesh.lower().lstrip("."))
+        if collision_mesh is not None:
+            conditions.append("id IN (SELECT file_id FROM links WHERE collision_mesh_type = ?)")
+            parameters.append(collision_mesh.lower().lstrip("."))
+
+        sql = "SELECT * FROM files"
+        if len(conditions) > 0:
+            sql += " WHERE " + " AND ".join(conditions)
+        sql += " ORDER BY path"
+        return pd.read_sql_query(sql, self.connection, params=parameters).drop(columns=["id"])
+
+
+    def sql(self, sql: str):
+        """
+        Run an arbitrary SQL statement against the catalog, e.g. for aggregates over the joints or links tables.
+        """
+        return pd.read_sql_query(sql, self.connection)
+
+
+    def close(self):
+        self.connection.close()
@@ -0,0 +1,92 @@
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Union
+import concurrent.futures
+import asyncio
+import os
+
+from urdf_analyzer.constants import CHECK_URDF_EXECUTABLE, DEFAULT_CHECK_URDF_TIMEOUT
+
+
+# Runs the urdfdom check_urdf executable on URDF files concurrently using asyncio subprocesses.
+# The executable is started directly (no shell), so paths containing spaces or shell characters are passed unchanged.
+
+@dataclass
+class CheckURDFResult:
+
+    def __init__(self, filename: str, returncode: int=None, stdout: str="", stderr: str="", timed_out: bool=False):
+        """
+        The result of running check_urdf on a single URDF file.
+
+        :param filename: the URDF file that was checked
+        :type filename: str
+        :param returncode: the return code of check_urdf, None if the process could not be started or timed out
+        :type returncode: int
+        :param stdout: the output of check_urdf, containing the kinematic tree of the robot if successful
+        :type stdout: str
+        :param stderr: the diagnostics of check_urdf
+        :type stderr: str
+        :param timed_out: True if check_urdf did not finish within the timeout and was killed
+        :type timed_out: bool
+        """
+        self.filename = filename
+        self.returncode = returncode
+        self.stdout = stdout
+        self.stderr = stderr
+        self.timed_out = timed_out
+        self.passed = returncode == 0 and not timed_out
+
+
+async def _check_urdf(filename: str, executable: str, semaphore: asyncio.Semaphore, timeout: float):
+    async with semaphore:
+        try:
+            process = await asyncio.create_subprocess_exec(executable, str(filename),
+                                                           stdout=asyncio.subprocess.PIPE,
+                                                           stderr=asyncio.subprocess.PIPE)
+        except OSError as e:
+            return CheckURDFResult(str(filename), stderr=f"Could not start '{executable}': {e}")
+        try:
+            stdout, stderr = await asyncio.wait_for(process.communicate(), timeout)
+        except asyncio.TimeoutError:
+            process.kill()
+            stdout, stderr = await process.communicate()
+            return CheckURDFResult(str(filename), None, stdout.decode(errors="replace"), stderr.decode(errors="replace"), timed_out=True)
+        return CheckURDFResult(str(filename), process.returncode, stdout.decode(errors="replace"), stderr.decode(errors="replace"))
+
+
+async def _check_urdfs(filenames: list, executable: str, max_concurrency: int, timeout: float):
+    semaphore = asyncio.Semaphore(max_concurrency)
+    return await asyncio.gather(*[_check_urdf(f, executable, semaphore, timeout) for f in filenames])
+
+
+def run_check_urdfs(filenames: list[Union[str, Path]], executable: str=CHECK_URDF_EXECUTABLE, max_concurrency: int=None, timeout: float=DEFAULT_CHECK_URDF_TIMEOUT):
+    """
+    Run check_urdf on the URDF files, with at most max_concurrency processes running at the same time.
+
+    :param filenames: the URDF files to check
+    :type filenames: list[str]
+    :param executable: the check_urdf executable
+    :type executable: str
+    :param max_concurrency: the maximum number of concurrent check_urdf processes. Defaults to the number of CPUs.
+    :type max_concurrency: int
+    :param timeout: the number of seconds after which a check_urdf process is killed
+    :type timeout: float
+    :return: the results, in the same order as the filenames
+    :rtype: list[CheckURDFResult]
+    """
+    if max_concurrency is None:
+        max_concurrency = os.cpu_count() or 1
+    assert max_concurrency > 0, f"The maximum concurrency must be positive, instead got '{max_concurrency}'."
+    coroutine = _check_urdfs(list(filenames), executable, max_concurrency, timeout)
+
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coroutine)
+    # an event loop is already running in this thread (e.g. in a notebook), so run the checks in a separate thread
+    with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
+        return executor.submit(asyncio.run, coroutine).result()
+
+
+def run_check_urdf(filename: Union[str, Path], executable: str=CHECK_URDF_EXECUTABLE, timeout: float=DEFAULT_CHECK_URDF_TIMEOUT):
+    return run_check_urdfs([filename], executable, 1, timeout)[0]
@@ -1,10 +1,22 @@
 import argparse
 from logging.config import fileConfig
+from pathlib import Path
+import pandas as pd
 import logging
+import json
+import time
 import sys
 
 import urdf_analyzer.api as api
 from urdf_analyzer.urdf_parser import URDFparser
+from urdf_analyzer.urdf_standard import JointStandard
+from urdf_analyzer.urdf_validator import URDFValidator, registered_rules
+from urdf_analyzer.xml_backend import xml_backends
+from urdf_analyzer.progress import ProgressReporter
+from urdf_analyzer.sampling import URDFSample
+from urdf_analyzer.name_index import URDFNameIndex
+from urdf_analyzer.parser_latency import ParserLatencyHistory
+from urdf_analyzer.constants import DEFAULT_CATALOG_FILE, DEFAULT_SERVER_HOST, DEFAULT_SERVER_PORT, DEFAULT_SERVER_MAX_CONCURRENCY, DEFAULT_PROGRESS_INTERVAL, DEFAULT_NAME_INDEX_FILE, DEFAULT_NAME_SIMILARITY, DEFAULT_PARSER_LATENCY_FILE
 
 
 # TODO: remove when finished implementing
@@ -25,6 +37,17 @@ def _validate_common_args(args, l):
             l.warning(f"The urdf-root-dir argument was parsed together with the urdf-search-dir. Ignoring the urdf-root-dir argument, as the tool will be searching for urdf files in the directory specified using urdf-search-dir: {args.urdf_search_dir}.")
         if args.filename is not None:
             l.warning(f"The filename argument was parsed together with the urdf-search-dir. Ignoring the filename argument, as the tool will be searching for urdf files in the directory specified using urdf-search-dir: {args.urdf_search_dir}.")
+    elif getattr(args, 'shard', None) is not None:
+        l.warning(f"The shard argument was parsed without the urdf-search-dir. Ignoring the shard argument, as only the files found in the urdf-search-dir are sharded.")
+
+
+def _shard_urdf_files(args, urdf_files, l):
+    shard = getattr(args, 'shard', None)
+    if shard is None:
+        return urdf_files
+    urdf_files = api.shard_urdf_files(urdf_files, shard, args.urdf_search_dir)
+    l.info(f"Analysing the {len(urdf_files)} urdf files of shard {shard[0]}/{shard[1]}")
+    return urdf_files
 
 
 def generate_schemas(args):
@@ -37,19 +60,29 @@ def generate_schemas(args):
     if 'duplicates-cmp' in args.generate_schema and (args.duplicates_file is None):
         l.error(f"The 'duplicates-cmp' is provided without the 'duplicates-file'. Please provide the duplicates directory. Exiting.")
         return
+    if 'duplicates-diff' in args.generate_schema and (args.duplicates_file is None):
+        l.error(f"The 'duplicates-diff' is provided without the 'duplicates-file'. Please provide the duplicates file. Exiting.")
+        return
     if 'dup-cmp-parser' in args.generate_schema and ('duplicates-cmp' not in args.generate_schema):
         l.warning(f"The 'dup-cmp-parser' argument is provided without the 'duplicates-cmp' argument. Ignoring.")
     if 'dup-cmp-sources' in args.generate_schema and ('duplicates-cmp' not in args.generate_schema):
         l.warning(f"The 'dup-cmp-sources' argument is provided without the 'duplicates-cmp' argument. Ignoring.")
     if args.duplicates_file is not None:
         l.warning(f"The 'duplicates-file' argument is provided without the 'duplicates-cmp' argument. Ignoring.")
+    if (args.sample is not None and args.sample <= 0) or (args.sample_fraction is not None and not 0 < args.sample_fraction <= 1):
+        l.error(f"The 'sample' has to be positive and the 'sample-fraction' in (0, 1]. Exiting.")
+        return
+    if (args.sample is not None or args.sample_fraction is not None) and args.urdf_search_dir is None:
+        l.warning(f"The sample argument was parsed without the urdf-search-dir. Ignoring the sample argument, as only the files found in the urdf-search-dir are sampled.")
 
     urdf_files = None
     if args.urdf_search_dir is not None:
-        urdf_files = api.search_for_urdfs(args.urdf_search_dir)
+        urdf_files = api.search_for_urdfs(args.urdf_search_dir, include_xacro=args.xacro)
         l.info(f"Found {len(urdf_files)} urdf files in the search directory {args.urdf_search_dir}")
+        urdf_files = _shard_urdf_files(args, urdf_files, l)
     elif args.filename is not None:
         urdf_files = args.filename
+        args.shard = None
     
     api.schema_generator(args.generate_schema, urdf_files, **vars(args))
 
@@ -68,8 +101,9 @@ def model_information(args):
         l.warning(f"The 'full' argument was provided although the 'out' was not. Ignoring the 'full' argument.") 
 
     if args.urdf_search_dir is not None:
-        urdf_files = api.search_for_urdfs(args.urdf_search_dir)
+        urdf_files = api.search_for_urdfs(args.urdf_search_dir, include_xacro=getattr(args, 'xacro', False))
         l.info(f"Found {len(urdf_files)} urdf files in the search directory {args.urdf_search_dir}")
+        urdf_files = _shard_urdf_files(args, urdf_files, l)
         urdfs_information: list[api.URDFInformation] = api.get_models_information(urdf_files=urdf_files, **vars(args))
         
     elif args.filename is not None:
@@ -92,7 +126,7 @@ def parsing_information(args):
 
     _validate_common_args(args, l)
 
-    if args.parser is not None and args.parser not in URDFparser.supported_parsers:
+    if args.parser is not None and any(p not in URDFparser.supported_parsers for p in args.parser):
         l.error(f"The provided parser: '{args.parser}' is not currently supported. The supported parsers are: '{URDFparser.supported_parsers}'. Exiting.")
         return None
 
@@ -101,13 +135,27 @@ def parsing_information(args):
     elif args.parser is not None:
         parser = args.parser
 
+    structure_only = getattr(args, 'structure_only', False)
+    check_meshes = getattr(args, 'check_meshes', False)
+    normalized = getattr(args, 'normalized', False)
+    gate = getattr(args, 'gate', None)
+    # the latencies are measured when gating, such that the following runs try the cheapest parsers first
+    latency_history = None
+    if gate is not None or getattr(args, 'latency_history', None) is not None:
+        latency_history = ParserLatencyHistory(args.latency_history or DEFAULT_PARSER_LATENCY_FILE, l)
+
     if args.urdf_search_dir is not None:
         urdf_files = api.search_for_urdfs(args.urdf_search_dir)
         l.info(f"Found {len(urdf_files)} urdf files in the search directory {args.urdf_search_dir}")
-        parsing_results = api.get_parsings_information(urdf_files, parser)
+        urdf_files = _shard_urdf_files(args, urdf_files, l)
+        parsing_results = api.get_parsings_information(urdf_files, parser, structure_only=structure_only, check_meshes=check_meshes, normalized=normalized, gate=gate, latency_history=latency_history)
 
     elif args.filename is not None:
-        parsing_results = api.get_parsing_information(args.filename, parser, args.urdf_root_dir)
+        parsing_results = api.get_parsing_information(args.filename, parser, args.urdf_root_dir, structure_only, check_meshes, normalized, gate, latency_history)
+
+    if gate is not None:
+        n_skipped = sum(len(skipped) for skipped in parsing_results['skipped_parsers'])
+        l.info(f"{int(parsing_results['passed_gate'].sum())}/{parsing_results.shape[0]} urdf files passed the '{gate}' gate, skipping {n_skipped} (file, parser) loads")
 
     if args.out is not None:
         if isinstance(args.out,str):
@@ -119,6 +167,162 @@ def parsing_information(args):
 
 
 
+def validate(args):
+    l = setup_logger(args)
+    l.info("Validating urdf files")
+
+    _validate_common_args(args, l)
+
+    if args.list_rules:
+        for rule in registered_rules.values():
+            print(f"{rule.name}: {rule.description}")
+        return None
+
+    if args.urdf_search_dir is not None:
+        urdf_files = api.search_for_urdfs(args.urdf_search_dir)
+        l.info(f"Found {len(urdf_files)} urdf files in the search directory {args.urdf_search_dir}")
+        urdf_files = _shard_urdf_files(args, urdf_files, l)
+    elif args.filename is not None:
+        urdf_files = [args.filename if args.urdf_root_dir is None else str(Path(args.urdf_root_dir, args.filename))]
+    else:
+        l.error("Either the 'filename' or the 'urdf-search-dir' argument has to be provided. Exiting.")
+        return None
+
+    validator = URDFValidator(l, args.rules)
+    validation_results = []
+    # the results of each file are printed as a json line as soon as the file has been validated
+    for urdf_file, issues in api.validate_urdfs(urdf_files, validator):
+        information = validator.get_issues_information(str(urdf_file), issues)
+        print(json.dumps(information), flush=True)
+        validation_results.append(information)
+
+    if args.rule_statistics:
+        print(validator.get_rule_statistics().to_string(index=False), file=sys.stderr)
+
+    validation_results = pd.DataFrame.from_records(validation_results, columns=list(validator.get_issues_information(None, None).keys()))
+    if args.out is not None:
+        if isinstance(args.out,str):
+            api._save_information(validation_results, args.out)
+        elif args.out is True:
+            api._save_information(validation_results)
+
+    return validation_results
+
+
+def query(args):
+    l = setup_logger(args)
+    l.info("Querying the catalog")
+
+    if args.sql is not None and any(f is not None for f in [args.where, args.joint_type, args.visual_mesh, args.collision_mesh]):
+        l.warning(f"The 'sql' argument was provided together with filters. Ignoring the filters.")
+
+    try:
+        results = api.query_catalog(args.catalog, args.sql, where=args.where, joint_type=args.joint_type,
+                                    visual_mesh=args.visual_mesh, collision_mesh=args.collision_mesh)
+    except FileNotFoundError as e:
+        l.error(f"{e} Exiting.")
+        return None
+
+    if args.count:
+        print(len(results))
+    else:
+        print(results.to_string(index=False))
+
+    if args.out is not None:
+        if isinstance(args.out,str):
+            api._save_information(results, args.out)
+        elif args.out is True:
+            api._save_information(results)
+
+    return results
+
+
+def search_names(args):
+    l = setup_logger(args)
+    l.info("Searching the name index")
+
+    start = time.perf_counter()
+    try:
+        results = api.search_names(args.pattern, args.index, args.kind, args.fuzzy, args.min_similarity, args.limit)
+    except FileNotFoundError as e:
+        l.error(f"{e} Exiting.")
+        return None
+    l.info(f"Found {len(results)} results in {1000 * (time.perf_counter() - start):.1f} ms")
+
+    if args.files:
+        results = results[["path"]].drop_duplicates()
+    if args.count:
+        print(len(results))
+    else:
+        print(results.to_string(index=False))
+
+    if args.out is not None:
+        if isinstance(args.out,str):
+            api._save_information(results, args.out)
+        elif args.out is True:
+            api._save_information(results)
+
+    return results
+
+
+def diff(args):
+    l = setup_logger(args)
+    l.info("Comparing urdf files")
+
+    if args.files is not None:
+        diff_results = api.diff_urdfs([tuple(args.files)], n_workers=1)
+    elif args.duplicates_file is not None:
+        diff_results = api.generate_duplicates_diff_schema(args.duplicates_file, args.dup_cmp_sources, out=args.out if args.out is not None else False, n_workers=args.workers)
+    else:
+        l.error("Either the 'files' or the 'duplicates-file' argument has to be provided. Exiting.")
+        return None
+
+    for information in diff_results.to_dict(orient="records"):
+        print(json.dumps(information, default=str))
+
+    if args.out is not None and args.files is not None:
+        if isinstance(args.out,str):
+            api._save_information(diff_results, args.out)
+        elif args.out is True:
+            api._save_information(diff_results)
+
+    return diff_results
+
+
+def merge(args):
+    l = setup_logger(args)
+    l.info("Merging the partial schemas")
+
+    try:
+        merged_results = api.merge_schemas(args.schema, args.partials, args.out)
+    except ValueError as e:
+        l.error(f"{e} Exiting.")
+        return None
+    l.info(f"Merged {len(args.partials)} partial '{args.schema}' schemas into {merged_results.shape[0]} rows")
+
+    return merged_results
+
+
+def serve(args):
+    l = setup_logger(args)
+    # imported here, such that the other subcommands do not import the http server
+    from urdf_analyzer.server import AnalysisService, create_server
+
+    service = AnalysisService(l, args.parsers, args.xml_backend, args.max_concurrency)
+    server = create_server(service, args.host, args.port, args.unix_socket)
+    address = f"unix://{args.unix_socket}" if args.unix_socket is not None else f"http://{args.host}:{server.server_address[1]}"
+    print(f"Serving urdf_analyzer at {address}", flush=True)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        service.close()
+        if args.unix_socket is not None and Path(args.unix_socket).exists():
+            Path(args.unix_socket).unlink()
+
+
 def _init_parsers():
     args_parser = argparse.ArgumentParser(add_help=True, allow_abbrev=False)
     args_parser.add_argument('--logger-config', type=open, help="Logger configuration file.")
@@ -134,6 +338,18 @@ def _add_common_arguments(subparser):
     subparser.add_argument("--urdf-root-dir", required=False, type=str, help="The root directory of the URDF file.")
     # if --out is provided with no argument, then store true, and save using default filename, otherwise if argument provided then use as filename 
     subparser.add_argument('--out', required=False, action='store', const=True, nargs="?", help="The name of the output file to save the results. Will be saved as .csv by default.")
+    _add_shard_argument(subparser)
+
+
+def _shard_type(value: str):
+    try:
+        return api.parse_shard(value)
+    except ValueError as e:
+        raise argparse.ArgumentTypeError(str(e))
+
+
+def _add_shard_argument(subparser):
+    subparser.add_argument('--shard', type=_shard_type, required=False, metavar="i/N", help="Only analyse the i'th of N shards of the urdf files found in the urdf-search-dir, e.g. '1/4'. The files are partitioned by a stable hash of their path relative to the urdf-search-dir.")
 
 
 def _create_model_information_parser(subparser):
@@ -144,10 +360,16 @@ def _create_model_information_parser(subparser):
     # potentially make a subparser for the joints and links, so that the user can specify if they want fully detailed results saved or not
     model_information_parser.add_argument('--joints', action='store_true', required=False, help="extract joint information: amount, types, names")
     model_information_parser.add_argument('--links', action='store_true', required=False, help="extract link information: amount, names")
+    model_information_parser.add_argument('--mesh-statistics', action='store_true', required=False, help="with --links, read the number of triangles, bounds and surface area of the .stl, .obj and .dae meshes of the links")
+    model_information_parser.add_argument('--dynamics', action='store_true', required=False, help="extract inertial, limit and dynamics information: total mass, center of mass, inertia checks")
+    model_information_parser.add_argument('--collisions', action='store_true', required=False, help="extract collision information: bounding boxes, self-collision candidates")
+    model_information_parser.add_argument('--topology', action='store_true', required=False, help="extract topology information: actuated DOF, tree depth, leaves, branching factor, longest serial chain, kinematic chains")
 
     # if --out is true, then it should be possible to specify if you want full results or not. By default the shorter version of the results will be provided. The full results can be provided, by supplying the argument --full
     # TODO: make this argument only possible if --out is specified
     model_information_parser.add_argument('--full', required=False, action='store_true', default=False, help="save full version of results")
+    model_information_parser.add_argument('--xacro', required=False, action='store_true', default=False, help="also search for '.urdf.xacro' files, which are expanded before the analysis")
+    model_information_parser.add_argument('--xml-backend', choices=list(xml_backends.keys()), required=False, help="the XML backend used to read the urdf files. By default the standard library ElementTree is used, which is faster for the full analysis")
 
     model_information_parser.set_defaults(analyze=model_information)
 
@@ -161,6 +383,11 @@ def _create_parsing_information_parser(subparser):
     group = parsing_information_parser.add_mutually_exclusive_group(required=True)
     group.add_argument('--parser', choices=URDFparser.supported_parsers, nargs="+", help=f"The urdf parser to use. Choose from: {URDFparser.supported_parsers}")
     group.add_argument('--all-parsers', action='store_true', help=f"Try parsing the urdf files with all the supported parsers: '{URDFparser.supported_parsers}'")
+    parsing_information_parser.add_argument('--normalized', action='store_true', required=False, default=False, help="Feed the parsers the canonical urdf files (minified, sorted attributes, normalised numbers, absolute mesh paths), which are cached.")
+    parsing_information_parser.add_argument('--structure-only', action='store_true', required=False, default=False, help=f"Skip loading the meshes and building the scene graph, for the parsers supporting it: {list(URDFparser.structure_only_arguments.keys())}.")
+    parsing_information_parser.add_argument('--check-meshes', action='store_true', required=False, default=False, help="Check that the meshes referenced by the urdf files can be found and read, separately from parsing.")
+    parsing_information_parser.add_argument('--gate', choices=api.GATE_MODES, required=False, help="Only decide whether any (or all) of the parsers load each urdf file, trying the cheapest parsers first and skipping the remaining parsers once the outcome is decided.")
+    parsing_information_parser.add_argument('--latency-history', type=str, required=False, help=f"The file of the measured latencies of the parsers, which order the parsers when gating. Default: '{DEFAULT_PARSER_LATENCY_FILE}'.")
 
     parsing_information_parser.set_defaults(analyze=parsing_information)
 
@@ -178,17 +405,128 @@ def create_generate_schemas_parser(subparser):
     generate_schemas_parser.add_argument('--urdf-search-dir', type=str, help="The directory to perform a recursive search for URDF files and pass them for analysis.")
     generate_schemas_parser.add_argument("--urdf-root-dir", required=False, type=str, help="The root directory of the URDF file.")
 
-    generate_schemas_parser.add_argument("generate_schema", choices=['tool-cmp','model-info','urdf-parse-cmp','duplicates-cmp'], default=[None, None, None, None], nargs="+", help=f"the types of schemas that can be generated.") # TODO: fix help description
+    generate_schemas_parser.add_argument("generate_schema", choices=['tool-cmp','model-info','urdf-parse-cmp','duplicates-cmp','duplicates-diff','catalog','validation','dataset-stats','normalize','name-index'], default=[None, None, None, None, None, None, None, None, None, None], nargs="+", help=f"the types of schemas that can be generated.") # TODO: fix help description
     generate_schemas_parser.add_argument("--out-dir", type=str, required=False, help=f"The output directory for the generated schemas.")
-    generate_schemas_parser.add_argument("--duplicates-file", type=str, required=False, help="The file describing the duplicate robots. Required only when 'duplicates-cmp' is provided.")
+    generate_schemas_parser.add_argument("--duplicates-file", type=str, required=False, help="The file describing the duplicate robots. Required only when 'duplicates-cmp' or 'duplicates-diff' is provided.")
     generate_schemas_parser.add_argument("--dup-cmp-parser", type=str, required=False, help=f"The parser to run the duplicate urdf files through. Can choose from {URDFparser.supported_parsers}, or can also choose 'all' to run the files through each supported parser.")
     generate_schemas_parser.add_argument("--dup-cmp-sources", type=str, required=False, nargs="+", help="The sources you would like to compare the duplicates against.")
+    generate_schemas_parser.add_argument("--xacro", action='store_true', required=False, default=False, help="Also search for '.urdf.xacro' files, which are expanded before the analysis.")
+    generate_schemas_parser.add_argument("--workers", type=int, required=False, help="The number of worker processes. Defaults to the number of CPUs.")
+    generate_schemas_parser.add_argument("--rules", choices=list(registered_rules.keys()), nargs="+", required=False, help="The validation rules to use when 'validation' is provided. By default all of the rules are used.")
+    generate_schemas_parser.add_argument("--catalog", type=str, required=False, help=f"The catalog file to store the results in when 'catalog' is provided. Default: '{DEFAULT_CATALOG_FILE}'.")
+    generate_schemas_parser.add_argument("--name-index", type=str, required=False, help=f"The name index file to update when 'name-index' is provided. Default: '{DEFAULT_NAME_INDEX_FILE}'.")
+    _add_shard_argument(generate_schemas_parser)
+    generate_schemas_parser.add_argument("--resume", action='store_true', required=False, default=False, help="Resume an interrupted 'tool-cmp' or 'urdf-parse-cmp' generation, skipping the (file, parser) units completed in the journal.")
+    generate_schemas_parser.add_argument("--structure-only", action='store_true', required=False, default=False, help="Parse the urdf files without loading the meshes when 'tool-cmp' or 'urdf-parse-cmp' is provided, for the parsers supporting it.")
+    generate_schemas_parser.add_argument("--normalized", action='store_true', required=False, default=False, help="Feed the parsers the canonical urdf files (minified, sorted attributes, normalised numbers, absolute mesh paths) when 'tool-cmp' or 'urdf-parse-cmp' is provided. The speedup of each parser is reported by 'normalize'.")
+    sample_group = generate_schemas_parser.add_mutually_exclusive_group()
+    sample_group.add_argument("--sample", type=int, required=False, help="Only analyse a stratified sample of N of the urdf files found in the urdf-search-dir, and estimate the means and pass rates over all of the files with confidence intervals.")
+    sample_group.add_argument("--sample-fraction", type=float, required=False, help="Only analyse a stratified sample of a fraction f of the urdf files found in the urdf-search-dir, see '--sample'.")
+    generate_schemas_parser.add_argument("--sample-strata", choices=URDFSample.strata_types, required=False, default="directory", help="Stratify the sample by the first directory of the files in the urdf-search-dir, or by the size of the files. Default: directory.")
+    generate_schemas_parser.add_argument("--sample-seed", type=int, required=False, default=0, help="The seed of the sample, the same seed gives the same sample. Default: 0.")
+    generate_schemas_parser.add_argument("--progress", choices=ProgressReporter.modes, required=False, help="Report the progress, throughput, failures and ETA of each stage: 'tty' rewrites a status line, 'json' writes a JSON object per line.")
+    generate_schemas_parser.add_argument("--progress-file", type=str, required=False, help="The file the progress is appended to. Default: stderr.")
+    generate_schemas_parser.add_argument("--progress-interval", type=float, required=False, help=f"The minimum number of seconds between progress reports of a stage. Default: {DEFAULT_PROGRESS_INTERVAL}.")
     # TODO: add argument duplicates-subdir, in case you only want to compare one robot
     generate_schemas_parser.set_defaults(analyze=generate_schemas)
 
     return generate_schemas_parser
 
 
+def _create_validate_parser(subparser):
+    validate_parser = subparser.add_parser("validate", allow_abbrev=False)
+
+    group = validate_parser.add_mutually_exclusive_group(required=False)
+    group.add_argument('--filename', type=str, help="URDF filename.")
+    group.add_argument('--urdf-search-dir', type=str, help="The directory to perform a recursive search for URDF files and pass them for analysis.")
+    validate_parser.add_argument("--urdf-root-dir", required=False, type=str, help="The root directory of the URDF file.")
+    validate_parser.add_argument('--rules', choices=list(registered_rules.keys()), nargs="+", required=False, help=f"The validation rules to use. By default all of the rules are used: {list(registered_rules.keys())}")
+    validate_parser.add_argument('--list-rules', action='store_true', required=False, help="Print the validation rules and their descriptions.")
+    validate_parser.add_argument('--rule-statistics', action='store_true', required=False, help="Print the execution time, hit count and number of issues of each rule after the validation.")
+    validate_parser.add_argument('--out', required=False, action='store', const=True, nargs="?", help="The name of the output file to save the results. Will be saved as .csv by default.")
+    _add_shard_argument(validate_parser)
+
+    validate_parser.set_defaults(analyze=validate)
+
+    return validate_parser
+
+
+def _create_query_parser(subparser):
+    query_parser = subparser.add_parser("query", allow_abbrev=False)
+
+    query_parser.add_argument("--catalog", type=str, default=DEFAULT_CATALOG_FILE, help=f"The catalog file generated using the 'catalog' schema. Default: '{DEFAULT_CATALOG_FILE}'.")
+    query_parser.add_argument("--where", type=str, required=False, help="An SQL condition on the model information of the files, e.g. \"n_revolute_joints > 6\".")
+    query_parser.add_argument("--joint-type", choices=JointStandard.joint_types, required=False, help="Only return files containing a joint of this type.")
+    query_parser.add_argument("--visual-mesh", type=str, required=False, help="Only return files containing a visual mesh of this type, e.g. 'dae'.")
+    query_parser.add_argument("--collision-mesh", type=str, required=False, help="Only return files containing a collision mesh of this type, e.g. 'dae'.")
+    query_parser.add_argument("--sql", type=str, required=False, help="An SQL statement to run against the 'files', 'joints' and 'links' tables of the catalog, e.g. for aggregates.")
+    query_parser.add_argument("--count", action='store_true', required=False, help="Only print the number of results.")
+    query_parser.add_argument('--out', required=False, action='store', const=True, nargs="?", help="The name of the output file to save the results. Will be saved as .csv by default.")
+
+    query_parser.set_defaults(analyze=query)
+
+    return query_parser
+
+
+def _create_search_names_parser(subparser):
+    search_names_parser = subparser.add_parser("search-names", allow_abbrev=False)
+
+    search_names_parser.add_argument("pattern", type=str, help="A glob pattern of the names, e.g. '*_wheel_joint', or a substring of the names if it contains no wildcards. Case insensitive.")
+    search_names_parser.add_argument("--index", type=str, default=DEFAULT_NAME_INDEX_FILE, help=f"The name index file generated using the 'name-index' schema. Default: '{DEFAULT_NAME_INDEX_FILE}'.")
+    search_names_parser.add_argument("--kind", choices=URDFNameIndex.kinds, nargs="+", required=False, help="Only search these kinds of names. By default the link names, joint names and mesh filenames are searched.")
+    search_names_parser.add_argument("--fuzzy", action='store_true', required=False, help="Return the names similar to the pattern, by the similarity of their trigrams.")
+    search_names_parser.add_argument("--min-similarity", type=float, default=DEFAULT_NAME_SIMILARITY, help=f"The minimum similarity (between 0 and 1) of the names of a fuzzy search. Default: {DEFAULT_NAME_SIMILARITY}.")
+    search_names_parser.add_argument("--limit", type=int, required=False, help="The maximum number of names returned, with all of the files containing them.")
+    search_names_parser.add_argument("--files", action='store_true', required=False, help="Only print the files containing the matching names.")
+    search_names_parser.add_argument("--count", action='store_true', required=False, help="Only print the number of results.")
+    search_names_parser.add_argument('--out', required=False, action='store', const=True, nargs="?", help="The name of the output file to save the results. Will be saved as .csv by default.")
+    search_names_parser.set_defaults(analyze=search_names)
+
+    return search_names_parser
+
+
+def _create_diff_parser(subparser):
+    diff_parser = subparser.add_parser("diff", allow_abbrev=False)
+
+    group = diff_parser.add_mutually_exclusive_group(required=True)
+    group.add_argument('--files', type=str, nargs=2, metavar=("FILENAME_A", "FILENAME_B"), help="The two URDF files to compare.")
+    group.add_argument('--duplicates-file', type=str, help="The file describing the duplicate robots. The duplicate urdf files of each robot are compared.")
+    diff_parser.add_argument("--dup-cmp-sources", type=str, required=False, nargs="+", help="The sources you would like to compare the duplicates against.")
+    diff_parser.add_argument("--workers", type=int, required=False, help="The number of worker processes. Defaults to the number of CPUs.")
+    diff_parser.add_argument('--out', required=False, action='store', const=True, nargs="?", help="The name of the output file to save the results. Will be saved as .csv by default.")
+
+    diff_parser.set_defaults(analyze=diff)
+
+    return diff_parser
+
+
+def _create_serve_parser(subparser):
+    serve_parser = subparser.add_parser("serve", allow_abbrev=False)
+
+    serve_parser.add_argument("--host", type=str, default=DEFAULT_SERVER_HOST, help=f"The host to listen on. Default: '{DEFAULT_SERVER_HOST}'.")
+    serve_parser.add_argument("--port", type=int, default=DEFAULT_SERVER_PORT, help=f"The port to listen on. Default: {DEFAULT_SERVER_PORT}.")
+    serve_parser.add_argument("--unix-socket", type=str, required=False, help="Listen on this Unix socket instead of the host and port.")
+    serve_parser.add_argument("--parsers", choices=URDFparser.supported_parsers, nargs="+", required=False, help="The parsers to load when the daemon starts. The other parsers are loaded on their first request.")
+    serve_parser.add_argument("--max-concurrency", type=int, default=DEFAULT_SERVER_MAX_CONCURRENCY, help=f"The maximum number of requests handled at the same time, further requests are rejected. Default: {DEFAULT_SERVER_MAX_CONCURRENCY}.")
+    serve_parser.add_argument('--xml-backend', choices=list(xml_backends.keys()), required=False, help="the XML backend used to read the urdf files. By default the standard library ElementTree is used, which is faster for the full analysis")
+
+    serve_parser.set_defaults(analyze=serve)
+
+    return serve_parser
+
+
+def _create_merge_parser(subparser):
+    merge_parser = subparser.add_parser("merge", allow_abbrev=False)
+
+    merge_parser.add_argument("schema", choices=['model-info','urdf-parse-cmp','tool-cmp','dataset-stats'], help="The type of the partial schemas, generated using 'generate-schemas' with '--shard'.")
+    merge_parser.add_argument("--partials", type=str, nargs="+", required=True, help="The partial schemas of the shards, e.g. 'results/tool_comparison_schema_shard-*.csv'.")
+    merge_parser.add_argument('--out', required=False, action='store', const=True, default=True, nargs="?", help="The name of the output file to save the merged schema. By default the schema is saved using the default filename of the schema.")
+
+    merge_parser.set_defaults(analyze=merge)
+
+    return merge_parser
+
+
 def create_urdf_analyzer(manual_test:list=[]):
     subparsers, args_parser = _init_parsers()
 
@@ -201,6 +539,24 @@ def create_urdf_analyzer(manual_test:list=[]):
     # generate schemas
     create_generate_schemas_parser(subparsers)
 
+    # validate urdf files
+    _create_validate_parser(subparsers)
+
+    # query the catalog
+    _create_query_parser(subparsers)
+
+    # search the link names, joint names and mesh filenames
+    _create_search_names_parser(subparsers)
+
+    # compare urdf files
+    _create_diff_parser(subparsers)
+
+    # merge the schemas of several shards
+    _create_merge_parser(subparsers)
+
+    # serve the analyses from a daemon
+    _create_serve_parser(subparsers)
+
     # Force help display when error occurrs. See https://stackoverflow.com/questions/3636967/python-argparse-how-can-i-display-help-automatically-on-error
     args_parser.usage = args_parser.format_help().replace("usage: ", "")
     
@@ -232,6 +588,23 @@ def main():
     manual_test_list11 = ['generate-schemas','urdf-parse-cmp', '--urdf-search-dir', 'resources/urdf_files']
     manual_test_list12 = ['generate-schemas','tool-cmp', '--urdf-search-dir', 'resources/urdf_files_dataset/urdf_files/random']
     manual_test_list13 = ['generate-schemas','duplicates-cmp', '--duplicates-file', 'resources/urdf_files_dataset/duplicates','--dup-cmp-sources','matlab','ros-industrial']
+    manual_test_list14 = ['generate-schemas','catalog', '--urdf-search-dir', 'resources/urdf_files']
+    manual_test_list15 = ['query', '--where', 'n_revolute_joints > 6', '--collision-mesh', 'dae']
+    manual_test_list16 = ['generate-schemas','validation', '--urdf-search-dir', 'resources/urdf_files']
+    manual_test_list17 = ['validate', '--urdf-search-dir', 'resources/urdf_files', '--rules', 'kinematic-tree', 'unique-names', '--rule-statistics']
+    manual_test_list18 = ['diff', '--files', 'resources/urdf_files/adept_mobile_robots/pioneer-lx.urdf', 'resources/urdf_files/adept_mobile_robots/pioneer-lx-devil.urdf']
+    manual_test_list19 = ['diff', '--duplicates-file', 'resources/urdf_files_dataset/duplicates.json', '--out']
+    manual_test_list20 = ['generate-schemas','tool-cmp', '--urdf-search-dir', 'resources/urdf_files', '--shard', '1/2']
+    manual_test_list21 = ['merge','tool-cmp', '--partials', 'results/tool_comparison_schema_shard-1-of-2.csv', 'results/tool_comparison_schema_shard-2-of-2.csv']
+    manual_test_list22 = ['serve', '--parsers', 'yourdfpy', '--unix-socket', '/tmp/urdf_analyzer.sock']
+    manual_test_list23 = ['generate-schemas','dataset-stats', '--urdf-search-dir', 'resources/urdf_files', '--workers', '2']
+    manual_test_list24 = ['generate-schemas','model-info','validation','dataset-stats', '--urdf-search-dir', 'resources/urdf_files', '--progress', 'json', '--progress-interval', '0']
+    manual_test_list25 = ['generate-schemas','model-info','validation', '--urdf-search-dir', 'resources/urdf_files', '--sample', '2', '--sample-strata', 'size']
+    manual_test_list26 = ['generate-schemas','normalize', '--urdf-search-dir', 'resources/urdf_files']
+    manual_test_list27 = ['generate-schemas','name-index', '--urdf-search-dir', 'resources/urdf_files']
+    manual_test_list28 = ['search-names', '*_wheel_joint', '--kind', 'joint', '--files']
+    manual_test_list29 = ['parsing-information','--urdf-search-dir','./resources/urdf_files/adept_mobile_robots/','--all-parsers','--gate','any']
+    manual_test_list30 = ['model-information','--filename','pioneer-lx-devil.urdf','--urdf-root-dir','resources/urdf_files/adept_mobile_robots','--links','--mesh-statistics','--out','--full']
     # TODO: add warning if the urdf search is done in a non-existing directory
     create_urdf_analyzer(manual_test=[])
 
@@ -0,0 +1,97 @@
+import http.client
+import argparse
+import socket
+import json
+import sys
+import os
+
+from urdf_analyzer.constants import DEFAULT_SERVER_ADDRESS
+
+
+# A thin client of the analysis daemon (urdf_analyzer serve), which forwards the analysis of a file to the daemon.
+# Only the standard library is imported, such that a call does not pay for importing pandas or loading the parsers.
+
+
+class UnixHTTPConnection(http.client.HTTPConnection):
+
+    def __init__(self, socket_file: str, timeout: float=None):
+        super().__init__("localhost", timeout=timeout)
+        self.socket_file = socket_file
+
+    def connect(self):
+        self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        if self.timeout is not None:
+            self.sock.settimeout(self.timeout)
+        self.sock.connect(self.socket_file)
+
+
+def send_request(server: str, path: str, request: dict=None, timeout: float=None):
+    """
+    Send a request to the analysis daemon.
+
+    :param server: the address of the daemon, 'http://<host>:<port>' or 'unix://<socket-file>'
+    :type server: str
+    :param path: the path of the request, e.g. '/model-information' or '/health'
+    :type path: str
+    :param request: the JSON object of a POST request. A GET request is sent if not provided.
+    :type request: dict
+    :return: the HTTP status and the JSON response of the daemon
+    :rtype: tuple[int, dict]
+    """
+    if server.startswith("unix://"):
+        connection = UnixHTTPConnection(server[len("unix://"):], timeout=timeout)
+    else:
+        address = server[len("http://"):] if server.startswith("http://") else server
+        connection = http.client.HTTPConnection(address, timeout=timeout)
+    try:
+        if request is None:
+            connection.request("GET", path)
+        else:
+            connection.request("POST", path, body=json.dumps(request), headers={"Content-Type": "application/json"})
+        response = connection.getresponse()
+        return response.status, json.loads(response.read() or b"{}")
+    finally:
+        connection.close()
+
+
+def main():
+    args_parser = argparse.ArgumentParser(description="Forward an analysis to the urdf_analyzer daemon, started using 'urdf_analyzer serve'.", allow_abbrev=False)
+    args_parser.add_argument("--server", type=str, default=DEFAULT_SERVER_ADDRESS, help=f"The address of the daemon, 'http://<host>:<port>' or 'unix://<socket-file>'. Default: '{DEFAULT_SERVER_ADDRESS}'.")
+    args_parser.add_argument("--timeout", type=float, required=False, help="The number of seconds to wait for the daemon.")
+    args_parser.add_argument("request", choices=["health", "metrics", "model-information", "parsing-information", "validate"], help="The request to send to the daemon.")
+    args_parser.add_argument("--filename", type=str, required=False, help="URDF filename.")
+    args_parser.add_argument("--urdf-root-dir", type=str, required=False, help="The root directory of the URDF file.")
+    args_parser.add_argument("--dynamics", action='store_true', help="model-information: extract inertial, limit and dynamics information")
+    args_parser.add_argument("--collisions", action='store_true', help="model-information: extract collision information")
+    args_parser.add_argument("--topology", action='store_true', help="model-information: extract topology information")
+    args_parser.add_argument("--full", action='store_true', help="model-information: return the full version of the results")
+    args_parser.add_argument("--parser", type=str, nargs="+", required=False, help="parsing-information: the parsers to use. By default the parsers loaded by the daemon.")
+    args_parser.add_argument("--rules", type=str, nargs="+", required=False, help="validate: the validation rules to use. By default all of the rules are used.")
+    args = args_parser.parse_args()
+
+    request = None
+    if args.request not in ["health", "metrics"]:
+        if args.filename is None:
+            args_parser.error(f"The '{args.request}' request requires the 'filename' argument.")
+        # the daemon may run in another working directory, so the paths are made absolute
+        if args.urdf_root_dir is not None:
+            request = {"filename": args.filename, "urdf_root_dir": os.path.abspath(args.urdf_root_dir)}
+        else:
+            request = {"filename": os.path.abspath(args.filename)}
+        if args.request == "model-information":
+            request.update({"dynamics": args.dynamics, "collisions": args.collisions, "topology": args.topology, "full": args.full})
+        elif args.request == "parsing-information" and args.parser is not None:
+            request["parser"] = args.parser
+        elif args.request == "validate" and args.rules is not None:
+            request["rules"] = args.rules
+    try:
+        status, response = send_request(args.server, f"/{args.request}", request, args.timeout)
+    except OSError as e:
+        print(f"Could not connect to the daemon at '{args.server}': {e}", file=sys.stderr)
+        sys.exit(2)
+    print(json.dumps(response))
+    sys.exit(0 if status == 200 else 1)
+
+
+if __name__ == '__main__':
+    main()
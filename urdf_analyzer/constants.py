@@ -4,4 +4,36 @@ DEFAULT_OUTPUT_DIR = "results"
 DEFAULT_TRANFORMATION_COMPARISON_DIR = DEFAULT_OUTPUT_DIR + "/transformations"
 
 META_INFORMATION_FILENAME = "meta-information.json"
-SOURCE_INFORMATION_FILENAME = "source-information.json"
\ No newline at end of file
+SOURCE_INFORMATION_FILENAME = "source-information.json"
+
+DEFAULT_CATALOG_FILE = DEFAULT_OUTPUT_DIR + "/catalog.sqlite"
+
+CHECK_URDF_EXECUTABLE = "check_urdf"
+DEFAULT_CHECK_URDF_TIMEOUT = 30
+
+DEFAULT_XACRO_CACHE_DIR = DEFAULT_OUTPUT_DIR + "/xacro_cache"
+
+DEFAULT_INERTIA_TOLERANCE = 0.1 # the relative tolerance when comparing the declared inertia with the inertia of the geometry
+
+DEFAULT_JOURNAL_DIR = DEFAULT_OUTPUT_DIR + "/journals"
+
+DEFAULT_SERVER_HOST = "127.0.0.1"
+DEFAULT_SERVER_PORT = 8765
+DEFAULT_SERVER_ADDRESS = f"http://{DEFAULT_SERVER_HOST}:{DEFAULT_SERVER_PORT}"
+DEFAULT_SERVER_MAX_CONCURRENCY = 8 # the maximum number of requests handled at the same time, further requests are rejected
+
+DEFAULT_HISTOGRAM_RELATIVE_ERROR = 0.01 # the relative error of the quantiles of the dataset statistics
+
+DEFAULT_PROGRESS_INTERVAL = 1.0 # the minimum number of seconds between writing the progress of a batch run
+
+DEFAULT_SAMPLE_CONFIDENCE = 0.95 # the confidence level of the intervals of the estimates of a sample
+
+DEFAULT_NORMALIZATION_CACHE_DIR = DEFAULT_OUTPUT_DIR + "/normalization_cache"
+DEFAULT_NORMALIZATION_REPEATS = 3 # the number of timed loads of the original and canonical files, whose median is reported
+
+DEFAULT_NAME_INDEX_FILE = DEFAULT_OUTPUT_DIR + "/name_index.sqlite"
+DEFAULT_NAME_SIMILARITY = 0.3 # the minimum trigram similarity of the names returned by a fuzzy name search
+
+DEFAULT_PARSER_LATENCY_FILE = DEFAULT_OUTPUT_DIR + "/parser_latency.json" # the measured latencies of the parsers, which order the parsers when gating
+
+DEFAULT_MODEL_CACHE_MAX_BYTES = 256 * 2**20 # the maximum estimated size of the XML trees and model information cached in a process
@@ -0,0 +1,217 @@
+from collections import Counter
+from logging import Logger
+import pandas as pd
+import math
+import os
+
+from urdf_analyzer.model_analysis import ModelAnalysis
+from urdf_analyzer.urdf_standard import JointStandard, LinkStandard
+from urdf_analyzer.constants import DEFAULT_HISTOGRAM_RELATIVE_ERROR
+
+
+# Summaries of a dataset of URDF files, computed in a single pass over the files, without keeping the results of each file.
+#
+# The distributions (e.g. of the number of joints) are summarised by histograms with logarithmic buckets, as in HDR histograms
+# and DDSketch: a value v > 0 is counted in the bucket i = ceil(log(v) / log(gamma)), with gamma = (1 + e) / (1 - e), such that
+# the quantiles are estimated with a relative error of at most e. The number of buckets grows with the logarithm of the range
+# of the values, and not with the number of files. The count, sum, minimum and maximum, and the number of meshes of each
+# format, are exact. The summaries of several workers or shards are merged by adding the counts of the buckets, which gives
+# the same summary as computing it over all of the files at once.
+
+
+class LogHistogram:
+
+    def __init__(self, relative_error: float=DEFAULT_HISTOGRAM_RELATIVE_ERROR):
+        """
+        :param relative_error: the maximum relative error of the quantiles, between 0 and 1
+        :type relative_error: float
+        """
+        self.relative_error = relative_error
+        self.gamma = (1 + relative_error) / (1 - relative_error)
+        self.log_gamma = math.log(self.gamma)
+        self.buckets = Counter() # bucket index -> count
+        self.n_zeros = 0
+        self.count = 0
+        self.total = 0
+        self.min = None
+        self.max = None
+
+
+    def add(self, value: float):
+        """
+        :raises ValueError: if the value is negative
+        """
+        if value < 0:
+            raise ValueError(f"The histogram only supports non-negative values, got {value}.")
+        if value == 0:
+            self.n_zeros += 1
+        else:
+            self.buckets[math.ceil(math.log(value) / self.log_gamma)] += 1
+        self.count += 1
+        self.total += value
+        self.min = value if self.min is None else min(self.min, value)
+        self.max = value if self.max is None else max(self.max, value)
+
+
+    def merge(self, other: "LogHistogram"):
+        """
+        :raises ValueError: if the histograms do not have the same relative error, i.e. the same buckets
+        """
+        if other.relative_error != self.relative_error:
+            raise ValueError(f"The histograms have different relative errors ({self.relative_error} and {other.relative_error}) and cannot be merged.")
+        self.buckets.update(other.buckets)
+        self.n_zeros += other.n_zeros
+        self.count += other.count
+        self.total += other.total
+        for value in [other.min, other.max]:
+            if value is not None:
+                self.min = value if self.min is None else min(self.min, value)
+                self.max = value if self.max is None else max(self.max, value)
+        return self
+
+
+    def quantile(self, q: float):
+        """
+        :param q: the quantile, between 0 and 1
+        :type q: float
+        :return: the estimated quantile, None if the histogram is empty
+        :rtype: float
+        """
+        if self.count == 0:
+            return None
+        rank = q * (self.count - 1)
+        if rank < self.n_zeros:
+            return 0
+        seen = self.n_zeros
+        for index in sorted(self.buckets):
+            seen += self.buckets[index]
+            if rank < seen:
+                # the value in the bucket (gamma^(i-1), gamma^i] with the smallest relative error to all of the values of the bucket
+                value = 2 * self.gamma ** index / (self.gamma + 1)
+                return min(max(value, self.min), self.max)
+        return self.max
+
+
+    def to_dict(self):
+        return {"relative_error": self.relative_error, "buckets": {str(i): c for i, c in sorted(self.buckets.items())},
+                "n_zeros": self.n_zeros, "count": self.count, "total": self.total, "min": self.min, "max": self.max}
+
+
+    @classmethod
+    def from_dict(cls, information: dict):
+        histogram = cls(information["relative_error"])
+        histogram.buckets = Counter({int(i): c for i, c in information["buckets"].items()})
+        for key in ["n_zeros", "count", "total", "min", "max"]:
+            setattr(histogram, key, information[key])
+        return histogram
+
+
+class DatasetStatistics:
+
+    metrics = ["n_joints", "dof", "n_links", "file_size"] + [f"n_{j}_joints" for j in JointStandard.joint_types]
+    quantiles = [0.5, 0.9, 0.99]
+
+    def __init__(self, relative_error: float=DEFAULT_HISTOGRAM_RELATIVE_ERROR):
+        """
+        Mergeable summaries of the joints, degrees of freedom, links, mesh formats and file sizes of a dataset of URDF files.
+
+        :param relative_error: the maximum relative error of the quantiles
+        :type relative_error: float
+        """
+        self.relative_error = relative_error
+        self.n_files = 0
+        self.n_failed_files = 0
+        self.histograms = {m: LogHistogram(relative_error) for m in self.metrics}
+        self.mesh_types = {v: Counter() for v in LinkStandard.visualisation_types} # the number of meshes of each format
+
+
+    def add_file(self, filename: str, model_analysis: ModelAnalysis):
+        """
+        Read a URDF file and add it to the statistics. The files that cannot be read are counted in n_failed_files.
+        """
+        self.add_model(filename, model_analysis, model_analysis.xml_urdf_reader(filename))
+
+
+    def add_model(self, filename: str, model_analysis: ModelAnalysis, root):
+        """
+        Add a URDF file which has already been read by the model analysis to the statistics, e.g. when its XML tree is shared
+        with other schemas.
+
+        :param root: the root of the XML tree returned by the model analysis, None if the file could not be read
+        """
+        self.n_files += 1
+        if root is None:
+            self.n_failed_files += 1
+            return
+        joint_information = model_analysis.get_joint_information()
+        link_information = model_analysis.get_link_information()
+        values = {"n_joints": joint_information.n_joints,
+                  "dof": sum(JointStandard.joint_type_dofs[t] * n for t, n in joint_information.n_joint_types.items()),
+                  "n_links": link_information.n_links,
+                  "file_size": os.path.getsize(filename)}
+        values.update({f"n_{t}_joints": n for t, n in joint_information.n_joint_types.items()})
+        for metric in self.metrics:
+            self.histograms[metric].add(values[metric])
+        self.mesh_types["visual"].update(link_information.visual_mesh_types)
+        self.mesh_types["collision"].update(link_information.collision_mesh_types)
+
+
+    def merge(self, other: "DatasetStatistics"):
+        self.n_files += other.n_files
+        self.n_failed_files += other.n_failed_files
+        for metric in self.metrics:
+            self.histograms[metric].merge(other.histograms[metric])
+        for visualisation_type in LinkStandard.visualisation_types:
+            self.mesh_types[visualisation_type].update(other.mesh_types[visualisation_type])
+        return self
+
+
+    def to_dict(self):
+        return {"relative_error": self.relative_error, "n_files": self.n_files, "n_failed_files": self.n_failed_files,
+                "histograms": {m: h.to_dict() for m, h in self.histograms.items()},
+                "mesh_types": {v: dict(sorted(c.items())) for v, c in self.mesh_types.items()}}
+
+
+    @classmethod
+    def from_dict(cls, information: dict):
+        statistics = cls(information["relative_error"])
+        statistics.n_files = information["n_files"]
+        statistics.n_failed_files = information["n_failed_files"]
+        statistics.histograms = {m: LogHistogram.from_dict(h) for m, h in information["histograms"].items()}
+        statistics.mesh_types = {v: Counter(c) for v, c in information["mesh_types"].items()}
+        return statistics
+
+
+    def get_summary(self):
+        """
+        :return: a row for each metric, with the count, sum, mean, minimum, quantiles and maximum of the values,
+            and a row for each mesh format, with the number of meshes and their share of the meshes of the visualisation type
+        :rtype: pd.DataFrame
+        """
+        quantile_columns = [f"p{round(q * 100)}" for q in self.quantiles]
+        columns = ["statistic", "count", "sum", "mean", "min"] + quantile_columns + ["max", "share"]
+        records = [{"statistic": "n_files", "count": self.n_files}, {"statistic": "n_failed_files", "count": self.n_failed_files}]
+        for metric, histogram in self.histograms.items():
+            record = {"statistic": metric, "count": histogram.count, "sum": histogram.total,
+                      "mean": histogram.total / histogram.count if histogram.count > 0 else None,
+                      "min": histogram.min, "max": histogram.max}
+            record.update({c: histogram.quantile(q) for c, q in zip(quantile_columns, self.quantiles)})
+            records.append(record)
+        for visualisation_type, mesh_types in self.mesh_types.items():
+            n_meshes = sum(mesh_types.values())
+            for mesh_type, count in sorted(mesh_types.items()):
+                records.append({"statistic": f"{visualisation_type}_meshes_{mesh_type}", "count": count, "share": count / n_meshes})
+        return pd.DataFrame.from_records(records, columns=columns)
+
+
+def get_dataset_statistics(urdf_files: list[str], logger: Logger, relative_error: float=DEFAULT_HISTOGRAM_RELATIVE_ERROR):
+    """
+    Compute the statistics of the URDF files in a single pass, reading one file at a time.
+
+    :rtype: DatasetStatistics
+    """
+    model_analysis = ModelAnalysis(logger)
+    statistics = DatasetStatistics(relative_error)
+    for urdf_file in urdf_files:
+        statistics.add_file(urdf_file, model_analysis)
+    return statistics
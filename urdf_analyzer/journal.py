@@ -0,0 +1,102 @@
+from logging import Logger
+from pathlib import Path
+import json
+import zlib
+import os
+
+
+# The journal records the completed units of a long-running schema generation, where a unit is the loading of one URDF
+# file with one parser. Each unit is appended as a JSON line with a checksum of its content, and is flushed to disk (fsync)
+# before the next unit is started, such that the completed units are kept if a parser or the process crashes.
+# If the process is killed while writing a line, the line is not terminated by a newline (or fails the checksum), and the
+# journal is truncated to its last complete line when it is resumed.
+#
+# A unit is identified by the URDF file, its size and modification time, the parser and the parse mode, such that the
+# units of files that were modified since they were journaled are loaded again.
+class ParsingJournal:
+
+    def __init__(self, journal_file: str, logger: Logger, resume: bool=False):
+        """
+        :param journal_file: the JSON lines file of the journal
+        :type journal_file: str
+        :param resume: if True, the units of an existing journal are read and are not loaded again. Otherwise the journal is reset.
+        :type resume: bool
+        """
+        self.logger = logger
+        self.journal_file = str(journal_file)
+        self.completed = {} # unit -> passed
+        dir = os.path.dirname(self.journal_file)
+        if dir != "" and not Path(dir).exists():
+            os.makedirs(dir)
+        if resume and Path(self.journal_file).exists():
+            self._read()
+            self.logger.info(f"Resuming from the journal '{self.journal_file}' with {len(self.completed)} completed units")
+        else:
+            open(self.journal_file, "wb").close()
+        self.f = open(self.journal_file, "ab")
+
+
+    @staticmethod
+    def _get_checksum(unit: dict):
+        return format(zlib.crc32(json.dumps(unit, sort_keys=True).encode()), "08x")
+
+
+    @staticmethod
+    def _get_unit(filename: str, parser: str, parse_mode: str):
+        filename = os.path.abspath(filename)
+        try:
+            stat = os.stat(filename)
+            signature = f"{stat.st_size}:{stat.st_mtime_ns}"
+        except OSError:
+            signature = None
+        return {"file": filename, "signature": signature, "parser": parser, "parse_mode": parse_mode}
+
+
+    @staticmethod
+    def _get_key(unit: dict):
+        return (unit["file"], unit["signature"], unit["parser"], unit["parse_mode"])
+
+
+    def _read(self):
+        with open(self.journal_file, "rb") as f:
+            content = f.read()
+        # the content after the last newline was not completely written
+        valid_size = content.rfind(b"\n") + 1
+        if valid_size < len(content):
+            self.logger.warning(f"Ignoring the incomplete last line of the journal '{self.journal_file}'")
+            with open(self.journal_file, "r+b") as f:
+                f.truncate(valid_size)
+        for line in content[:valid_size].splitlines():
+            try:
+                entry = json.loads(line)
+                if entry.pop("checksum") != self._get_checksum(entry):
+                    raise ValueError("checksum mismatch")
+                self.completed[self._get_key(entry)] = entry["passed"]
+            except (ValueError, KeyError, TypeError, AttributeError) as e:
+                self.logger.warning(f"Ignoring a corrupted line of the journal '{self.journal_file}': {e}")
+
+
+    def get_result(self, filename: str, parser: str, parse_mode: str):
+        """
+        :return: if the file was loaded by the parser, None if the unit has not been completed
+        :rtype: bool
+        """
+        return self.completed.get(self._get_key(self._get_unit(filename, parser, parse_mode)))
+
+
+    def record(self, filename: str, parser: str, parse_mode: str, passed: bool):
+        """
+        Append a completed unit to the journal, which is written to disk before returning.
+        """
+        unit = self._get_unit(filename, parser, parse_mode)
+        unit["passed"] = bool(passed)
+        unit["checksum"] = self._get_checksum(unit)
+        self.f.write((json.dumps(unit) + "\n").encode())
+        self.f.flush()
+        os.fsync(self.f.fileno())
+        del unit["checksum"]
+        self.completed[self._get_key(unit)] = unit["passed"]
+
+
+    def close(self):
+        self.f.close()
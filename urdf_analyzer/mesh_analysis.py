@@ -0,0 +1,585 @@
+from pathlib import Path
+from array import array
+import xml.parsers.expat
+import itertools
+import warnings
+import numpy as np
+import os
+
+
+# Localises the mesh files referenced by URDF files, and reads the statistics of the meshes: the number of triangles, the bounds and
+# the surface area. The statistics are cached by the path, modification time and size of the mesh file, as the same meshes are
+# typically referenced by many links and by many URDF files of the same robot.
+# The validity of the meshes (found and readable) can be checked separately from parsing the URDF structure, see get_mesh_validity().
+#
+# The meshes are streamed rather than loaded as a whole, such that the memory stays bounded for large meshes (e.g. 100 MB hulls):
+# - STL: the binary triangles are read in chunks of mesh_chunk_size,
+# - OBJ: the 'v' lines are kept as a flat array of coordinates, while the 'f' lines are triangulated in chunks of mesh_chunk_size faces,
+# - Collada: the file is read with expat, without building a DOM. Only the <float_array> of the positions of the current <mesh> is kept,
+#   while the indices of the primitives (<p>) are triangulated as their text is received. The per-geometry statistics are combined
+#   with the transforms of the <node> elements instancing them and the <unit> of the file. Only <triangles>, <polylist> and
+#   <polygons> are read (not strips and fans), and the up axis is not applied, as for the bounds of the STL meshes.
+
+_mesh_statistics = {} # (path, modification time, size) -> statistics or None
+
+stl_triangle_dtype = np.dtype([('normal', '<f4', (3,)), ('vertices', '<f4', (3, 3)), ('attribute', '<u2')])
+
+mesh_chunk_size = 2**16 # the number of triangles (STL) or faces (OBJ) that are processed at once
+
+
+def resolve_mesh_filename(filename: str, urdf_root_dir: str):
+    """
+    Localise a mesh file referenced by a URDF file. The filename can be relative to the URDF file, absolute, or use the
+    'file://' or 'package://<package>/<path>' prefixes. A package is searched for in the directory of the URDF file,
+    its parent directories and the ROS_PACKAGE_PATH.
+
+    :param filename: the filename of the mesh, as written in the URDF file
+    :type filename: str
+    :param urdf_root_dir: the directory of the URDF file
+    :type urdf_root_dir: str
+    :return: the path of the mesh file, None if it could not be found
+    :rtype: str
+    """
+    if filename is None:
+        return None
+    if filename.startswith("file://"):
+        filename = filename[len("file://"):]
+    if filename.startswith("package://"):
+        package, _, relative_path = filename[len("package://"):].partition("/")
+        candidates = [Path(urdf_root_dir)] + list(Path(urdf_root_dir).parents) if urdf_root_dir is not None else []
+        candidates += [Path(p) for p in os.environ.get("ROS_PACKAGE_PATH", "").split(os.pathsep) if p != ""]
+        for candidate in candidates:
+            for package_path in [candidate, Path(candidate, package)]:
+                if package_path.name == package and Path(package_path, relative_path).is_file():
+                    return str(Path(package_path, relative_path))
+        return None
+    path = Path(filename)
+    if not path.is_absolute() and urdf_root_dir is not None:
+        path = Path(urdf_root_dir, path)
+    return str(path) if path.is_file() else None
+
+
+def read_stl_vertices(filename: str):
+    """
+    Read the vertices of a binary or ASCII STL file.
+
+    :return: the vertices of the triangles, with shape (3*n_triangles, 3)
+    :rtype: np.ndarray
+    """
+    size = os.path.getsize(filename)
+    with open(filename, "rb") as f:
+        header = f.read(84)
+        # binary STL files can also start with 'solid', so the size given by the number of triangles is checked first
+        if len(header) == 84:
+            n_triangles = int(np.frombuffer(header, dtype='<u4', count=1, offset=80)[0])
+            if size == 84 + n_triangles * stl_triangle_dtype.itemsize:
+                triangles = np.fromfile(f, dtype=stl_triangle_dtype, count=n_triangles)
+                return triangles['vertices'].reshape(-1, 3).astype(float)
+        if not header.lstrip().startswith(b"solid"):
+            raise ValueError(f"The file '{filename}' is neither a binary nor an ASCII STL file.")
+        f.seek(0)
+        values = [line.split()[1:4] for line in f if line.lstrip().startswith(b"vertex")]
+    return np.array(values, dtype=float).reshape(-1, 3)
+
+
+class _TriangleStatistics:
+
+    def __init__(self):
+        """
+        The number of triangles, the bounds and the surface area of a mesh, accumulated chunk by chunk.
+        """
+        self.n_triangles = 0
+        self.surface_area = 0.0
+        self.aabb_min = np.full(3, np.inf)
+        self.aabb_max = np.full(3, -np.inf)
+
+
+    def add(self, triangles: np.ndarray):
+        """
+        :param triangles: the vertices of the triangles, with shape (n_triangles, 3, 3)
+        :type triangles: np.ndarray
+        """
+        if len(triangles) == 0:
+            return
+        self.n_triangles += len(triangles)
+        normals = np.cross(triangles[:, 1] - triangles[:, 0], triangles[:, 2] - triangles[:, 0])
+        self.surface_area += float(np.linalg.norm(normals, axis=1).sum()) / 2
+        self.aabb_min = np.minimum(self.aabb_min, triangles.min(axis=(0, 1)))
+        self.aabb_max = np.maximum(self.aabb_max, triangles.max(axis=(0, 1)))
+
+
+    def add_indexed(self, positions: np.ndarray, triangles: np.ndarray):
+        """
+        :param positions: the vertices of the mesh, with shape (n_vertices, 3)
+        :type positions: np.ndarray
+        :param triangles: the indices of the vertices of the triangles, with shape (n_triangles, 3)
+        :type triangles: np.ndarray
+        """
+        if len(triangles) == 0:
+            return
+        if triangles.min() < 0 or triangles.max() >= len(positions):
+            raise ValueError("The mesh references vertices that do not exist.")
+        self.add(positions[triangles])
+
+
+    def add_transformed(self, other, transform: np.ndarray):
+        """
+        Add the statistics of a mesh transformed by a 4x4 affine transform. The bounds are the bounds of the transformed corners of its
+        bounds, which are exact for translations and scales, and the surface area is exact for rigid and uniformly scaled transforms.
+        """
+        if other.n_triangles == 0:
+            return
+        corners = np.array(list(itertools.product(*zip(other.aabb_min, other.aabb_max)))) @ transform[:3, :3].T + transform[:3, 3]
+        self.n_triangles += other.n_triangles
+        self.surface_area += other.surface_area * float(abs(np.linalg.det(transform[:3, :3]))) ** (2/3)
+        self.aabb_min = np.minimum(self.aabb_min, corners.min(axis=0))
+        self.aabb_max = np.maximum(self.aabb_max, corners.max(axis=0))
+
+
+    def get_statistics(self):
+        """
+        :return: the number of triangles, the minimum and maximum corners of the bounds (None if there are no triangles) and the surface area
+        :rtype: dict
+        """
+        has_triangles = self.n_triangles > 0
+        return {"n_triangles": self.n_triangles, "aabb_min": self.aabb_min if has_triangles else None,
+                "aabb_max": self.aabb_max if has_triangles else None, "surface_area": self.surface_area}
+
+
+def triangulate_polygons(vertex_indices: np.ndarray, counts: np.ndarray):
+    """
+    Triangulate polygons as fans around their first vertex, which is exact for convex polygons.
+
+    :param vertex_indices: the indices of the vertices of the polygons, one polygon after the other
+    :type vertex_indices: np.ndarray
+    :param counts: the number of vertices of each polygon
+    :type counts: np.ndarray
+    :return: the indices of the vertices of the triangles, with shape (n_triangles, 3)
+    :rtype: np.ndarray
+    """
+    counts = np.asarray(counts, dtype=np.int64)
+    starts = np.cumsum(counts) - counts
+    n_fan_triangles = np.maximum(counts - 2, 0)
+    first = np.repeat(starts, n_fan_triangles)
+    # the index of each triangle within its polygon
+    k = np.arange(len(first)) - np.repeat(np.cumsum(n_fan_triangles) - n_fan_triangles, n_fan_triangles)
+    return np.asarray(vertex_indices, dtype=np.int64)[np.stack([first, first + k + 1, first + k + 2], axis=1)]
+
+
+def read_stl_statistics(filename: str):
+    """
+    Read the statistics of a binary or ASCII STL file, where the binary triangles are read in chunks.
+
+    :return: see _TriangleStatistics.get_statistics()
+    :rtype: dict
+    """
+    statistics = _TriangleStatistics()
+    size = os.path.getsize(filename)
+    with open(filename, "rb") as f:
+        header = f.read(84)
+        if len(header) == 84:
+            n_triangles = int(np.frombuffer(header, dtype='<u4', count=1, offset=80)[0])
+            if size == 84 + n_triangles * stl_triangle_dtype.itemsize:
+                for _ in range(0, n_triangles, mesh_chunk_size):
+                    triangles = np.fromfile(f, dtype=stl_triangle_dtype, count=mesh_chunk_size)
+                    statistics.add(triangles['vertices'].astype(float))
+                return statistics.get_statistics()
+    # ASCII STL files are small, as they are rarely used for large meshes
+    statistics.add(read_stl_vertices(filename).reshape(-1, 3, 3))
+    return statistics.get_statistics()
+
+
+def read_obj_statistics(filename: str):
+    """
+    Read the statistics of a Wavefront OBJ file, from its 'v' and 'f' lines. The polygons are triangulated as fans, and the
+    faces are processed in chunks of mesh_chunk_size, such that only the vertices are kept in memory.
+
+    :return: see _TriangleStatistics.get_statistics()
+    :rtype: dict
+    """
+    statistics = _TriangleStatistics()
+    coordinates = array('d')
+    vertex_indices = array('q')
+    counts = array('q')
+
+    def add_faces():
+        positions = np.frombuffer(coordinates, dtype=float).reshape(-1, 3)
+        statistics.add_indexed(positions, triangulate_polygons(np.frombuffer(vertex_indices, dtype=np.int64), np.frombuffer(counts, dtype=np.int64)))
+
+    with open(filename, "rb") as f:
+        for line in f:
+            if line.startswith(b"v ") or line.startswith(b"v\t"):
+                values = line.split()[1:4]
+                if len(values) != 3:
+                    raise ValueError(f"The vertex '{line.decode(errors='replace').strip()}' of '{filename}' does not have 3 coordinates.")
+                coordinates.extend(map(float, values))
+            elif line.startswith(b"f ") or line.startswith(b"f\t"):
+                n_vertices = len(coordinates) // 3
+                tokens = line.split()[1:]
+                for token in tokens:
+                    # v, v/vt, v/vt/vn or v//vn, where the indices start at 1 and negative indices are relative to the last vertex
+                    index = int(token.split(b"/", 1)[0])
+                    vertex_indices.append(index - 1 if index > 0 else n_vertices + index)
+                counts.append(len(tokens))
+                if len(counts) >= mesh_chunk_size:
+                    add_faces()
+                    vertex_indices, counts = array('q'), array('q')
+    add_faces()
+    return statistics.get_statistics()
+
+
+class _NumberStream:
+
+    def __init__(self, dtype):
+        """
+        Parses the whitespace separated numbers of a text received in chunks, where a number can be split between two chunks.
+        """
+        self.dtype = dtype
+        self.remainder = ""
+
+
+    def feed(self, text: str):
+        """
+        :return: the numbers completed by the chunk
+        :rtype: np.ndarray
+        """
+        text = self.remainder + text
+        if text[-1:].isspace():
+            self.remainder = ""
+        else:
+            # the last number may continue in the next chunk
+            end = max(text.rfind(c) for c in " \t\n\r") + 1
+            text, self.remainder = text[:end], text[end:]
+        return self._parse(text)
+
+
+    def close(self):
+        """
+        :return: the last number, if any
+        :rtype: np.ndarray
+        """
+        text, self.remainder = self.remainder, ""
+        return self._parse(text)
+
+
+    def _parse(self, text: str):
+        if text == "" or text.isspace():
+            return np.zeros(0, dtype=self.dtype)
+        # the older numpy versions only warn about the text that is not a number, and return the numbers before it
+        with warnings.catch_warnings():
+            warnings.simplefilter("error", DeprecationWarning)
+            try:
+                return np.fromstring(text, dtype=self.dtype, sep=" ")
+            except DeprecationWarning as e:
+                raise ValueError(f"The text '{text[:50]}' does not only contain numbers.") from e
+
+
+class _PolygonStream:
+
+    def __init__(self, positions: np.ndarray, stride: int, vertex_offset: int, counts: np.ndarray, statistics: _TriangleStatistics):
+        """
+        Triangulates the polygons of a Collada <triangles> or <polylist> primitive, from the indices of its <p> element received in chunks.
+
+        :param stride: the number of indices per vertex, i.e. the number of inputs of the primitive
+        :param vertex_offset: the offset of the index of the position within the indices of a vertex
+        :param counts: the number of vertices of each polygon (<vcount>), None for triangles
+        """
+        self.positions = positions
+        self.stride = stride
+        self.vertex_offset = vertex_offset
+        self.counts = counts
+        self.cumulative_counts = np.cumsum(counts) if counts is not None else None
+        self.statistics = statistics
+        self.pending = np.zeros(0, dtype=np.int64) # the indices of an incomplete vertex
+        self.vertex_indices = np.zeros(0, dtype=np.int64) # the indices of the vertices of the incomplete polygons
+        self.n_polygons = 0
+        self.n_vertices = 0 # of the complete polygons
+
+
+    def add(self, indices: np.ndarray):
+        indices = np.concatenate([self.pending, indices])
+        n_complete = len(indices) // self.stride * self.stride
+        self.pending = indices[n_complete:]
+        self.vertex_indices = np.concatenate([self.vertex_indices, indices[self.vertex_offset:n_complete:self.stride]])
+        if self.counts is None:
+            n_used = len(self.vertex_indices) // 3 * 3
+            triangles = self.vertex_indices[:n_used].reshape(-1, 3)
+        else:
+            end = int(np.searchsorted(self.cumulative_counts, self.n_vertices + len(self.vertex_indices), side='right'))
+            counts = self.counts[self.n_polygons:end]
+            n_used = int(counts.sum())
+            triangles = triangulate_polygons(self.vertex_indices[:n_used], counts)
+            self.n_polygons = end
+            self.n_vertices += n_used
+        self.vertex_indices = self.vertex_indices[n_used:]
+        self.statistics.add_indexed(self.positions, triangles)
+
+
+class _ColladaReader:
+
+    primitives = ["triangles", "polylist", "polygons"]
+    transforms = ["matrix", "translate", "rotate", "scale"]
+    buffer_size = 2**20 # the maximum number of characters of the text chunks
+
+    def __init__(self):
+        """
+        Reads the statistics of a Collada file with expat, see the comment at the top of the module.
+        """
+        self.unit = 1.0
+        self.geometries = {} # geometry id -> _TriangleStatistics
+        self.instances = [] # (geometry id, transform of the node)
+        self.path = [] # the names of the open elements
+        self.node_transforms = [np.eye(4)]
+        self.numbers = None # the _NumberStream of the text of the current element, if it is read
+        self.values = []
+        self._start_geometry(None)
+
+
+    def _start_geometry(self, geometry_id: str):
+        self.geometry_id = geometry_id
+        self.statistics = _TriangleStatistics()
+        self.arrays = {} # float_array id -> values, of the current mesh
+        self.array_of_source = {} # source id -> float_array id
+        self.stride_of_source = {}
+        self.position_source = {} # vertices id -> source id of the positions
+        self.primitive = None
+
+
+    def read(self, filename: str):
+        parser = xml.parsers.expat.ParserCreate()
+        parser.buffer_text = True
+        parser.buffer_size = self.buffer_size
+        parser.StartElementHandler = self._start_element
+        parser.EndElementHandler = self._end_element
+        parser.CharacterDataHandler = self._character_data
+        with open(filename, "rb") as f:
+            parser.ParseFile(f)
+
+        statistics = _TriangleStatistics()
+        unit = np.diag([self.unit, self.unit, self.unit, 1.0])
+        instances = self.instances if len(self.instances) > 0 else [(geometry_id, np.eye(4)) for geometry_id in self.geometries]
+        for geometry_id, transform in instances:
+            if geometry_id in self.geometries:
+                statistics.add_transformed(self.geometries[geometry_id], unit @ transform)
+        return statistics.get_statistics()
+
+
+    def _read_numbers(self, dtype):
+        self.numbers = _NumberStream(dtype)
+        self.values = []
+
+
+    def _start_element(self, name: str, attributes: dict):
+        parent = self.path[-1] if len(self.path) > 0 else None
+        self.path.append(name)
+        if name == "unit" and self.path[-3:-1] == ["COLLADA", "asset"]:
+            self.unit = float(attributes.get("meter", 1.0))
+        elif name == "geometry":
+            self._start_geometry(attributes.get("id"))
+        elif name == "source" and parent == "mesh":
+            self.source_id = attributes.get("id")
+        elif name == "float_array" and self.path[-3:-1] == ["mesh", "source"]:
+            self.array_of_source[self.source_id] = attributes.get("id")
+            self._read_numbers(float)
+        elif name == "accessor" and self.path[-4:-1] == ["mesh", "source", "technique_common"]:
+            self.stride_of_source[self.source_id] = int(attributes.get("stride", 1))
+        elif name == "vertices":
+            self.vertices_id = attributes.get("id")
+        elif name == "input" and parent == "vertices" and attributes.get("semantic") == "POSITION":
+            self.position_source[self.vertices_id] = attributes.get("source", "").lstrip("#")
+        elif name in self.primitives and parent == "mesh":
+            self.primitive = {"type": name, "inputs": [], "counts": None, "stream": None}
+        elif name == "input" and parent in self.primitives and self.primitive is not None:
+            self.primitive["inputs"].append(attributes)
+        elif name in ["vcount", "p"] and parent in self.primitives + ["ph"] and self.primitive is not None:
+            self._read_numbers(np.int64)
+            if name == "p" and self.primitive["type"] != "polygons" and self.primitive["stream"] is None:
+                self.primitive["stream"] = _PolygonStream(*self._get_primitive_layout(), self.primitive["counts"], self.statistics)
+        elif name == "node":
+            self.node_transforms.append(self.node_transforms[-1])
+        elif name in self.transforms and parent == "node":
+            self._read_numbers(float)
+        elif name == "instance_geometry" and "node" in self.path:
+            self.instances.append((attributes.get("url", "").lstrip("#"), self.node_transforms[-1]))
+
+
+    def _get_primitive_layout(self):
+        """
+        :return: the positions of the vertices of the current primitive, the number of indices per vertex and the offset of the index of the position
+        :rtype: tuple[np.ndarray, int, int]
+        """
+        inputs = self.primitive["inputs"]
+        vertex_input = next(i for i in inputs if i.get("semantic") == "VERTEX")
+        source_id = vertex_input.get("source", "").lstrip("#")
+        source_id = self.position_source.get(source_id, source_id)
+        positions = self.arrays[self.array_of_source[source_id]].reshape(-1, self.stride_of_source.get(source_id, 3))[:, :3]
+        stride = max(int(i.get("offset", 0)) for i in inputs) + 1
+        return positions, stride, int(vertex_input.get("offset", 0))
+
+
+    def _character_data(self, text: str):
+        if self.numbers is None:
+            return
+        values = self.numbers.feed(text)
+        stream = self.primitive["stream"] if self.path[-1] == "p" and self.primitive is not None else None
+        if stream is not None:
+            stream.add(values)
+        else:
+            self.values.append(values)
+
+
+    def _end_element(self, name: str):
+        self.path.pop()
+        if self.numbers is not None:
+            values = self.numbers.close()
+            self.numbers = None
+            if name == "p" and self.primitive["stream"] is not None:
+                self.primitive["stream"].add(values)
+                return
+            self.values.append(values)
+            values = np.concatenate(self.values)
+            self.values = []
+            if name == "float_array":
+                self.arrays[self.array_of_source[self.source_id]] = values
+            elif name == "vcount":
+                self.primitive["counts"] = values
+            elif name == "p":
+                # each <p> of <polygons> is a single polygon
+                positions, stride, vertex_offset = self._get_primitive_layout()
+                vertex_indices = values[vertex_offset::stride]
+                self.statistics.add_indexed(positions, triangulate_polygons(vertex_indices, [len(vertex_indices)]))
+            else:
+                self.node_transforms[-1] = self.node_transforms[-1] @ self._get_transform(name, values)
+        elif name == "vertices":
+            # only the positions are needed, not the normals, texture coordinates, etc.
+            position_arrays = {self.array_of_source.get(s) for s in self.position_source.values()}
+            self.arrays = {k: v for k, v in self.arrays.items() if k in position_arrays}
+        elif name in self.primitives:
+            self.primitive = None
+        elif name == "geometry":
+            self.geometries[self.geometry_id] = self.statistics
+            self._start_geometry(None)
+        elif name == "node":
+            self.node_transforms.pop()
+
+
+    @staticmethod
+    def _get_transform(name: str, values: np.ndarray):
+        transform = np.eye(4)
+        if name == "matrix":
+            transform = values.reshape(4, 4)
+        elif name == "translate":
+            transform[:3, 3] = values[:3]
+        elif name == "scale":
+            transform[:3, :3] = np.diag(values[:3])
+        elif name == "rotate":
+            # the axis and the angle in degrees, using the Rodrigues formula
+            axis = values[:3] / np.linalg.norm(values[:3])
+            angle = np.radians(values[3])
+            cross = np.array([[0, -axis[2], axis[1]], [axis[2], 0, -axis[0]], [-axis[1], axis[0], 0]])
+            transform[:3, :3] = np.eye(3) + np.sin(angle) * cross + (1 - np.cos(angle)) * cross @ cross
+        return transform
+
+
+def read_dae_statistics(filename: str):
+    """
+    Read the statistics of a Collada file, streamed with expat, see the comment at the top of the module.
+
+    :return: see _TriangleStatistics.get_statistics()
+    :rtype: dict
+    """
+    return _ColladaReader().read(filename)
+
+
+mesh_statistics_readers = {".stl": read_stl_statistics, ".dae": read_dae_statistics, ".obj": read_obj_statistics}
+
+
+def get_mesh_statistics(filename: str):
+    """
+    Get the number of triangles, the axis aligned bounds and the surface area of a mesh file, in the reference frame of the mesh.
+
+    :param filename: the path of the mesh file
+    :type filename: str
+    :return: the statistics of the mesh, with the keys n_triangles, aabb_min, aabb_max (None if the mesh has no triangles) and surface_area,
+        None if the mesh type is not supported or the mesh could not be read
+    :rtype: dict
+    """
+    try:
+        stat = os.stat(filename)
+    except (OSError, TypeError):
+        return None
+    key = (str(filename), stat.st_mtime_ns, stat.st_size)
+    if key not in _mesh_statistics:
+        statistics = None
+        reader = mesh_statistics_readers.get(os.path.splitext(str(filename))[1].lower())
+        if reader is not None:
+            try:
+                statistics = reader(filename)
+            except (OSError, ValueError, IndexError, KeyError, StopIteration, xml.parsers.expat.ExpatError):
+                statistics = None
+        _mesh_statistics[key] = statistics
+    return _mesh_statistics[key]
+
+
+def scale_mesh_statistics(statistics: dict, scale: list[float]):
+    """
+    Scale the statistics of a mesh by the scale of a URDF mesh element. The surface area is only known for uniform scales, as the
+    area of each triangle changes differently otherwise, and is None for non-uniform scales.
+
+    :param statistics: see get_mesh_statistics()
+    :type statistics: dict
+    :param scale: the scale of the x, y and z axes
+    :type scale: list[float]
+    :rtype: dict
+    """
+    if statistics is None:
+        return None
+    scale = np.asarray(scale, dtype=float)
+    scaled = dict(statistics)
+    if statistics["aabb_min"] is not None:
+        # a negative scale mirrors the mesh, which swaps the minimum and maximum
+        corners = np.stack([statistics["aabb_min"] * scale, statistics["aabb_max"] * scale])
+        scaled["aabb_min"], scaled["aabb_max"] = corners.min(axis=0), corners.max(axis=0)
+    uniform = np.all(np.abs(scale) == abs(scale[0]))
+    scaled["surface_area"] = float(statistics["surface_area"] * scale[0]**2) if uniform else None
+    return scaled
+
+
+def get_mesh_bounds(filename: str):
+    """
+    Get the axis aligned bounds of a mesh file, in the reference frame of the mesh, see get_mesh_statistics().
+
+    :param filename: the path of the mesh file
+    :type filename: str
+    :return: the minimum and maximum corners of the bounds, None if the mesh type is not supported, the mesh could not be read or has no triangles
+    :rtype: tuple[np.ndarray, np.ndarray]
+    """
+    statistics = get_mesh_statistics(filename)
+    if statistics is None or statistics["aabb_min"] is None:
+        return None
+    return statistics["aabb_min"], statistics["aabb_max"]
+
+
+def get_mesh_validity(filenames: list[str], urdf_root_dir: str):
+    """
+    Check that the meshes referenced by a URDF file can be found and read. The STL, OBJ and Collada meshes are read, while the meshes of the
+    other types are only checked to be non-empty files, as they are not supported by get_mesh_statistics().
+
+    :param filenames: the filenames of the meshes, as written in the URDF file
+    :type filenames: list[str]
+    :param urdf_root_dir: the directory of the URDF file
+    :type urdf_root_dir: str
+    :return: the number of distinct meshes, of meshes that could not be found, and of meshes that could not be read
+    :rtype: dict[str, int]
+    """
+    validity = {"n_meshes": 0, "n_missing_meshes": 0, "n_unreadable_meshes": 0}
+    for filename in dict.fromkeys(filenames):
+        validity["n_meshes"] += 1
+        path = resolve_mesh_filename(filename, urdf_root_dir)
+        if path is None:
+            validity["n_missing_meshes"] += 1
+        elif os.path.splitext(path)[1].lower() in mesh_statistics_readers:
+            validity["n_unreadable_meshes"] += get_mesh_statistics(path) is None
+        elif os.path.getsize(path) == 0:
+            validity["n_unreadable_meshes"] += 1
+    return validity
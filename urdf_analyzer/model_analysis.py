@@ -2,34 +2,52 @@ import xml.etree.ElementTree as ET
 import os
 from logging import Logger
 from urdf_analyzer.urdf_components.joint import Joint, JointsMetaInformation
-from urdf_analyzer.urdf_components.link import Link, LinksMetaInformation, Mesh, Box, Sphere, Cylinder
-from urdf_analyzer.urdf_standard import LinkStandard
+from urdf_analyzer.urdf_components.link import Link, LinksMetaInformation, Mesh, Box, Sphere, Cylinder, Inertial, Collision
+from urdf_analyzer.urdf_components.dynamics import DynamicsMetaInformation
+from urdf_analyzer.urdf_components.collision import CollisionMetaInformation
+from urdf_analyzer.urdf_components.topology import TopologyMetaInformation
+from urdf_analyzer.urdf_components.origin import Origin
+from urdf_analyzer.urdf_standard import LinkStandard, JointStandard
+from urdf_analyzer.xacro_expander import expand_xacro_file
+from urdf_analyzer.xml_backend import get_xml_backend
 
 class ModelAnalysis:
 
 
-    def __init__(self, logger: Logger):
+    def __init__(self, logger: Logger, xml_backend: str=None):
+        """
+        :param xml_backend: the XML backend used to read the URDF files, see xml_backend.get_available_xml_backends(). By default ElementTree is used.
+        :type xml_backend: str
+        """
         self.logger = logger
+        self.xml_backend = get_xml_backend(xml_backend)
         self.root = None
+        self.urdf_root_dir = None # the directory of the loaded URDF, used to localise the meshes
 
 
     def xml_urdf_reader(self, filename: str, urdf_root_dir:str=None):
-        root_dir = os.getcwd()
         basename = os.path.abspath(filename)
         if urdf_root_dir is None:
             urdf_root_dir = os.path.dirname(basename)
         filename_only = os.path.basename(basename)
+        self.urdf_root_dir = os.path.abspath(urdf_root_dir)
+        if filename_only.endswith(".xacro"):
+            # the xacro file is expanded to a URDF file in the xacro cache, which is read instead
+            filename_only = expand_xacro_file(os.path.join(os.path.abspath(urdf_root_dir), filename_only), self.logger)
+            if filename_only is None:
+                self.root = None
+                return None
+            filename_only = os.path.abspath(filename_only)
         try:
-            os.chdir(urdf_root_dir)
-            tree = ET.ElementTree(file=filename_only)
+            # the file is read by its absolute path rather than changing the working directory, which is shared by the threads of the process
+            root = self.xml_backend.parse(os.path.join(self.urdf_root_dir, filename_only))
         except:
             self.logger.error(f"Error while loading {basename} using the xml reader")
-            tree = None
+            root = None
             pass
-        os.chdir(root_dir)
-        if tree is None:
+        if root is None:
             return None
-        self.root = tree.getroot()
+        self.root = root
         return self.root
 
 
@@ -54,13 +72,52 @@ class ModelAnalysis:
         # code should not get here, but if so, then return None
         return None
     
+    ### START ### Common elements ######
+
+    def _parse_floats(self, text: str, n_values: int):
+        try:
+            values = [float(v) for v in text.split()]
+        except (AttributeError, ValueError):
+            return None
+        return values if len(values) == n_values else None
+
+    def _get_origin(self, element: ET.Element):
+        origin = element.find("origin")
+        if origin is None:
+            return Origin()
+        return Origin(self._parse_floats(origin.attrib.get("xyz", "0 0 0"), 3), self._parse_floats(origin.attrib.get("rpy", "0 0 0"), 3))
+
+    def _get_float_attributes(self, element: ET.Element, attributes: list[str]):
+        if element is None:
+            return None
+        values = {}
+        for attribute in attributes:
+            try:
+                values[attribute] = float(element.attrib[attribute])
+            except (KeyError, ValueError):
+                values[attribute] = None
+        return values
+
+    ### END ### Common elements ######
+
+
     ### START ### Joint information ######
 
+    def _get_link_reference(self, joint: ET.Element, element: str):
+        reference = joint.find(element)
+        return reference.attrib.get("link") if reference is not None else None
+
     def _get_joint_information(self, root: ET.ElementTree):
         joints = []
-        for joint in root.iter("joint"):
+        for joint in self.xml_backend.find_joints(root):
             try:
-                joints.append(Joint(joint.attrib['name'], joint.attrib['type']))
+                joints.append(Joint(joint.attrib['name'], joint.attrib['type'],
+                                    parent=self._get_link_reference(joint, "parent"),
+                                    child=self._get_link_reference(joint, "child"),
+                                    origin=self._get_origin(joint),
+                                    limit=self._get_float_attributes(joint.find("limit"), JointStandard.limit_attributes),
+                                    dynamics=self._get_float_attributes(joint.find("dynamics"), JointStandard.dynamics_attributes),
+                                    mimic=joint.find("mimic").attrib.get("joint") if joint.find("mimic") is not None else None))
             except:
                 pass
         joints_information = JointsMetaInformation(joints)
@@ -89,26 +146,29 @@ class ModelAnalysis:
         if geometry_visualisation_type in tag_names:
             # TODO: see if it is possible to dynamically pass the number of required variables as None when instantiating the Geometry types
             try:
+                shapes = {}
+                for shape in self.xml_backend.find_geometry_shapes(tag_names[geometry_visualisation_type]):
+                    shapes.setdefault(shape.tag, []).append(shape)
                 # check if mesh
-                search_mesh = list(tag_names[geometry_visualisation_type].iter(LinkStandard.geometry_types[0]))
+                search_mesh = shapes.get(LinkStandard.geometry_types[0], [])
                 if len(search_mesh) == 1: # TODO: double check that it makes sense to only take the first value of the list
                     mesh = Mesh(None)
                     return self._check_optional_and_required_args_geometry(search_mesh, mesh)
                          
                 # check if box
-                search_box = list(tag_names[geometry_visualisation_type].iter(LinkStandard.geometry_types[3]))
+                search_box = shapes.get(LinkStandard.geometry_types[3], [])
                 if len(search_box) == 1: # TODO: double check that it makes sense to only take the first value of the list
                     box = Box()
                     return self._check_optional_and_required_args_geometry(search_box, box)
        
                 # check if cylinder
-                search_cylinder = list(tag_names[geometry_visualisation_type].iter(LinkStandard.geometry_types[2]))
+                search_cylinder = shapes.get(LinkStandard.geometry_types[2], [])
                 if len(search_cylinder) == 1:
                     cylinder = Cylinder(None, None)
                     return self._check_optional_and_required_args_geometry(search_cylinder, cylinder)
 
                 # check if sphere
-                search_sphere = list(tag_names[geometry_visualisation_type].iter(LinkStandard.geometry_types[1]))
+                search_sphere = shapes.get(LinkStandard.geometry_types[1], [])
                 if len(search_sphere) == 1:
                     sphere = Sphere(None)
                     return self._check_optional_and_required_args_geometry(search_sphere, sphere)
@@ -117,24 +177,97 @@ class ModelAnalysis:
         #self.logger.warning("The link geometry could not be determined.")
         return None
 
-    def _get_link_information(self, root: ET.ElementTree):
+    def _get_link_inertial_information(self, link: ET.Element):
+        inertial = link.find("inertial")
+        if inertial is None:
+            return None
+        mass = self._get_float_attributes(inertial.find("mass"), ["value"])
+        inertia = self._get_float_attributes(inertial.find("inertia"), LinkStandard.inertia_attributes)
+        if mass is None or mass["value"] is None:
+            return None
+        inertia = [inertia[i] if inertia is not None and inertia[i] is not None else 0.0 for i in LinkStandard.inertia_attributes]
+        return Inertial(mass["value"], inertia, self._get_origin(inertial))
+
+    def _get_link_collisions(self, link: ET.Element):
+        collisions = []
+        for collision in link.findall(LinkStandard.visualisation_types[1]):
+            geometry = self._get_link_geometry_information({LinkStandard.visualisation_types[1]: collision}, LinkStandard.visualisation_types[1])
+            if geometry is not None:
+                collisions.append(Collision(geometry, self._get_origin(collision)))
+        return collisions
+
+    def _get_link_information(self, root: ET.ElementTree, mesh_statistics: bool=False):
         links = []
-        for link in root.iter("link"):
+        for link in self.xml_backend.find_links(root):
             tag_names = {x.tag:x for x in link.iter("*")}
             try:
                 name = link.attrib["name"]
                 visual_geometry = self._get_link_geometry_information(tag_names, LinkStandard.visualisation_types[0])
                 collision_geometry = self._get_link_geometry_information(tag_names, LinkStandard.visualisation_types[1])
-                links.append(Link(name=name,visual_geometry=visual_geometry,collision_geometry=collision_geometry))
+                inertial = self._get_link_inertial_information(link)
+                collisions = self._get_link_collisions(link)
+                links.append(Link(name=name,visual_geometry=visual_geometry,collision_geometry=collision_geometry,inertial=inertial,collisions=collisions))
             except:
                 pass
-        links_information = LinksMetaInformation(links)
+        links_information = LinksMetaInformation(links, mesh_statistics, self.urdf_root_dir)
         return links_information
 
-    def get_link_information(self):
-        return self._get_link_information(self.root)
+    def get_link_information(self, mesh_statistics: bool=False):
+        """
+        :param mesh_statistics: if True, the statistics of the meshes of the links are read, see LinksMetaInformation
+        :type mesh_statistics: bool
+        """
+        return self._get_link_information(self.root, mesh_statistics)
 
 
     ### END ### Link information ######
 
+
+    ### START ### Dynamics information ######
+
+    def get_dynamics_information(self, joints_information: JointsMetaInformation=None, links_information: LinksMetaInformation=None):
+        """
+        Get the inertial, limit and dynamics information, from the joints and links read by get_joint_information() and get_link_information().
+        If the joint or link information is not provided, it is read from the loaded URDF.
+        """
+        if joints_information is None:
+            joints_information = self.get_joint_information()
+        if links_information is None:
+            links_information = self.get_link_information()
+        return DynamicsMetaInformation(links_information.links, joints_information.joints)
+
+    ### END ### Dynamics information ######
+
+
+    ### START ### Collision information ######
+
+    def get_collision_information(self, joints_information: JointsMetaInformation=None, links_information: LinksMetaInformation=None):
+        """
+        Get the collision bounding boxes and the self-collision candidates, from the joints and links read by get_joint_information() and get_link_information().
+        If the joint or link information is not provided, it is read from the loaded URDF.
+        """
+        if joints_information is None:
+            joints_information = self.get_joint_information()
+        if links_information is None:
+            links_information = self.get_link_information()
+        return CollisionMetaInformation(links_information.links, joints_information.joints, self.urdf_root_dir)
+
+    ### END ### Collision information ######
+
+
+    ### START ### Topology information ######
+
+    def get_topology_information(self, joints_information: JointsMetaInformation=None, links_information: LinksMetaInformation=None):
+        """
+        Get the topology metrics of the kinematic tree, from the joints and links read by get_joint_information() and get_link_information().
+        If the joint or link information is not provided, it is read from the loaded URDF.
+        """
+        if joints_information is None:
+            joints_information = self.get_joint_information()
+        if links_information is None:
+            links_information = self.get_link_information()
+        return TopologyMetaInformation(joints_information.joints, [l.name for l in links_information.links])
+
+    ### END ### Topology information ######
+
 # TODO: add domain knowledge, e.g. the user should be able to specify the system is a robotic arm with X DOF, and then the URDF analyser can analyse it and check that this is correct
\ No newline at end of file
@@ -0,0 +1,174 @@
+from collections import OrderedDict
+import pandas as pd
+import threading
+import sys
+import os
+
+from urdf_analyzer.constants import DEFAULT_MODEL_CACHE_MAX_BYTES
+
+
+# An in-process cache of the XML trees and the model information of the URDF files, for the callers analysing the same files
+# many times, e.g. notebooks and services, see api.get_model_information().
+#
+# The entries are keyed by the absolute path of the file, its modification time and its size, such that a modified file is read
+# again, and the entries of its previous version are dropped. The cache is bounded by the estimated size of its entries in bytes,
+# rather than by their number, as the files range from a few links to thousands: the least recently used entries are evicted
+# until the entries fit. The entries are shared between the callers, and the cache can be shared between threads, as all of
+# its state is only accessed while holding its lock.
+
+
+def estimate_element_bytes(root):
+    """
+    :return: an estimate of the memory of an XML tree in bytes, from the number of elements and the length of their strings
+    :rtype: int
+    """
+    n_bytes = 0
+    for element in root.iter():
+        n_bytes += sys.getsizeof(element) + len(str(element.tag)) + len(element.text or "") + len(element.tail or "")
+        n_bytes += sum(sys.getsizeof(k) + sys.getsizeof(v) for k, v in element.attrib.items())
+    return n_bytes
+
+
+def estimate_object_bytes(obj):
+    """
+    :return: an estimate of the memory of an object and of the objects it references (attributes, items and DataFrames) in bytes,
+        where each object is only counted once
+    :rtype: int
+    """
+    seen = set()
+    n_bytes = 0
+    pending = [obj]
+    while len(pending) > 0:
+        obj = pending.pop()
+        if id(obj) in seen:
+            continue
+        seen.add(id(obj))
+        if isinstance(obj, pd.DataFrame):
+            n_bytes += int(obj.memory_usage(deep=True).sum())
+            continue
+        if isinstance(obj, pd.Series):
+            n_bytes += int(obj.memory_usage(deep=True))
+            continue
+        n_bytes += sys.getsizeof(obj)
+        if isinstance(obj, dict):
+            pending.extend(obj.keys())
+            pending.extend(obj.values())
+        elif isinstance(obj, (list, tuple, set, frozenset)):
+            pending.extend(obj)
+        elif hasattr(obj, "__dict__"):
+            pending.append(vars(obj))
+    return n_bytes
+
+
+class ModelInformationCache:
+
+    def __init__(self, max_bytes: int=DEFAULT_MODEL_CACHE_MAX_BYTES):
+        """
+        :param max_bytes: the maximum estimated size of the entries in bytes
+        :type max_bytes: int
+        """
+        self.max_bytes = max_bytes
+        self.lock = threading.RLock()
+        self.entries = OrderedDict() # key -> (value, n_bytes), from the least to the most recently used
+        self.keys_of_path = {} # path -> keys of the entries of the file
+        self.n_bytes = 0
+        self.n_evictions = 0
+        self.counters = {} # kind of entry -> {'hits': int, 'misses': int}
+
+
+    @staticmethod
+    def _get_path(filename: str, urdf_root_dir: str=None):
+        return os.path.abspath(os.path.join(urdf_root_dir, os.path.basename(filename)) if urdf_root_dir is not None else filename)
+
+
+    @classmethod
+    def get_file_key(cls, filename: str, urdf_root_dir: str=None):
+        """
+        :param urdf_root_dir: the root directory of the URDF file, which the filename is relative to, see ModelAnalysis.xml_urdf_reader()
+        :return: the absolute path, modification time and size of the file, or None if the file does not exist
+        :rtype: tuple[str, int, int]
+        """
+        path = cls._get_path(filename, urdf_root_dir)
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+        return (path, stat.st_mtime_ns, stat.st_size)
+
+
+    def get(self, key: tuple):
+        """
+        :param key: the kind of the entry (e.g. 'root'), followed by the file key (see get_file_key()) and the options of the entry
+        :type key: tuple
+        :return: the value of the entry, None if it is not cached
+        """
+        with self.lock:
+            counters = self.counters.setdefault(key[0], {"hits": 0, "misses": 0})
+            if key not in self.entries:
+                counters["misses"] += 1
+                return None
+            counters["hits"] += 1
+            self.entries.move_to_end(key)
+            return self.entries[key][0]
+
+
+    def put(self, key: tuple, value, n_bytes: int):
+        """
+        Cache the value, evicting the least recently used entries until the entries fit in max_bytes.
+        The entries of the previous versions of the file are removed. A value larger than max_bytes is not cached.
+
+        :param key: see get()
+        :type key: tuple
+        :param n_bytes: the estimated size of the value in bytes, see estimate_element_bytes() and estimate_object_bytes()
+        :type n_bytes: int
+        """
+        if n_bytes > self.max_bytes:
+            return
+        path, mtime_ns, size = key[1:4]
+        with self.lock:
+            for stale_key in [k for k in self.keys_of_path.get(path, set()) if k[2:4] != (mtime_ns, size)]:
+                self._remove(stale_key)
+            if key in self.entries:
+                self._remove(key)
+            while self.n_bytes + n_bytes > self.max_bytes:
+                self._remove(next(iter(self.entries)))
+                self.n_evictions += 1
+            self.entries[key] = (value, n_bytes)
+            self.keys_of_path.setdefault(path, set()).add(key)
+            self.n_bytes += n_bytes
+
+
+    def _remove(self, key: tuple):
+        _, n_bytes = self.entries.pop(key)
+        self.n_bytes -= n_bytes
+        keys = self.keys_of_path[key[1]]
+        keys.discard(key)
+        if len(keys) == 0:
+            del self.keys_of_path[key[1]]
+
+
+    def invalidate(self, filename: str=None, urdf_root_dir: str=None):
+        """
+        Remove the entries of a file, or all of the entries if no file is provided.
+
+        :return: the number of removed entries
+        :rtype: int
+        """
+        with self.lock:
+            if filename is None:
+                keys = list(self.entries.keys())
+            else:
+                keys = list(self.keys_of_path.get(self._get_path(filename, urdf_root_dir), set()))
+            for key in keys:
+                self._remove(key)
+            return len(keys)
+
+
+    def get_statistics(self):
+        """
+        :return: the number of hits and misses of each kind of entry, the number of entries and evictions, and the estimated size of the entries
+        :rtype: dict
+        """
+        with self.lock:
+            return {"n_entries": len(self.entries), "n_bytes": self.n_bytes, "max_bytes": self.max_bytes, "n_evictions": self.n_evictions,
+                    **{f"n_{kind}_{counter}": n for kind, counters in self.counters.items() for counter, n in counters.items()}}
@@ -0,0 +1,260 @@
+from fnmatch import fnmatchcase
+from logging import Logger
+from pathlib import Path
+import pandas as pd
+import sqlite3
+import math
+import os
+import re
+
+from urdf_analyzer.model_analysis import ModelAnalysis
+from urdf_analyzer.constants import DEFAULT_NAME_SIMILARITY
+
+
+# An inverted index of the link names, joint names and mesh filenames of a collection of URDF files, stored in an SQLite database,
+# such that the files containing a name can be found without reading the URDF files again.
+# The tables are:
+#   - files: one row per indexed URDF file, with the modification time and size of the file when it was indexed
+#   - terms: one row per distinct (kind, name), where kind is 'link', 'joint' or 'mesh'
+#   - postings: the files containing each term
+#   - trigrams: the trigrams (three consecutive characters) of the lowercase name of each term
+#   - trigram_counts: the number of terms containing each trigram
+# As many robots share the same names (e.g. base_link), the trigrams are only stored once per distinct name. A substring or glob
+# pattern is matched by intersecting the terms containing the rarest trigrams of the literal parts of the pattern, and checking
+# the pattern on these candidates only, such that the common trigrams (e.g. 'ink' of 'link') are never read.
+# A fuzzy pattern is matched by the similarity of the trigrams, i.e. the number of shared trigrams divided by the number of trigrams
+# of the pattern and the name (Jaccard index, as the similarity of pg_trgm). A name with a similarity of at least s shares at least
+# s * n of the n trigrams of the pattern, so it contains one of the n - ceil(s * n) + 1 rarest trigrams of the pattern, and only
+# the names containing these are compared.
+# The index is updated incrementally: only the files which are new or have changed since they were indexed are read again.
+
+_wildcard_pattern = re.compile(r"\[[^\]]*\]|[*?]")
+
+
+def get_trigrams(text: str):
+    text = text.lower()
+    return {text[i:i+3] for i in range(len(text) - 2)}
+
+
+def get_urdf_names(filename: str, model_analysis: ModelAnalysis):
+    """
+    :return: the distinct (kind, name) of the links, joints and mesh filenames of the URDF file, None if the file could not be read
+    :rtype: list[tuple[str, str]]
+    """
+    return get_model_names(model_analysis, model_analysis.xml_urdf_reader(filename))
+
+
+def get_model_names(model_analysis: ModelAnalysis, root):
+    """
+    :param root: the root of the XML tree of the URDF file already read by the model analysis, None if the file could not be read
+    :return: the distinct (kind, name) of the links, joints and mesh filenames of the URDF file, None if the file could not be read
+    :rtype: list[tuple[str, str]]
+    """
+    if root is None:
+        return None
+    names = {("joint", j.name) for j in model_analysis.get_joint_information().joints if j.name is not None}
+    names.update(("link", l.name) for l in model_analysis.get_link_information().links if l.name is not None)
+    names.update(("mesh", m.attrib["filename"]) for m in root.iter("mesh") if m.attrib.get("filename") is not None)
+    return sorted(names)
+
+
+class URDFNameIndex:
+
+    kinds = ["link", "joint", "mesh"]
+    max_parameters = 500 # the number of ids in a single query, below the limit of SQLite
+    max_intersected_trigrams = 3 # the rarest trigrams of a pattern which are intersected, the candidates are then checked against the pattern
+
+    def __init__(self, index_file: str, logger: Logger, read_only: bool=False):
+        self.logger = logger
+        self.index_file = str(index_file)
+        if read_only:
+            if not Path(self.index_file).exists():
+                raise FileNotFoundError(f"The name index '{self.index_file}' does not exist. Generate it using the 'name-index' schema first.")
+            self.connection = sqlite3.connect(f"file:{Path(self.index_file).absolute().as_posix()}?mode=ro", uri=True)
+        else:
+            dir = os.path.dirname(self.index_file)
+            if dir != "" and not Path(dir).exists():
+                os.makedirs(dir)
+            self.connection = sqlite3.connect(self.index_file)
+            self._create_tables()
+
+
+    def _create_tables(self):
+        self.connection.executescript("""
+            CREATE TABLE IF NOT EXISTS files (id INTEGER PRIMARY KEY, path TEXT UNIQUE NOT NULL, mtime_ns INTEGER, size INTEGER);
+            CREATE TABLE IF NOT EXISTS terms (id INTEGER PRIMARY KEY, kind TEXT NOT NULL, name TEXT NOT NULL, n_trigrams INTEGER,
+                                              UNIQUE(kind, name));
+            CREATE TABLE IF NOT EXISTS postings (term_id INTEGER NOT NULL, file_id INTEGER NOT NULL,
+                                                 PRIMARY KEY(term_id, file_id)) WITHOUT ROWID;
+            CREATE TABLE IF NOT EXISTS trigrams (trigram TEXT NOT NULL, term_id INTEGER NOT NULL,
+                                                 PRIMARY KEY(trigram, term_id)) WITHOUT ROWID;
+            CREATE TABLE IF NOT EXISTS trigram_counts (trigram TEXT PRIMARY KEY, n_terms INTEGER NOT NULL) WITHOUT ROWID;
+            CREATE INDEX IF NOT EXISTS idx_postings_file ON postings(file_id);
+            CREATE INDEX IF NOT EXISTS idx_trigrams_term ON trigrams(term_id);
+        """)
+        self.connection.commit()
+
+
+    ### START ### Update ######
+
+    def get_changed_files(self, urdf_files: list[str]):
+        """
+        :return: the URDF files which are not indexed, or which have been modified since they were indexed
+        :rtype: list[str]
+        """
+        indexed = {path: (mtime_ns, size) for path, mtime_ns, size in self.connection.execute("SELECT path, mtime_ns, size FROM files")}
+        changed_files = []
+        for urdf_file in urdf_files:
+            stat = os.stat(urdf_file)
+            if indexed.get(Path(os.path.abspath(urdf_file)).as_posix()) != (stat.st_mtime_ns, stat.st_size):
+                changed_files.append(urdf_file)
+        return changed_files
+
+
+    def add_file(self, path: str, names: list[tuple[str, str]], mtime_ns: int, size: int):
+        """
+        Add (or replace) the names of a URDF file in the index.
+
+        :param path: the path of the URDF file, used as the unique key of the file in the index
+        :type path: str
+        :param names: the (kind, name) of the file, see get_urdf_names(). None if the file could not be read, in which case
+            the file is indexed without names, such that it is only read again when it is modified.
+        :type names: list[tuple[str, str]]
+        """
+        path = Path(os.path.abspath(path)).as_posix()
+        cursor = self.connection.cursor()
+        cursor.execute("INSERT INTO files (path, mtime_ns, size) VALUES (?, ?, ?) ON CONFLICT(path) DO UPDATE SET mtime_ns = excluded.mtime_ns, size = excluded.size",
+                       (path, mtime_ns, size))
+        file_id = cursor.execute("SELECT id FROM files WHERE path = ?", (path,)).fetchone()[0]
+        cursor.execute("DELETE FROM postings WHERE file_id = ?", (file_id,))
+        for kind, name in names if names is not None else []:
+            cursor.execute("INSERT OR IGNORE INTO terms (kind, name) VALUES (?, ?)", (kind, name))
+            if cursor.rowcount > 0: # a new term
+                term_id = cursor.lastrowid
+                trigrams = get_trigrams(name)
+                cursor.execute("UPDATE terms SET n_trigrams = ? WHERE id = ?", (len(trigrams), term_id))
+                cursor.executemany("INSERT INTO trigrams (trigram, term_id) VALUES (?, ?)", [(t, term_id) for t in trigrams])
+                cursor.executemany("INSERT INTO trigram_counts (trigram, n_terms) VALUES (?, 1) ON CONFLICT(trigram) DO UPDATE SET n_terms = n_terms + 1",
+                                   [(t,) for t in trigrams])
+            else:
+                term_id = cursor.execute("SELECT id FROM terms WHERE kind = ? AND name = ?", (kind, name)).fetchone()[0]
+            cursor.execute("INSERT OR IGNORE INTO postings (term_id, file_id) VALUES (?, ?)", (term_id, file_id))
+
+
+    def remove_missing_files(self):
+        """
+        Remove the files which no longer exist, and the names which are no longer contained in any file.
+
+        :return: the number of removed files
+        :rtype: int
+        """
+        missing_ids = [(file_id,) for file_id, path in self.connection.execute("SELECT id, path FROM files") if not os.path.exists(path)]
+        with self.connection:
+            self.connection.executemany("DELETE FROM postings WHERE file_id = ?", missing_ids)
+            self.connection.executemany("DELETE FROM files WHERE id = ?", missing_ids)
+            self.connection.execute("CREATE TEMP TABLE IF NOT EXISTS unused_terms (id INTEGER PRIMARY KEY)")
+            self.connection.execute("DELETE FROM unused_terms")
+            self.connection.execute("INSERT INTO unused_terms SELECT id FROM terms WHERE NOT EXISTS (SELECT 1 FROM postings WHERE postings.term_id = terms.id)")
+            removed_counts = self.connection.execute("SELECT trigram, COUNT(*) FROM trigrams WHERE term_id IN (SELECT id FROM unused_terms) GROUP BY trigram").fetchall()
+            self.connection.executemany("UPDATE trigram_counts SET n_terms = n_terms - ? WHERE trigram = ?", [(n, t) for t, n in removed_counts])
+            self.connection.execute("DELETE FROM trigram_counts WHERE n_terms <= 0")
+            self.connection.execute("DELETE FROM trigrams WHERE term_id IN (SELECT id FROM unused_terms)")
+            self.connection.execute("DELETE FROM terms WHERE id IN (SELECT id FROM unused_terms)")
+        return len(missing_ids)
+
+    ### END ### Update ######
+
+
+    ### START ### Search ######
+
+    def _get_terms(self, sql: str, parameters: list, kinds: list[str]=None):
+        if kinds is not None:
+            sql += f" AND kind IN ({', '.join(['?']*len(kinds))})"
+            parameters = parameters + list(kinds)
+        return self.connection.execute(sql, parameters).fetchall()
+
+
+    def _get_trigram_counts(self, trigrams: set[str]):
+        """
+        :return: the number of terms containing each of the trigrams, 0 if none
+        :rtype: dict[str, int]
+        """
+        counts = dict(self.connection.execute(f"SELECT trigram, n_terms FROM trigram_counts WHERE trigram IN ({', '.join(['?']*len(trigrams))})",
+                                              sorted(trigrams)).fetchall())
+        return {t: counts.get(t, 0) for t in trigrams}
+
+
+    def _get_postings(self, term_ids: list[int]):
+        rows = []
+        for i in range(0, len(term_ids), self.max_parameters):
+            chunk = term_ids[i:i+self.max_parameters]
+            rows += self.connection.execute(f"""
+                SELECT postings.term_id, files.path FROM postings JOIN files ON files.id = postings.file_id
+                WHERE postings.term_id IN ({', '.join(['?']*len(chunk))})""", chunk).fetchall()
+        return rows
+
+
+    def search(self, pattern: str, kinds: list[str]=None, fuzzy: bool=False, min_similarity: float=DEFAULT_NAME_SIMILARITY, limit: int=None):
+        """
+        Find the files containing the names matching the pattern. The names are matched case insensitively.
+
+        :param pattern: a glob pattern (e.g. '*_wheel_joint'), or a substring of the names if it contains no wildcards (*, ?, [...])
+        :type pattern: str
+        :param kinds: only search these kinds of names, see kinds. By default all kinds are searched.
+        :type kinds: list[str]
+        :param fuzzy: if True, the names similar to the pattern are returned, by the similarity of their trigrams, see min_similarity
+        :type fuzzy: bool
+        :param min_similarity: the minimum similarity (between 0 and 1) of the names returned by a fuzzy search
+        :type min_similarity: float
+        :param limit: the maximum number of names that are returned, with all of the files containing them
+        :type limit: int
+        :return: a row for each matching name and file containing it, with the kind of the name, and the similarity for a fuzzy search
+        :rtype: pd.DataFrame
+        """
+        pattern = pattern.lower()
+        if fuzzy:
+            pattern_trigrams = get_trigrams(_wildcard_pattern.sub("", pattern))
+            if len(pattern_trigrams) == 0:
+                self.logger.warning(f"The pattern '{pattern}' is too short for a fuzzy search, which needs at least 3 characters.")
+                return pd.DataFrame(columns=["kind", "name", "path", "similarity"])
+            n = len(pattern_trigrams)
+            counts = self._get_trigram_counts(pattern_trigrams)
+            min_shared = max(1, math.ceil(min_similarity * n))
+            prefix = sorted(pattern_trigrams, key=lambda t: (counts[t], t))[:n - min_shared + 1]
+            candidates = self._get_terms(f"""
+                SELECT terms.id, kind, name, CAST(shared AS REAL) / (? + n_trigrams - shared) AS similarity
+                FROM (SELECT term_id, COUNT(*) AS shared FROM trigrams
+                      WHERE term_id IN (SELECT term_id FROM trigrams WHERE trigram IN ({', '.join(['?']*len(prefix))}))
+                      AND trigram IN ({', '.join(['?']*n)}) GROUP BY term_id)
+                JOIN terms ON terms.id = term_id WHERE shared >= ?""", [n] + prefix + sorted(pattern_trigrams) + [min_shared], kinds)
+            matches = sorted([c for c in candidates if c[3] >= min_similarity], key=lambda c: (-c[3], c[1], c[2]))
+        else:
+            glob = pattern if _wildcard_pattern.search(pattern) is not None else f"*{pattern}*"
+            pattern_trigrams = set().union(*[get_trigrams(literal) for literal in _wildcard_pattern.split(pattern)])
+            if len(pattern_trigrams) > 0:
+                # the terms containing the rarest trigrams, which are few enough to be checked against the pattern
+                counts = self._get_trigram_counts(pattern_trigrams)
+                rarest = sorted(pattern_trigrams, key=lambda t: (counts[t], t))[:self.max_intersected_trigrams]
+                joins = " ".join(f"JOIN trigrams t{i} ON t{i}.trigram = ? AND t{i}.term_id = t0.term_id" for i in range(1, len(rarest)))
+                candidates = self._get_terms(f"""
+                    SELECT terms.id, kind, name, NULL FROM trigrams t0 {joins} JOIN terms ON terms.id = t0.term_id
+                    WHERE t0.trigram = ?""", rarest[1:] + rarest[:1], kinds) if counts[rarest[0]] > 0 else []
+            else:
+                # the literal parts of the pattern are too short to use the trigrams, so all of the names are checked
+                candidates = self._get_terms("SELECT id, kind, name, NULL FROM terms WHERE 1", [], kinds)
+            matches = sorted([c for c in candidates if fnmatchcase(c[2].lower(), glob)], key=lambda c: (c[1], c[2]))
+        if limit is not None:
+            matches = matches[:limit]
+
+        # the names are kept in the order of the matches, i.e. by kind and name, or by similarity for a fuzzy search
+        terms = {term_id: (rank, kind, name, similarity) for rank, (term_id, kind, name, similarity) in enumerate(matches)}
+        records = [(*terms[term_id], path) for term_id, path in self._get_postings(list(terms.keys()))]
+        results = pd.DataFrame.from_records(records, columns=["rank", "kind", "name", "similarity", "path"]).sort_values(["rank", "path"])
+        columns = ["kind", "name", "path", "similarity"] if fuzzy else ["kind", "name", "path"]
+        return results[columns].reset_index(drop=True)
+
+    ### END ### Search ######
+
+
+    def close(self):
+        self.connection.close()
@@ -0,0 +1,76 @@
+from logging import Logger
+from pathlib import Path
+import json
+import os
+
+
+# The measured latency of the URDF parsers, i.e. the mean number of seconds a parser takes to load a URDF file, kept across runs
+# in a JSON file. The latencies are used to try the cheapest parsers first when gating the URDF files, see api.get_parsings_information().
+#
+# The total time and number of loaded files are kept per parser and parse mode, such that the mean latency includes all of the runs.
+# Until a parser has been measured, its prior latency is used, which orders the parsers from the command line tool to the
+# MATLAB engine.
+
+
+class ParserLatencyHistory:
+
+    # the prior latencies of the parsers in seconds per file, before they have been measured
+    prior_latencies = {'check_urdf': 0.01, 'yourdfpy': 0.05, 'pybullet': 0.05, 'urdfpy': 0.1, 'roboticstoolbox': 1.0, 'matlab': 5.0}
+    default_prior_latency = 1.0 # of the parsers without a prior latency
+
+    def __init__(self, history_file: str, logger: Logger):
+        """
+        :param history_file: the JSON file of the latencies, which is created if it does not exist. If None, the latencies are only kept in memory.
+        :type history_file: str
+        """
+        self.logger = logger
+        self.history_file = str(history_file) if history_file is not None else None
+        self.latencies = {} # 'parser:parse_mode' -> {'total_s': float, 'n_files': int}
+        if self.history_file is not None and Path(self.history_file).exists():
+            try:
+                with open(self.history_file) as f:
+                    self.latencies = json.load(f)
+            except (ValueError, OSError) as e:
+                self.logger.warning(f"Ignoring the parser latency history '{self.history_file}', which could not be read: {e}")
+
+
+    def get_latency(self, parser: str, parse_mode: str):
+        """
+        :return: the mean number of seconds the parser takes to load a file in the parse mode, or its prior latency if it has not been measured
+        :rtype: float
+        """
+        latency = self.latencies.get(f"{parser}:{parse_mode}")
+        if latency is None or latency["n_files"] == 0:
+            return self.prior_latencies.get(parser, self.default_prior_latency)
+        return latency["total_s"] / latency["n_files"]
+
+
+    def order(self, parsers: list[str], parse_modes: dict):
+        """
+        :param parse_modes: the parse mode of each parser
+        :type parse_modes: dict[str, str]
+        :return: the parsers from the cheapest to the most expensive
+        :rtype: list[str]
+        """
+        return sorted(parsers, key=lambda p: self.get_latency(p, parse_modes[p]))
+
+
+    def record(self, parser: str, parse_mode: str, elapsed_s: float, n_files: int):
+        """
+        Add the time the parser took to load n_files files to the history.
+        """
+        if n_files == 0:
+            return
+        latency = self.latencies.setdefault(f"{parser}:{parse_mode}", {"total_s": 0.0, "n_files": 0})
+        latency["total_s"] += elapsed_s
+        latency["n_files"] += n_files
+
+
+    def save(self):
+        if self.history_file is None:
+            return
+        dir = os.path.dirname(self.history_file)
+        if dir != "" and not Path(dir).exists():
+            os.makedirs(dir)
+        with open(self.history_file, "w") as f:
+            json.dump(self.latencies, f, indent=2, sort_keys=True)
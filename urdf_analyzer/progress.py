@@ -0,0 +1,119 @@
+import json
+import time
+import sys
+
+from urdf_analyzer.constants import DEFAULT_PROGRESS_INTERVAL
+
+
+# Progress of the batch runs, e.g. generate-schemas over a large directory.
+#
+# A run consists of stages (e.g. 'model-info' or 'parsing:yourdfpy'), each processing a known number of files.
+# The progress is only counted in the main process: the results of the worker processes are counted as they are yielded
+# to the main process by api._imap_in_pool(), such that the workers do not share any state and the counts of the workers
+# are aggregated without any locking. An update only increments the counters and reads the clock, and the progress is
+# only written when the interval has elapsed since it was last written.
+#
+# The progress is written either as a single status line which is rewritten on a terminal ('tty'), or as JSON lines ('json'),
+# one object per interval and per finished stage, which can be collected by job dashboards.
+
+
+class ProgressReporter:
+
+    modes = ["tty", "json"]
+
+    def __init__(self, mode: str="tty", stream=None, interval: float=DEFAULT_PROGRESS_INTERVAL):
+        """
+        :param mode: 'tty' to rewrite a status line, or 'json' to write a JSON object per line
+        :type mode: str
+        :param stream: the stream the progress is written to. Defaults to stderr, such that it is not mixed with the results.
+        :param interval: the minimum number of seconds between writing the progress of a stage
+        :type interval: float
+        :raises ValueError: if the mode is not supported
+        """
+        if mode not in self.modes:
+            raise ValueError(f"The progress mode '{mode}' is not supported. The supported modes are: {self.modes}")
+        self.mode = mode
+        self.stream = stream if stream is not None else sys.stderr
+        self.interval = interval
+        self.start_time = time.monotonic()
+        self.stage_name = None
+        self.stages = [] # the summaries of the finished stages
+
+
+    def start_stage(self, name: str, total: int):
+        """
+        Start a new stage of the run, finishing the current stage if any.
+
+        :param name: the name of the stage, e.g. the schema and the parser
+        :param total: the number of files processed in the stage
+        """
+        if self.stage_name is not None:
+            self.finish_stage()
+        self.stage_name = name
+        self.total = total
+        self.done = 0
+        self.failed = 0
+        self.stage_start_time = time.monotonic()
+        self.last_write_time = self.stage_start_time
+
+
+    def update(self, n: int=1, failed: int=0):
+        """
+        Count n processed files of the current stage, of which failed could not be processed.
+        """
+        self.done += n
+        self.failed += failed
+        now = time.monotonic()
+        if now - self.last_write_time >= self.interval:
+            self.last_write_time = now
+            self._write(self.get_status(now), "progress")
+
+
+    def finish_stage(self):
+        if self.stage_name is None:
+            return
+        status = self.get_status(time.monotonic())
+        self.stages.append(status)
+        self._write(status, "stage_finished")
+        self.stage_name = None
+
+
+    def close(self):
+        """
+        Finish the current stage, and write the summary of the run in 'json' mode.
+        """
+        self.finish_stage()
+        if self.mode == "json":
+            self._write({"elapsed_s": round(time.monotonic() - self.start_time, 3), "stages": self.stages}, "run_finished")
+
+
+    def get_status(self, now: float):
+        """
+        :return: the number of processed and failed files of the current stage, the throughput in files per second and the estimated time
+            remaining in seconds, None until a file has been processed
+        :rtype: dict
+        """
+        elapsed = now - self.stage_start_time
+        files_per_s = self.done / elapsed if elapsed > 0 else None
+        eta_s = (self.total - self.done) / files_per_s if files_per_s else None
+        return {"stage": self.stage_name, "done": self.done, "total": self.total, "failed": self.failed, "elapsed_s": round(elapsed, 3),
+                "files_per_s": round(files_per_s, 3) if files_per_s is not None else None,
+                "eta_s": round(max(eta_s, 0), 1) if eta_s is not None else None}
+
+
+    def _write(self, status: dict, event: str):
+        if self.mode == "json":
+            self.stream.write(json.dumps({"event": event, "time": time.time(), **status}) + "\n")
+        elif event != "run_finished":
+            self.stream.write("\r" + self._format_status_line(status) + ("\n" if event == "stage_finished" else ""))
+        self.stream.flush()
+
+
+    @staticmethod
+    def _format_status_line(status: dict):
+        percentage = 100 * status["done"] / status["total"] if status["total"] > 0 else 100
+        files_per_s = f"{status['files_per_s']:.1f}" if status["files_per_s"] is not None else "-"
+        eta = time.strftime("%H:%M:%S", time.gmtime(status["eta_s"])) if status["eta_s"] is not None else "--:--:--"
+        # padded, such that a shorter line overwrites the previous line completely
+        return f"{status['stage']}: {status['done']}/{status['total']} files ({percentage:.0f}%), {files_per_s} files/s, {status['failed']} failed, ETA {eta}".ljust(100)
+
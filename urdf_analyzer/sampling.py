@@ -0,0 +1,174 @@
+from statistics import NormalDist
+from pathlib import Path
+from typing import Union
+import pandas as pd
+import numpy as np
+import hashlib
+import math
+import os
+
+from urdf_analyzer.constants import DEFAULT_SAMPLE_CONFIDENCE
+
+
+# Stratified sampling of the URDF files of a dataset, to estimate e.g. the fraction of files passing a parser or the mean number
+# of joints from a small sample of the files, instead of analysing all of the files.
+#
+# The files are divided into strata, either by the directory (the first directory of the path relative to the search directory,
+# which is usually the robot or the source), or by the size of the file (powers of two), and the sample size is allocated to the
+# strata proportionally to their sizes, with at least two files per stratum when the sample is large enough (one file per stratum
+# otherwise), such that the variance of the strata can be estimated. Within a stratum, the
+# files with the smallest stable hash of (seed, relative path) are drawn, such that the sample is reproducible, independently of the
+# order in which the files were found and of where the dataset is stored.
+#
+# The means and proportions are estimated using the stratified estimator, the weighted mean of the means of the strata,
+# with the variance sum_h W_h^2 (1 - n_h/N_h) s_h^2 / n_h, where W_h = N_h/N is the weight of the stratum, N_h its number of files,
+# n_h its number of sampled files and s_h^2 the sample variance of the stratum. The variance of a stratum with a single sampled file
+# cannot be estimated from the stratum, and the variance pooled over the strata with several sampled files is used instead, or the
+# variance of all of the sampled files if no stratum has several sampled files. The confidence intervals are normal approximations.
+
+
+class URDFSample:
+
+    strata_types = ["directory", "size"]
+
+    def __init__(self, urdf_files: list, n: int=None, fraction: float=None, strata: str="directory", seed: int=0, root_dir: Union[str, Path]=None):
+        """
+        :param urdf_files: the URDF files of the dataset, see api.search_for_urdfs()
+        :type urdf_files: list[str]
+        :param n: the number of files to sample
+        :type n: int
+        :param fraction: the fraction of the files to sample, if n is not provided
+        :type fraction: float
+        :param strata: how the files are divided into strata, one of strata_types
+        :type strata: str
+        :param seed: the seed of the sample, the same seed gives the same sample
+        :type seed: int
+        :param root_dir: the directory the files were found in
+        :type root_dir: str
+        :raises ValueError: if neither or both of n and fraction are provided, if they are not positive, or if the strata are not supported
+        """
+        if (n is None) == (fraction is None):
+            raise ValueError("Either the number of files (n) or the fraction of files to sample has to be provided.")
+        if (n is not None and n <= 0) or (fraction is not None and not 0 < fraction <= 1):
+            raise ValueError(f"The sample size has to be positive and the fraction in (0, 1], got n={n} and fraction={fraction}.")
+        if strata not in self.strata_types:
+            raise ValueError(f"The strata '{strata}' are not supported. The supported strata are: {self.strata_types}")
+        self.strata = strata
+        self.seed = seed
+        self.root_dir = root_dir
+        self.n_population = len(urdf_files)
+        if n is None:
+            n = max(1, round(fraction * self.n_population))
+
+        population = {} # stratum -> files of the stratum
+        for urdf_file in urdf_files:
+            population.setdefault(self._get_stratum(urdf_file), []).append(urdf_file)
+        self.stratum_sizes = {h: len(files) for h, files in population.items()}
+
+        self.stratum_of_file = {} # the stratum of each sampled file, by the filename as str
+        allocation = self._allocate(self.stratum_sizes, min(n, self.n_population))
+        for stratum, files in population.items():
+            for urdf_file in sorted(files, key=self._get_hash)[:allocation[stratum]]:
+                self.stratum_of_file[str(urdf_file)] = stratum
+        # the sampled files, in the order of urdf_files
+        self.files = [f for f in urdf_files if str(f) in self.stratum_of_file]
+
+
+    def _get_relative_path(self, urdf_file):
+        path = Path(urdf_file)
+        if self.root_dir is not None:
+            try:
+                path = path.relative_to(self.root_dir)
+            except ValueError: # the file is not in the root directory
+                pass
+        return path
+
+
+    def _get_stratum(self, urdf_file):
+        if self.strata == "size":
+            size = os.path.getsize(urdf_file)
+            return f"size<{2 ** size.bit_length()}B"
+        parts = self._get_relative_path(urdf_file).parts
+        return parts[0] if len(parts) > 1 else "."
+
+
+    def _get_hash(self, urdf_file):
+        key = f"{self.seed}:{self._get_relative_path(urdf_file).as_posix()}"
+        return hashlib.blake2b(key.encode(), digest_size=8).digest()
+
+
+    @staticmethod
+    def _allocate(stratum_sizes: dict, n: int):
+        """
+        Allocate the sample size to the strata proportionally to their sizes (largest remainder), with at least two files
+        per stratum (or all of its files) if n is at least twice the number of strata, otherwise at least one file per stratum
+        if n is at least the number of strata.
+        """
+        n_population = sum(stratum_sizes.values())
+        if n_population == 0:
+            return {}
+        quotas = {h: n * size / n_population for h, size in stratum_sizes.items()}
+        minimum = 2 if n >= 2 * len(stratum_sizes) else 1 if n >= len(stratum_sizes) else 0
+        allocation = {h: min(stratum_sizes[h], max(minimum, math.floor(q))) for h, q in quotas.items()}
+        # remove the files given to the small strata from the largest strata
+        while sum(allocation.values()) > n:
+            largest = max([h for h in allocation if allocation[h] > minimum], key=lambda h: allocation[h] - quotas[h])
+            allocation[largest] -= 1
+        by_remainder = sorted(quotas, key=lambda h: quotas[h] - allocation[h], reverse=True)
+        while sum(allocation.values()) < n:
+            for h in by_remainder:
+                if sum(allocation.values()) == n:
+                    break
+                if allocation[h] < stratum_sizes[h]:
+                    allocation[h] += 1
+        return allocation
+
+
+    def get_estimates(self, results: pd.DataFrame, confidence: float=DEFAULT_SAMPLE_CONFIDENCE):
+        """
+        Estimate the mean of each numeric column of the results over all of the files of the dataset, and the proportion
+        of each boolean column (e.g. the files passing a parser). The missing values, e.g. of the files which could not be read,
+        are excluded, and the strata without values are excluded from the estimate.
+
+        :param results: a row for each of the sampled files, indexed by the filenames
+        :type results: pd.DataFrame
+        :param confidence: the confidence level of the intervals
+        :type confidence: float
+        :return: a row for each column, with the estimate, its standard error and confidence interval, and the number of sampled files
+        :rtype: pd.DataFrame
+        """
+        z = NormalDist().inv_cdf((1 + confidence) / 2)
+        results = results.set_axis([str(f) for f in results.index], axis=0)
+        strata = pd.Series([self.stratum_of_file[f] for f in results.index], index=results.index)
+        records = []
+        for column in results.columns:
+            values = results[column].dropna()
+            is_proportion = len(values) > 0 and all(isinstance(v, (bool, np.bool_)) for v in values)
+            try:
+                values = pd.to_numeric(values.astype(float) if is_proportion else values, errors='coerce')
+            except (TypeError, ValueError): # e.g. a column of lists
+                continue
+            if len(values) == 0 or values.isna().any():
+                continue # not a numeric column
+            groups = values.groupby(strata[values.index])
+            n_covered = sum(self.stratum_sizes[h] for h in groups.groups)
+            # the variance used for the strata with a single sampled file
+            degrees_of_freedom = sum(len(group) - 1 for _, group in groups)
+            pooled_variance = sum((len(group) - 1) * group.var() for _, group in groups if len(group) > 1) / degrees_of_freedom if degrees_of_freedom > 0 else values.var()
+            estimate = 0
+            variance = 0
+            for stratum, group in groups:
+                weight = self.stratum_sizes[stratum] / n_covered
+                n_sampled = len(group)
+                estimate += weight * group.mean()
+                # the variance is NaN if a single file was sampled from the whole dataset, and unknown
+                stratum_variance = group.var() if n_sampled > 1 else pooled_variance
+                variance += weight ** 2 * (1 - n_sampled / self.stratum_sizes[stratum]) * stratum_variance / n_sampled
+            standard_error = math.sqrt(variance)
+            ci_low, ci_high = estimate - z * standard_error, estimate + z * standard_error
+            if is_proportion:
+                ci_low, ci_high = max(ci_low, 0.0), min(ci_high, 1.0)
+            records.append({"statistic": f"fraction_{column}" if is_proportion else f"mean_{column}", "estimate": estimate,
+                            "standard_error": standard_error, "ci_low": ci_low, "ci_high": ci_high, "confidence": confidence,
+                            "n_sampled": len(values), "n_population": self.n_population})
+        return pd.DataFrame.from_records(records, columns=["statistic", "estimate", "standard_error", "ci_low", "ci_high", "confidence", "n_sampled", "n_population"])
@@ -0,0 +1,250 @@
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from socketserver import ThreadingMixIn, UnixStreamServer
+from logging import Logger
+from pathlib import Path
+import threading
+import json
+import time
+import os
+
+from urdf_analyzer.model_analysis import ModelAnalysis
+from urdf_analyzer.urdf_validator import URDFValidator
+from urdf_analyzer.urdf_parser import URDFparser
+from urdf_analyzer.constants import DEFAULT_SERVER_HOST, DEFAULT_SERVER_PORT, DEFAULT_SERVER_MAX_CONCURRENCY
+import urdf_analyzer.api as api
+
+
+# The analysis daemon keeps the ModelAnalysis, the validator and the URDF parsers loaded between requests, such that a
+# request only pays for analysing the file, and not for starting the interpreter, importing the dependencies and
+# loading the parsers (e.g. starting the MATLAB engine). The requests are served over HTTP, on a TCP port or a Unix socket:
+#   - GET /health: if the daemon is running
+#   - GET /metrics: the number of requests, rejected requests and errors, and the latency of each endpoint
+#   - POST /model-information, /parsing-information, /validate: a JSON object with the filename and the options of the analysis
+# At most max_concurrency requests are handled at the same time, further requests are rejected with 503 (Service Unavailable).
+# The files are read by their absolute paths, without changing the working directory of the process, such that the requests
+# can be handled by concurrent threads. The ModelAnalysis of the daemon reads one file at a time, and each parser loads one file
+# at a time, as their state is kept between the files, while different parsers load their files concurrently.
+
+
+class AnalysisService:
+
+    endpoints = ["model-information", "parsing-information", "validate"]
+
+    def __init__(self, logger: Logger, parsers: list[str]=None, xml_backend: str=None, max_concurrency: int=DEFAULT_SERVER_MAX_CONCURRENCY):
+        """
+        :param parsers: the parsers that are loaded when the daemon starts. The other parsers are loaded on their first request.
+        :type parsers: list[str]
+        :param xml_backend: the XML backend of the ModelAnalysis, see xml_backend.get_xml_backend()
+        :type xml_backend: str
+        :param max_concurrency: the maximum number of requests handled at the same time
+        :type max_concurrency: int
+        """
+        self.logger = logger
+        self.model_analysis = ModelAnalysis(logger, xml_backend)
+        self.validator = URDFValidator(logger)
+        self.analysis_lock = threading.Lock()
+        self.parsers = {}
+        self.parser_locks = {}
+        self.parsers_lock = threading.Lock()
+        for parser in parsers if parsers is not None else []:
+            self._get_parser(parser)
+        self.max_concurrency = max_concurrency
+        self.slots = threading.BoundedSemaphore(max_concurrency)
+        self.started = time.monotonic()
+        self.metrics_lock = threading.Lock()
+        self.metrics = {"n_requests": 0, "n_rejected": 0, "n_errors": 0, "in_flight": 0,
+                        "endpoints": {e: {"n_requests": 0, "total_latency_s": 0.0, "max_latency_s": 0.0} for e in self.endpoints}}
+
+
+    def _get_parser(self, parser: str):
+        if parser not in URDFparser.supported_parsers:
+            raise ValueError(f"The parser '{parser}' is not supported. The supported parsers are: {URDFparser.supported_parsers}")
+        with self.parsers_lock:
+            if parser not in self.parsers:
+                self.logger.info(f"Loading the parser '{parser}'")
+                self.parsers[parser] = URDFparser(parser, self.logger)
+                self.parser_locks[parser] = threading.Lock()
+        return self.parsers[parser], self.parser_locks[parser]
+
+
+    def get_health(self):
+        return {"status": "ok", "uptime_s": round(time.monotonic() - self.started, 3), "parsers": list(self.parsers.keys())}
+
+
+    def get_metrics(self):
+        with self.metrics_lock:
+            metrics = json.loads(json.dumps(self.metrics))
+        metrics["max_concurrency"] = self.max_concurrency
+        metrics["uptime_s"] = round(time.monotonic() - self.started, 3)
+        return metrics
+
+
+    def try_acquire(self):
+        """
+        :return: if the request can be handled, otherwise the maximum number of concurrent requests is reached
+        :rtype: bool
+        """
+        acquired = self.slots.acquire(blocking=False)
+        with self.metrics_lock:
+            self.metrics["n_requests"] += 1
+            if acquired:
+                self.metrics["in_flight"] += 1
+            else:
+                self.metrics["n_rejected"] += 1
+        return acquired
+
+
+    def release(self, endpoint: str, latency: float, error: bool):
+        with self.metrics_lock:
+            self.metrics["in_flight"] -= 1
+            self.metrics["n_errors"] += int(error)
+            if endpoint in self.metrics["endpoints"]:
+                endpoint_metrics = self.metrics["endpoints"][endpoint]
+                endpoint_metrics["n_requests"] += 1
+                endpoint_metrics["total_latency_s"] += latency
+                endpoint_metrics["max_latency_s"] = max(endpoint_metrics["max_latency_s"], latency)
+        self.slots.release()
+
+
+    def handle(self, endpoint: str, request: dict):
+        """
+        :param endpoint: one of endpoints
+        :type endpoint: str
+        :param request: the filename, and the options of the analysis
+        :type request: dict
+        :raises ValueError: if the request is invalid
+        :return: the results of the analysis
+        :rtype: dict
+        """
+        if not isinstance(request, dict) or request.get("filename") is None:
+            raise ValueError("The request has to be a JSON object with a 'filename'.")
+        if endpoint == "model-information":
+            return self._get_model_information(request)
+        if endpoint == "parsing-information":
+            return self._get_parsing_information(request)
+        if endpoint == "validate":
+            return self._validate(request)
+        raise ValueError(f"The endpoint '{endpoint}' is not supported. The supported endpoints are: {self.endpoints}")
+
+
+    def _get_model_information(self, request: dict):
+        kwargs = {k: request.get(k, k in ["joints", "links"]) for k in ["joints", "links", "dynamics", "collisions", "topology"]}
+        with self.analysis_lock:
+            if self.model_analysis.xml_urdf_reader(request["filename"], request.get("urdf_root_dir")) is None:
+                raise ValueError(f"The file '{request['filename']}' could not be read.")
+            urdf_information = api.get_model_information(model_analysis=self.model_analysis, **kwargs)
+        urdf_information.filename = request["filename"]
+        urdf_information.compile_results(request.get("full", False))
+        return {"filename": request["filename"], **urdf_information.df_results.to_dict(orient="records")[0]}
+
+
+    def _get_parsing_information(self, request: dict):
+        parsers = request.get("parser", list(self.parsers.keys()) if len(self.parsers) > 0 else URDFparser.supported_parsers)
+        parsers = [parsers] if isinstance(parsers, str) else parsers
+        information = {"filename": request["filename"]}
+        for parser in parsers:
+            tool_parser, parser_lock = self._get_parser(parser)
+            with parser_lock:
+                _, model = next(tool_parser.load_many([request["filename"]], request.get("urdf_root_dir")))
+            information[parser] = model is not None
+        information["count"] = sum(information[p] for p in parsers)
+        return information
+
+
+    def _validate(self, request: dict):
+        validator = URDFValidator(self.logger, request["rules"]) if request.get("rules") is not None else self.validator
+        with self.analysis_lock:
+            root = self.model_analysis.xml_urdf_reader(request["filename"], request.get("urdf_root_dir"))
+            issues = validator.validate(root) if root is not None else None
+        return validator.get_issues_information(request["filename"], issues)
+
+
+    def close(self):
+        for parser in self.parsers.values():
+            parser.close()
+
+
+def _to_json(value):
+    # numpy values are converted to their python equivalents
+    if hasattr(value, "tolist"):
+        return value.tolist()
+    return str(value)
+
+
+class AnalysisRequestHandler(BaseHTTPRequestHandler):
+
+    def _send_json(self, status: int, information: dict, headers: dict=None):
+        body = json.dumps(information, default=_to_json).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        for key, value in (headers or {}).items():
+            self.send_header(key, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        if self.path == "/health":
+            self._send_json(200, self.server.service.get_health())
+        elif self.path == "/metrics":
+            self._send_json(200, self.server.service.get_metrics())
+        else:
+            self._send_json(404, {"error": f"Unknown path '{self.path}'."})
+
+    def do_POST(self):
+        service: AnalysisService = self.server.service
+        endpoint = self.path.strip("/")
+        if endpoint not in service.endpoints:
+            self._send_json(404, {"error": f"Unknown endpoint '{endpoint}'. The endpoints are: {service.endpoints}"})
+            return
+        if not service.try_acquire():
+            self._send_json(503, {"error": f"The maximum number of concurrent requests ({service.max_concurrency}) is reached."}, {"Retry-After": "1"})
+            return
+        start = time.perf_counter()
+        error = True
+        try:
+            request = json.loads(self.rfile.read(int(self.headers.get("Content-Length", 0))) or b"{}")
+            self._send_json(200, service.handle(endpoint, request))
+            error = False
+        except ValueError as e: # including invalid JSON
+            self._send_json(400, {"error": str(e)})
+        except Exception as e:
+            service.logger.exception(f"Error while handling a request to '{endpoint}'")
+            self._send_json(500, {"error": str(e)})
+        finally:
+            service.release(endpoint, time.perf_counter() - start, error)
+
+    def log_message(self, format, *args):
+        self.server.service.logger.debug(format % args)
+
+
+class AnalysisHTTPServer(ThreadingHTTPServer):
+
+    daemon_threads = True
+
+    def __init__(self, address: tuple, service: AnalysisService):
+        self.service = service
+        super().__init__(address, AnalysisRequestHandler)
+
+
+class AnalysisUnixServer(ThreadingMixIn, UnixStreamServer):
+
+    daemon_threads = True
+
+    def __init__(self, socket_file: str, service: AnalysisService):
+        self.service = service
+        # a socket file left by a daemon that was not shut down is removed
+        if Path(socket_file).exists():
+            os.remove(socket_file)
+        super().__init__(socket_file, AnalysisRequestHandler)
+
+
+def create_server(service: AnalysisService, host: str=DEFAULT_SERVER_HOST, port: int=DEFAULT_SERVER_PORT, unix_socket: str=None):
+    """
+    :param unix_socket: if provided, the daemon listens on this Unix socket instead of the host and port
+    :type unix_socket: str
+    :return: the server, which is started using serve_forever()
+    """
+    if unix_socket is not None:
+        return AnalysisUnixServer(unix_socket, service)
+    return AnalysisHTTPServer((host, port), service)
@@ -0,0 +1,145 @@
+from dataclasses import dataclass
+import pandas as pd
+import numpy as np
+
+from urdf_analyzer.urdf_components.kinematics import KinematicTree, origins_to_transforms
+from urdf_analyzer.urdf_standard import LinkStandard
+from urdf_analyzer.mesh_analysis import resolve_mesh_filename, get_mesh_bounds
+
+# following the standard defined in: https://wiki.ros.org/urdf/XML/link (collision)
+#
+# The collision elements are represented by their axis aligned bounding boxes (AABBs) in the root frame, with all joints in their zero position.
+# Potentially self-colliding link pairs are found using a sweep and prune broadphase along the x axis, where the overlap on the y and z axes is
+# checked for the candidate pairs. Links connected by a joint (adjacent links) are excluded, as they are expected to touch.
+
+
+@dataclass
+class CollisionMetaInformation:
+
+    def __init__(self, links: list, joints: list, urdf_root_dir: str=None) -> None:
+        """
+        The collision bounding boxes and self-collision candidates of a robot.
+
+        :param links: the links of the robot, with their collision elements
+        :type links: list[Link]
+        :param joints: the joints of the robot
+        :type joints: list[Joint]
+        :param urdf_root_dir: the directory of the URDF file, used to localise the meshes
+        :type urdf_root_dir: str
+
+        returns self, which contains:
+            - body_links: the name of the link of each collision body
+            - aabb_min, aabb_max: the corners of the AABB of each collision body in the root frame, with shape (n_collision_bodies, 3)
+            - unresolved_meshes: the filenames of the collision meshes that could not be found or read
+            - self_collision_candidates: the pairs of non-adjacent links with overlapping AABBs
+        """
+        link_names = [l.name for l in links]
+        link_index = {name: i for i, name in enumerate(link_names)}
+
+        # the local bounds of each collision body, relative to the origin of the collision element
+        self.body_links = []
+        self.unresolved_meshes = []
+        local_min = []
+        local_max = []
+        origins = []
+        for link in links:
+            for collision in link.collisions:
+                bounds = self._get_geometry_bounds(collision.geometry, urdf_root_dir)
+                if bounds is None:
+                    continue
+                self.body_links.append(link.name)
+                local_min.append(bounds[0])
+                local_max.append(bounds[1])
+                origins.append(collision.origin)
+        self.n_collision_bodies = len(self.body_links)
+        self.n_unresolved_collision_meshes = len(self.unresolved_meshes)
+
+        # transform the local bounds to the root frame: collision frame -> link frame -> root frame
+        link_transforms = KinematicTree(joints, link_names).get_zero_configuration_transforms()
+        transforms = np.array([link_transforms.get(name, np.eye(4)) for name in self.body_links]).reshape(-1, 4, 4) @ origins_to_transforms(origins)
+        local_min = np.array(local_min, dtype=float).reshape(-1, 3)
+        local_max = np.array(local_max, dtype=float).reshape(-1, 3)
+        centers = np.einsum('nij,nj->ni', transforms[:, :3, :3], (local_min + local_max) / 2) + transforms[:, :3, 3]
+        half_extents = np.einsum('nij,nj->ni', np.abs(transforms[:, :3, :3]), (local_max - local_min) / 2)
+        self.aabb_min = centers - half_extents
+        self.aabb_max = centers + half_extents
+        self.collision_bounds = [[round(float(v), 6) + 0.0 for v in self.aabb_min.min(axis=0)],
+                                 [round(float(v), 6) + 0.0 for v in self.aabb_max.max(axis=0)]] if self.n_collision_bodies > 0 else None
+
+        # adjacent links are encoded as a single integer per pair of link indices, smallest index first
+        adjacent = [(link_index[j.parent], link_index[j.child]) for j in joints if j.parent in link_index and j.child in link_index]
+        adjacent_codes = np.array([min(a, b) * len(link_names) + max(a, b) for a, b in adjacent], dtype=np.int64)
+        body_link_indices = np.array([link_index[name] for name in self.body_links], dtype=np.int64)
+        pairs = self._sweep_and_prune(self.aabb_min, self.aabb_max)
+        first, second = body_link_indices[pairs[0]], body_link_indices[pairs[1]]
+        codes = np.minimum(first, second) * len(link_names) + np.maximum(first, second)
+        codes = np.unique(codes[(first != second) & ~np.isin(codes, adjacent_codes)])
+        self.self_collision_candidates = [(link_names[c // len(link_names)], link_names[c % len(link_names)]) for c in codes.tolist()]
+        self.n_self_collision_candidates = len(self.self_collision_candidates)
+
+        # Save results to pandas DataFrame
+        self.df_columns_short = ["n_collision_bodies", "n_self_collision_candidates"]
+        self.df_columns_full = self.df_columns_short + ["n_unresolved_collision_meshes", "collision_bounds", "self_collision_candidates"]
+
+        self.df_results_full = pd.DataFrame(columns=self.df_columns_full)
+        self.df_results_full.loc[0, self.df_columns_full[0]] = self.n_collision_bodies
+        self.df_results_full.loc[0, self.df_columns_full[1]] = self.n_self_collision_candidates
+        self.df_results_full.loc[0, self.df_columns_full[2]] = self.n_unresolved_collision_meshes
+        self.df_results_full.loc[0, self.df_columns_full[3]] = self.collision_bounds
+        self.df_results_full.loc[0, self.df_columns_full[4]] = [list(pair) for pair in self.self_collision_candidates]
+
+        self.df_results = self.df_results_full[self.df_results_full.columns[0:len(self.df_columns_short)]]
+
+
+    def _get_geometry_bounds(self, geometry, urdf_root_dir: str):
+        """
+        The bounds of a collision geometry, relative to the origin of the collision element. None if the bounds could not be determined.
+        """
+        try:
+            if geometry.geometry_type == LinkStandard.geometry_types[3]: # box
+                half_size = np.array([float(v) for v in geometry.size.split()]) / 2
+                return -half_size, half_size
+            if geometry.geometry_type == LinkStandard.geometry_types[2]: # cylinder, along the z axis
+                r, h = float(geometry.radius), float(geometry.length)
+                return -np.array([r, r, h/2]), np.array([r, r, h/2])
+            if geometry.geometry_type == LinkStandard.geometry_types[1]: # sphere
+                r = float(geometry.radius)
+                return -np.full(3, r), np.full(3, r)
+            if geometry.geometry_type == LinkStandard.geometry_types[0]: # mesh
+                bounds = get_mesh_bounds(resolve_mesh_filename(geometry.filename, urdf_root_dir))
+                if bounds is None:
+                    self.unresolved_meshes.append(geometry.filename)
+                    return None
+                scale = np.array([float(v) for v in geometry.scale.split()])
+                # a negative scale mirrors the mesh, which swaps the minimum and maximum
+                scaled = np.stack([bounds[0] * scale, bounds[1] * scale])
+                return scaled.min(axis=0), scaled.max(axis=0)
+        except (AttributeError, TypeError, ValueError):
+            pass
+        return None
+
+
+    @staticmethod
+    def _sweep_and_prune(aabb_min: np.ndarray, aabb_max: np.ndarray):
+        """
+        Find the pairs of AABBs that overlap. The AABBs are sorted by their minimum x, such that the candidates of each AABB
+        are the following AABBs starting before its maximum x. Touching AABBs are not considered overlapping.
+
+        :return: the indices of the overlapping pairs, with shape (2, n_pairs)
+        :rtype: np.ndarray
+        """
+        n = len(aabb_min)
+        if n < 2:
+            return np.zeros((2, 0), dtype=np.int64)
+        order = np.argsort(aabb_min[:, 0], kind='stable')
+        sorted_min_x = aabb_min[order, 0]
+        # the sorted position of the last AABB starting before the maximum x of each AABB
+        ends = np.searchsorted(sorted_min_x, aabb_max[order, 0], side='left')
+        counts = np.maximum(ends - np.arange(n) - 1, 0)
+        first = np.repeat(np.arange(n), counts)
+        # the offsets of the candidates of each AABB, i.e. 1, 2, ..., count
+        offsets = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts) + 1
+        second = first + offsets
+        first, second = order[first], order[second]
+        overlap = np.all((aabb_min[first] < aabb_max[second]) & (aabb_min[second] < aabb_max[first]), axis=1)
+        return np.stack([first[overlap], second[overlap]])
@@ -0,0 +1,139 @@
+from dataclasses import dataclass
+import pandas as pd
+import numpy as np
+
+from urdf_analyzer.urdf_components.kinematics import KinematicTree
+from urdf_analyzer.urdf_standard import JointStandard, LinkStandard
+from urdf_analyzer.constants import DEFAULT_INERTIA_TOLERANCE
+
+# following the standard defined in: https://wiki.ros.org/urdf/XML/link (inertial) and https://wiki.ros.org/urdf/XML/joint (limit, dynamics)
+
+
+@dataclass
+class DynamicsMetaInformation:
+
+    inertial_dtype = np.dtype([('mass', 'f8'), ('xyz', 'f8', (3,)), ('rpy', 'f8', (3,)), ('inertia', 'f8', (6,))])
+    joint_dtype = np.dtype([(a, 'f8') for a in JointStandard.limit_attributes + JointStandard.dynamics_attributes])
+
+    def __init__(self, links: list, joints: list, inertia_tolerance: float=DEFAULT_INERTIA_TOLERANCE) -> None:
+        """
+        The inertial properties of the links, and the limit and dynamics properties of the joints, stored in NumPy structured arrays.
+
+        returns self, which contains:
+            - inertial_links: list of the names of the links with inertial properties
+            - inertials: structured array with the mass, origin (xyz, rpy) and inertia (ixx, ixy, ixz, iyy, iyz, izz) of each link in inertial_links
+            - joint_properties: structured array with the limit and dynamics attributes of each joint, NaN if not specified
+            - total_mass: the sum of the masses of the links
+            - center_of_mass: the center of mass of the robot relative to the root link, with all joints in their zero position
+            - n_non_positive_definite_inertias, n_triangle_inequality_violations, n_primitive_inertia_mismatches: the number of links failing the checks
+        """
+        inertial_links = [l for l in links if l.inertial is not None]
+        self.inertial_links = [l.name for l in inertial_links]
+        self.inertials = np.zeros(len(inertial_links), dtype=self.inertial_dtype)
+        self.inertials['mass'] = [l.inertial.mass for l in inertial_links]
+        self.inertials['xyz'] = np.array([l.inertial.origin.xyz for l in inertial_links], dtype=float).reshape(-1, 3)
+        self.inertials['rpy'] = np.array([l.inertial.origin.rpy for l in inertial_links], dtype=float).reshape(-1, 3)
+        self.inertials['inertia'] = np.array([l.inertial.inertia for l in inertial_links], dtype=float).reshape(-1, 6)
+
+        self.joint_properties = np.full(len(joints), np.nan, dtype=self.joint_dtype)
+        for i, joint in enumerate(joints):
+            for properties in [joint.limit, joint.dynamics]:
+                if properties is not None:
+                    for attribute, value in properties.items():
+                        if value is not None:
+                            self.joint_properties[attribute][i] = value
+
+        self.n_inertials = len(inertial_links)
+        self.total_mass = float(self.inertials['mass'].sum())
+        self.center_of_mass = self._get_center_of_mass(KinematicTree(joints, [l.name for l in links]))
+
+        # checks of the inertia tensors
+        self.inertia_tensors = self._get_inertia_tensors(self.inertials['inertia'])
+        principal_moments = np.linalg.eigvalsh(self.inertia_tensors) if self.n_inertials > 0 else np.zeros((0, 3))
+        self.non_positive_definite = principal_moments[:, 0] <= 0
+        self.triangle_inequality_violations = principal_moments[:, 0] + principal_moments[:, 1] < principal_moments[:, 2] * (1 - 1e-9)
+        self.primitive_inertia_mismatches = self._get_primitive_inertia_mismatches(inertial_links, principal_moments, inertia_tolerance)
+
+        self.n_non_positive_definite_inertias = int(self.non_positive_definite.sum())
+        self.n_triangle_inequality_violations = int(self.triangle_inequality_violations.sum())
+        self.n_primitive_inertia_mismatches = len(self.primitive_inertia_mismatches)
+
+        # checks of the joint limits
+        self.n_joint_limits = int((~np.isnan(self.joint_properties['effort']) | ~np.isnan(self.joint_properties['velocity'])).sum())
+        self.n_joint_dynamics = int((~np.isnan(self.joint_properties['damping']) | ~np.isnan(self.joint_properties['friction'])).sum())
+        self.n_invalid_joint_limits = int(((self.joint_properties['lower'] > self.joint_properties['upper']) |
+                                           (self.joint_properties['effort'] < 0) |
+                                           (self.joint_properties['velocity'] < 0)).sum())
+
+        # Save results to pandas DataFrame
+        self.df_columns_short = ["total_mass", "center_of_mass"]
+        self.df_columns_full = self.df_columns_short + ["n_inertials", "n_non_positive_definite_inertias", "n_triangle_inequality_violations",
+                                                        "n_primitive_inertia_mismatches", "n_joint_limits", "n_invalid_joint_limits", "n_joint_dynamics"]
+
+        self.df_results_full = pd.DataFrame(columns=self.df_columns_full)
+        self.df_results_full.loc[0, self.df_columns_full[0]] = self.total_mass
+        self.df_results_full.loc[0, self.df_columns_full[1]] = self.center_of_mass
+        for column in self.df_columns_full[2:]:
+            self.df_results_full.loc[0, column] = getattr(self, column)
+
+        self.df_results = self.df_results_full[self.df_results_full.columns[0:len(self.df_columns_short)]]
+
+
+    def _get_center_of_mass(self, kinematic_tree: KinematicTree):
+        if self.total_mass <= 0:
+            return None
+        transforms = kinematic_tree.get_zero_configuration_transforms()
+        # links that are not reachable from a root link are placed at the origin
+        link_transforms = np.array([transforms.get(name, np.eye(4)) for name in self.inertial_links]).reshape(-1, 4, 4)
+        positions = np.einsum('nij,nj->ni', link_transforms[:, :3, :3], self.inertials['xyz']) + link_transforms[:, :3, 3]
+        return [round(float(v), 6) + 0.0 for v in (self.inertials['mass'] @ positions) / self.total_mass]
+
+
+    @staticmethod
+    def _get_inertia_tensors(inertia: np.ndarray):
+        ixx, ixy, ixz, iyy, iyz, izz = inertia.T
+        return np.stack([np.stack([ixx, ixy, ixz], axis=-1),
+                         np.stack([ixy, iyy, iyz], axis=-1),
+                         np.stack([ixz, iyz, izz], axis=-1)], axis=-2)
+
+
+    @staticmethod
+    def _get_primitive_principal_moments(geometry, mass: float):
+        try:
+            if geometry.geometry_type == LinkStandard.geometry_types[3]: # box
+                x, y, z = [float(v) for v in geometry.size.split()]
+                return np.array([y*y + z*z, x*x + z*z, x*x + y*y]) * mass / 12
+            if geometry.geometry_type == LinkStandard.geometry_types[2]: # cylinder
+                r, h = float(geometry.radius), float(geometry.length)
+                return np.array([(3*r*r + h*h) * mass / 12, (3*r*r + h*h) * mass / 12, r*r * mass / 2])
+            if geometry.geometry_type == LinkStandard.geometry_types[1]: # sphere
+                r = float(geometry.radius)
+                return np.full(3, 2 * mass * r*r / 5)
+        except (AttributeError, TypeError, ValueError):
+            pass
+        return None
+
+
+    def _get_primitive_inertia_mismatches(self, inertial_links: list, principal_moments: np.ndarray, inertia_tolerance: float):
+        """
+        Compare the declared inertias with the inertias of solid primitive geometries (box, cylinder, sphere) with the same mass.
+        The collision geometry is used if available, otherwise the visual geometry.
+        The principal moments are compared, such that the comparison does not depend on the orientation of the inertia frame.
+        """
+        indices = []
+        expected = []
+        for i, link in enumerate(inertial_links):
+            geometry = link.collision_geometry if link.collision_geometry is not None else link.visual_geometry
+            if geometry is None:
+                continue
+            moments = self._get_primitive_principal_moments(geometry, link.inertial.mass)
+            if moments is not None:
+                indices.append(i)
+                expected.append(np.sort(moments))
+        if len(indices) == 0:
+            return []
+        expected = np.array(expected)
+        declared = principal_moments[indices]
+        scale = np.maximum(np.abs(expected).max(axis=1), np.finfo(float).tiny)
+        relative_error = np.abs(declared - expected).max(axis=1) / scale
+        return [self.inertial_links[indices[i]] for i in np.flatnonzero(relative_error > inertia_tolerance)]
@@ -1,5 +1,6 @@
 from dataclasses import dataclass
 from urdf_analyzer.urdf_standard import JointStandard
+from urdf_analyzer.urdf_components.origin import Origin
 import pandas as pd
 
 # following the standard defined in: https://wiki.ros.org/urdf/XML/joint
@@ -7,7 +8,7 @@ import pandas as pd
 @dataclass
 class Joint:
 
-    def __init__(self, name: str, jtype: str):
+    def __init__(self, name: str, jtype: str, parent: str=None, child: str=None, origin: Origin=None, limit: dict=None, dynamics: dict=None, mimic: str=None):
         """
         A joint element has two attributes: name and type.
 
@@ -15,11 +16,29 @@ class Joint:
         :type name: str
         :param type: Specifies the type of joint
         :type type: str
+        :param parent: the name of the parent link
+        :type parent: str
+        :param child: the name of the child link
+        :type child: str
+        :param origin: the transform from the parent link to the child link
+        :type origin: Origin
+        :param limit: the attributes of the limit element (lower, upper, effort, velocity) as floats
+        :type limit: dict
+        :param dynamics: the attributes of the dynamics element (damping, friction) as floats
+        :type dynamics: dict
+        :param mimic: the name of the joint mimicked by this joint, i.e. the joint is not actuated independently
+        :type mimic: str
         :raises AssertionError: if the specified type is not part of the URDF standard
         """
         self.name = name
         assert jtype in JointStandard.joint_types, f"The type '{jtype}' of the joint '{name}' is not part of the defined URDF standard for joints. The allowed joints types from the standard are '{JointStandard.joint_types}'"
         self.type = jtype
+        self.parent = parent
+        self.child = child
+        self.origin = origin if origin is not None else Origin()
+        self.limit = limit
+        self.dynamics = dynamics
+        self.mimic = mimic
 
 
     def get_explanantion_of_type(self):
@@ -0,0 +1,100 @@
+import numpy as np
+
+from urdf_analyzer.urdf_components.origin import Origin
+
+
+def rpy_to_rotation_matrices(rpy: np.ndarray):
+    """
+    Convert fixed axis roll, pitch, yaw angles to rotation matrices, i.e. R = Rz(yaw) Ry(pitch) Rx(roll).
+
+    :param rpy: the angles, with shape (n, 3)
+    :type rpy: np.ndarray
+    :return: the rotation matrices, with shape (n, 3, 3)
+    :rtype: np.ndarray
+    """
+    rpy = np.asarray(rpy, dtype=float).reshape(-1, 3)
+    cr, cp, cy = np.cos(rpy).T
+    sr, sp, sy = np.sin(rpy).T
+    rotations = np.empty((len(rpy), 3, 3))
+    rotations[:, 0, 0] = cy*cp
+    rotations[:, 0, 1] = cy*sp*sr - sy*cr
+    rotations[:, 0, 2] = cy*sp*cr + sy*sr
+    rotations[:, 1, 0] = sy*cp
+    rotations[:, 1, 1] = sy*sp*sr + cy*cr
+    rotations[:, 1, 2] = sy*sp*cr - cy*sr
+    rotations[:, 2, 0] = -sp
+    rotations[:, 2, 1] = cp*sr
+    rotations[:, 2, 2] = cp*cr
+    return rotations
+
+
+def origins_to_transforms(origins: list[Origin]):
+    """
+    Convert origins to homogeneous transformation matrices, with shape (n, 4, 4).
+    """
+    transforms = np.zeros((len(origins), 4, 4))
+    if len(origins) == 0:
+        return transforms
+    transforms[:, :3, :3] = rpy_to_rotation_matrices([o.rpy for o in origins])
+    transforms[:, :3, 3] = np.array([o.xyz for o in origins], dtype=float)
+    transforms[:, 3, 3] = 1.0
+    return transforms
+
+
+class KinematicTree:
+
+    def __init__(self, joints: list, link_names: list[str]=None):
+        """
+        The tree formed by the links and joints of a URDF.
+        Links with multiple parent joints only use the first parent joint, and links in cycles are not reachable from a root link.
+
+        :param joints: the joints of the URDF
+        :type joints: list[Joint]
+        :param link_names: the names of the links of the URDF. If not provided, the links referenced by the joints are used.
+        :type link_names: list[str]
+        """
+        self.joints = [j for j in joints if j.parent is not None and j.child is not None]
+        self.parent_joint = {} # child link -> joint
+        self.child_joints = {} # parent link -> list of joints
+        for joint in self.joints:
+            if joint.child in self.parent_joint:
+                continue
+            self.parent_joint[joint.child] = joint
+            self.child_joints.setdefault(joint.parent, []).append(joint)
+
+        if link_names is None:
+            link_names = list(dict.fromkeys([l for j in self.joints for l in (j.parent, j.child)]))
+        self.link_names = link_names
+        self.roots = [l for l in link_names if l not in self.parent_joint]
+
+        # the links in breadth first order from the root links, such that a parent link is always before its child links
+        self.order = list(self.roots)
+        visited = set(self.roots)
+        i = 0
+        while i < len(self.order):
+            for joint in self.child_joints.get(self.order[i], []):
+                if joint.child not in visited:
+                    visited.add(joint.child)
+                    self.order.append(joint.child)
+            i += 1
+        self._transforms = None
+
+
+    def get_zero_configuration_transforms(self):
+        """
+        The transforms of the links relative to the root link(s), when all of the joints are in their zero position.
+        Links that are not reachable from a root link are not included.
+
+        :return: the transform of each link
+        :rtype: dict[str, np.ndarray]
+        """
+        if self._transforms is None:
+            joints = [self.parent_joint[l] for l in self.order if l in self.parent_joint]
+            joint_transforms = dict(zip([j.child for j in joints], origins_to_transforms([j.origin for j in joints])))
+            self._transforms = {}
+            for link in self.order:
+                if link in joint_transforms:
+                    self._transforms[link] = self._transforms[self.parent_joint[link].parent] @ joint_transforms[link]
+                else:
+                    self._transforms[link] = np.eye(4)
+        return self._transforms
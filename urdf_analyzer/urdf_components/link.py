@@ -2,6 +2,8 @@ from dataclasses import dataclass
 import pandas as pd
 
 from urdf_analyzer.urdf_standard import LinkStandard
+from urdf_analyzer.urdf_components.origin import Origin
+from urdf_analyzer.mesh_analysis import resolve_mesh_filename, get_mesh_statistics, scale_mesh_statistics
 
 # following the standard defined in: https://wiki.ros.org/urdf/XML/link
 # the types and required parameters are from (with a few modifications): https://github.com/ros/urdfdom/blob/master/xsd/urdf.xsd 
@@ -76,22 +78,64 @@ class Mesh(Geometry):
         super().__init__()
         self.filename = filename
         self.scale = scale
+        self.statistics = None # the scaled statistics of the mesh file, if read, see LinksMetaInformation
     
 
 
+@dataclass
+class Collision:
+
+    def __init__(self, geometry: Geometry, origin: Origin=None) -> None:
+        """
+        A collision element of a link. A link can have multiple collision elements, and the union of their geometries forms the collision representation of the link.
+
+        :param geometry: the shape of the collision element
+        :type geometry: Geometry
+        :param origin: the reference frame of the collision element, relative to the reference frame of the link
+        :type origin: Origin
+        """
+        self.geometry = geometry
+        self.origin = origin if origin is not None else Origin()
+
+
+@dataclass
+class Inertial:
+
+    def __init__(self, mass: float, inertia: list[float], origin: Origin=None) -> None:
+        """
+        The mass, position of the center of mass, and the central inertia properties of the link.
+
+        :param mass: the mass of the link
+        :type mass: float
+        :param inertia: the 3x3 rotational inertia matrix, represented in the inertia frame, given as [ixx, ixy, ixz, iyy, iyz, izz]
+        :type inertia: list[float]
+        :param origin: the pose of the inertial reference frame (the center of mass) relative to the link reference frame
+        :type origin: Origin
+        """
+        self.mass = mass
+        self.inertia = inertia
+        self.origin = origin if origin is not None else Origin()
+
+
 @dataclass
 class Link:
 
-    def __init__(self, name: str, visual_geometry: Geometry=None, collision_geometry: Geometry=None) -> None:
+    def __init__(self, name: str, visual_geometry: Geometry=None, collision_geometry: Geometry=None, inertial: Inertial=None, collisions: list[Collision]=None) -> None:
         """
         A link element has one attribute: name.
 
         :param name: The name of the link itself 
         :type name: str
+        :param inertial: The inertial properties of the link
+        :type inertial: Inertial
+        :param collisions: All of the collision elements of the link, with their origins
+        :type collisions: list[Collision]
         """
         self.name = name
         self.visual_geometry = visual_geometry
         self.collision_geometry = collision_geometry
+        self.inertial = inertial
+        self.collisions = collisions if collisions is not None else []
 
 
 
@@ -109,9 +153,32 @@ class LinksMetaInformation:
                 mesh_types[mesh_type] += 1
         return mesh_types
 
-    def __init__(self, links: list[Link]) -> None:
+    def _obtain_mesh_statistics(self, link_geometry: Geometry, urdf_root_dir: str):
         """
-        
+        Read the statistics of the mesh file of a mesh geometry, scaled by the scale of the mesh, and attach them to the geometry.
+
+        :return: the statistics rounded for the results, None if the mesh could not be found or read
+        :rtype: dict
+        """
+        try:
+            scale = [float(v) for v in link_geometry.scale.split()]
+        except (AttributeError, ValueError):
+            scale = []
+        statistics = get_mesh_statistics(resolve_mesh_filename(link_geometry.filename, urdf_root_dir))
+        link_geometry.statistics = scale_mesh_statistics(statistics, scale) if len(scale) == 3 else None
+        if link_geometry.statistics is None:
+            return None
+        return {k: [round(float(x), 6) + 0.0 for x in v] if k.startswith("aabb") and v is not None else round(v, 6) if isinstance(v, float) else v
+                for k, v in link_geometry.statistics.items()}
+
+    def __init__(self, links: list[Link], mesh_statistics: bool=False, urdf_root_dir: str=None) -> None:
+        """
+        :param mesh_statistics: if True, the number of triangles, the bounds and the surface area of the meshes of the visual and collision geometries are read
+            (see mesh_analysis.get_mesh_statistics()), and attached to the geometries
+        :type mesh_statistics: bool
+        :param urdf_root_dir: the directory of the URDF file, used to localise the meshes
+        :type urdf_root_dir: str
+
         returns self, which contains:
             - n_links: int
             - links: list of Link
@@ -147,6 +214,13 @@ class LinksMetaInformation:
         if len(self.collision_mesh_types) > 0:
             self.df_columns_full = self.df_columns_full + ['collision_meshes']
             self.df_results_full.loc[0, self.df_columns_full[len(self.df_columns_full)-1]] = [self.collision_mesh_types]       
+        if mesh_statistics:
+            geometries = [(f"{l.name}_{t}", g) for l in self.links for t, g in [("visual", l.visual_geometry), ("collision", l.collision_geometry)]
+                          if g is not None and g.geometry_type == LinkStandard.geometry_types[0]]
+            self.df_columns_full = self.df_columns_full + ['mesh_statistics']
+            # a list can only be set in a single cell of an existing object column
+            self.df_results_full['mesh_statistics'] = pd.Series([None], dtype=object)
+            self.df_results_full.at[0, 'mesh_statistics'] = [{name: self._obtain_mesh_statistics(g, urdf_root_dir)} for name, g in geometries]
 
         self.df_results = self.df_results_full[self.df_results_full.columns[0:len(self.df_columns_short)]]
 
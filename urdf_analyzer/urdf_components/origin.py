@@ -0,0 +1,18 @@
+from dataclasses import dataclass
+
+# following the standard defined in: https://wiki.ros.org/urdf/XML/link and https://wiki.ros.org/urdf/XML/joint
+
+@dataclass
+class Origin:
+
+    def __init__(self, xyz: list[float]=None, rpy: list[float]=None) -> None:
+        """
+        The reference frame of an element, relative to the reference frame of its parent.
+
+        :param xyz: the x, y, z offset
+        :type xyz: list[float]
+        :param rpy: the fixed axis roll, pitch and yaw angles in radians
+        :type rpy: list[float]
+        """
+        self.xyz = xyz if xyz is not None else [0.0, 0.0, 0.0]
+        self.rpy = rpy if rpy is not None else [0.0, 0.0, 0.0]
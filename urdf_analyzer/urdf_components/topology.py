@@ -0,0 +1,86 @@
+from dataclasses import dataclass
+import pandas as pd
+
+from urdf_analyzer.urdf_components.kinematics import KinematicTree
+from urdf_analyzer.urdf_standard import JointStandard
+
+# The topology of the kinematic tree formed by the links (nodes) and joints (edges) of a robot.
+#
+# The metrics are computed in a single pass over the links in breadth first order (KinematicTree.order), where each link
+# is visited after its parent link, such that the depth and serial chain length of a link are computed from its parent.
+# The metrics are therefore computed in O(links + joints). The kinematic chains are built from the parent of each leaf,
+# and their total length is the sum of the depths of the leaves.
+
+
+@dataclass
+class TopologyMetaInformation:
+
+    def __init__(self, joints: list, link_names: list[str]=None) -> None:
+        """
+        :param joints: the joints of the robot
+        :type joints: list[Joint]
+        :param link_names: the names of the links of the robot
+        :type link_names: list[str]
+
+        returns self, which contains:
+            - actuated_dof: the degrees of freedom of the joints in the tree, excluding the joints mimicking another joint
+            - tree_depth: the largest number of joints from a root link to a link
+            - n_leaves: the number of leaf links (end-effectors), i.e. links without child joints
+            - max_branching_factor, mean_branching_factor: the largest and mean number of child joints of the links with child joints
+            - longest_serial_chain: the largest number of consecutive joints without branching
+            - kinematic_chains: the links from the root link to each leaf link
+        """
+        tree = KinematicTree(joints, link_names)
+
+        depth = {}
+        serial_chain = {} # the number of joints of the serial chain ending at the link
+        self.actuated_dof = 0
+        n_children = []
+        leaves = []
+        for link in tree.order:
+            joint = tree.parent_joint.get(link)
+            if joint is None: # root link
+                depth[link] = 0
+                serial_chain[link] = 0
+            else:
+                depth[link] = depth[joint.parent] + 1
+                # the chain continues through the parent link, unless the parent link branches
+                parent_is_serial = len(tree.child_joints[joint.parent]) == 1
+                serial_chain[link] = serial_chain[joint.parent] + 1 if parent_is_serial else 1
+                if joint.mimic is None:
+                    self.actuated_dof += JointStandard.joint_type_dofs[joint.type]
+            children = tree.child_joints.get(link, [])
+            if len(children) > 0:
+                n_children.append(len(children))
+            else:
+                leaves.append(link)
+
+        self.tree_depth = max(depth.values()) if len(depth) > 0 else 0
+        self.n_leaves = len(leaves)
+        self.max_branching_factor = max(n_children) if len(n_children) > 0 else 0
+        self.mean_branching_factor = round(sum(n_children) / len(n_children), 6) if len(n_children) > 0 else 0.0
+        self.longest_serial_chain = max(serial_chain.values()) if len(serial_chain) > 0 else 0
+        self.kinematic_chains = [self._get_chain(tree, leaf) for leaf in leaves]
+
+        # Save results to pandas DataFrame
+        self.df_columns_short = ["actuated_dof", "tree_depth", "n_leaves"]
+        self.df_columns_full = self.df_columns_short + ["max_branching_factor", "mean_branching_factor", "longest_serial_chain", "kinematic_chains"]
+
+        self.df_results_full = pd.DataFrame(columns=self.df_columns_full)
+        self.df_results_full.loc[0, self.df_columns_full[0]] = self.actuated_dof
+        self.df_results_full.loc[0, self.df_columns_full[1]] = self.tree_depth
+        self.df_results_full.loc[0, self.df_columns_full[2]] = self.n_leaves
+        self.df_results_full.loc[0, self.df_columns_full[3]] = self.max_branching_factor
+        self.df_results_full.loc[0, self.df_columns_full[4]] = self.mean_branching_factor
+        self.df_results_full.loc[0, self.df_columns_full[5]] = self.longest_serial_chain
+        self.df_results_full.loc[0, self.df_columns_full[6]] = self.kinematic_chains
+
+        self.df_results = self.df_results_full[self.df_results_full.columns[0:len(self.df_columns_short)]]
+
+
+    @staticmethod
+    def _get_chain(tree: KinematicTree, leaf: str):
+        chain = [leaf]
+        while chain[-1] in tree.parent_joint:
+            chain.append(tree.parent_joint[chain[-1]].parent)
+        return chain[::-1]
@@ -3,13 +3,19 @@ import pandas as pd
 
 from urdf_analyzer.urdf_components.joint import JointsMetaInformation
 from urdf_analyzer.urdf_components.link import LinksMetaInformation
+from urdf_analyzer.urdf_components.dynamics import DynamicsMetaInformation
+from urdf_analyzer.urdf_components.collision import CollisionMetaInformation
+from urdf_analyzer.urdf_components.topology import TopologyMetaInformation
 
 @dataclass
 class URDFInformation:
 
-    def __init__(self, filename: str=None, joint_information: JointsMetaInformation=None, link_information: LinksMetaInformation=None):
+    def __init__(self, filename: str=None, joint_information: JointsMetaInformation=None, link_information: LinksMetaInformation=None, dynamics_information: DynamicsMetaInformation=None, collision_information: CollisionMetaInformation=None, topology_information: TopologyMetaInformation=None):
         self.joint_information = joint_information
         self.link_information = link_information
+        self.dynamics_information = dynamics_information
+        self.collision_information = collision_information
+        self.topology_information = topology_information
         self.filename = filename
         self.df_results = None
 
@@ -18,6 +24,9 @@ class URDFInformation:
         
         self._add_res_to_dataframe("joint_information", full_results)
         self._add_res_to_dataframe("link_information", full_results)
+        self._add_res_to_dataframe("dynamics_information", full_results)
+        self._add_res_to_dataframe("collision_information", full_results)
+        self._add_res_to_dataframe("topology_information", full_results)
         
         self.df_results = self.df_results.rename(index={0:self.filename})
 
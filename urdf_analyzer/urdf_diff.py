@@ -0,0 +1,236 @@
+import xml.etree.ElementTree as ET
+from dataclasses import dataclass
+from collections import Counter
+from logging import Logger
+import hashlib
+
+from urdf_analyzer.urdf_standard import LinkStandard
+
+
+# Describe how two URDF files differ, in terms of their links, joints and geometry (visual and collision) elements.
+#
+# Each element is given a content signature, which is a hash of its attributes and sub-elements, excluding its name.
+# The elements of the two files are then matched by name and by signature using hash joins (dictionaries), such that
+# the comparison runs in O(elements) instead of comparing each pair of elements:
+#   - same name, different signature -> modified
+#   - removed and added elements with the same signature -> renamed
+#   - otherwise -> removed or added
+# The links are compared first, such that the renamed links can be mapped in the joints (parent, child) and geometry elements,
+# i.e. renaming a link does not also report its joints and geometries as modified.
+
+
+@dataclass
+class ElementChange:
+
+    def __init__(self, change_type: str, element: str, name: str, new_name: str=None, details: list[str]=None):
+        """
+        A difference between an element of two URDF files.
+
+        :param change_type: the type of change, one of URDFDiff.change_types
+        :type change_type: str
+        :param element: the type of element, one of URDFDiff.element_types
+        :type element: str
+        :param name: the name of the element in the first file, or in the second file if the element was added
+        :type name: str
+        :param new_name: the name of the element in the second file, if the element was renamed
+        :type new_name: str
+        :param details: the attributes and sub-elements that differ, if the element was modified
+        :type details: list[str]
+        """
+        self.change_type = change_type
+        self.element = element
+        self.name = name
+        self.new_name = new_name
+        self.details = details if details is not None else []
+
+    @property
+    def description(self):
+        if self.change_type == "renamed":
+            return f"The {self.element} '{self.name}' was renamed to '{self.new_name}'."
+        if self.change_type == "modified":
+            return f"The {self.element} '{self.name}' was modified: {', '.join(self.details)}."
+        return f"The {self.element} '{self.name}' was {self.change_type}."
+
+
+def _normalise_value(value: str):
+    # numbers are compared by value, such that e.g. '0 0 0' and '0.0 0.0 0.0' are equal
+    tokens = value.split()
+    try:
+        return " ".join(f"{float(t):.9g}" for t in tokens)
+    except ValueError:
+        return " ".join(tokens)
+
+
+def _canonical(element: ET.Element, exclude: tuple=(), rename: dict=None):
+    """
+    A canonical text representation of an element, independent of the order of its attributes and sub-elements.
+    The attributes in exclude are left out, and the attribute values in rename are replaced, e.g. the names of renamed links.
+    """
+    attributes = []
+    for key in sorted(element.attrib):
+        if key in exclude:
+            continue
+        value = element.attrib[key]
+        if rename is not None and value in rename and key == "link":
+            value = rename[value]
+        attributes.append(f"{key}={_normalise_value(value)}")
+    children = sorted(_canonical(child, rename=rename) for child in element)
+    text = (element.text or "").strip()
+    return f"{element.tag}[{';'.join(attributes)}]{text}({','.join(children)})"
+
+
+def _signature(canonical: str):
+    return hashlib.blake2b(canonical.encode(), digest_size=16).digest()
+
+
+class URDFDiff:
+
+    change_types = ["added", "removed", "renamed", "modified"]
+    element_types = ["link", "joint"] + LinkStandard.visualisation_types
+
+    def __init__(self, logger: Logger):
+        self.logger = logger
+
+
+    def diff_files(self, filename_a: str, filename_b: str):
+        """
+        :return: the changes from the first to the second file, or None if one of the files could not be read
+        :rtype: list[ElementChange]
+        """
+        roots = []
+        for filename in [filename_a, filename_b]:
+            try:
+                roots.append(ET.parse(filename).getroot())
+            except (OSError, ET.ParseError) as e:
+                self.logger.error(f"Error while loading {filename} using the xml reader: {e}")
+                return None
+        return self.diff(*roots)
+
+
+    def diff(self, root_a: ET.Element, root_b: ET.Element):
+        """
+        Compare the links, joints and geometry elements of two URDFs.
+
+        :param root_a: the root (robot) element of the first URDF
+        :type root_a: ET.Element
+        :param root_b: the root (robot) element of the second URDF
+        :type root_b: ET.Element
+        :return: the changes from the first to the second URDF
+        :rtype: list[ElementChange]
+        """
+        changes = []
+        links_a = self._get_named_elements(root_a, "link")
+        links_b = self._get_named_elements(root_b, "link")
+        link_renames = self._join(changes, "link",
+                                  {n: _canonical(e, ("name",)) for n, e in links_a.items()},
+                                  {n: _canonical(e, ("name",)) for n, e in links_b.items()},
+                                  links_a, links_b)
+
+        for visualisation_type in LinkStandard.visualisation_types:
+            geometries_a = self._get_geometry_elements(links_a, visualisation_type, link_renames)
+            geometries_b = self._get_geometry_elements(links_b, visualisation_type, None)
+            self._join(changes, visualisation_type,
+                       {n: _canonical(e, ("name",)) for n, e in geometries_a.items()},
+                       {n: _canonical(e, ("name",)) for n, e in geometries_b.items()},
+                       geometries_a, geometries_b)
+
+        joints_a = self._get_named_elements(root_a, "joint")
+        joints_b = self._get_named_elements(root_b, "joint")
+        self._join(changes, "joint",
+                   {n: _canonical(e, ("name",), link_renames) for n, e in joints_a.items()},
+                   {n: _canonical(e, ("name",)) for n, e in joints_b.items()},
+                   joints_a, joints_b, link_renames)
+        return changes
+
+
+    def get_diff_information(self, filename_a: str, filename_b: str, changes: list[ElementChange]):
+        """
+        Summarise the changes between two URDF files in a dictionary, with the number of changes of each type and their descriptions.
+        """
+        information = {'filename_a': filename_a, 'filename_b': filename_b, 'identical': None, 'n_changes': None}
+        for element_type in self.element_types:
+            for change_type in self.change_types:
+                information[f"n_{element_type}s_{change_type}"] = None
+        information['changes'] = None
+        if changes is None: # one of the files could not be read
+            return information
+        information['identical'] = len(changes) == 0
+        information['n_changes'] = len(changes)
+        counts = Counter((c.element, c.change_type) for c in changes)
+        for element_type in self.element_types:
+            for change_type in self.change_types:
+                information[f"n_{element_type}s_{change_type}"] = counts[(element_type, change_type)]
+        information['changes'] = [c.description for c in changes]
+        return information
+
+
+    def _get_named_elements(self, root: ET.Element, tag: str):
+        elements = {}
+        for element in root.iterfind(tag):
+            name = element.attrib.get("name")
+            if name is not None and name not in elements:
+                elements[name] = element
+        return elements
+
+
+    def _get_geometry_elements(self, links: dict, visualisation_type: str, link_renames: dict):
+        # the geometry elements are named by their link (mapped to the new name if the link was renamed) and their index in the link
+        geometries = {}
+        for link_name, link in links.items():
+            if link_renames is not None:
+                link_name = link_renames.get(link_name, link_name)
+            for i, geometry in enumerate(link.iterfind(visualisation_type)):
+                geometries[f"{link_name}/{visualisation_type}[{i}]"] = geometry
+        return geometries
+
+
+    def _join(self, changes: list, element_type: str, canonicals_a: dict, canonicals_b: dict, elements_a: dict=None, elements_b: dict=None, rename_a: dict=None):
+        """
+        Match the elements of two URDFs by name and by signature, appending the changes.
+        The links only differing in their geometry elements are not reported as modified, as the geometry elements are compared separately.
+
+        :return: the renamed elements, old name -> new name
+        :rtype: dict[str, str]
+        """
+        signatures_a = {n: _signature(c) for n, c in canonicals_a.items()}
+        signatures_b = {n: _signature(c) for n, c in canonicals_b.items()}
+
+        for name, signature in signatures_a.items():
+            if name in signatures_b and signatures_b[name] != signature:
+                details = self._get_details(elements_a[name], elements_b[name], rename_a) if elements_a is not None else []
+                if len(details) == 0 and element_type == "link":
+                    continue
+                changes.append(ElementChange("modified", element_type, name, details=details if len(details) > 0 else ["content"]))
+
+        # the added elements by signature, such that the removed elements can be matched in constant time
+        added = {}
+        for name, signature in signatures_b.items():
+            if name not in signatures_a:
+                added.setdefault(signature, []).append(name)
+        renames = {}
+        for name, signature in signatures_a.items():
+            if name in signatures_b:
+                continue
+            if len(added.get(signature, [])) > 0:
+                renames[name] = added[signature].pop(0)
+                changes.append(ElementChange("renamed", element_type, name, new_name=renames[name]))
+            else:
+                changes.append(ElementChange("removed", element_type, name))
+        for names in added.values():
+            for name in names:
+                changes.append(ElementChange("added", element_type, name))
+        return renames
+
+
+    def _get_details(self, element_a: ET.Element, element_b: ET.Element, rename_a: dict=None):
+        """
+        The attributes and types of sub-elements that differ between two elements with the same name.
+        The geometry elements of links are compared separately, and are therefore not included.
+        """
+        details = [a for a in sorted(set(element_a.attrib) | set(element_b.attrib))
+                   if _normalise_value(element_a.attrib.get(a, "")) != _normalise_value(element_b.attrib.get(a, ""))]
+        skip = LinkStandard.visualisation_types if element_a.tag == "link" else []
+        children_a = Counter(_canonical(c, rename=rename_a) for c in element_a if c.tag not in skip)
+        children_b = Counter(_canonical(c) for c in element_b if c.tag not in skip)
+        tags = {c.split("[", 1)[0] for c in (children_a - children_b) + (children_b - children_a)}
+        return details + sorted(tags)
@@ -0,0 +1,139 @@
+import xml.etree.ElementTree as ET
+from logging import Logger
+from pathlib import Path
+import hashlib
+import json
+import os
+
+from urdf_analyzer.mesh_analysis import resolve_mesh_filename
+from urdf_analyzer.constants import DEFAULT_NORMALIZATION_CACHE_DIR
+
+
+# The normalisation of URDF files to a canonical form, which is cheaper to parse by the URDF parsers:
+# - comments, processing instructions and the whitespace between the elements are removed (minified),
+# - the attributes of each element are sorted by name,
+# - the numbers of the numeric attributes (e.g. xyz, rpy, mass value, limits) are written in their shortest form,
+#   e.g. '0.000000' as '0' and '1.50' as '1.5',
+# - the mesh filenames (relative, 'file://' and 'package://') are resolved to absolute paths, such that the canonical file can be
+#   parsed from any directory and the parsers do not need to locate the packages.
+#
+# The canonical files are cached on disk by the hash of the content and the directory of the URDF file, and of the ROS_PACKAGE_PATH,
+# as the mesh filenames are resolved relative to them. A canonical file of which some mesh filenames could not be resolved is only
+# provisional: it is written next to the cache entries but never returned from the cache, such that the URDF file is normalised
+# again once the missing meshes exist.
+
+URDF_NORMALIZER_VERSION = 1
+
+NUMERIC_ATTRIBUTES = ["xyz", "rpy", "size", "radius", "length", "scale", "value", "rgba", "lower", "upper", "effort", "velocity",
+                      "damping", "friction", "multiplier", "offset", "soft_lower_limit", "soft_upper_limit", "k_position", "k_velocity",
+                      "rising", "falling", "ixx", "ixy", "ixz", "iyy", "iyz", "izz"]
+
+
+def _normalize_number(token: str):
+    number = float(token)
+    if number == 0: # also -0
+        return "0"
+    if number.is_integer() and abs(number) < 1e15:
+        return str(int(number))
+    return repr(number)
+
+
+def _normalize_numbers(value: str):
+    """
+    :return: the whitespace separated numbers of the value in their shortest form, or the value if it does not only contain numbers
+    :rtype: str
+    """
+    try:
+        return " ".join(_normalize_number(token) for token in value.split())
+    except ValueError:
+        return value
+
+
+class URDFNormalizer:
+
+    def __init__(self, logger: Logger):
+        self.logger = logger
+        self.n_unresolved_meshes = 0
+
+
+    def normalize(self, root: ET.Element, urdf_root_dir: str):
+        """
+        Normalise the URDF tree in place.
+
+        :param root: the robot element of the URDF file
+        :type root: ET.Element
+        :param urdf_root_dir: the directory of the URDF file, which the mesh filenames are resolved relative to
+        :type urdf_root_dir: str
+        :return: the normalised robot element
+        :rtype: ET.Element
+        """
+        self.n_unresolved_meshes = 0
+        for element in root.iter():
+            element.text = element.text.strip() if element.text is not None and element.text.strip() != "" else None
+            element.tail = None
+            attributes = dict(element.attrib)
+            for name in NUMERIC_ATTRIBUTES:
+                if name in attributes:
+                    attributes[name] = _normalize_numbers(attributes[name])
+            if element.tag == "mesh" and "filename" in attributes:
+                mesh_file = resolve_mesh_filename(attributes["filename"], urdf_root_dir)
+                if mesh_file is None:
+                    # kept as is, such that the parsers report the missing mesh as for the original file
+                    self.n_unresolved_meshes += 1
+                else:
+                    attributes["filename"] = os.path.abspath(mesh_file)
+            element.attrib.clear()
+            element.attrib.update(sorted(attributes.items()))
+        return root
+
+
+def _get_cache_key(filename: str):
+    with open(filename, "rb") as f:
+        content = f.read()
+    key = hashlib.sha256(content)
+    key.update(json.dumps({"urdf_root_dir": os.path.dirname(os.path.abspath(filename)), "ros_package_path": os.environ.get("ROS_PACKAGE_PATH", ""),
+                           "version": URDF_NORMALIZER_VERSION}, sort_keys=True).encode())
+    return key.hexdigest()
+
+
+def normalize_urdf_file(filename: str, logger: Logger, cache_dir: str=DEFAULT_NORMALIZATION_CACHE_DIR):
+    """
+    Normalise a URDF file to its canonical form, which is stored in the cache directory.
+    If the URDF file has already been normalised, the cached canonical file is returned, unless some of its meshes could not be resolved.
+
+    :param filename: the URDF file
+    :type filename: str
+    :param cache_dir: the directory of the canonical URDF files
+    :type cache_dir: str
+    :return: the canonical URDF file, or None if the URDF file could not be read
+    :rtype: str
+    """
+    try:
+        key = _get_cache_key(filename)
+    except OSError as e:
+        logger.error(f"Error while reading the urdf file {filename}: {e}")
+        return None
+    stem = os.path.basename(str(filename)).split(".")[0]
+    normalized_file = os.path.join(cache_dir, f"{stem}-{key[:16]}.urdf")
+    if Path(normalized_file).exists():
+        return normalized_file
+
+    try:
+        root = ET.parse(filename).getroot()
+    except ET.ParseError as e:
+        logger.error(f"Error while normalising the urdf file {filename}: {e}")
+        return None
+    normalizer = URDFNormalizer(logger)
+    normalizer.normalize(root, os.path.dirname(os.path.abspath(filename)))
+    if normalizer.n_unresolved_meshes > 0:
+        logger.info(f"{normalizer.n_unresolved_meshes} mesh files of {filename} could not be resolved, their filenames are kept as is.")
+        # not cached, as the meshes may be created or their package added to the ROS_PACKAGE_PATH later
+        normalized_file = os.path.join(cache_dir, f"{stem}-{key[:16]}.provisional.urdf")
+
+    if not Path(cache_dir).exists():
+        os.makedirs(cache_dir, exist_ok=True)
+    # write to a temporary file and replace, as multiple processes may normalise the same file
+    tmp_file = normalized_file + f".{os.getpid()}.tmp"
+    ET.ElementTree(root).write(tmp_file, encoding="utf-8", xml_declaration=True)
+    os.replace(tmp_file, normalized_file)
+    return normalized_file
@@ -1,8 +1,10 @@
 from logging import Logger
 from pathlib import Path
-import subprocess
+import functools
 import os
 
+from urdf_analyzer.check_urdf_runner import run_check_urdf, run_check_urdfs
+
 import matlab.engine
 eng = matlab.engine.start_matlab()
 
@@ -10,15 +12,41 @@ eng = matlab.engine.start_matlab()
 class URDFparser:
 
     supported_parsers = ['yourdfpy','urdfpy','pybullet','roboticstoolbox','matlab','check_urdf'] 
+    parse_modes = ['full', 'structure']
+
+    # the arguments of the parsers that skip loading the meshes and building the scene graph, for parsers supporting it
+    structure_only_arguments = {'yourdfpy': {'build_scene_graph': False, 'build_collision_scene_graph': False, 'load_meshes': False, 'load_collision_meshes': False},
+                                'urdfpy': {'lazy_load_meshes': True}}
+    # the parsers that never load the meshes
+    structure_only_parsers = ['check_urdf']
 
 
+    @classmethod
+    def get_parse_mode(cls, parser: str, structure_only: bool=False):
+        """
+        :return: the mode in which the parser loads the URDF files, one of parse_modes
+        :rtype: str
+        """
+        if parser in cls.structure_only_parsers or (structure_only and parser in cls.structure_only_arguments):
+            return cls.parse_modes[1]
+        return cls.parse_modes[0]
+
     def _set_default_parser(self):
         default_parser = self.supported_parsers[0]
         import yourdfpy
         self.parser[default_parser] = yourdfpy
 
-    def __init__(self, parser: str, logger: Logger):
+    def __init__(self, parser: str, logger: Logger, structure_only: bool=False):
+        """
+        :param structure_only: if True, the parser skips loading the meshes and building the scene graph, if it supports it.
+            The mode that is used is stored in parse_mode.
+        :type structure_only: bool
+        """
         self.logger = logger
+        self.structure_only = structure_only
+        self.parse_mode = self.get_parse_mode(parser, structure_only)
+        if structure_only and self.parse_mode != self.parse_modes[1]:
+            self.logger.info(f"The parser '{parser}' does not support skipping the meshes. Parsing in '{self.parse_mode}' mode.")
         assert len(self.supported_parsers) == len(set(self.supported_parsers)), f"The list of parsers ({self.supported_parsers}) contains duplicates. Each parser should be unique." # should mathematically be a set, as we do not want duplicates
         if parser not in self.supported_parsers:
             self.logger.error(f"The chosen parser '{parser}' is not currently supported. Please choose a parser that is supported from: '{self.supported_parsers}'")
@@ -46,7 +74,7 @@ class URDFparser:
 
         elif parser == 'pybullet':
             import pybullet
-            pybullet.connect(pybullet.DIRECT)
+            self.physics_client = pybullet.connect(pybullet.DIRECT)
             self.parser[parser] = pybullet
 
         self._set_urdf_loader()
@@ -56,12 +84,13 @@ class URDFparser:
     # programmed as a function instead of just defining in a dictionary with the supported_parser, since some parsers may require multiple steps for parsing urdf files
     def _set_urdf_loader(self):
         parser = list(self.parser.keys())[0]
+        loader_arguments = self.structure_only_arguments.get(parser, {}) if self.parse_mode == self.parse_modes[1] else {}
         # yourdfpy
         if 'yourdfpy' == parser:
-            self.urdf_loader = self.parser[parser].URDF.load
+            self.urdf_loader = functools.partial(self.parser[parser].URDF.load, **loader_arguments)
         # urdfpy
         elif 'urdfpy' == parser:
-            self.urdf_loader = self.parser[parser].URDF.load
+            self.urdf_loader = functools.partial(self.parser[parser].URDF.load, **loader_arguments)
         # roboticstoolbox
         elif 'roboticstoolbox' == parser:
             self.urdf_loader = self.parser[parser].ERobot.URDF
@@ -71,17 +100,18 @@ class URDFparser:
         # urdfdom check_urdf
         elif 'check_urdf' == parser:
             def check_urdf(filename):
-                res = subprocess.run(f'check_urdf {filename}', shell=True, capture_output=True, text=True)
-                if res.returncode == 0: # success
-                    return res.stdout
+                self.check_urdf_result = run_check_urdf(filename)
+                if self.check_urdf_result.passed:
+                    return self.check_urdf_result.stdout
                 else:
+                    self.logger.info(f"check_urdf failed for {filename}: {self.check_urdf_result.stderr.strip()}")
                     return None
             self.urdf_loader = lambda filename : check_urdf(filename)
         # pybullet
         elif 'pybullet' == parser:
             def parse_urdf(filename):
                 try:
-                    res = self.parser[parser].loadURDF(filename)
+                    res = self.parser[parser].loadURDF(filename, physicsClientId=self.physics_client)
                     return res
                 except:
                     return None
@@ -90,19 +120,62 @@ class URDFparser:
 
     
     def load_urdf(self, filename: str, urdf_root_dir: str=None):
-        root_dir = os.getcwd()
         basename = os.path.abspath(filename)
         if urdf_root_dir is None:
             urdf_root_dir = os.path.dirname(basename)
+        # the file is loaded by its absolute path rather than changing the working directory, which is shared by the threads of the process
+        urdf_root_dir = os.path.abspath(urdf_root_dir)
         filename_only = os.path.basename(basename)
         try:
-            os.chdir(urdf_root_dir)
-            self.logger.info(f"Trying to load urdf file: {urdf_root_dir}/{filename_only}")
+            self.logger.debug(f"Trying to load urdf file: {urdf_root_dir}/{filename_only}")
             model = self.urdf_loader(str(Path(urdf_root_dir,filename_only)))
-            self.logger.info(f"Successfully loaded {urdf_root_dir}/{filename_only} using the urdf loader {list(self.parser.keys())[0]}")
+            self.logger.debug(f"Successfully loaded {urdf_root_dir}/{filename_only} using the urdf loader {list(self.parser.keys())[0]}")
         except:
             self.logger.warning(f"Failed to load {urdf_root_dir}/{filename_only}")
             model = None
             pass
-        os.chdir(root_dir)
-        return model
\ No newline at end of file
+        return model
+
+
+    def reset(self):
+        """
+        Reset the state of the parser between files, such that the same parser can be reused for many files.
+        """
+        parser = list(self.parser.keys())[0]
+        if parser == 'pybullet':
+            # remove the bodies of the previously loaded files from the simulation
+            self.parser[parser].resetSimulation(physicsClientId=self.physics_client)
+        elif parser == 'check_urdf':
+            self.check_urdf_result = None
+
+
+    def load_many(self, filenames: list, urdf_root_dir: str=None):
+        """
+        Load many URDF files with the same parser instance, resetting its state between the files.
+        The check_urdf parser checks all of the files concurrently before yielding the results.
+
+        :param filenames: the URDF files to load
+        :type filenames: list[str]
+        :param urdf_root_dir: the root directory of the URDF files. If not provided, the directory of each file is used.
+        :type urdf_root_dir: str
+        :return: a generator of (filename, model), where model is None if the file could not be loaded
+        :rtype: Generator[tuple[str, object]]
+        """
+        parser = list(self.parser.keys())[0]
+        if parser == 'check_urdf':
+            paths = [Path(urdf_root_dir, os.path.basename(f)) if urdf_root_dir is not None else Path(os.path.abspath(f)) for f in filenames]
+            for filename, result in zip(filenames, run_check_urdfs(paths)):
+                self.check_urdf_result = result
+                if not result.passed:
+                    self.logger.info(f"check_urdf failed for {filename}: {result.stderr.strip()}")
+                yield filename, result.stdout if result.passed else None
+            return
+        for filename in filenames:
+            self.reset()
+            yield filename, self.load_urdf(filename, urdf_root_dir)
+
+
+    def close(self):
+        parser = list(self.parser.keys())[0]
+        if parser == 'pybullet':
+            self.parser[parser].disconnect(physicsClientId=self.physics_client)
\ No newline at end of file
@@ -16,6 +16,14 @@ class JointStandard:
     assert len(joint_types) == len(joint_type_explanations), f"The length of the joints types ({len(joint_types)}) is not the same as the length of the joint type explanations ({len(joint_type_explanations)}). There is an error in the implemented standard of the joints."
     for i in range(len(joint_types)):
         joint_types_and_explanations[joint_types[i]] = joint_type_explanations[i]
+    required_attributes = ['name', 'type']
+    required_elements = {'parent': ['link'], 'child': ['link']} # the required elements and their required attributes
+    limit_required_joint_types = ['revolute', 'prismatic']
+    limit_required_attributes = ['effort', 'velocity']
+    limit_attributes = ['lower', 'upper', 'effort', 'velocity']
+    dynamics_attributes = ['damping', 'friction']
+    # the degrees of freedom of each joint type, where the planar joint moves in the plane (x, y) and rotates around its axis
+    joint_type_dofs = {'revolute': 1, 'prismatic': 1, 'continuous': 1, 'fixed': 0, 'floating': 6, 'planar': 3}
 
 
 
@@ -25,6 +33,8 @@ class JointStandard:
 class LinkStandard:
     visualisation_types = ["visual", "collision"]
     geometry_types = ["mesh", "sphere", "cylinder", "box"]
+    required_attributes = ['name']
+    inertia_attributes = ['ixx', 'ixy', 'ixz', 'iyy', 'iyz', 'izz']
     geometries_arguments = {geometry_types[0]: {'required': ['filename'], 'optional': ['scale']},
                             geometry_types[1]: {'required': ['radius'], 'optional': []},
                             geometry_types[2]: {'required': ['radius', 'length'], 'optional': []},
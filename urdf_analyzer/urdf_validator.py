@@ -1,10 +1,336 @@
+import xml.etree.ElementTree as ET
+from dataclasses import dataclass
+from logging import Logger
+import pandas as pd
+import time
 
+from urdf_analyzer.urdf_standard import JointStandard, LinkStandard
 
 
 # Check the joints and see if they fulfill the requirements described in: http://wiki.ros.org/urdf/XML/joint
 # Check the links and see if they fulfill the requirements described in: http://wiki.ros.org/urdf/XML/link
-# Do the same for some of the other elements: http://wiki.ros.org/urdf/XML
+# Check that the links and joints form a kinematic tree, i.e. a single root link, no cycles and no orphan links
+#
+# The checks are implemented as rules, which subscribe to the types of the elements of the robot (e.g. 'link', 'joint').
+# The validator visits each element once, and passes it to the rules subscribed to its type, such that all of the checks
+# are done in a single traversal. The validation runs in O(links + joints).
 
-# Consider using different parsers as part of the validation of the URDF file
+# TODO: Do the same for some of the other elements: http://wiki.ros.org/urdf/XML
+# TODO: Consider using different parsers as part of the validation of the URDF file
 
-# Need to generate errors where they are found, and if possible reason for the error
+
+@dataclass
+class ValidationIssue:
+
+    def __init__(self, issue_type: str, element: str, name: str, message: str, rule: str=None):
+        """
+        An issue found while validating a URDF file.
+
+        :param issue_type: the type of issue, one of URDFValidator.issue_types
+        :type issue_type: str
+        :param element: the type of element containing the issue, e.g. 'joint' or 'link'
+        :type element: str
+        :param name: the name of the element containing the issue
+        :type name: str
+        :param message: a description of the issue
+        :type message: str
+        :param rule: the name of the rule that found the issue
+        :type rule: str
+        """
+        self.issue_type = issue_type
+        self.element = element
+        self.name = name
+        self.message = message
+        self.rule = rule
+
+
+registered_rules = {}
+
+def register_rule(rule_class):
+    """
+    Register a ValidationRule, such that it can be selected by its name in the URDFValidator.
+    """
+    assert rule_class.name not in registered_rules, f"A validation rule with the name '{rule_class.name}' is already registered."
+    registered_rules[rule_class.name] = rule_class
+    return rule_class
+
+
+class ValidationRule:
+
+    name = None
+    description = None
+    element_types = [] # the types of elements of the robot that the rule is visiting
+
+    def start(self):
+        """
+        Called before the elements of a URDF are visited.
+        """
+        pass
+
+    def visit(self, element: ET.Element, issues: list):
+        """
+        Called for each element of the URDF with a type in element_types.
+        """
+        pass
+
+    def finish(self, issues: list):
+        """
+        Called after all of the elements of a URDF have been visited.
+        """
+        pass
+
+    def _issue(self, issue_type: str, element: str, name: str, message: str):
+        return ValidationIssue(issue_type, element, name, message, self.name)
+
+    def _check_required_attributes(self, element: ET.Element, required_attributes: list, element_type: str, name: str, issues: list):
+        missing = [a for a in required_attributes if a not in element.attrib]
+        for attribute in missing:
+            issues.append(self._issue('missing_attribute', element_type, name, f"The {element.tag} element of the {element_type} '{name}' is missing the required attribute '{attribute}'."))
+        return len(missing) == 0
+
+
+@register_rule
+class LinkStandardRule(ValidationRule):
+
+    name = "link-standard"
+    description = "The links have a name, and their visual and collision geometries have the required arguments of LinkStandard."
+    element_types = ["link"]
+
+    def visit(self, link: ET.Element, issues: list):
+        if not self._check_required_attributes(link, LinkStandard.required_attributes, 'link', None, issues):
+            return
+        name = link.attrib['name']
+        for visualisation_type in LinkStandard.visualisation_types:
+            for visualisation in link.iterfind(visualisation_type):
+                geometry = visualisation.find('geometry')
+                if geometry is None:
+                    issues.append(self._issue('missing_element', 'link', name, f"The {visualisation_type} element of the link '{name}' is missing the geometry element."))
+                    continue
+                shapes = [g for g in geometry if g.tag in LinkStandard.geometry_types]
+                if len(shapes) == 0:
+                    issues.append(self._issue('missing_element', 'link', name, f"The {visualisation_type} geometry of the link '{name}' does not contain any of the geometry types {LinkStandard.geometry_types}."))
+                for shape in shapes:
+                    self._check_required_attributes(shape, LinkStandard.geometries_arguments[shape.tag]['required'], 'link', name, issues)
+
+
+@register_rule
+class JointStandardRule(ValidationRule):
+
+    name = "joint-standard"
+    description = "The joints have the required attributes and elements of JointStandard, and a type from the standard."
+    element_types = ["joint"]
+
+    def visit(self, joint: ET.Element, issues: list):
+        name = joint.attrib.get('name')
+        self._check_required_attributes(joint, JointStandard.required_attributes, 'joint', name, issues)
+        joint_type = joint.attrib.get('type')
+        if joint_type is not None and joint_type not in JointStandard.joint_types:
+            issues.append(self._issue('invalid_joint_type', 'joint', name, f"The type '{joint_type}' of the joint '{name}' is not one of the joint types {JointStandard.joint_types}."))
+
+        for element, required_attributes in JointStandard.required_elements.items():
+            sub_element = joint.find(element)
+            if sub_element is None:
+                issues.append(self._issue('missing_element', 'joint', name, f"The joint '{name}' is missing the required element '{element}'."))
+            else:
+                self._check_required_attributes(sub_element, required_attributes, 'joint', name, issues)
+
+        if joint_type in JointStandard.limit_required_joint_types:
+            limit = joint.find('limit')
+            if limit is None:
+                issues.append(self._issue('missing_element', 'joint', name, f"The {joint_type} joint '{name}' is missing the required element 'limit'."))
+            else:
+                self._check_required_attributes(limit, JointStandard.limit_required_attributes, 'joint', name, issues)
+
+
+@register_rule
+class UniqueNamesRule(ValidationRule):
+
+    name = "unique-names"
+    description = "The names of the links, and the names of the joints, are unique."
+    element_types = ["link", "joint"]
+
+    def start(self):
+        self.names = {"link": set(), "joint": set()}
+
+    def visit(self, element: ET.Element, issues: list):
+        name = element.attrib.get('name')
+        if name is None:
+            return
+        if name in self.names[element.tag]:
+            issues.append(self._issue('duplicate_name', element.tag, name, f"The {element.tag} name '{name}' is used by multiple {element.tag}s."))
+        self.names[element.tag].add(name)
+
+
+@register_rule
+class KinematicTreeRule(ValidationRule):
+
+    name = "kinematic-tree"
+    description = "The joints reference existing links, and the links and joints form a single tree without cycles or orphan links."
+    element_types = ["link", "joint"]
+
+    def start(self):
+        self.links = set()
+        self.parent_of = {} # child link -> (parent link, joint)
+        self.links_in_joints = set()
+
+    def visit(self, element: ET.Element, issues: list):
+        if element.tag == "link":
+            if 'name' in element.attrib:
+                self.links.add(element.attrib['name'])
+            return
+        name = element.attrib.get('name')
+        parent = element.find('parent')
+        child = element.find('child')
+        if parent is None or child is None or 'link' not in parent.attrib or 'link' not in child.attrib:
+            return
+        parent, child = parent.attrib['link'], child.attrib['link']
+        self.links_in_joints.add(parent)
+        self.links_in_joints.add(child)
+        if child in self.parent_of:
+            issues.append(self._issue('multiple_parents', 'joint', name, f"The link '{child}' is the child of both joint '{self.parent_of[child][1]}' and joint '{name}'."))
+            return
+        self.parent_of[child] = (parent, name)
+
+    def finish(self, issues: list):
+        links = self.links
+        parent_of = self.parent_of
+        for child, (parent, joint) in list(parent_of.items()):
+            for link in [parent, child]:
+                if link not in links:
+                    issues.append(self._issue('unknown_link', 'joint', joint, f"The joint '{joint}' references the link '{link}', which does not exist."))
+            if child not in links:
+                del parent_of[child]
+        if len(links) == 0:
+            return
+
+        # walk from each link towards the root, marking the links on the current path, such that each link is only walked once
+        state = {} # link -> 1 if on the current path, 2 if done
+        for link in links:
+            path = []
+            current = link
+            while current is not None and current not in state:
+                state[current] = 1
+                path.append(current)
+                current = parent_of[current][0] if current in parent_of else None
+            if current is not None and state[current] == 1:
+                cycle = path[path.index(current):]
+                issues.append(self._issue('cycle', 'joint', parent_of[current][1], f"The links {cycle} form a cycle."))
+            for p in path:
+                state[p] = 2
+
+        if len(links) == 1:
+            return
+        roots = [l for l in links if l not in parent_of and l in self.links_in_joints]
+        orphans = [l for l in links if l not in self.links_in_joints]
+        for orphan in sorted(orphans):
+            issues.append(self._issue('orphan_link', 'link', orphan, f"The link '{orphan}' is not connected to any joint."))
+        if len(roots) == 0 and len(orphans) == 0:
+            issues.append(self._issue('no_root', 'link', None, "There is no root link, as every link is the child of a joint."))
+        elif len(roots) > 1:
+            issues.append(self._issue('multiple_roots', 'link', None, f"There are multiple root links: {sorted(roots)}."))
+
+
+class URDFValidator:
+
+    issue_types = ['missing_attribute', 'missing_element', 'invalid_joint_type', 'duplicate_name', 'unknown_link',
+                   'multiple_parents', 'cycle', 'no_root', 'multiple_roots', 'orphan_link']
+
+    def __init__(self, logger: Logger, rules: list[str]=None):
+        """
+        :param rules: the names of the registered rules to validate with. By default all of the registered rules are used.
+        :type rules: list[str]
+        :raises ValueError: if one of the rules is not registered
+        """
+        self.logger = logger
+        if rules is None:
+            rules = list(registered_rules.keys())
+        unknown_rules = [r for r in rules if r not in registered_rules]
+        if len(unknown_rules) > 0:
+            raise ValueError(f"The validation rules {unknown_rules} are not registered. The registered rules are: {list(registered_rules.keys())}")
+        self.rules = [registered_rules[r]() for r in rules]
+
+        # the rules subscribed to each element type
+        self.subscribers = {}
+        for rule in self.rules:
+            for element_type in rule.element_types:
+                self.subscribers.setdefault(element_type, []).append(rule)
+
+        # the execution time (in nanoseconds), number of visited elements and issues found by each rule
+        self.rule_time = {r.name: 0 for r in self.rules}
+        self.rule_hits = {r.name: 0 for r in self.rules}
+        self.rule_issues = {r.name: 0 for r in self.rules}
+
+
+    def validate_file(self, filename: str):
+        try:
+            root = ET.parse(filename).getroot()
+        except (OSError, ET.ParseError) as e:
+            self.logger.error(f"Error while loading {filename} using the xml reader: {e}")
+            return None
+        return self.validate(root)
+
+
+    def validate(self, root: ET.Element):
+        """
+        Validate the elements of a URDF in a single traversal of the elements of the robot.
+
+        :param root: the root (robot) element of the URDF
+        :type root: ET.Element
+        :return: the issues found
+        :rtype: list[ValidationIssue]
+        """
+        issues = []
+        clock = time.perf_counter_ns
+        for rule in self.rules:
+            start = clock()
+            rule.start()
+            self.rule_time[rule.name] += clock() - start
+
+        for element in root:
+            rules = self.subscribers.get(element.tag)
+            if rules is None:
+                continue
+            for rule in rules:
+                start = clock()
+                rule.visit(element, issues)
+                self.rule_time[rule.name] += clock() - start
+                self.rule_hits[rule.name] += 1
+
+        for rule in self.rules:
+            start = clock()
+            rule.finish(issues)
+            self.rule_time[rule.name] += clock() - start
+
+        for issue in issues:
+            self.rule_issues[issue.rule] += 1
+        return issues
+
+
+    def get_rule_statistics(self):
+        """
+        The execution time, number of visited elements (hits) and number of issues found by each rule, accumulated over the validated files.
+
+        :rtype: pd.DataFrame
+        """
+        return pd.DataFrame({'rule': [r.name for r in self.rules],
+                             'time_s': [self.rule_time[r.name] / 1e9 for r in self.rules],
+                             'hits': [self.rule_hits[r.name] for r in self.rules],
+                             'n_issues': [self.rule_issues[r.name] for r in self.rules]})
+
+
+    def get_issues_information(self, filename: str, issues: list[ValidationIssue]):
+        """
+        Summarise the issues of a URDF file in a dictionary, with the number of issues of each type and the issue messages.
+        """
+        information = {'filename': filename, 'valid': None, 'n_issues': None}
+        for issue_type in self.issue_types:
+            information[f"n_{issue_type}"] = None
+        information['issues'] = None
+        if issues is None: # the file could not be read
+            return information
+        information['valid'] = len(issues) == 0
+        information['n_issues'] = len(issues)
+        for issue_type in self.issue_types:
+            information[f"n_{issue_type}"] = len([i for i in issues if i.issue_type == issue_type])
+        information['issues'] = [i.message for i in issues]
+        return information
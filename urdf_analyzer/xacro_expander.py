@@ -0,0 +1,434 @@
+import xml.etree.ElementTree as ET
+from logging import Logger
+from pathlib import Path
+import hashlib
+import json
+import math
+import os
+import re
+
+from urdf_analyzer.constants import DEFAULT_XACRO_CACHE_DIR
+
+
+# An in-process expansion of xacro files to URDF, supporting the commonly used subset of xacro:
+# properties (also blocks), args, macros (with default, block and multi-block parameters), includes, if/unless,
+# insert_block, element, attribute, ${...} expressions and the $(arg), $(find), $(env), $(optenv), $(dirname) substitutions.
+#
+# Parsed include files and the macro definitions in them are cached for the lifetime of the process,
+# as many robots include the same macro libraries. The expanded URDF files are cached on disk by the hash of the input.
+
+XACRO_NAMESPACES = ["http://www.ros.org/wiki/xacro", "http://ros.org/wiki/xacro"]
+XACRO_EXPANDER_VERSION = 1
+
+_parsed_files = {} # path -> (mtime_ns, size, root element)
+_macro_definitions = {} # macro element -> XacroMacro
+_package_paths = {} # (package name, search start directory) -> package directory
+
+_expression_pattern = re.compile(r"\$\{([^{}]*)\}")
+_substitution_pattern = re.compile(r"\$\(([^()]*)\)")
+
+_expression_functions = {name: getattr(math, name) for name in ["sin", "cos", "tan", "asin", "acos", "atan", "atan2", "sqrt", "radians", "degrees", "floor", "ceil", "fabs", "pow", "exp", "log", "hypot"]}
+_expression_functions.update({"pi": math.pi, "e": math.e, "abs": abs, "min": min, "max": max, "int": int, "float": float, "round": round,
+                              "str": str, "len": len, "bool": bool, "True": True, "False": False, "None": None, "true": True, "false": False})
+
+
+class XacroError(Exception):
+    pass
+
+
+def _is_xacro_tag(tag):
+    if not isinstance(tag, str) or not tag.startswith("{"):
+        return False
+    return tag[1:].split("}")[0] in XACRO_NAMESPACES
+
+def _local_name(tag):
+    return tag.split("}")[-1]
+
+def _to_value(text):
+    if not isinstance(text, str):
+        return text
+    for convert in (int, float):
+        try:
+            return convert(text)
+        except ValueError:
+            pass
+    return text
+
+def _to_bool(value):
+    if isinstance(value, str):
+        if value.strip().lower() in ["true", "1"]:
+            return True
+        if value.strip().lower() in ["false", "0", ""]:
+            return False
+        raise XacroError(f"The value '{value}' can not be interpreted as a boolean.")
+    return bool(value)
+
+
+def _parse_cached(filename: str):
+    path = os.path.abspath(filename)
+    stat = os.stat(path)
+    cached = _parsed_files.get(path)
+    if cached is not None and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+        return cached[2]
+    root = ET.parse(path).getroot()
+    _parsed_files[path] = (stat.st_mtime_ns, stat.st_size, root)
+    return root
+
+
+class XacroMacro:
+
+    def __init__(self, element: ET.Element):
+        """
+        A macro definition, with the parameters parsed from the 'params' attribute, e.g. params="name *origin **content length:=1 color:=^|red"
+        """
+        self.name = element.attrib["name"]
+        self.body = element
+        self.params = [] # list of (name, kind, default), kind is 'value', 'block' or 'multiblock'
+        for param in element.attrib.get("params", "").split():
+            if param.startswith("**"):
+                self.params.append((param[2:], "multiblock", None))
+            elif param.startswith("*"):
+                self.params.append((param[1:], "block", None))
+            elif ":=" in param:
+                name, default = param.split(":=", 1)
+                self.params.append((name, "value", default))
+            elif "=" in param:
+                name, default = param.split("=", 1)
+                self.params.append((name, "value", default))
+            else:
+                self.params.append((param, "value", None))
+
+
+def _get_macro_definition(element: ET.Element):
+    macro = _macro_definitions.get(element)
+    if macro is None:
+        macro = XacroMacro(element)
+        _macro_definitions[element] = macro
+    return macro
+
+
+class _LazyProperty:
+
+    def __init__(self, text: str, scope):
+        self.text = text
+        self.scope = scope
+        self.evaluating = False
+        self.evaluated = False
+        self.value = None
+
+
+class _Scope:
+
+    def __init__(self, parent=None):
+        self.parent = parent
+        self.properties = {}
+        self.macros = {}
+
+    def find(self, name, attribute):
+        scope = self
+        while scope is not None:
+            symbols = getattr(scope, attribute)
+            if name in symbols:
+                return symbols[name]
+            scope = scope.parent
+        raise KeyError(name)
+
+
+class _ExpressionNamespace(dict):
+
+    def __init__(self, expander, scope):
+        super().__init__()
+        self.expander = expander
+        self.scope = scope
+
+    def __missing__(self, name):
+        try:
+            return self.expander._get_property(name, self.scope)
+        except KeyError:
+            if name in _expression_functions:
+                return _expression_functions[name]
+            raise NameError(f"The property '{name}' is not defined.")
+
+
+class XacroExpander:
+
+    def __init__(self, logger: Logger, args: dict=None, package_paths: dict=None):
+        """
+        :param args: values of the xacro arguments, overriding the defaults in the xacro files
+        :type args: dict
+        :param package_paths: directories of ROS packages used to resolve $(find package), e.g. {"kinova_description": "/path/to/kinova_description"}
+        :type package_paths: dict
+        """
+        self.logger = logger
+        self.args = dict(args) if args is not None else {}
+        self.package_paths = dict(package_paths) if package_paths is not None else {}
+        self.includes = []
+
+
+    def expand_file(self, filename: str):
+        """
+        Expand a xacro file.
+
+        :return: the expanded URDF root element
+        :rtype: ET.Element
+        """
+        self.includes = []
+        root = _parse_cached(filename)
+        scope = _Scope()
+        expanded_root = ET.Element(root.tag, {k: v for k, v in root.attrib.items() if not _is_xacro_tag(k)})
+        self._expand_children(root, expanded_root, scope, os.path.dirname(os.path.abspath(filename)))
+        return expanded_root
+
+
+    ### START ### Expressions ######
+
+    def _get_property(self, name, scope):
+        prop = scope.find(name, "properties")
+        if not isinstance(prop, _LazyProperty):
+            return prop
+        if not prop.evaluated:
+            if prop.evaluating:
+                raise XacroError(f"The property '{name}' is defined recursively.")
+            prop.evaluating = True
+            prop.value = _to_value(self._eval_text(prop.text, prop.scope[0], prop.scope[1]))
+            prop.evaluating = False
+            prop.evaluated = True
+        return prop.value
+
+    def _substitute(self, substitution, base_dir):
+        command, *arguments = substitution.split()
+        if command == "arg":
+            if arguments[0] not in self.args:
+                raise XacroError(f"The argument '{arguments[0]}' is not defined.")
+            return str(self.args[arguments[0]])
+        if command == "find":
+            return self._find_package(arguments[0], base_dir)
+        if command == "env":
+            if arguments[0] not in os.environ:
+                raise XacroError(f"The environment variable '{arguments[0]}' is not defined.")
+            return os.environ[arguments[0]]
+        if command == "optenv":
+            return os.environ.get(arguments[0], " ".join(arguments[1:]))
+        if command == "dirname":
+            return base_dir
+        if command == "cwd":
+            return os.getcwd()
+        raise XacroError(f"The substitution '$({substitution})' is not supported.")
+
+    def _find_package(self, package, base_dir):
+        if package in self.package_paths:
+            return str(self.package_paths[package])
+        key = (package, base_dir)
+        if key not in _package_paths:
+            # search the parent directories of the xacro file, and the ROS_PACKAGE_PATH, for a directory named as the package
+            candidates = [Path(base_dir)] + list(Path(base_dir).parents)
+            candidates += [Path(p) for p in os.environ.get("ROS_PACKAGE_PATH", "").split(os.pathsep) if p != ""]
+            package_path = None
+            for candidate in candidates:
+                if candidate.name == package:
+                    package_path = candidate
+                    break
+                if Path(candidate, package).is_dir():
+                    package_path = Path(candidate, package)
+                    break
+            if package_path is None:
+                raise XacroError(f"The package '{package}' could not be found from '{base_dir}'.")
+            _package_paths[key] = str(package_path)
+        return _package_paths[key]
+
+    def _eval_text(self, text, scope, base_dir):
+        if text is None or "$" not in text:
+            return text
+        text = _substitution_pattern.sub(lambda m: self._substitute(m.group(1), base_dir), text)
+        expressions = list(_expression_pattern.finditer(text))
+        if len(expressions) == 0:
+            return text
+        namespace = _ExpressionNamespace(self, scope)
+        def evaluate(expression):
+            try:
+                return eval(expression, {"__builtins__": {}}, namespace)
+            except (NameError, SyntaxError, TypeError, ValueError, ZeroDivisionError) as e:
+                raise XacroError(f"Error while evaluating the expression '${{{expression}}}': {e}")
+        if len(expressions) == 1 and expressions[0].span() == (0, len(text)):
+            return str(evaluate(expressions[0].group(1)))
+        return _expression_pattern.sub(lambda m: str(evaluate(m.group(1))), text)
+
+    ### END ### Expressions ######
+
+
+    ### START ### Expansion ######
+
+    def _expand_children(self, source: ET.Element, destination: ET.Element, scope: _Scope, base_dir: str):
+        if destination.text is None or destination.text.strip() == "":
+            destination.text = self._eval_text(source.text, scope, base_dir)
+        for child in source:
+            if not isinstance(child.tag, str): # comments and processing instructions
+                continue
+            if _is_xacro_tag(child.tag):
+                self._expand_xacro_element(child, destination, scope, base_dir)
+            else:
+                attributes = {k: self._eval_text(v, scope, base_dir) for k, v in child.attrib.items() if not _is_xacro_tag(k)}
+                expanded_child = ET.SubElement(destination, child.tag, attributes)
+                self._expand_children(child, expanded_child, scope, base_dir)
+                expanded_child.tail = child.tail
+
+    def _expand_xacro_element(self, element: ET.Element, destination: ET.Element, scope: _Scope, base_dir: str):
+        tag = _local_name(element.tag)
+        if tag == "property":
+            name = element.attrib["name"]
+            if "value" in element.attrib:
+                scope.properties[name] = _LazyProperty(element.attrib["value"], (scope, base_dir))
+            elif "default" in element.attrib:
+                if name not in scope.properties:
+                    scope.properties[name] = _LazyProperty(element.attrib["default"], (scope, base_dir))
+            else:
+                scope.properties[name] = ("block", list(element), scope, base_dir)
+        elif tag == "arg":
+            name = element.attrib["name"]
+            if name not in self.args:
+                self.args[name] = self._eval_text(element.attrib.get("default", ""), scope, base_dir)
+        elif tag == "macro":
+            scope.macros[element.attrib["name"]] = _get_macro_definition(element)
+        elif tag == "include":
+            filename = self._eval_text(element.attrib["filename"], scope, base_dir)
+            filename = os.path.join(base_dir, filename)
+            try:
+                root = _parse_cached(filename)
+            except (OSError, ET.ParseError) as e:
+                raise XacroError(f"The included file '{filename}' could not be read: {e}")
+            stat = os.stat(filename)
+            self.includes.append([os.path.abspath(filename), stat.st_mtime_ns, stat.st_size])
+            self._expand_children(root, destination, scope, os.path.dirname(os.path.abspath(filename)))
+        elif tag in ["if", "unless"]:
+            condition = _to_bool(_to_value(self._eval_text(element.attrib["value"], scope, base_dir)))
+            if condition == (tag == "if"):
+                self._expand_children(element, destination, scope, base_dir)
+        elif tag == "insert_block":
+            name = self._eval_text(element.attrib["name"], scope, base_dir)
+            block = scope.find(name, "properties")
+            if not isinstance(block, tuple) or block[0] != "block":
+                raise XacroError(f"The block '{name}' is not defined.")
+            _, elements, block_scope, block_base_dir = block
+            wrapper = ET.Element("block")
+            wrapper.extend(elements)
+            self._expand_children(wrapper, destination, block_scope, block_base_dir)
+        elif tag == "element":
+            # the name is given by the 'xacro:name' attribute
+            name = self._eval_text([v for k, v in element.attrib.items() if _local_name(k) == "name"][0], scope, base_dir)
+            attributes = {k: self._eval_text(v, scope, base_dir) for k, v in element.attrib.items() if not _is_xacro_tag(k) and k != "name"}
+            expanded_element = ET.SubElement(destination, name, attributes)
+            self._expand_children(element, expanded_element, scope, base_dir)
+        elif tag == "attribute":
+            destination.attrib[self._eval_text(element.attrib["name"], scope, base_dir)] = self._eval_text(element.attrib["value"], scope, base_dir)
+        else:
+            try:
+                macro = scope.find(tag, "macros")
+            except KeyError:
+                raise XacroError(f"The xacro element or macro '{tag}' is not defined.")
+            self._expand_macro_call(macro, element, destination, scope, base_dir)
+
+    def _expand_macro_call(self, macro: XacroMacro, call: ET.Element, destination: ET.Element, scope: _Scope, base_dir: str):
+        macro_scope = _Scope(scope)
+        blocks = [child for child in call if isinstance(child.tag, str)]
+        for name, kind, default in macro.params:
+            if kind == "block":
+                if len(blocks) == 0:
+                    raise XacroError(f"The block parameter '{name}' of the macro '{macro.name}' is not provided.")
+                macro_scope.properties[name] = ("block", [blocks.pop(0)], scope, base_dir)
+            elif kind == "multiblock":
+                block = call.find(name)
+                if block is None:
+                    raise XacroError(f"The block parameter '{name}' of the macro '{macro.name}' is not provided.")
+                blocks = [b for b in blocks if b is not block]
+                macro_scope.properties[name] = ("block", list(block), scope, base_dir)
+            elif name in call.attrib:
+                macro_scope.properties[name] = _to_value(self._eval_text(call.attrib[name], scope, base_dir))
+            elif default is not None:
+                if default.startswith("^"):
+                    # inherit the value from the calling scope, with an optional default after '|'
+                    try:
+                        macro_scope.properties[name] = self._get_property(name, scope)
+                    except KeyError:
+                        if "|" not in default:
+                            raise XacroError(f"The parameter '{name}' of the macro '{macro.name}' is not defined in the calling scope.")
+                        macro_scope.properties[name] = _to_value(self._eval_text(default.split("|", 1)[1], scope, base_dir))
+                else:
+                    macro_scope.properties[name] = _to_value(self._eval_text(default, scope, base_dir))
+            else:
+                raise XacroError(f"The parameter '{name}' of the macro '{macro.name}' is not provided.")
+        self._expand_children(macro.body, destination, macro_scope, base_dir)
+
+    ### END ### Expansion ######
+
+
+def _get_cache_key(filename: str, args: dict):
+    with open(filename, "rb") as f:
+        content = f.read()
+    key = hashlib.sha256(content)
+    key.update(json.dumps({"args": args if args is not None else {}, "version": XACRO_EXPANDER_VERSION}, sort_keys=True, default=str).encode())
+    return key.hexdigest()
+
+
+def _includes_unchanged(includes):
+    for path, mtime_ns, size in includes:
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return False
+        if stat.st_mtime_ns != mtime_ns or stat.st_size != size:
+            return False
+    return True
+
+
+def expand_xacro_file(filename: str, logger: Logger, args: dict=None, package_paths: dict=None, cache_dir: str=DEFAULT_XACRO_CACHE_DIR):
+    """
+    Expand a xacro file to a URDF file, which is stored in the cache directory.
+    If the xacro file (and the files it includes) has already been expanded with the same arguments, the cached URDF file is returned.
+
+    :param filename: the xacro file
+    :type filename: str
+    :param args: values of the xacro arguments
+    :type args: dict
+    :param package_paths: directories of ROS packages used to resolve $(find package)
+    :type package_paths: dict
+    :param cache_dir: the directory of the expanded URDF files
+    :type cache_dir: str
+    :return: the expanded URDF file, or None if the expansion failed
+    :rtype: str
+    """
+    try:
+        key = _get_cache_key(filename, args)
+    except OSError as e:
+        logger.error(f"Error while reading the xacro file {filename}: {e}")
+        return None
+    stem = os.path.basename(filename).split(".")[0]
+    expanded_file = os.path.join(cache_dir, f"{stem}-{key[:16]}.urdf")
+    manifest_file = os.path.join(cache_dir, f"{stem}-{key[:16]}.json")
+
+    if Path(expanded_file).exists() and Path(manifest_file).exists():
+        try:
+            with open(manifest_file, "r") as f:
+                manifest = json.load(f)
+            if manifest["key"] == key and _includes_unchanged(manifest["includes"]):
+                return expanded_file
+        except (OSError, ValueError, KeyError):
+            pass
+
+    expander = XacroExpander(logger, args, package_paths)
+    try:
+        root = expander.expand_file(filename)
+    except (XacroError, ET.ParseError, OSError, KeyError) as e:
+        logger.error(f"Error while expanding the xacro file {filename}: {e}")
+        return None
+
+    if not Path(cache_dir).exists():
+        os.makedirs(cache_dir, exist_ok=True)
+    # write to temporary files and replace, as multiple processes may expand the same file
+    tmp_suffix = f".{os.getpid()}.tmp"
+    ET.ElementTree(root).write(expanded_file + tmp_suffix, encoding="utf-8", xml_declaration=True)
+    os.replace(expanded_file + tmp_suffix, expanded_file)
+    with open(manifest_file + tmp_suffix, "w") as f:
+        json.dump({"key": key, "source": os.path.abspath(filename), "includes": expander.includes}, f)
+    os.replace(manifest_file + tmp_suffix, manifest_file)
+
+    return expanded_file
@@ -0,0 +1,78 @@
+import xml.etree.ElementTree as ET
+
+from urdf_analyzer.urdf_standard import LinkStandard
+
+try:
+    from lxml import etree as lxml_etree
+except ImportError:
+    lxml_etree = None
+
+
+# The XML backends used by ModelAnalysis to read URDF files.
+# The standard library ElementTree is used by default, as the full analysis is faster with it: lxml parses faster, but accessing
+# its elements from Python is slower, see benchmarks/xml_backend_benchmark.py. lxml can be chosen when it is installed, e.g. for very
+# large generated files (huge_tree), where the lookups of the joints, links and geometries are compiled to XPath expressions once.
+# The elements of both backends have the same API (attrib, find, findall, iter), such that the rest of the analysis does not depend on the backend.
+
+
+class ElementTreeBackend:
+
+    name = "etree"
+
+    def parse(self, filename: str):
+        return ET.ElementTree(file=filename).getroot()
+
+    def find_joints(self, root):
+        return root.iter("joint")
+
+    def find_links(self, root):
+        return root.iter("link")
+
+    def find_geometry_shapes(self, element):
+        """
+        The geometry shapes (mesh, box, cylinder, sphere) contained in a visual or collision element.
+        """
+        return [e for e in element.iter() if e.tag in LinkStandard.geometry_types]
+
+
+class LxmlBackend:
+
+    name = "lxml"
+
+    def __init__(self):
+        # comments and processing instructions are removed, such that iterating the children of an element only returns elements, as in ElementTree
+        self.parser = lxml_etree.XMLParser(huge_tree=True, remove_comments=True, remove_pis=True, resolve_entities=False)
+        self._find_joints = lxml_etree.XPath("descendant-or-self::joint")
+        self._find_links = lxml_etree.XPath("descendant-or-self::link")
+        self._find_geometry_shapes = lxml_etree.XPath(".//*[" + " or ".join(f"self::{g}" for g in LinkStandard.geometry_types) + "]")
+
+    def parse(self, filename: str):
+        return lxml_etree.parse(filename, self.parser).getroot()
+
+    def find_joints(self, root):
+        return self._find_joints(root)
+
+    def find_links(self, root):
+        return self._find_links(root)
+
+    def find_geometry_shapes(self, element):
+        return self._find_geometry_shapes(element)
+
+
+xml_backends = {ElementTreeBackend.name: ElementTreeBackend, LxmlBackend.name: LxmlBackend}
+
+def get_available_xml_backends():
+    return [LxmlBackend.name, ElementTreeBackend.name] if lxml_etree is not None else [ElementTreeBackend.name]
+
+def get_xml_backend(name: str=None):
+    """
+    :param name: the name of the XML backend, one of xml_backends. By default ElementTree is used.
+    :type name: str
+    :raises ValueError: if the backend is not supported or not installed
+    """
+    available_backends = get_available_xml_backends()
+    if name is None:
+        name = ElementTreeBackend.name
+    if name not in available_backends:
+        raise ValueError(f"The XML backend '{name}' is not available. The available backends are: {available_backends}")
+    return xml_backends[name]()